@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+:Synopsis:          This script compares the HTTP/1.1 and HTTP/2 transports on the bulk fan-out path
+:Usage:             ``python benchmarks/http2_bulk.py --username KEY --password SECRET --item-ids ids.txt``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+
+For each item ID the ``/items/{id}`` and ``/items/{id}/properties`` endpoints are queried concurrently with
+:py:meth:`highspot.core.Highspot.get_many` using each transport in turn.
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from highspot import Highspot                                   # noqa: E402
+from highspot.transports import HTTP1, HTTP2, http2_available   # noqa: E402
+
+
+def run_transport(args, transport_name, endpoints):
+    """This function runs the bulk fan-out with a transport and returns the elapsed time of each round."""
+    hs = Highspot(username=args.username, password=args.password, region=args.region, transport=transport_name,
+                  max_connections=args.max_connections)
+    timings = []
+    try:
+        for _ in range(args.rounds):
+            start_time = time.perf_counter()
+            hs.get_many(endpoints, max_workers=args.concurrency)
+            timings.append(time.perf_counter() - start_time)
+    finally:
+        hs.close()
+    return timings
+
+
+def main():
+    """This function parses the command-line arguments and prints the benchmark results."""
+    parser = argparse.ArgumentParser(description='Compare the HTTP/1.1 and HTTP/2 transports on bulk requests')
+    parser.add_argument('--username', default=os.environ.get('HIGHSPOT_USERNAME'))
+    parser.add_argument('--password', default=os.environ.get('HIGHSPOT_PASSWORD'))
+    parser.add_argument('--region', default=None)
+    parser.add_argument('--item-ids', required=True, help='a file with one item ID per line')
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--max-connections', type=int, default=10)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    if not http2_available():
+        parser.error('The httpx and h2 packages must be installed to run this benchmark.')
+
+    with open(args.item_ids) as id_file:
+        item_ids = [line.strip() for line in id_file if line.strip()]
+    endpoints = [endpoint for item_id in item_ids for endpoint in (f'/items/{item_id}', f'/items/{item_id}/properties')]
+    for transport_name in (HTTP1, HTTP2):
+        timings = run_transport(args, transport_name, endpoints)
+        median = statistics.median(timings)
+        print(f'{transport_name}: {len(endpoints)} requests, median {median:.3f} s, '
+              f'{len(endpoints) / median:.1f} requests/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+:Synopsis:          This script benchmarks the cold-start cost of importing highspot and instantiating the core object
+:Usage:             ``python benchmarks/import_time.py [--runs 20]``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+
+The *lazy* scenario reflects the default behavior of the package, where the submodules, the :py:mod:`requests`
+library and the inner class objects are only loaded when first used. The *eager* scenario forces everything to be
+loaded up front, which mirrors the behavior of the package prior to the introduction of lazy initialization.
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+SCENARIOS = {
+    'lazy': """
+import time
+_start = time.perf_counter()
+from highspot import Highspot
+hs = Highspot(username='user', password='pass')
+print(time.perf_counter() - _start)
+""",
+    'eager': """
+import time
+_start = time.perf_counter()
+from highspot import Highspot
+import requests
+from highspot import api, domain, groups, items, pitches, request, spots, users
+hs = Highspot(username='user', password='pass')
+for _inner in (hs.domain, hs.groups, hs.items, hs.pitches, hs.requests, hs.spots, hs.users):
+    pass
+for _name in ('highspot.core', 'highspot.api', 'highspot.utils.version'):
+    sys.modules[_name].logger.level
+print(time.perf_counter() - _start)
+""",
+}
+
+
+def time_scenario(code, runs):
+    """This function runs a scenario in fresh interpreters and returns the elapsed times in milliseconds."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get('PYTHONPATH')])))
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', f'import sys\n{code}'], env=env)
+        timings.append(float(output.decode().strip()) * 1000)
+    return timings
+
+
+def main():
+    """This function parses the command-line arguments and prints the benchmark results."""
+    parser = argparse.ArgumentParser(description=__doc__.split(':Synopsis:')[1].split('\n')[0].strip())
+    parser.add_argument('--runs', type=int, default=20, help='the number of fresh interpreters per scenario')
+    args = parser.parse_args()
+    results = {name: time_scenario(code, args.runs) for name, code in SCENARIOS.items()}
+    for name, timings in results.items():
+        print(f'{name:>6}: median {statistics.median(timings):8.2f} ms   min {min(timings):8.2f} ms')
+    speedup = statistics.median(results['eager']) / statistics.median(results['lazy'])
+    print(f'Lazy initialization is {speedup:.1f}x faster on cold start')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+:Synopsis:          This script records API responses to a cassette file and measures the throughput of replaying them
+:Usage:             ``python benchmarks/replay_throughput.py --cassette items.cassette --record --endpoints eps.txt``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+
+When ``--record`` is given the endpoints are queried against the live API (which requires credentials) and the
+responses are written to the cassette. The cassette is then replayed without network access, both at memory speed and
+with the recorded latency, by querying every recorded endpoint with :py:meth:`highspot.core.Highspot.get_many`.
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import urllib.parse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from highspot import Highspot       # noqa: E402
+from highspot import transports     # noqa: E402
+
+
+def record(args):
+    """This function queries the endpoints against the live API and writes the responses to the cassette."""
+    with open(args.endpoints) as endpoints_file:
+        endpoints = [line.strip() for line in endpoints_file if line.strip()]
+    hs = Highspot(username=args.username, password=args.password, region=args.region,
+                  transport=transports.RecordingTransport(args.cassette))
+    try:
+        hs.get_many(endpoints, max_workers=args.concurrency)
+    finally:
+        hs.close()
+    print(f'{len(endpoints)} responses were recorded to {args.cassette}')
+
+
+def replay(args, latency_factor):
+    """This function replays every recorded endpoint and returns the elapsed time of each round."""
+    transport = transports.ReplayTransport(args.cassette, latency_factor=latency_factor)
+    hs = Highspot(username='replay', password='replay', transport=transport)
+    # The recorded URLs include the API version, which is part of the base URL of the core object
+    version_path = urllib.parse.urlsplit(hs.base_url).path
+    endpoints = [transports.get_request_key(response.url)[len(version_path):]
+                 for response in transports.load_cassette(args.cassette)[1]]
+    timings = []
+    for _ in range(args.rounds):
+        transport.rewind()
+        start_time = time.perf_counter()
+        hs.get_many(endpoints, max_workers=args.concurrency)
+        timings.append(time.perf_counter() - start_time)
+    return len(endpoints), timings
+
+
+def main():
+    """This function parses the command-line arguments and prints the benchmark results."""
+    parser = argparse.ArgumentParser(description='Measure the throughput of replaying recorded API responses')
+    parser.add_argument('--cassette', required=True)
+    parser.add_argument('--record', action='store_true', help='record the cassette against the live API first')
+    parser.add_argument('--endpoints', help='a file with one endpoint URI per line (required with --record)')
+    parser.add_argument('--username', default=os.environ.get('HIGHSPOT_USERNAME'))
+    parser.add_argument('--password', default=os.environ.get('HIGHSPOT_PASSWORD'))
+    parser.add_argument('--region', default=None)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    if args.record:
+        if not args.endpoints:
+            parser.error('The --endpoints file is required to record a cassette.')
+        record(args)
+
+    for label, latency_factor in (('memory speed', 0.0), ('recorded latency', 1.0)):
+        request_count, timings = replay(args, latency_factor)
+        median = statistics.median(timings)
+        print(f'{label}: {request_count} requests, median {median:.3f} s, {request_count / median:.1f} requests/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+:Synopsis:          This script measures how the throughput of a sharded export scales with the number of worker hosts
+:Usage:             ``python benchmarks/sharded_export_scaling.py --hosts 1 2 4 --users 2000 --items 2000``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+
+Each simulated host is a separate process with its own core object, whose transport serves a synthetic tenant with a
+fixed latency and permits a limited number of concurrent connections (mirroring the per-connection limits of the API).
+Every host works on the same work directory, and the merged output of each run is compared with the first run to
+confirm that it is deterministic.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import threading
+import multiprocessing
+import urllib.parse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from highspot import Highspot       # noqa: E402
+from highspot import coordinator    # noqa: E402
+from highspot import transports     # noqa: E402
+
+
+class SyntheticTenantTransport(transports.BaseTransport):
+    """This class serves the users, Spots, items and item properties of a synthetic tenant with a fixed latency."""
+    def __init__(self, user_count, item_count, spot_count, latency, max_connections):
+        """This method instantiates the transport with the size of the tenant and the connection limit."""
+        self.user_count = user_count
+        self.spot_count = spot_count
+        self.items_per_spot = item_count // spot_count
+        self.latency = latency
+        self._connections = threading.BoundedSemaphore(max_connections)
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method returns the synthetic response for a GET request after the simulated latency."""
+        parsed_url = urllib.parse.urlsplit(url)
+        query = {key: values[0] for key, values in urllib.parse.parse_qs(parsed_url.query).items()}
+        path = parsed_url.path.split('/v0.5', 1)[-1]
+        with self._connections:
+            time.sleep(self.latency)
+        if path.endswith('/properties'):
+            body = {'item_id': path.split('/')[2], 'title': f"Title of {path.split('/')[2]}"}
+        else:
+            start, limit = int(query.get('start', 0)), int(query.get('limit', 100))
+            if path == '/users':
+                ids = [f'user{index:06d}' for index in range(self.user_count)]
+            elif path == '/spots':
+                ids = [f'spot{index:03d}' for index in range(self.spot_count)]
+            else:
+                ids = [f"{query['spot']}-item{index:06d}" for index in range(self.items_per_spot)]
+            body = {'collection': [{'id': record_id} for record_id in ids[start:start + limit]]}
+        return transports.RecordedResponse(url, 200, {'Content-Type': 'application/json'},
+                                           json.dumps(body).encode('utf-8'), self.latency)
+
+
+def run_host(args, work_dir, output_dir):
+    """This function runs the workers of a simulated host until the export is finished."""
+    transport = SyntheticTenantTransport(args.users, args.items, args.spots, args.latency, args.connections)
+    hs = Highspot(username='benchmark', password='benchmark', transport=transport, max_connections=args.connections)
+    try:
+        coordinator.run_sharded_export(hs, work_dir, output_dir=output_dir, limit=args.limit,
+                                       worker_count=args.connections, poll_interval=0.05)
+    finally:
+        hs.close()
+
+
+def run_export(args, host_count):
+    """This function runs an export with the given number of simulated hosts and returns the elapsed time."""
+    work_dir = tempfile.mkdtemp(prefix='highspot-shards-')
+    output_dir = os.path.join(work_dir, 'output')
+    try:
+        # Plan the export before starting the hosts so that every host uses the same options
+        export_coordinator = coordinator.ExportCoordinator(work_dir, limit=args.limit)
+        export_coordinator.plan()
+        export_coordinator.close()
+        start_time = time.perf_counter()
+        hosts = [multiprocessing.Process(target=run_host, args=(args, work_dir, output_dir))
+                 for _ in range(host_count)]
+        for host in hosts:
+            host.start()
+        for host in hosts:
+            host.join()
+        elapsed = time.perf_counter() - start_time
+        digest = hashlib.sha256()
+        for file_name in sorted(coordinator.MERGED_FILE_NAMES.values()):
+            with open(os.path.join(output_dir, file_name), 'rb') as merged_file:
+                digest.update(merged_file.read())
+        return elapsed, digest.hexdigest()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    """This function parses the command-line arguments and prints the benchmark results."""
+    parser = argparse.ArgumentParser(description='Measure the scaling of a sharded export across worker hosts')
+    parser.add_argument('--hosts', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--spots', type=int, default=10)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.02, help='the simulated latency of each request')
+    parser.add_argument('--connections', type=int, default=4, help='the concurrent connections permitted per host')
+    args = parser.parse_args()
+
+    first_elapsed, first_digest = None, None
+    for host_count in args.hosts:
+        elapsed, digest = run_export(args, host_count)
+        first_elapsed, first_digest = first_elapsed or elapsed, first_digest or digest
+        print(f'{host_count} hosts: {elapsed:.2f} s, {first_elapsed / elapsed:.2f}x the throughput of '
+              f"{args.hosts[0]} hosts, output {'identical' if digest == first_digest else 'DIFFERENT'}")
+
+
+if __name__ == '__main__':
+    main()
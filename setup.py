@@ -4,7 +4,7 @@
 :Synopsis:          This script is the primary configuration file for the highspot project
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     17 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 import setuptools
@@ -68,6 +68,11 @@ setuptools.setup(
         "Topic :: Office/Business",
         "Topic :: Software Development :: Libraries :: Python Modules"
     ],
+    entry_points={
+        'console_scripts': [
+            'highspot=highspot.cli:main',
+        ],
+    },
     python_requires='>=3.6',
     install_requires=[
         "urllib3>=1.26.7",
@@ -75,6 +80,17 @@ setuptools.setup(
         "setuptools~=52.0.0"
     ],
     extras_require={
+        'analytics': [
+            'numpy>=1.21.0'
+        ],
+        'compression': [
+            'brotli>=1.0.9',
+            'zstandard>=0.18.0'
+        ],
+        'http2': [
+            'httpx>=0.23.0',
+            'h2>=4.1.0'
+        ],
         'sphinx': [
             'Sphinx>=3.4.0',
             'sphinxcontrib-applehelp>=1.0.2',
@@ -4,13 +4,22 @@
 :Synopsis:          This is the ``__init__`` module for the highspot package
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     10 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 from .core import Highspot
 from .utils import version
 
-__all__ = ['core', 'Highspot']
+__all__ = ['core', 'Highspot', 'HighspotPool']
 
 # Define the package version by pulling from the highspot.utils.version module
 __version__ = version.get_full_version()
+
+
+def __getattr__(name):
+    """This function imports the :py:class:`highspot.pool.HighspotPool` class the first time it is accessed so that
+       the pool module (and :py:mod:`concurrent.futures`) is not loaded when only the core object is used."""
+    if name == 'HighspotPool':
+        from .pool import HighspotPool
+        return HighspotPool
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
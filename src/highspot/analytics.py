@@ -0,0 +1,547 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.analytics
+:Synopsis:          Defines column-oriented (and vectorized when NumPy is installed) aggregations of item reports
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import io
+import csv
+import math
+import datetime
+import functools
+import itertools
+import collections
+
+from . import items
+from .errors import exceptions
+from .utils import import_utils, log_utils
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Defer importing NumPy until a report is loaded with the vectorized operations
+np = import_utils.lazy_import('numpy')
+
+# Define the column types
+NUMERIC = 'numeric'
+TIMESTAMP = 'timestamp'
+CATEGORICAL = 'categorical'
+
+# Define the length in seconds of the fixed time bucket intervals
+INTERVAL_SECONDS = {
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400,
+    'week': 604800,
+}
+
+# Define the number of CSV rows that are transposed into columns at a time
+DEFAULT_BATCH_SIZE = 65536
+
+# Define the supported aggregation functions
+AGGREGATIONS = ('count', 'sum', 'mean', 'min', 'max')
+
+# Define the words which identify the columns that contain timestamps when the column types are inferred
+TIMESTAMP_NAME_HINTS = ('date', 'time', 'timestamp', 'created', 'updated')
+
+
+def numpy_available():
+    """This function determines if NumPy is installed so that the vectorized operations can be used.
+
+    .. note:: NumPy can be installed with the ``analytics`` extra (i.e. ``pip install highspot[analytics]``).
+
+    :returns: Boolean value indicating if NumPy can be imported
+    """
+    try:
+        import numpy
+    except ImportError:
+        return False
+    return True
+
+
+def load_item_report(hs_object, item_id, column_types=None, use_numpy=None):
+    """This function retrieves the CSV report for an item and loads it into typed columns for aggregation.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param item_id: The unique identifier for the item
+    :type item_id: str
+    :param column_types: Dictionary with column names as keys and the column types (``numeric``, ``timestamp`` or
+                         ``categorical``) as values for any columns whose types should not be inferred
+    :type column_types: dict, None
+    :param use_numpy: Determines if NumPy arrays should be used (``True`` when NumPy is installed by default)
+    :type use_numpy: bool, None
+    :returns: The :py:class:`highspot.analytics.ReportFrame` object
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    report = items.get_item_report(hs_object, item_id)
+    if not isinstance(report, str):
+        raise exceptions.DataMismatchError(f"The report for the item '{item_id}' could not be retrieved: {report}")
+    return ReportFrame.from_csv(report, column_types=column_types, use_numpy=use_numpy)
+
+
+def parse_timestamp(value):
+    """This function converts an ISO 8601 timestamp into the number of seconds since the Unix epoch (in UTC).
+
+    :param value: The timestamp (e.g. ``2022-10-16T14:05:00Z`` or ``2022-10-16``)
+    :type value: str
+    :returns: The number of seconds since the epoch or ``nan`` if the value is empty
+    :raises: :py:exc:`ValueError`
+    """
+    if not value:
+        return math.nan
+    parsed = datetime.datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def format_timestamp(seconds):
+    """This function converts a number of seconds since the Unix epoch into an ISO 8601 timestamp (in UTC).
+
+    :param seconds: The number of seconds since the epoch
+    :type seconds: int, float
+    :returns: The timestamp as a string (e.g. ``2022-10-16T00:00:00Z``)
+    """
+    return datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ReportFrame(object):
+    """This class stores the rows of a report as typed columns and aggregates them a column at a time.
+
+    Numeric columns are stored as floats, timestamp columns are stored as seconds since the Unix epoch and any other
+    columns (e.g. user and item IDs) are stored as integer codes into a list of their distinct values. When NumPy is
+    installed the columns are NumPy arrays and the aggregations are vectorized, otherwise the columns are lists.
+    """
+    def __init__(self, columns, column_types, categories=None, use_numpy=None):
+        """This method instantiates the :py:class:`highspot.analytics.ReportFrame` class object.
+
+        :param columns: Dictionary with the column names as keys and the column values (arrays or lists) as values
+        :type columns: dict
+        :param column_types: Dictionary with the column names as keys and the column types as values
+        :type column_types: dict
+        :param categories: Dictionary with the categorical column names as keys and their distinct values as values
+        :type categories: dict, None
+        :param use_numpy: Determines if NumPy arrays are used (``True`` when NumPy is installed by default)
+        :type use_numpy: bool, None
+        """
+        self.use_numpy = numpy_available() if use_numpy is None else use_numpy
+        self.columns = columns
+        self.column_types = column_types
+        self.categories = categories or {}
+        self.row_count = len(next(iter(columns.values()))) if columns else 0
+
+    def __len__(self):
+        """This method returns the number of rows in the report."""
+        return self.row_count
+
+    @classmethod
+    def from_csv(cls, csv_content, column_types=None, use_numpy=None, batch_size=DEFAULT_BATCH_SIZE):
+        """This method parses CSV content into typed columns.
+
+        .. note:: The rows are transposed into columns in batches so that only one batch of row lists exists at a time,
+                  which keeps the cost of garbage collection from growing with the size of the report.
+
+        .. note:: Rows with fewer values than the header are padded with empty values (i.e. the missing trailing values
+                  are treated as empty) so that every column has a value for every row.
+
+        :param csv_content: The CSV content (e.g. from :py:func:`highspot.items.get_item_report`)
+        :type csv_content: str, bytes
+        :param column_types: Dictionary with column names as keys and the column types (``numeric``, ``timestamp``
+                             or ``categorical``) as values for any columns whose types should not be inferred
+        :type column_types: dict, None
+        :param use_numpy: Determines if NumPy arrays should be used (``True`` when NumPy is installed by default)
+        :type use_numpy: bool, None
+        :param batch_size: The number of rows transposed into columns at a time (``65536`` by default)
+        :type batch_size: int
+        :returns: The :py:class:`highspot.analytics.ReportFrame` object
+        :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+                 :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if isinstance(csv_content, bytes):
+            csv_content = csv_content.decode('utf-8-sig')
+        reader = csv.reader(io.StringIO(csv_content.lstrip('\ufeff')))
+        header = next(reader, [])
+        use_numpy = numpy_available() if use_numpy is None else use_numpy
+        batches = [[] for _ in header]
+        while True:
+            rows = list(filter(None, itertools.islice(reader, batch_size)))
+            if not rows:
+                break
+            if set(map(len, rows)) != {len(header)}:
+                rows = _pad_rows(rows, len(header))
+            for batch, values in zip(batches, zip(*rows)):
+                if use_numpy:
+                    batch.append(np.array(values, dtype=str))
+                else:
+                    batch.extend(values)
+        if use_numpy:
+            values_by_column = [np.concatenate(batch) if batch else np.array([], dtype=str) for batch in batches]
+        else:
+            values_by_column = batches
+        columns, types, categories = {}, {}, {}
+        for name, values in zip(header, values_by_column):
+            column_type = (column_types or {}).get(name)
+            if column_type not in (None, NUMERIC, TIMESTAMP, CATEGORICAL):
+                raise exceptions.InvalidFieldError(f"The value '{column_type}' is not a valid column type.")
+            column, column_type, column_categories = _convert_column(name, values, column_type, use_numpy)
+            columns[name], types[name] = column, column_type
+            if column_categories is not None:
+                categories[name] = column_categories
+        return cls(columns, types, categories, use_numpy)
+
+    def get_column(self, name, decode=True):
+        """This method returns the values of a column.
+
+        :param name: The name of the column
+        :type name: str
+        :param decode: Determines if categorical codes should be converted back into their values (``True`` by
+                       default)
+        :type decode: bool
+        :returns: A list of the column values
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        column = self._get_column(name)
+        if decode and self.column_types[name] == CATEGORICAL:
+            labels = self.categories[name]
+            return [labels[code] for code in column]
+        return column.tolist() if self.use_numpy else list(column)
+
+    def count(self, by=None):
+        """This method counts the rows in the report or in each group.
+
+        :param by: The column name(s) by which to group the rows (no grouping by default)
+        :type by: str, list, tuple, None
+        :returns: The number of rows or a dictionary with the group values as keys and the counts as values
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if by is None:
+            return self.row_count
+        return {key: values['count'] for key, values in self.group_by(by).items()}
+
+    def sum(self, column, by=None):
+        """This method sums the values of a numeric column for the report or for each group.
+
+        .. note:: Empty values are ignored.
+
+        :param column: The name of the numeric column
+        :type column: str
+        :param by: The column name(s) by which to group the rows (no grouping by default)
+        :type by: str, list, tuple, None
+        :returns: The sum or a dictionary with the group values as keys and the sums as values
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if by is None:
+            values = self._get_column(column)
+            if self.use_numpy:
+                return float(np.nansum(values))
+            return math.fsum(value for value in values if not math.isnan(value))
+        return {key: values[f'{column}_sum'] for key, values in self.group_by(by, {column: 'sum'}).items()}
+
+    def group_by(self, by, aggregations=None):
+        """This method groups the rows by the values of one or more columns and aggregates each group.
+
+        :param by: The column name(s) by which to group the rows
+        :type by: str, list, tuple
+        :param aggregations: Dictionary with the numeric column names as keys and the aggregation functions
+                             (``count``, ``sum``, ``mean``, ``min`` or ``max``) or lists of them as values
+        :type aggregations: dict, None
+        :returns: A dictionary with the group values (as a tuple when grouping by several columns) as keys and
+                  dictionaries with the ``count`` and the ``{column}_{function}`` aggregates as values
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        aggregations = {column: [functions] if isinstance(functions, str) else list(functions)
+                        for column, functions in (aggregations or {}).items()}
+        for column, functions in aggregations.items():
+            self._get_column(column)
+            for function in functions:
+                if function not in AGGREGATIONS:
+                    raise exceptions.InvalidFieldError(f"The value '{function}' is not a valid aggregation.")
+        if self.use_numpy:
+            return self._group_by_numpy(by, aggregations)
+        return self._group_by_lists(by, aggregations)
+
+    def add_time_bucket(self, column, interval='day', name=None):
+        """This method adds a column with the start of the time bucket that contains each value of a timestamp column.
+
+        :param column: The name of the timestamp column
+        :type column: str
+        :param interval: The bucket interval (``minute``, ``hour``, ``day``, ``week`` or ``month``)
+        :type interval: str
+        :param name: The name of the new column (``{column}_{interval}`` by default)
+        :type name: str, None
+        :returns: The name of the new column
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        values = self._get_column(column)
+        if self.column_types[column] != TIMESTAMP:
+            raise exceptions.InvalidFieldError(f"The column '{column}' does not contain timestamps.")
+        if interval != 'month' and interval not in INTERVAL_SECONDS:
+            raise exceptions.InvalidFieldError(f"The value '{interval}' is not a valid time bucket interval.")
+        name = name or f'{column}_{interval}'
+        if self.use_numpy:
+            if interval == 'month':
+                valid = ~np.isnan(values)
+                months = np.full(values.shape, np.nan)
+                months[valid] = values[valid].astype('datetime64[s]').astype('datetime64[M]') \
+                    .astype('datetime64[s]').astype(np.float64)
+                buckets = months
+            else:
+                seconds = INTERVAL_SECONDS[interval]
+                # Weeks begin on Monday, which is four days after the epoch (a Thursday)
+                offset = 3 * 86400 if interval == 'week' else 0
+                buckets = np.floor((values + offset) / seconds) * seconds - offset
+        else:
+            buckets = [_get_bucket_start(value, interval) for value in values]
+        self.columns[name] = buckets
+        self.column_types[name] = TIMESTAMP
+        return name
+
+    def count_by_time(self, column, interval='day', by=None):
+        """This method counts the rows within each time bucket of a timestamp column.
+
+        :param column: The name of the timestamp column
+        :type column: str
+        :param interval: The bucket interval (``minute``, ``hour``, ``day``, ``week`` or ``month``)
+        :type interval: str
+        :param by: Additional column name(s) by which to group the rows within each bucket
+        :type by: str, list, tuple, None
+        :returns: A dictionary with the bucket start timestamps (or tuples with the bucket and group values) as keys
+                  and the counts as values
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        bucket_column = self.add_time_bucket(column, interval)
+        by = [by] if isinstance(by, str) else list(by or [])
+        return self.count([bucket_column] + by if by else bucket_column)
+
+    def _get_column(self, _name):
+        """This method returns a column or raises an exception if it does not exist."""
+        if _name not in self.columns:
+            raise exceptions.InvalidFieldError(f"The column '{_name}' does not exist in the report.")
+        return self.columns[_name]
+
+    def _decode_value(self, _name, _value):
+        """This method converts a stored value (e.g. a categorical code) into the value returned in the results."""
+        _column_type = self.column_types[_name]
+        if _column_type == CATEGORICAL:
+            return self.categories[_name][int(_value)]
+        if isinstance(_value, float) and math.isnan(_value):
+            return None
+        if _column_type == TIMESTAMP:
+            return format_timestamp(_value)
+        return float(_value)
+
+    def _decode_values(self, _name, _values):
+        """This method converts an array of stored values into a list of the values returned in the results."""
+        if self.column_types[_name] == CATEGORICAL:
+            return np.array(self.categories[_name], dtype=object)[_values.astype(np.int64)].tolist()
+        return [self._decode_value(_name, _value) for _value in _values.tolist()]
+
+    def _group_by_numpy(self, _by, _aggregations):
+        """This method performs a vectorized group-by using the NumPy arrays."""
+        # Combine the codes of each grouping column into a single group key per row
+        _label_counts, _key_labels, _combined = [], [], None
+        for _name in _by:
+            _column = self._get_column(_name)
+            if self.column_types[_name] == CATEGORICAL:
+                _labels, _codes = np.arange(len(self.categories[_name])), _column
+            else:
+                _labels, _codes = np.unique(_column, return_inverse=True)
+            _key_labels.append(_labels)
+            _label_counts.append(len(_labels))
+            _combined = _codes.astype(np.int64) if _combined is None else _combined * len(_labels) + _codes
+        if _combined is None:
+            return {}
+        _group_keys, _inverse = np.unique(_combined, return_inverse=True)
+        _inverse = _inverse.reshape(-1)
+        _group_count = len(_group_keys)
+        _aggregates = {'count': np.bincount(_inverse, minlength=_group_count)}
+        for _column_name, _functions in _aggregations.items():
+            _values = self.columns[_column_name].astype(np.float64)
+            _valid = ~np.isnan(_values)
+            _valid_counts = np.bincount(_inverse, weights=_valid, minlength=_group_count)
+            _sums = np.bincount(_inverse, weights=np.where(_valid, _values, 0.0), minlength=_group_count)
+            for _function in _functions:
+                if _function == 'count':
+                    _result = _valid_counts
+                elif _function == 'sum':
+                    _result = _sums
+                elif _function == 'mean':
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        _result = _sums / _valid_counts
+                else:
+                    _result = np.full(_group_count, np.inf if _function == 'min' else -np.inf)
+                    (np.fmin if _function == 'min' else np.fmax).at(_result, _inverse, _values)
+                    _result[np.isinf(_result)] = np.nan
+                _aggregates[f'{_column_name}_{_function}'] = _result
+
+        # Split the combined group keys back into the values of each grouping column
+        _remaining, _key_values = _group_keys.copy(), []
+        for _labels, _label_count in zip(reversed(_key_labels), reversed(_label_counts)):
+            _remaining, _positions = np.divmod(_remaining, _label_count)
+            _key_values.insert(0, _labels[_positions])
+        _key_values = [self._decode_values(_name, _values) for _name, _values in zip(_by, _key_values)]
+        _keys = list(zip(*_key_values)) if len(_by) > 1 else _key_values[0]
+        _aggregate_lists = []
+        for _aggregate_name, _values in _aggregates.items():
+            if _aggregate_name.endswith('count'):
+                _values = _values.astype(np.int64).tolist()
+            elif np.isnan(_values).any():
+                _values = [None if math.isnan(_value) else _value for _value in _values.tolist()]
+            else:
+                _values = _values.tolist()
+            _aggregate_lists.append(_values)
+        _aggregate_names = tuple(_aggregates)
+        return {_key: dict(zip(_aggregate_names, _row)) for _key, _row in zip(_keys, zip(*_aggregate_lists))}
+
+    def _group_by_lists(self, _by, _aggregations):
+        """This method performs a group-by a column at a time when NumPy is not installed.
+
+        .. note:: The rows are counted with a :py:class:`collections.Counter` object and the values of each aggregated
+                  column are collected in a single pass over that column, so that no work is done per row and column
+                  in the interpreter beyond appending the value to the list of its group.
+        """
+        _key_columns = [self._get_column(_name) for _name in _by]
+        _raw_keys = _key_columns[0] if len(_by) == 1 else list(zip(*_key_columns))
+        _counts = collections.Counter(_raw_keys)
+        _values_by_column = {}
+        for _name in _aggregations:
+            _groups = _values_by_column[_name] = collections.defaultdict(list)
+            for _raw_key, _value in zip(_raw_keys, self.columns[_name]):
+                # Empty values are stored as NaN, which is the only value that is not equal to itself
+                if _value == _value:
+                    _groups[_raw_key].append(_value)
+        _decoders = [self._get_decoder(_name) for _name in _by]
+        _results = {}
+        for _raw_key, _count in _counts.items():
+            if len(_by) == 1:
+                _decoded = _decoders[0](_raw_key)
+            else:
+                _decoded = tuple([_decoder(_value) for _decoder, _value in zip(_decoders, _raw_key)])
+            _result = {'count': _count}
+            for _name, _functions in _aggregations.items():
+                _values = _values_by_column[_name].get(_raw_key, [])
+                for _function in _functions:
+                    _result[f'{_name}_{_function}'] = _aggregate_values(_values, _function)
+            _results[_decoded] = _result
+        return _results
+
+    def _get_decoder(self, _name):
+        """This method returns the function that converts the stored values of a column into the returned values."""
+        if self.column_types[_name] == CATEGORICAL:
+            return self.categories[_name].__getitem__
+        return functools.partial(self._decode_value, _name)
+
+
+def _convert_column(_name, _values, _column_type, _use_numpy):
+    """This function converts the text values of a CSV column into a typed column.
+
+    :param _name: The name of the column
+    :type _name: str
+    :param _values: The text values of the column
+    :type _values: list, class[numpy.ndarray]
+    :param _column_type: The column type or ``None`` to infer it
+    :type _column_type: str, None
+    :param _use_numpy: Determines if a NumPy array should be returned
+    :type _use_numpy: bool
+    :returns: A tuple with the column values, the column type and the categories (or ``None``)
+    """
+    if _column_type in (None, NUMERIC):
+        try:
+            if _use_numpy:
+                # Parse the whole column at once with empty values treated as missing
+                return np.where(_values == '', 'nan', _values).astype(np.float64), NUMERIC, None
+            return [float(_value) if _value else math.nan for _value in _values], NUMERIC, None
+        except ValueError:
+            if _column_type == NUMERIC:
+                raise exceptions.InvalidFieldError(f"The column '{_name}' contains non-numeric values.")
+    if _column_type == TIMESTAMP or (_column_type is None and
+                                     any(_hint in _name.lower() for _hint in TIMESTAMP_NAME_HINTS)):
+        if _use_numpy:
+            try:
+                # Parse the whole column at once when the timestamps are in UTC, which is how reports are exported
+                _datetimes = np.char.rstrip(_values, 'Z').astype('datetime64[s]')
+                _seconds = _datetimes.astype(np.int64).astype(np.float64)
+                _seconds[np.isnat(_datetimes)] = np.nan
+                return _seconds, TIMESTAMP, None
+            except ValueError:
+                pass
+        try:
+            _seconds = [parse_timestamp(_value) for _value in _values]
+            return (np.array(_seconds, dtype=np.float64) if _use_numpy else _seconds), TIMESTAMP, None
+        except ValueError:
+            if _column_type == TIMESTAMP:
+                raise exceptions.InvalidFieldError(f"The column '{_name}' contains invalid timestamps.")
+    if _use_numpy:
+        _categories, _codes = np.unique(_values, return_inverse=True)
+        return _codes.reshape(-1).astype(np.int64), CATEGORICAL, _categories.tolist()
+    _codes_by_value, _codes = {}, []
+    for _value in _values:
+        _code = _codes_by_value.get(_value)
+        if _code is None:
+            _code = _codes_by_value[_value] = len(_codes_by_value)
+        _codes.append(_code)
+    return _codes, CATEGORICAL, list(_codes_by_value)
+
+
+def _pad_rows(_rows, _width):
+    """This function pads the CSV rows that have fewer values than the header with empty values.
+
+    :param _rows: The CSV rows
+    :type _rows: list
+    :param _width: The number of columns in the header
+    :type _width: int
+    :returns: The list of rows with a value for every column
+    :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    _padded = []
+    for _row in _rows:
+        if len(_row) > _width:
+            raise exceptions.DataMismatchError(f"A row of the report has {len(_row)} values but the header only "
+                                               f"has {_width} columns: {_row}")
+        _padded.append(_row + [''] * (_width - len(_row)) if len(_row) < _width else _row)
+    return _padded
+
+
+def _get_bucket_start(_seconds, _interval):
+    """This function returns the start of the time bucket that contains a timestamp.
+
+    :param _seconds: The number of seconds since the epoch
+    :type _seconds: float
+    :param _interval: The bucket interval (``minute``, ``hour``, ``day``, ``week`` or ``month``)
+    :type _interval: str
+    :returns: The start of the bucket as the number of seconds since the epoch
+    """
+    if math.isnan(_seconds):
+        return math.nan
+    if _interval == 'month':
+        _timestamp = datetime.datetime.fromtimestamp(_seconds, datetime.timezone.utc)
+        return _timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
+    _length = INTERVAL_SECONDS[_interval]
+    _offset = 3 * 86400 if _interval == 'week' else 0
+    return math.floor((_seconds + _offset) / _length) * _length - _offset
+
+
+def _aggregate_values(_values, _function):
+    """This function aggregates a list of numeric values.
+
+    :param _values: The values to aggregate (excluding empty values)
+    :type _values: list
+    :param _function: The aggregation function (``count``, ``sum``, ``mean``, ``min`` or ``max``)
+    :type _function: str
+    :returns: The aggregated value (or ``None`` when there are no values for a mean, minimum or maximum)
+    """
+    if _function == 'count':
+        return len(_values)
+    if _function == 'sum':
+        return math.fsum(_values)
+    if not _values:
+        return None
+    if _function == 'mean':
+        return math.fsum(_values) / len(_values)
+    return min(_values) if _function == 'min' else max(_values)
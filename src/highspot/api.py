@@ -4,19 +4,37 @@
 :Synopsis:          This module handles interactions with the Highspot REST API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     16 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
-import requests
+import re
+import json
+import time
+import logging
+import threading
 
-from . import errors
-from .utils import log_utils
+from . import core, errors, transports
+from .utils import json_stream, log_utils, projection, scheduler
 
 # Initialize logging
-logger = log_utils.initialize_logging(__name__)
+logger = log_utils.defer_logging(__name__)
 
+# Define the lock that prevents multiple transports from being created for the same core object
+_transport_lock = threading.Lock()
 
-def get_request_with_retries(hs_object, endpoint, return_json=True, verify_ssl=True):
+# Define the API hosts for each Highspot region (which are defined in the core module)
+DEFAULT_REGION = core.DEFAULT_REGION
+REGION_HOSTS = core.REGION_HOSTS
+
+# Define the endpoint template under which requests for files on other hosts (e.g. a CDN) are recorded
+CDN_ENDPOINT_TEMPLATE = '/cdn'
+
+# Define the path segments that are followed by a unique identifier in endpoint URIs
+ID_PARENT_SEGMENTS = {'groups', 'items', 'lists', 'pitches', 'requests', 'spots', 'users'}
+
+
+def get_request_with_retries(hs_object, endpoint, return_json=True, verify_ssl=True, fields=None, exclude=None,
+                             stream=False, priority=None):
     """This function performs a GET request and will retry several times if a failure occurs.
 
     :param hs_object: The Highspot object
@@ -26,30 +44,528 @@ def get_request_with_retries(hs_object, endpoint, return_json=True, verify_ssl=T
     :type return_json: bool
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
-    :returns: The JSON data from the response or the raw :py:mod:`requests` response.
+    :param fields: The field(s) to retain in the returned JSON record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned JSON record(s)
+    :type exclude: str, tuple, list, set, None
+    :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+    :type stream: bool
+    :param priority: The priority class used when a request scheduler is enabled (the priority assigned to the
+                     current thread, or ``interactive``, by default)
+    :type priority: str, None
+    :returns: The JSON data from the response, a generator of the records when streaming, or the raw
+              :py:mod:`requests` response.
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+    """
+    if stream and return_json:
+        return stream_records(hs_object, endpoint, verify_ssl=verify_ssl, fields=fields, exclude=exclude,
+                              priority=priority)
+    cache = getattr(hs_object, 'response_cache', None)
+    if return_json and not stream and cache is not None and cache.is_cached_endpoint(get_endpoint_template(endpoint)):
+        # Only the response body is cached so that each caller decodes (and may modify) its own copy of the data
+        content = cache.get(endpoint, lambda: _load_cacheable_content(hs_object, endpoint, verify_ssl, priority))
+        return projection.project_response(json.loads(content), fields, exclude)
+    response = _get_response(hs_object, endpoint, verify_ssl, stream, priority)[0]
+    if return_json:
+        response = projection.project_response(response.json(), fields, exclude)
+    return response
+
+
+def stream_records(hs_object, endpoint, verify_ssl=True, fields=None, exclude=None, chunk_size=65536,
+                   collection_key=projection.COLLECTION_KEY, include_raw=False, priority=None):
+    """This function performs a GET request and yields the records of the response as they are received and decoded.
+
+    .. note:: The request is performed when the first record is requested, and the body is parsed incrementally so
+              only the current chunk and record are held in memory rather than the entire response.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param endpoint: The endpoint URI to query
+    :type endpoint: str
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param fields: The field(s) to retain in the returned records (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned records
+    :type exclude: str, tuple, list, set, None
+    :param chunk_size: The maximum number of bytes read from the response at a time (``65536`` by default)
+    :type chunk_size: int
+    :param collection_key: The key that contains the records within a paged response (``collection`` by default)
+    :type collection_key: str
+    :param include_raw: Determines if each record should be yielded in a tuple with its raw (unprojected) JSON text
+                        (``False`` by default)
+    :type include_raw: bool
+    :param priority: The priority class used when a request scheduler is enabled (the priority assigned to the
+                     current thread, or ``interactive``, by default)
+    :type priority: str, None
+    :returns: A generator of the records (or of tuples with each record and its raw JSON text)
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    fields, exclude = projection.normalize_fields(fields), projection.normalize_fields(exclude)
+    response, transport, endpoint_template = _get_response(hs_object, endpoint, verify_ssl, True, priority)
+    parser, decoded_bytes = json_stream.RecordStreamParser(collection_key, include_raw), 0
+    try:
+        if response.status_code >= 400:
+            # An error payload must not be mistaken for an empty collection (i.e. the end of the data)
+            raise errors.exceptions.APIRequestError(f'The records could not be retrieved and returned a '
+                                                    f'{response.status_code} response.')
+        for chunk in transport.iter_content(response, chunk_size):
+            decoded_bytes += len(chunk)
+            for record in parser.feed(chunk):
+                yield _project_streamed_record(record, fields, exclude, include_raw)
+        for record in parser.close():
+            yield _project_streamed_record(record, fields, exclude, include_raw)
+    finally:
+        response.close()
+        wire_bytes, decoded_bytes = transport.get_transfer_sizes(response, decoded_bytes)
+        hs_object.metrics.record_transfer(endpoint_template, wire_bytes, decoded_bytes)
+
+
+def stream_content(hs_object, endpoint, verify_ssl=True, chunk_size=65536, priority=None):
+    """This function performs a GET request and yields the raw body of the response in chunks as they are received.
+
+    .. note:: The body is never decoded as text, so binary content (e.g. PDF or video files) is yielded unchanged and
+              only the current chunk is held in memory.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param endpoint: The endpoint URI to query
+    :type endpoint: str
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param chunk_size: The maximum number of bytes in each chunk (``65536`` by default)
+    :type chunk_size: int
+    :param priority: The priority class used when a request scheduler is enabled (the priority assigned to the
+                     current thread, or ``interactive``, by default)
+    :type priority: str, None
+    :returns: A generator of the chunks as bytes
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    response, transport, endpoint_template = _get_response(hs_object, endpoint, verify_ssl, True, priority)
+    decoded_bytes = 0
+    try:
+        if response.status_code >= 400:
+            raise errors.exceptions.APIRequestError(f'The content could not be retrieved and returned a '
+                                                    f'{response.status_code} response.')
+        for chunk in transport.iter_content(response, chunk_size):
+            decoded_bytes += len(chunk)
+            yield chunk
+    finally:
+        response.close()
+        wire_bytes, decoded_bytes = transport.get_transfer_sizes(response, decoded_bytes)
+        hs_object.metrics.record_transfer(endpoint_template, wire_bytes, decoded_bytes)
+
+
+def get_file_content(hs_object, url, verify_ssl=True, priority=None):
+    """This function downloads a file (e.g. a thumbnail image) from an API endpoint or from an absolute URL.
+
+    .. note:: The credentials are only sent when the file is hosted by the API, so they are never shared with other
+              hosts (e.g. a content delivery network). Files on other hosts are retried, limited and recorded in the
+              metrics in the same way as API requests under the ``/cdn`` endpoint template.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param url: The endpoint URI or the absolute URL of the file
+    :type url: str
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param priority: The priority class used when a request scheduler is enabled (the priority assigned to the
+                     current thread, or ``interactive``, by default)
+    :type priority: str, None
+    :returns: The file content as bytes
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    if url.startswith(hs_object.base_url):
+        url = url[len(hs_object.base_url):]
+    if url.startswith(('http://', 'https://')):
+        response = _get_url_response(hs_object, url, url, CDN_ENDPOINT_TEMPLATE, None, verify_ssl,
+                                     _priority=priority)[0]
+    else:
+        response = _get_response(hs_object, url, verify_ssl, _priority=priority)[0]
+    if response.status_code >= 400:
+        raise errors.exceptions.APIRequestError(f'The file could not be downloaded and returned a '
+                                                f'{response.status_code} response.')
+    return response.content
+
+
+def get_transport(hs_object):
+    """This function returns the transport (and its connection pool) used by a core object.
+
+    .. note:: The transport is created the first time it is needed using the ``transport_name`` and
+              ``max_connections`` values defined for the core object.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :returns: The transport object (e.g. :py:class:`highspot.transports.RequestsTransport`)
+    """
+    if hs_object.transport is None:
+        with _transport_lock:
+            if hs_object.transport is None:
+                transport = transports.get_transport(hs_object.transport_name, hs_object.max_connections)
+                accept_encoding = transports.get_accept_encoding(transport, hs_object.compression)
+                hs_object.headers = dict(hs_object.headers or {}, **{'Accept-Encoding': accept_encoding})
+                hs_object.transport = transport
+    return hs_object.transport
+
+
+def get_many(hs_object, endpoints, return_json=True, verify_ssl=True, max_workers=None, priority=None):
+    """This function performs GET requests for many endpoints concurrently and returns the results in order.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param endpoints: The endpoint URIs to query
+    :type endpoints: list, tuple
+    :param return_json: Determines if JSON data should be returned
+    :type return_json: bool
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param max_workers: The maximum number of concurrent requests (``10`` by default, or the highest limit of the
+                        adaptive concurrency limiter when it is enabled)
+    :type max_workers: int, None
+    :param priority: The priority class used when a request scheduler is enabled (the priority assigned to the
+                     current thread, or ``interactive``, by default)
+    :type priority: str, None
+    :returns: A list of the JSON data or raw responses in the same order as the endpoints
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    # The priority is resolved here because it is assigned per thread and the requests run on the worker threads
+    priority = priority or scheduler.get_priority()
+    if max_workers is None:
+        # Provide enough workers for the adaptive limiter to raise the concurrency to its highest limit
+        limiter = hs_object.concurrency_limiter
+        max_workers = limiter.max_limit if limiter is not None else 10
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda endpoint: get_request_with_retries(hs_object, endpoint, return_json,
+                                                                           verify_ssl, priority=priority),
+                                 endpoints))
+
+
+def get_base_url(region=None, api_version='0.5', base_url=None):
+    """This function returns the base URL for the API in a given region.
+
+    :param region: The Highspot region (e.g. ``us`` or ``su2``) which is ``su2`` by default
+    :type region: str, None
+    :param api_version: The version of the API (``0.5`` by default)
+    :type api_version: str
+    :param base_url: An explicit host (e.g. ``https://api.highspot.com``) which takes precedence over the region
+    :type base_url: str, None
+    :returns: The base URL including the API version
+    :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    if base_url:
+        base_url = base_url.rstrip('/')
+        return base_url if re.search(r'/v\d+(\.\d+)*$', base_url) else f'{base_url}/v{api_version}'
+    region = region or DEFAULT_REGION
+    if region not in REGION_HOSTS:
+        raise errors.exceptions.InvalidFieldError(f"The value '{region}' is not a valid Highspot region.")
+    return f'{REGION_HOSTS[region]}/v{api_version}'
+
+
+def discover_region(auth, api_version='0.5', regions=None, verify_ssl=True, timeout=10, transport=None):
+    """This function identifies the region whose API host accepts the provided credentials.
+
+    .. note:: The hosts are queried through the given transport (e.g. the transport of a core object, which may be a
+              :py:class:`highspot.transports.ReplayTransport` object) or through a temporary HTTP/1.1 transport.
+
+    :param auth: The username and password to use for authentication
+    :type auth: tuple
+    :param api_version: The version of the API (``0.5`` by default)
+    :type api_version: str
+    :param regions: The regions to check in order (all regions in :py:data:`highspot.api.REGION_HOSTS` by default)
+    :type regions: list, tuple, None
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param timeout: The number of seconds to wait for each host to respond (``10`` by default)
+    :type timeout: int, float
+    :param transport: The transport through which the hosts are queried (a temporary HTTP/1.1 transport by default)
+    :type transport: class[highspot.transports.BaseTransport], None
+    :returns: The name of the region
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+    """
+    regions = regions or [DEFAULT_REGION] + [region for region in REGION_HOSTS if region != DEFAULT_REGION]
+    query_transport = transport or transports.get_transport(transports.HTTP1, max_connections=1)
+    try:
+        for region in regions:
+            query_url = f'{get_base_url(region, api_version)}/me'
+            try:
+                response = query_transport.get(query_url, auth=auth, verify=verify_ssl, timeout=timeout)
+            except Exception as exc_msg:
+                logger.debug(f"The '{region}' region could not be reached: {type(exc_msg).__name__}: {exc_msg}",
+                             extra={'endpoint': '/me', 'region': region})
+                continue
+            if response.status_code == 200:
+                return region
+    finally:
+        if transport is None:
+            query_transport.close()
+    raise errors.exceptions.APIConnectionError('The credentials were not accepted by the API host in any region.')
+
+
+def get_endpoint_template(endpoint):
+    """This function returns the template for an endpoint URI with the identifiers replaced by placeholders.
+
+    .. note:: The query string is removed, meaning that ``/items/abc123/content?format=text/csv`` returns the
+              ``/items/{id}/content`` template.
+
+    :param endpoint: The endpoint URI
+    :type endpoint: str
+    :returns: The endpoint template as a string
+    """
+    segments = endpoint.split('?', 1)[0].strip('/').split('/')
+    template_segments = []
+    for index, segment in enumerate(segments):
+        parent_segment = segments[index - 1] if index else None
+        if parent_segment in ID_PARENT_SEGMENTS:
+            template_segments.append('{id}')
+        elif parent_segment == 'properties':
+            template_segments.append('{property_name}')
+        else:
+            template_segments.append(segment)
+    return '/' + '/'.join(template_segments)
+
+
+def add_paging_params(endpoint, start=0, limit=100):
+    """This function appends the ``start`` and ``limit`` query parameters to an endpoint URI.
+
+    :param endpoint: The endpoint URI to which the paging parameters should be added
+    :type endpoint: str
+    :param start: The start position of the paged request (``0`` by default)
+    :type start: int, str
+    :param limit: The maximum number of records returned (``100`` by default)
+    :type limit: int, str
+    :returns: The endpoint URI with the paging parameters
+    """
+    separator = '&' if '?' in endpoint else '?'
+    return f'{endpoint}{separator}start={start}&limit={limit}'
+
+
+def _project_streamed_record(_record, _fields, _exclude, _include_raw):
+    """This function applies a projection to a streamed record while retaining its raw JSON text (if included).
+
+    :param _record: The decoded record or a tuple with the decoded record and its raw JSON text
+    :param _fields: The normalized field(s) to retain
+    :type _fields: tuple, None
+    :param _exclude: The normalized field(s) to remove
+    :type _exclude: tuple, None
+    :param _include_raw: Indicates that the record is a tuple with its raw JSON text
+    :type _include_raw: bool
+    :returns: The projected record (or a tuple with the projected record and its raw JSON text)
+    """
+    if _include_raw:
+        return projection.project_record(_record[0], _fields, _exclude), _record[1]
+    return projection.project_record(_record, _fields, _exclude)
+
+
+def _get_response(_hs_object, _endpoint, _verify_ssl=True, _stream=False, _priority=None):
+    """This function performs a GET request with retries and returns the response along with the transport used.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _endpoint: The endpoint URI to query
+    :type _endpoint: str
+    :param _verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type _verify_ssl: bool
+    :param _stream: Determines if the body should be left unread for streaming (``False`` by default)
+    :type _stream: bool
+    :param _priority: The priority class used when a request scheduler is enabled (the priority assigned to the
+                      current thread, or ``interactive``, by default)
+    :type _priority: str, None
+    :returns: A tuple with the response, the transport and the endpoint template
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     # Construct the query URL
-    endpoint = f'/{endpoint}' if not endpoint.startswith('/') else endpoint
-    query_url = hs_object.base_url + endpoint
+    _endpoint = f'/{_endpoint}' if not _endpoint.startswith('/') else _endpoint
+    _query_url = _hs_object.base_url + _endpoint
+    return _get_url_response(_hs_object, _query_url, _endpoint, get_endpoint_template(_endpoint), _hs_object.auth,
+                             _verify_ssl, _stream, _priority)
+
+
+def _get_url_response(_hs_object, _query_url, _endpoint, _endpoint_template, _auth, _verify_ssl=True, _stream=False,
+                      _priority=None):
+    """This function performs a GET request for a full URL with retries and returns the response and the transport.
+
+    .. note:: The request is admitted by the scheduler, concurrency limiter and rate limiter, and each attempt is
+              recorded with the metrics and the circuit breaker of the endpoint template, whether the URL is hosted
+              by the API or by another host (e.g. a content delivery network).
 
-    # Perform the API call
-    retries, response = 0, None
-    while retries <= 5:
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _query_url: The full URL to query
+    :type _query_url: str
+    :param _endpoint: The endpoint URI (or URL) that is reported in the log records
+    :type _endpoint: str
+    :param _endpoint_template: The endpoint template under which the attempts are recorded
+    :type _endpoint_template: str
+    :param _auth: The username and password sent with the request (or ``None`` to send no credentials)
+    :type _auth: tuple, None
+    :param _verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type _verify_ssl: bool
+    :param _stream: Determines if the body should be left unread for streaming (``False`` by default)
+    :type _stream: bool
+    :param _priority: The priority class used when a request scheduler is enabled (the priority assigned to the
+                      current thread, or ``interactive``, by default)
+    :type _priority: str, None
+    :returns: A tuple with the response, the transport and the endpoint template
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+    """
+    _breaker = _hs_object.circuit_breakers.get_breaker(_endpoint_template) if _hs_object.circuit_breakers else None
+    _transport, _retries, _response = get_transport(_hs_object), 0, None
+    _priority = _priority or scheduler.get_priority()
+    while _retries <= 5:
+        if _breaker is not None:
+            _breaker.before_request()
+        _acquire_request_slot(_hs_object, _priority)
+        _start_time, _failed, _status_code = time.perf_counter(), True, None
         try:
-            response = requests.get(query_url, auth=hs_object.auth, verify=verify_ssl)
+            _response = _transport.get(_query_url, auth=_auth, verify=_verify_ssl, headers=_hs_object.headers,
+                                       stream=_stream)
+            _status_code = _response.status_code
+            _failed = _status_code >= 500
+            if not _stream:
+                _record_transfer(_hs_object, _transport, _endpoint_template, _response)
+            _report_completed_attempt(_response, 'get', _retries, _endpoint, time.perf_counter() - _start_time)
             break
-        except Exception as exc_msg:
-            _report_failed_attempt(exc_msg, 'get', retries)
-            retries += 1
-    if retries == 6:
-        _raise_exception_for_repeated_timeouts()
-    if return_json:
-        response = response.json()
-    return response
+        except Exception as _exc_msg:
+            _report_failed_attempt(_exc_msg, 'get', _retries, _endpoint, time.perf_counter() - _start_time)
+            _retries += 1
+        finally:
+            _latency = time.perf_counter() - _start_time
+            _record_attempt(_hs_object, _endpoint_template, _breaker, _latency, _failed)
+            _release_request_slot(_hs_object, _latency, _status_code, _failed)
+    if _retries == 6:
+        _raise_exception_for_repeated_timeouts(_endpoint)
+    return _response, _transport, _endpoint_template
+
+
+def _load_cacheable_content(_hs_object, _endpoint, _verify_ssl, _priority):
+    """This function performs a GET request for the response cache and returns the body and whether it may be cached.
+
+    .. note:: Only successful responses (along with ``404`` and ``410`` responses, which indicate a deleted object)
+              are cached so that a transient error is not served until the entry expires.
+    """
+    _response = _get_response(_hs_object, _endpoint, _verify_ssl, False, _priority)[0]
+    return _response.content, _response.status_code < 400 or _response.status_code in (404, 410)
+
+
+def _acquire_request_slot(_hs_object, _priority):
+    """This function blocks until the scheduler, concurrency limiter and rate limiter (if defined) admit a request.
+
+    .. note:: The scheduler takes the rate limit tokens itself so that they are granted in priority order, and it
+              applies the current limit of the adaptive concurrency limiter.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _priority: The priority class of the request
+    :type _priority: str
+    :returns: None
+    """
+    if _hs_object.scheduler is not None:
+        _hs_object.scheduler.acquire(_priority)
+        return
+    if _hs_object.concurrency_limiter is not None:
+        _hs_object.concurrency_limiter.acquire()
+    _wait_for_rate_limiter(_hs_object)
+
+
+def _release_request_slot(_hs_object, _latency, _status_code, _failed):
+    """This function reports the outcome of an attempt to the concurrency limiter and frees its slot.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _latency: The number of seconds that elapsed during the attempt
+    :type _latency: float
+    :param _status_code: The status code of the response (``None`` if no response was received)
+    :type _status_code: int, None
+    :param _failed: Indicates that the attempt failed
+    :type _failed: bool
+    :returns: None
+    """
+    _scheduler, _limiter = _hs_object.scheduler, _hs_object.concurrency_limiter
+    if _limiter is not None:
+        _in_flight = _scheduler.in_flight if _scheduler is not None else None
+        _limiter.record_response(_latency, _status_code, _failed, _in_flight)
+    if _scheduler is not None:
+        _scheduler.release()
+    elif _limiter is not None:
+        _limiter.release()
+
 
+def _wait_for_rate_limiter(_hs_object):
+    """This function blocks until the rate limiter of the core object (if defined) permits another request.
 
-def _report_failed_attempt(_exc_msg, _request_type, _retries):
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :returns: None
+    """
+    if _hs_object.rate_limiter is not None:
+        _waited = _hs_object.rate_limiter.acquire()
+        if _waited:
+            _hs_object.metrics.increment('rate_limit_wait', amount=_waited)
+
+
+def _record_transfer(_hs_object, _transport, _endpoint_template, _response):
+    """This function records the compressed and decompressed size of a response body with the metrics.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _transport: The transport that performed the request
+    :param _endpoint_template: The endpoint template that was queried
+    :type _endpoint_template: str
+    :param _response: The response returned by the transport
+    :returns: None
+    """
+    _wire_bytes, _decoded_bytes = _transport.get_transfer_sizes(_response)
+    _hs_object.metrics.record_transfer(_endpoint_template, _wire_bytes, _decoded_bytes)
+
+
+def _record_attempt(_hs_object, _endpoint_template, _breaker, _latency, _failed):
+    """This function records the outcome of a request attempt with the metrics, circuit breaker and profiler.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _endpoint_template: The endpoint template that was queried
+    :type _endpoint_template: str
+    :param _breaker: The circuit breaker for the endpoint template (if enabled)
+    :type _breaker: class[highspot.utils.circuit_breaker.CircuitBreaker], None
+    :param _latency: The number of seconds that elapsed during the attempt
+    :type _latency: float
+    :param _failed: Indicates that the attempt failed due to an exception or a server error
+    :type _failed: bool
+    :returns: None
+    """
+    _hs_object.metrics.record_request(_endpoint_template, _latency, _failed)
+    if _breaker is not None:
+        _breaker.record_result(not _failed)
+    if _hs_object.profiler is not None:
+        _hs_object.profiler.add_network_time(_latency)
+
+
+def _report_completed_attempt(_response, _request_type, _retries, _endpoint=None, _latency=None):
+    """This function logs a structured debug record for an API call that returned a response.
+
+    :param _response: The response returned by the API call
+    :param _request_type: The type of API request (e.g. ``post``, ``put`` or ``get``)
+    :type _request_type: str
+    :param _retries: The attempt number for the API request
+    :type _retries: int
+    :param _endpoint: The endpoint URI that was queried
+    :type _endpoint: str, None
+    :param _latency: The number of seconds that elapsed during the attempt
+    :type _latency: float, None
+    :returns: None
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"The {_request_type.upper()} request returned a {_response.status_code} response.",
+                     extra=_get_log_fields(_request_type, _retries, _endpoint, _latency, _response.status_code))
+
+
+def _report_failed_attempt(_exc_msg, _request_type, _retries, _endpoint=None, _latency=None):
     """This function reports a failed API call that will be retried.
 
     :param _exc_msg: The exception that was raised within a try/except clause
@@ -57,23 +573,64 @@ def _report_failed_attempt(_exc_msg, _request_type, _retries):
     :type _request_type: str
     :param _retries: The attempt number for the API request
     :type _retries: int
+    :param _endpoint: The endpoint URI that was queried
+    :type _endpoint: str, None
+    :param _latency: The number of seconds that elapsed during the attempt
+    :type _latency: float, None
     :returns: None
     """
     _exc_name = type(_exc_msg).__name__
+    if isinstance(_exc_msg, errors.exceptions.HighspotError):
+        # Errors raised by the library itself (e.g. by a replay transport) are not wrapped
+        raise _exc_msg
     if 'connect' not in _exc_name.lower():
         raise RuntimeError(f"{_exc_name}: {_exc_msg}")
     _current_attempt = f"(Attempt {_retries} of 5)"
     _error_msg = f"The {_request_type.upper()} request has failed with the following exception: " + \
                  f"{_exc_name}: {_exc_msg} {_current_attempt}"
-    errors.handlers.eprint(f"{_error_msg}\n{_exc_name}: {_exc_msg}\n")
+    logger.warning(_error_msg, extra=_get_log_fields(_request_type, _retries, _endpoint, _latency,
+                                                     _exception=_exc_name))
+
+
+def _get_log_fields(_request_type, _retries, _endpoint, _latency, _status_code=None, _exception=None):
+    """This function returns the structured fields that are attached to request-path log records.
+
+    :param _request_type: The type of API request (e.g. ``post``, ``put`` or ``get``)
+    :type _request_type: str
+    :param _retries: The attempt number for the API request
+    :type _retries: int
+    :param _endpoint: The endpoint URI that was queried
+    :type _endpoint: str, None
+    :param _latency: The number of seconds that elapsed during the attempt
+    :type _latency: float, None
+    :param _status_code: The HTTP status code of the response (if applicable)
+    :type _status_code: int, None
+    :param _exception: The name of the exception that was raised (if applicable)
+    :type _exception: str, None
+    :returns: A dictionary with the structured log fields
+    """
+    _fields = {
+        'method': _request_type.upper(),
+        'endpoint': _endpoint,
+        'attempt': _retries,
+        'latency': round(_latency, 6) if _latency is not None else None,
+    }
+    if _status_code is not None:
+        _fields['status_code'] = _status_code
+    if _exception:
+        _fields['error'] = _exception
+    return _fields
 
 
-def _raise_exception_for_repeated_timeouts():
+def _raise_exception_for_repeated_timeouts(_endpoint=None):
     """This function raises an exception when all API attempts (including) retries resulted in a timeout.
 
+    :param _endpoint: The endpoint URI that was queried
+    :type _endpoint: str, None
     :returns: None
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     _failure_msg = "The script was unable to complete successfully after five consecutive API timeouts. " + \
                    "Please run the script again or contact Highspot for further assistance."
+    logger.error(_failure_msg, extra={'endpoint': _endpoint, 'attempt': 5})
     raise errors.exceptions.APIConnectionError(_failure_msg)
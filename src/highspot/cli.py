@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.cli
+:Synopsis:          Defines the ``highspot`` command-line interface for bulk exports, downloads and reports
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import csv
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from . import columnar, coordinator, core, exports, items, pipeline, request
+from .errors import exceptions
+from .utils import content_cache, scheduler
+
+# Define the endpoints and default filters of the resources that can be exported
+EXPORT_RESOURCES = {
+    'users': ('/users', {}),
+    'groups': ('/groups', {}),
+    'items': ('/items', {}),
+    'pitches': ('/pitches', {'sortby': 'recent_activity'}),
+}
+
+# Define the supported output formats for exports
+CSV = 'csv'
+COLUMNAR = 'columnar'
+OUTPUT_FORMATS = (exports.JSON_LINES, exports.JSON_ARRAY, CSV, COLUMNAR)
+
+# Define the suffix of the intermediate file used when an export is converted to another format
+RECORDS_SUFFIX = '.records.jsonl'
+
+
+def main(argv=None):
+    """This function runs the ``highspot`` command-line interface.
+
+    :param argv: The command-line arguments (``sys.argv[1:]`` by default)
+    :type argv: list, None
+    :returns: The exit status (``0`` when successful)
+    """
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if not args.username or not args.password:
+        parser.error('The API key and secret must be provided with --username and --password or the '
+                     'HIGHSPOT_USERNAME and HIGHSPOT_PASSWORD environment variables.')
+    hs = get_client(args)
+    start_time = time.perf_counter()
+    try:
+        counts = args.command_function(hs, args)
+    except (exceptions.HighspotError, TimeoutError) as exc_msg:
+        print(f'Error: {exc_msg}', file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print('Interrupted (run the command again to resume)', file=sys.stderr)
+        return 130
+    finally:
+        hs.close()
+    if not args.quiet:
+        print_stats(hs, counts, time.perf_counter() - start_time)
+    return 0
+
+
+def get_parser():
+    """This function returns the argument parser for the command-line interface.
+
+    :returns: The :py:class:`argparse.ArgumentParser` object
+    """
+    parser = argparse.ArgumentParser(prog='highspot', description='Perform bulk operations against the Highspot API')
+    parser.add_argument('--username', default=os.environ.get('HIGHSPOT_USERNAME'),
+                        help='the API key (defaults to the HIGHSPOT_USERNAME environment variable)')
+    parser.add_argument('--password', default=os.environ.get('HIGHSPOT_PASSWORD'),
+                        help='the API secret (defaults to the HIGHSPOT_PASSWORD environment variable)')
+    parser.add_argument('--region', default=None, help='the region of the tenant (e.g. us or su2, or auto)')
+    parser.add_argument('--base-url', default=None, help='an explicit API host that takes precedence over the region')
+    parser.add_argument('--concurrency', type=int, default=10, help='the number of concurrent requests (default: 10)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='tune the number of concurrent requests from the observed latency and throttling')
+    parser.add_argument('--rate-limit', type=float, default=None, help='the maximum number of requests per second')
+    parser.add_argument('--rate-limit-burst', type=int, default=None, help='the number of requests allowed at once')
+    parser.add_argument('--transport', choices=('http1', 'http2'), default='http1')
+    parser.add_argument('--quiet', action='store_true', help='do not print the throughput and latency statistics')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    export_parser = subparsers.add_parser('export', help='export every user, group, item or pitch to a file')
+    export_parser.add_argument('resource', choices=sorted(EXPORT_RESOURCES))
+    export_parser.add_argument('output', help='the path to the output file')
+    export_parser.add_argument('--format', dest='output_format', choices=OUTPUT_FORMATS, default=exports.JSON_LINES)
+    export_parser.add_argument('--spot-id', help='the Spot whose items are exported (required for items)')
+    export_parser.add_argument('--list-id', help='a list by which to filter the exported items')
+    export_parser.add_argument('--limit', type=int, default=100, help='the number of records per page (default: 100)')
+    export_parser.add_argument('--fields', help='a comma-separated list of the fields to retain')
+    export_parser.add_argument('--exclude', help='a comma-separated list of the fields to remove')
+    _add_resume_arguments(export_parser)
+    export_parser.set_defaults(command_function=run_export)
+
+    download_parser = subparsers.add_parser('download', help='download the content of items to a directory')
+    download_parser.add_argument('item_ids', nargs='*', help='the items to download')
+    download_parser.add_argument('--spot-id', help='download every item in a Spot')
+    download_parser.add_argument('--list-id', help='a list by which to filter the items in the Spot')
+    download_parser.add_argument('--output-dir', default='.', help='the directory for the files (default: .)')
+    download_parser.add_argument('--hash', dest='hash_algorithm', default=None,
+                                 help='a hashlib algorithm with which to hash each file (e.g. sha256)')
+    _add_cache_arguments(download_parser)
+    _add_resume_arguments(download_parser)
+    download_parser.set_defaults(command_function=run_download, report=False, extension='')
+
+    report_parser = subparsers.add_parser('report', help='download the CSV reports of items to a directory')
+    report_parser.add_argument('item_ids', nargs='+', help='the items whose reports are downloaded')
+    report_parser.add_argument('--output-dir', default='.', help='the directory for the reports (default: .)')
+    _add_cache_arguments(report_parser)
+    _add_resume_arguments(report_parser)
+    report_parser.set_defaults(command_function=run_download, report=True, extension='.csv', spot_id=None,
+                               hash_algorithm=None)
+
+    shard_parser = subparsers.add_parser('shard-export',
+                                         help='work on a full export that is divided between hosts in shards')
+    shard_parser.add_argument('work_dir', help='the directory shared by every host for the queue and the shard files')
+    shard_parser.add_argument('--output-dir', default=None, help='the directory for the merged files once finished')
+    shard_parser.add_argument('--spot-id', dest='spot_ids', action='append', default=None,
+                              help='a Spot whose items are exported (may be repeated, every Spot by default)')
+    shard_parser.add_argument('--no-users', dest='include_users', action='store_false', help='do not export users')
+    shard_parser.add_argument('--no-properties', dest='include_properties', action='store_false',
+                              help='do not export the properties of each item')
+    shard_parser.add_argument('--content', dest='include_content', action='store_true',
+                              help='download the content of each item')
+    shard_parser.add_argument('--limit', type=int, default=100, help='the number of records per page (default: 100)')
+    shard_parser.add_argument('--workers', type=int, default=None,
+                              help='the number of workers on this host (default: the --concurrency value)')
+    shard_parser.add_argument('--lease', type=float, default=300.0,
+                              help='the number of seconds after which an abandoned shard is reassigned (default: 300)')
+    shard_parser.set_defaults(command_function=run_shard_export)
+
+    wait_parser = subparsers.add_parser('wait', help='wait for asynchronous requests to finish')
+    wait_parser.add_argument('request_ids', nargs='+', help='the asynchronous requests to wait for')
+    wait_parser.add_argument('--interval', type=float, default=2.0, help='the initial polling interval in seconds')
+    wait_parser.add_argument('--timeout', type=float, default=300.0, help='the maximum wait in seconds')
+    wait_parser.add_argument('--no-result', dest='include_result', action='store_false',
+                             help='do not retrieve the result of each request')
+    wait_parser.set_defaults(command_function=run_wait)
+    return parser
+
+
+def get_client(args):
+    """This function instantiates the core object configured with the connection arguments.
+
+    :param args: The parsed command-line arguments
+    :type args: class[argparse.Namespace]
+    :returns: The core :py:class:`highspot.Highspot` object
+    """
+    return core.Highspot(username=args.username, password=args.password, region=args.region,
+                         base_url=args.base_url, max_connections=args.concurrency, rate_limit=args.rate_limit,
+                         rate_limit_burst=args.rate_limit_burst, transport=args.transport,
+                         adaptive_concurrency=args.adaptive)
+
+
+def run_export(hs_object, args):
+    """This function exports every record of a resource to a file, resuming from the checkpoint of an earlier run.
+
+    .. note:: The ``csv`` and ``columnar`` formats are exported to an intermediate JSON Lines file first, so they
+              can be resumed in the same way, and the intermediate file is removed once it has been converted.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param args: The parsed command-line arguments
+    :type args: class[argparse.Namespace]
+    :returns: A dictionary with the number of exported ``records``
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+             :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+    """
+    endpoint, filters = EXPORT_RESOURCES[args.resource]
+    filters = dict(filters)
+    if args.resource == 'items':
+        if not args.spot_id:
+            raise exceptions.MissingRequiredDataError(param='--spot-id')
+        filters.update({'spot': args.spot_id, 'list': args.list_id})
+    converted = args.output_format in (CSV, COLUMNAR)
+    output_path = f'{args.output}{RECORDS_SUFFIX}' if converted else args.output
+    job = exports.ExportJob(hs_object, endpoint, output_path, filters=filters, limit=args.limit, fields=args.fields,
+                            exclude=args.exclude,
+                            output_format=exports.JSON_LINES if converted else args.output_format)
+    record_count = job.run(resume=args.resume)
+    if args.output_format == CSV:
+        _write_csv(output_path, args.output)
+    elif args.output_format == COLUMNAR:
+        columnar.write_store(args.output, _iter_json_lines(output_path), resource=args.resource,
+                             spot_id=args.spot_id)
+    if converted:
+        os.remove(output_path)
+    return {'records': record_count}
+
+
+def run_download(hs_object, args):
+    """This function downloads the content (or the CSV reports) of items concurrently to a directory.
+
+    .. note:: A line of JSON is printed for each file with the item ID, the path, the size, the hash (when requested)
+              and whether it was served from the cache or skipped because it had already been downloaded.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param args: The parsed command-line arguments
+    :type args: class[argparse.Namespace]
+    :returns: A dictionary with the number of downloaded ``files``, ``skipped`` files and downloaded ``bytes``
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+    """
+    item_ids = list(args.item_ids)
+    if args.spot_id:
+        filters = {'spot': args.spot_id, 'list': args.list_id}
+        endpoint = '/items?' + urllib.parse.urlencode({key: value for key, value in filters.items() if value})
+        item_ids.extend(record['id'] for record in pipeline.iter_records(hs_object, endpoint) if 'id' in record)
+    if not item_ids:
+        raise exceptions.MissingRequiredDataError(param='item_ids')
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache = content_cache.ContentCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache_dir else None
+    counts = {'files': 0, 'skipped': 0, 'bytes': 0}
+    with ThreadPoolExecutor(max_workers=args.concurrency, initializer=scheduler.set_priority,
+                            initargs=(scheduler.BATCH,)) as executor:
+        for outcome in executor.map(lambda item_id: _download_item(hs_object, item_id, args, cache), item_ids):
+            print(json.dumps(outcome, separators=(',', ':')), flush=True)
+            counts['skipped' if outcome['skipped'] else 'files'] += 1
+            counts['bytes'] += 0 if outcome['skipped'] else outcome['size']
+    return counts
+
+
+def run_wait(hs_object, args):
+    """This function waits for asynchronous requests to finish and prints a line of JSON with the outcome of each.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param args: The parsed command-line arguments
+    :type args: class[argparse.Namespace]
+    :returns: A dictionary with the number of ``finished requests``
+    :raises: :py:exc:`TimeoutError`,
+             :py:exc:`highspot.errors.exceptions.APIConnectionError`
+    """
+    def _wait(_request_id):
+        return request.wait_for_request(hs_object, _request_id, interval=args.interval, timeout=args.timeout,
+                                        include_result=args.include_result)
+
+    with ThreadPoolExecutor(max_workers=min(args.concurrency, len(args.request_ids))) as executor:
+        for request_id, outcome in zip(args.request_ids, executor.map(_wait, args.request_ids)):
+            print(json.dumps(dict(outcome, request_id=request_id), separators=(',', ':')), flush=True)
+    return {'finished requests': len(args.request_ids)}
+
+
+def run_shard_export(hs_object, args):
+    """This function works on a sharded export (planning it first if needed) and merges the output once finished.
+
+    .. note:: The command can be run on several hosts with the same work directory (e.g. on a network filesystem),
+              and the options given to the first run are used by every host.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param args: The parsed command-line arguments
+    :type args: class[argparse.Namespace]
+    :returns: A dictionary with the number of completed ``shards`` and the merged record counts (if merged)
+    :raises: :py:exc:`highspot.errors.exceptions.IncompleteExportError`
+    """
+    outcome = coordinator.run_sharded_export(hs_object, args.work_dir, output_dir=args.output_dir,
+                                             spot_ids=args.spot_ids, include_users=args.include_users,
+                                             include_properties=args.include_properties,
+                                             include_content=args.include_content, limit=args.limit,
+                                             worker_count=args.workers or args.concurrency, lease_seconds=args.lease)
+    counts = {'shards': outcome['progress']['shards'][coordinator.DONE]}
+    counts.update(outcome['merged'] or {})
+    return counts
+
+
+def print_stats(hs_object, counts, elapsed, stream=None):
+    """This function prints the throughput and latency statistics of a command.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param counts: Dictionary with the names and totals of the processed units (e.g. ``records`` or ``files``)
+    :type counts: dict
+    :param elapsed: The number of seconds that the command took
+    :type elapsed: float
+    :param stream: The stream to which the statistics are written (``sys.stderr`` by default)
+    :returns: None
+    """
+    stream = stream or sys.stderr
+    endpoints = hs_object.get_metrics()['endpoints']
+    request_count = sum(metrics['requests'] for metrics in endpoints.values())
+    failure_count = sum(metrics['failures'] for metrics in endpoints.values())
+    total_latency = sum(metrics['total_latency'] for metrics in endpoints.values())
+    wire_bytes = sum(metrics['wire_bytes'] for metrics in endpoints.values())
+    elapsed = max(elapsed, 1e-9)
+    print(f'Completed in {elapsed:.2f} s', file=stream)
+    for name, total in counts.items():
+        print(f'  {name}: {total} ({total / elapsed:.1f}/s)', file=stream)
+    print(f'  requests: {request_count} ({request_count / elapsed:.1f}/s, {failure_count} failed)', file=stream)
+    if request_count:
+        print(f'  average latency: {total_latency / request_count * 1000:.1f} ms', file=stream)
+        print(f'  transferred: {wire_bytes / 1048576:.2f} MB ({wire_bytes / 1048576 / elapsed:.2f} MB/s)', file=stream)
+    for endpoint_template, metrics in sorted(endpoints.items()):
+        print(f"  {endpoint_template}: {metrics['requests']} requests, average "
+              f"{metrics['average_latency'] * 1000:.1f} ms, max {metrics['max_latency'] * 1000:.1f} ms", file=stream)
+
+
+def _add_resume_arguments(_parser):
+    """This function adds the arguments that determine if an earlier run is resumed to a subcommand parser.
+
+    :param _parser: The subcommand parser
+    :type _parser: class[argparse.ArgumentParser]
+    :returns: None
+    """
+    _parser.add_argument('--resume', dest='resume', action='store_true', default=True,
+                         help='resume from the files and checkpoints of an earlier run (default)')
+    _parser.add_argument('--no-resume', dest='resume', action='store_false', help='start again from the beginning')
+
+
+def _add_cache_arguments(_parser):
+    """This function adds the arguments that configure the local content cache to a subcommand parser.
+
+    :param _parser: The subcommand parser
+    :type _parser: class[argparse.ArgumentParser]
+    :returns: None
+    """
+    _parser.add_argument('--cache-dir', default=None,
+                         help='a directory in which downloaded content is cached and shared between runs')
+    _parser.add_argument('--cache-size', type=int, default=content_cache.DEFAULT_MAX_SIZE // (1024 * 1024),
+                         help='the maximum size of the cache in MB (default: 256)')
+
+
+def _download_item(_hs_object, _item_id, _args, _cache=None):
+    """This function downloads the content (or the CSV report) of an item to the output directory.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _item_id: The unique identifier for the item
+    :type _item_id: str
+    :param _args: The parsed command-line arguments
+    :type _args: class[argparse.Namespace]
+    :param _cache: The local content cache (if enabled), from which the content is downloaded again if its cached
+                   file has been evicted
+    :type _cache: class[highspot.utils.content_cache.ContentCache], None
+    :returns: A dictionary with the outcome of the download
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    _file_path = os.path.join(_args.output_dir, f'{_item_id}{_args.extension}')
+    _outcome = {'item_id': _item_id, 'path': _file_path, 'cached': False, 'skipped': False}
+    if _args.resume and os.path.exists(_file_path):
+        return dict(_outcome, size=os.path.getsize(_file_path), skipped=True)
+    if _cache is None:
+        _result = items.download_item_content(_hs_object, _item_id, _file_path, report=_args.report,
+                                              hash_algorithm=_args.hash_algorithm)
+        return dict(_outcome, **_result)
+
+    # The cache is addressed by the SHA-256 digest of the content, so other hashes are calculated separately
+    _cache_key = f"{'report' if _args.report else 'content'}:{_item_id}"
+    _temp_path = f'{_file_path}.part'
+    _digests = _cache.get_alias(_cache_key, pin=True)
+    if _digests:
+        # The file is pinned while it is copied, but it may still have been removed by another process
+        try:
+            _cached_path = _cache.get_path(_digests[0])
+            if _cached_path is not None:
+                shutil.copyfile(_cached_path, _temp_path)
+                _outcome['cached'] = True
+        except FileNotFoundError:
+            pass
+        finally:
+            _cache.unpin(_digests)
+    if _outcome['cached']:
+        os.replace(_temp_path, _file_path)
+    else:
+        _content = items.get_item_content_bytes(_hs_object, _item_id, report=_args.report)
+        _cache.set_alias(_cache_key, [_cache.put(_content, extension=_args.extension)[0]])
+        with open(_temp_path, 'wb') as _content_file:
+            _content_file.write(_content)
+        os.replace(_temp_path, _file_path)
+    _outcome['size'] = os.path.getsize(_file_path)
+    _outcome['hash'] = None
+    if _args.hash_algorithm:
+        with open(_file_path, 'rb') as _content_file:
+            _outcome['hash'] = _get_file_hash(_content_file, _args.hash_algorithm)
+    return _outcome
+
+
+def _get_file_hash(_file, _hash_algorithm):
+    """This function returns the hexadecimal digest of a file object using a :py:mod:`hashlib` algorithm.
+
+    :param _file: The file object opened in binary mode
+    :param _hash_algorithm: The name of the :py:mod:`hashlib` algorithm
+    :type _hash_algorithm: str
+    :returns: The hexadecimal digest
+    """
+    _hash = hashlib.new(_hash_algorithm)
+    for _chunk in iter(lambda: _file.read(1024 * 1024), b''):
+        _hash.update(_chunk)
+    return _hash.hexdigest()
+
+
+def _iter_json_lines(_file_path):
+    """This function yields the records of a JSON Lines file.
+
+    :param _file_path: The path to the JSON Lines file
+    :type _file_path: str
+    :returns: A generator of the records
+    """
+    with open(_file_path, 'r', encoding='utf-8') as _records_file:
+        for _line in _records_file:
+            if _line.strip():
+                yield json.loads(_line)
+
+
+def _write_csv(_records_path, _output_path):
+    """This function converts a JSON Lines file of records into a CSV file with the nested fields flattened.
+
+    .. note:: The records are read twice so that the header includes every field without holding the records in
+              memory.
+
+    :param _records_path: The path to the JSON Lines file
+    :type _records_path: str
+    :param _output_path: The path to the CSV file, which is only replaced once it is complete
+    :type _output_path: str
+    :returns: None
+    """
+    _fieldnames = {}
+    for _record in _iter_json_lines(_records_path):
+        _fieldnames.update(dict.fromkeys(pipeline.flatten_record(_record)))
+    _temp_path = f'{_output_path}.tmp'
+    with open(_temp_path, 'w', encoding='utf-8', newline='') as _csv_file:
+        _writer = csv.DictWriter(_csv_file, fieldnames=list(_fieldnames))
+        _writer.writeheader()
+        for _record in _iter_json_lines(_records_path):
+            _writer.writerow(pipeline.flatten_record(_record))
+    os.replace(_temp_path, _output_path)
@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.columnar
+:Synopsis:          Defines memory-mapped columnar stores of exported records that many processes can share read-only
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import array
+import struct
+
+from . import pipeline, snapshots
+from .errors import exceptions
+from .utils import log_utils, projection
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the file signature, the version of the layout and the fixed-size header that precedes the directory
+MAGIC = b'HSCOLUMN'
+STORE_VERSION = 1
+HEADER = struct.Struct('<8sHHIQ')
+
+# Define the byte order flags stored in the header, as the offset and index arrays use the native byte order
+BYTE_ORDERS = {'little': 1, 'big': 2}
+
+# Define the index that marks a field which is missing from a record
+NULL_INDEX = 0xFFFFFFFF
+
+# Define the tags that precede each value in a string table to identify how it is decoded
+STRING_TAG = b's'
+JSON_TAG = b'j'
+
+# Define the alignment of each section so that the arrays can be cast without copying
+ALIGNMENT = 8
+
+
+def export_store(hs_object, resource, file_path, spot_id=None, limit=100, fields=None, exclude=None, id_field='id'):
+    """This function retrieves every record for a resource and writes them to a memory-mapped columnar store.
+
+    .. note:: The store can then be opened by any number of processes with the ``open_store`` function, which maps
+              the file read-only so the operating system shares a single copy of it between the processes.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param resource: The resource to export (``users``, ``groups`` or ``items``)
+    :type resource: str
+    :param file_path: The path to the store file, which is only replaced once the export is complete
+    :type file_path: str
+    :param spot_id: The unique identifier for the Spot (required when the resource is ``items``)
+    :type spot_id: str, None
+    :param limit: Maximum number of records returned per page (``100`` by default)
+    :type limit: int
+    :param fields: The field(s) to retain in the stored records (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the stored records
+    :type exclude: str, tuple, list, set, None
+    :param id_field: The field that contains the unique identifier of each record (``id`` by default)
+    :type id_field: str
+    :returns: The number of stored records
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+             :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+    """
+    endpoint = snapshots.get_resource_endpoint(resource, spot_id)
+    fields, exclude = projection.normalize_fields(fields), projection.normalize_fields(exclude)
+    if fields and id_field not in fields:
+        fields = fields + (id_field,)
+    records = (projection.project_record(record, fields, exclude)
+               for record in pipeline.iter_records(hs_object, endpoint, limit=limit))
+    return write_store(file_path, records, id_field=id_field, resource=resource, spot_id=spot_id)
+
+
+def write_store(file_path, records, id_field='id', resource=None, spot_id=None):
+    """This function writes records to a memory-mapped columnar store file.
+
+    .. note:: Each column has a string table of its distinct values (so repeated values such as a role or a content
+              type are stored once) and an array with the position of the value for each row. The rows are indexed
+              by ID with an array of the row numbers sorted by ID, which is searched in place when the store is read.
+
+    :param file_path: The path to the store file, which is only replaced once it is complete
+    :type file_path: str
+    :param records: The records to store (e.g. a list or a generator of dictionaries)
+    :type records: list, tuple, generator
+    :param id_field: The field that contains the unique identifier of each record (``id`` by default)
+    :type id_field: str
+    :param resource: The resource to which the records belong (e.g. ``users``)
+    :type resource: str, None
+    :param spot_id: The unique identifier for the Spot to which the records belong
+    :type spot_id: str, None
+    :returns: The number of stored records
+    """
+    columns, row_count = {}, 0
+    for record in records:
+        for name in record:
+            if name not in columns:
+                # Columns that first appear in a later record are missing from the earlier rows
+                columns[name] = ({}, array.array('I', [NULL_INDEX]) * row_count)
+        for name, (table, positions) in columns.items():
+            if name not in record:
+                positions.append(NULL_INDEX)
+                continue
+            encoded = _encode_value(record[name])
+            position = table.get(encoded)
+            if position is None:
+                position = table[encoded] = len(table)
+            positions.append(position)
+        row_count += 1
+
+    sections, directory = [], {
+        'resource': resource,
+        'spot_id': spot_id,
+        'created_at': time.time(),
+        'id_field': id_field,
+        'columns': [],
+    }
+    for name, (table, positions) in columns.items():
+        offsets, total = array.array('Q', [0]), 0
+        for encoded in table:
+            total += len(encoded)
+            offsets.append(total)
+        directory['columns'].append({'name': name, 'distinct': len(table)})
+        sections.extend(((name, 'offsets', offsets.tobytes()), (name, 'values', b''.join(table)),
+                         (name, 'rows', positions.tobytes())))
+    sections.append((None, 'id_index', _get_id_index(columns.get(id_field)).tobytes()))
+    _write_sections(file_path, directory, sections, row_count)
+    return row_count
+
+
+def open_store(file_path):
+    """This function opens a columnar store file read-only.
+
+    :param file_path: The path to the store file
+    :type file_path: str
+    :returns: The :py:class:`highspot.columnar.ColumnarStore` object
+    :raises: :py:exc:`FileNotFoundError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    return ColumnarStore(file_path)
+
+
+def _encode_value(_value):
+    """This function encodes a field value for a string table with a tag that identifies how it is decoded.
+
+    :param _value: The field value
+    :returns: The tagged value as bytes
+    """
+    if isinstance(_value, str):
+        return STRING_TAG + _value.encode('utf-8')
+    return JSON_TAG + json.dumps(_value, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def _decode_value(_raw_value):
+    """This function decodes a tagged value from a string table.
+
+    :param _raw_value: The tagged value
+    :type _raw_value: bytes, memoryview
+    :returns: The field value
+    """
+    if _raw_value[:1] == STRING_TAG:
+        return str(_raw_value[1:], 'utf-8')
+    return json.loads(bytes(_raw_value[1:]))
+
+
+def _get_id_index(_id_column):
+    """This function returns the row numbers of the records that have an ID, sorted by the encoded ID.
+
+    :param _id_column: A tuple with the string table and the row positions of the ID column
+    :type _id_column: tuple, None
+    :returns: An array of the sorted row numbers
+    """
+    if _id_column is None:
+        return array.array('I')
+    _table, _positions = _id_column
+    _values = list(_table)
+    _rows = [_row for _row, _position in enumerate(_positions) if _position != NULL_INDEX]
+    _rows.sort(key=lambda _row: _values[_positions[_row]])
+    return array.array('I', _rows)
+
+
+def _write_sections(_file_path, _directory, _sections, _row_count):
+    """This function writes the header, the directory and the aligned sections to a store file.
+
+    .. note:: The sections are written to a temporary file that replaces the store file once it is complete, so the
+              processes that have the previous file mapped continue to read a consistent copy of it.
+
+    :param _file_path: The path to the store file
+    :type _file_path: str
+    :param _directory: The directory describing the store (to which the section locations are added)
+    :type _directory: dict
+    :param _sections: Tuples with the column name (``None`` for the ID index), section name and section content
+    :type _sections: list
+    :param _row_count: The number of rows in the store
+    :type _row_count: int
+    :returns: None
+    """
+    # The directory is encoded twice as the section offsets depend on its own length
+    _locations, _directory_length = [], 0
+    while True:
+        _position, _locations = _align(HEADER.size + _directory_length), []
+        for _name, _section, _content in _sections:
+            _locations.append([_position, len(_content)])
+            _position = _align(_position + len(_content))
+        _add_section_locations(_directory, _sections, _locations)
+        _encoded_directory = json.dumps(_directory, separators=(',', ':')).encode('utf-8')
+        if len(_encoded_directory) <= _directory_length:
+            break
+        # Reserve some room so that the larger offsets on the next pass still fit
+        _directory_length = len(_encoded_directory) + 64
+    _encoded_directory = _encoded_directory.ljust(_directory_length, b' ')
+
+    _temp_path = f'{_file_path}.tmp'
+    with open(_temp_path, 'wb') as _store_file:
+        _store_file.write(HEADER.pack(MAGIC, STORE_VERSION, BYTE_ORDERS[sys.byteorder], _row_count,
+                                      len(_encoded_directory)))
+        _store_file.write(_encoded_directory)
+        for (_name, _section, _content), (_offset, _length) in zip(_sections, _locations):
+            _store_file.write(b'\0' * (_offset - _store_file.tell()))
+            _store_file.write(_content)
+        _store_file.flush()
+        os.fsync(_store_file.fileno())
+    os.replace(_temp_path, _file_path)
+
+
+def _add_section_locations(_directory, _sections, _locations):
+    """This function adds the offset and length of each section to the directory of a store.
+
+    :param _directory: The directory describing the store
+    :type _directory: dict
+    :param _sections: Tuples with the column name (``None`` for the ID index), section name and section content
+    :type _sections: list
+    :param _locations: Lists with the offset and length of each section
+    :type _locations: list
+    :returns: None
+    """
+    _columns = {_column['name']: _column for _column in _directory['columns']}
+    for (_name, _section, _content), _location in zip(_sections, _locations):
+        if _name is None:
+            _directory[_section] = _location
+        else:
+            _columns[_name][_section] = _location
+
+
+def _align(_position):
+    """This function rounds a file position up to the next section boundary.
+
+    :param _position: The file position
+    :type _position: int
+    :returns: The aligned file position
+    """
+    return -(-_position // ALIGNMENT) * ALIGNMENT
+
+
+class ColumnarStore(object):
+    """This class provides read-only access to the records in a memory-mapped columnar store file.
+
+    .. note:: The file is mapped rather than read, so opening a store only decodes its directory and the values are
+              decoded when they are accessed. The raw values can also be accessed without copying them using the
+              :py:meth:`highspot.columnar.ColumnarStore.get_raw` method.
+    """
+    def __init__(self, file_path):
+        """This method instantiates the :py:class:`highspot.columnar.ColumnarStore` class object.
+
+        :param file_path: The path to the store file
+        :type file_path: str
+        :raises: :py:exc:`FileNotFoundError`,
+                 :py:exc:`highspot.errors.exceptions.DataMismatchError`
+        """
+        self.file_path = file_path
+        with open(file_path, 'rb') as store_file:
+            self._mmap = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._view = memoryview(self._mmap)
+            directory, self.row_count = self._read_directory()
+        except BaseException:
+            self.close()
+            raise
+        self.resource = directory.get('resource')
+        self.spot_id = directory.get('spot_id')
+        self.created_at = directory.get('created_at')
+        self.id_field = directory.get('id_field')
+        self.columns = [column['name'] for column in directory['columns']]
+        self._columns = {}
+        for column in directory['columns']:
+            self._columns[column['name']] = (self._get_section(column['offsets'], 'Q'),
+                                             self._get_section(column['values']),
+                                             self._get_section(column['rows'], 'I'))
+        self._id_index = self._get_section(directory['id_index'], 'I')
+
+    def __len__(self):
+        """This method returns the number of records in the store."""
+        return self.row_count
+
+    def __contains__(self, record_id):
+        """This method determines if a record ID is in the store."""
+        return self.find_row(record_id) is not None
+
+    def __iter__(self):
+        """This method yields each record in the store in the order they were written."""
+        for row in range(self.row_count):
+            yield self.get_row(row)
+
+    def __enter__(self):
+        """This method returns the store when it is used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """This method closes the store when the context manager exits."""
+        self.close()
+
+    def find_row(self, record_id):
+        """This method searches the ID index for the row number of a record.
+
+        :param record_id: The unique identifier of the record
+        :type record_id: str
+        :returns: The row number, or ``None`` if the record is not in the store
+        """
+        if self.id_field not in self._columns:
+            return None
+        target = _encode_value(record_id)
+        low, high = 0, len(self._id_index)
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(self.get_raw(self._id_index[middle], self.id_field, tagged=True)) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._id_index):
+            row = self._id_index[low]
+            if self.get_raw(row, self.id_field, tagged=True) == target:
+                return row
+        return None
+
+    def get(self, record_id, default=None, columns=None):
+        """This method returns the record with a given ID.
+
+        :param record_id: The unique identifier of the record
+        :type record_id: str
+        :param default: The value returned when the record is not in the store (``None`` by default)
+        :param columns: The column(s) to include in the record (all columns by default)
+        :type columns: str, tuple, list, set, None
+        :returns: The record as a dictionary, or the default value
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        row = self.find_row(record_id)
+        return default if row is None else self.get_row(row, columns)
+
+    def get_row(self, row, columns=None):
+        """This method returns the record in a given row.
+
+        :param row: The row number
+        :type row: int
+        :param columns: The column(s) to include in the record (all columns by default)
+        :type columns: str, tuple, list, set, None
+        :returns: The record as a dictionary (without the fields that were missing from the original record)
+        :raises: :py:exc:`IndexError`,
+                 :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        record = {}
+        for column in projection.normalize_fields(columns) or self.columns:
+            raw_value = self.get_raw(row, column, tagged=True)
+            if raw_value is not None:
+                record[column] = _decode_value(raw_value)
+        return record
+
+    def get_value(self, row, column, default=None):
+        """This method returns the decoded value of a field in a given row.
+
+        :param row: The row number
+        :type row: int
+        :param column: The name of the column
+        :type column: str
+        :param default: The value returned when the field is missing from the record (``None`` by default)
+        :returns: The field value, or the default value
+        :raises: :py:exc:`IndexError`,
+                 :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        raw_value = self.get_raw(row, column, tagged=True)
+        return default if raw_value is None else _decode_value(raw_value)
+
+    def get_raw(self, row, column, tagged=False):
+        """This method returns the raw value of a field in a given row without copying it out of the mapped file.
+
+        .. note:: String values are returned as their UTF-8 encoding and any other value is returned as its JSON text.
+                  The returned :py:class:`memoryview` object must be released before the store is closed.
+
+        :param row: The row number
+        :type row: int
+        :param column: The name of the column
+        :type column: str
+        :param tagged: Determines if the tag that identifies the value type should be included (``False`` by default)
+        :type tagged: bool
+        :returns: The raw value as a :py:class:`memoryview` object, or ``None`` if the field is missing from the record
+        :raises: :py:exc:`IndexError`,
+                 :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if column not in self._columns:
+            raise exceptions.InvalidFieldError(f"The column '{column}' is not in the store.")
+        if not 0 <= row < self.row_count:
+            raise IndexError(f'The row {row} is not in the store.')
+        offsets, values, positions = self._columns[column]
+        position = positions[row]
+        if position == NULL_INDEX:
+            return None
+        start = offsets[position] if tagged else offsets[position] + 1
+        return values[start:offsets[position + 1]]
+
+    def iter_column(self, column, default=None):
+        """This method yields the decoded values of a column in row order.
+
+        .. note:: Each distinct value is decoded only once, so iterating over a column with repeated values (e.g. a
+                  role or a content type) is faster than retrieving the records.
+
+        :param column: The name of the column
+        :type column: str
+        :param default: The value yielded for the rows where the field is missing (``None`` by default)
+        :returns: A generator of the field values
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if column not in self._columns:
+            raise exceptions.InvalidFieldError(f"The column '{column}' is not in the store.")
+        offsets, values, positions = self._columns[column]
+        decoded = {}
+        for position in positions:
+            if position == NULL_INDEX:
+                yield default
+                continue
+            value = decoded.get(position, decoded)
+            if value is decoded:
+                value = decoded[position] = _decode_value(values[offsets[position]:offsets[position + 1]])
+            yield value
+
+    def close(self):
+        """This method releases the views of the mapped file and unmaps it.
+
+        :returns: None
+        """
+        for offsets, values, positions in getattr(self, '_columns', {}).values():
+            for view in (offsets, values, positions):
+                view.release()
+        self._columns = {}
+        for name in ('_id_index', '_view'):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def _read_directory(self):
+        """This method validates the header of the store file and decodes its directory.
+
+        :returns: A tuple with the directory and the number of rows
+        :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+        """
+        if len(self._mmap) < HEADER.size:
+            raise exceptions.DataMismatchError(f"The file '{self.file_path}' is not a columnar store.")
+        magic, version, byte_order, row_count, directory_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != STORE_VERSION:
+            raise exceptions.DataMismatchError(f"The file '{self.file_path}' is not a supported columnar store.")
+        if byte_order != BYTE_ORDERS[sys.byteorder]:
+            raise exceptions.DataMismatchError(f"The file '{self.file_path}' was written with a different byte order.")
+        directory = json.loads(bytes(self._view[HEADER.size:HEADER.size + directory_length]))
+        return directory, row_count
+
+    def _get_section(self, _location, _item_format=None):
+        """This method returns a view of a section of the mapped file, cast to an array format when one is given.
+
+        :param _location: The offset and length of the section
+        :type _location: list
+        :param _item_format: The :py:mod:`array` format of the items in the section (e.g. ``I`` or ``Q``)
+        :type _item_format: str, None
+        :returns: The :py:class:`memoryview` object
+        """
+        _offset, _length = _location
+        _section = self._view[_offset:_offset + _length]
+        if _item_format is None:
+            return _section
+        _cast = _section.cast(_item_format)
+        _section.release()
+        return _cast
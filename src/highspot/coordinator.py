@@ -0,0 +1,700 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.coordinator
+:Synopsis:          Defines a coordinator that splits a full export into shards which are leased to worker nodes
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import json
+import time
+import shutil
+import socket
+import sqlite3
+import threading
+import urllib.parse
+
+from . import api, items, pipeline
+from .errors import exceptions
+from .utils import log_utils, scheduler
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the kinds of shard into which an export is split
+USERS_PAGE = 'users'
+SPOTS_PAGE = 'spots'
+ITEMS_PAGE = 'items'
+ITEM_DETAILS = 'item_details'
+
+# Define the states of a shard within the work queue
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+# Define the names of the files and directories within the work directory
+QUEUE_FILE_NAME = 'queue.db'
+SHARDS_DIR_NAME = 'shards'
+CONTENT_DIR_NAME = 'content'
+
+# Define the merged output file for each kind of shard
+MERGED_FILE_NAMES = {
+    USERS_PAGE: 'users.jsonl',
+    SPOTS_PAGE: 'spots.jsonl',
+    ITEMS_PAGE: 'items.jsonl',
+    ITEM_DETAILS: 'item_details.jsonl',
+}
+
+
+def get_shard_id(kind, start=None, spot_id=None, item_id=None):
+    """This function returns the identifier of a shard, which also determines its position in the merged output.
+
+    .. note:: The ``start`` offsets are zero-padded so that the identifiers sort in the order of the pages.
+
+    :param kind: The kind of shard (``users``, ``spots``, ``items`` or ``item_details``)
+    :type kind: str
+    :param start: The start position of the page (for the paged kinds of shard)
+    :type start: int, None
+    :param spot_id: The unique identifier for the Spot (for a page of items)
+    :type spot_id: str, None
+    :param item_id: The unique identifier for the item (for the details of an item)
+    :type item_id: str, None
+    :returns: The shard identifier (e.g. ``items:abc123:000000000100``)
+    """
+    if kind == ITEM_DETAILS:
+        return f'{kind}:{item_id}'
+    elif kind == ITEMS_PAGE:
+        return f'{kind}:{spot_id}:{start:012d}'
+    return f'{kind}:{start:012d}'
+
+
+def run_sharded_export(hs_object, work_dir, output_dir=None, spot_ids=None, include_users=True,
+                       include_properties=True, include_content=False, limit=100, worker_count=4, lease_seconds=300,
+                       poll_interval=1.0):
+    """This function plans a sharded export (unless it was already planned), works on it and merges the output.
+
+    .. note:: The same call may be made on every host that shares the ``work_dir`` (e.g. on a network filesystem), in
+              which case the options of the host that planned the export are used. Each host merges the output once
+              the export is finished (provided that an ``output_dir`` is defined), which produces identical files.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param work_dir: The directory shared by the workers for the queue and the shard files
+    :type work_dir: str
+    :param output_dir: The directory in which the merged files are created (the output is not merged by default)
+    :type output_dir: str, None
+    :param spot_ids: The Spots whose items are exported (every Spot by default)
+    :type spot_ids: list, tuple, None
+    :param include_users: Determines if the users should be exported (``True`` by default)
+    :type include_users: bool
+    :param include_properties: Determines if the properties of each item should be exported (``True`` by default)
+    :type include_properties: bool
+    :param include_content: Determines if the content of each item should be downloaded (``False`` by default)
+    :type include_content: bool
+    :param limit: Maximum number of records returned per page (``100`` by default)
+    :type limit: int
+    :param worker_count: The number of worker threads on this host (``4`` by default)
+    :type worker_count: int
+    :param lease_seconds: The number of seconds after which a lease that is not renewed expires (``300`` by default)
+    :type lease_seconds: int, float
+    :param poll_interval: The number of seconds a worker waits before asking for a shard again (``1.0`` by default)
+    :type poll_interval: int, float
+    :returns: A dictionary with the ``progress`` of the export and the ``merged`` record counts (or ``None``)
+    :raises: :py:exc:`highspot.errors.exceptions.IncompleteExportError`
+    """
+    export_coordinator = ExportCoordinator(work_dir, spot_ids=spot_ids, include_users=include_users,
+                                           include_properties=include_properties, include_content=include_content,
+                                           limit=limit, lease_seconds=lease_seconds)
+    try:
+        export_coordinator.run_workers(hs_object, worker_count, poll_interval)
+        merged = export_coordinator.merge(output_dir) if output_dir else None
+        return {'progress': export_coordinator.get_progress(), 'merged': merged}
+    finally:
+        export_coordinator.close()
+
+
+class ShardQueue(object):
+    """This class stores the shards of an export in an SQLite database through which they are leased to workers.
+
+    Each lease expires after a number of seconds unless it is renewed, at which point the shard is assigned to the
+    next worker that asks for one (e.g. when the worker holding it was stopped). A shard that fails, or whose lease
+    expires, is retried until it has been attempted ``max_attempts`` times and is then marked as failed.
+
+    .. note:: The database may be shared by the processes on a host or by several hosts through a network filesystem
+              that supports file locking, as every lease is taken within an exclusive transaction.
+    """
+    def __init__(self, path, lease_seconds=300, max_attempts=5, timeout=60):
+        """This method instantiates the :py:class:`highspot.coordinator.ShardQueue` class object.
+
+        :param path: The path to the SQLite database file
+        :type path: str
+        :param lease_seconds: The number of seconds after which a lease that is not renewed expires (``300`` by
+                              default)
+        :type lease_seconds: int, float
+        :param max_attempts: The number of times a shard is attempted before it is marked as failed (``5`` by default)
+        :type max_attempts: int
+        :param timeout: The number of seconds to wait for another worker to release a lock on the database (``60`` by
+                        default)
+        :type timeout: int, float
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            # The database is only synchronized at checkpoints, as a lost lease or shard is simply processed again
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS shards (shard_id TEXT PRIMARY KEY, kind TEXT, '
+                                     'params TEXT, priority INTEGER, state TEXT, worker TEXT, lease_expires REAL, '
+                                     'attempts INTEGER, result TEXT, error TEXT)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS shards_state ON shards (state, priority, shard_id)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT)')
+
+    def add_shards(self, shards):
+        """This method adds shards to the queue, ignoring any that have already been added.
+
+        :param shards: Tuples with the shard identifier, the kind of shard, a dictionary of parameters and the priority
+                       (lower priorities are leased first)
+        :type shards: list, tuple
+        :returns: The number of shards that were added
+        """
+        with self._transaction() as cursor:
+            return self._insert_shards(cursor, shards)
+
+    def lease(self, worker_id, lease_seconds=None):
+        """This method leases the next pending shard (or a shard whose lease has expired) to a worker.
+
+        :param worker_id: The unique identifier for the worker
+        :type worker_id: str
+        :param lease_seconds: The number of seconds after which the lease expires (the queue default by default)
+        :type lease_seconds: int, float, None
+        :returns: A dictionary with the ``shard_id``, ``kind``, ``params`` and ``attempts`` of the shard, or ``None``
+                  if no shard is available
+        """
+        now = time.time()
+        with self._transaction() as cursor:
+            cursor.execute("UPDATE shards SET state = ?, error = 'The lease expired on every attempt.' "
+                           "WHERE state = ? AND lease_expires <= ? AND attempts >= ?",
+                           (FAILED, LEASED, now, self.max_attempts))
+            row = cursor.execute('SELECT shard_id, kind, params, attempts FROM shards WHERE state = ? OR '
+                                 '(state = ? AND lease_expires <= ?) ORDER BY priority, shard_id LIMIT 1',
+                                 (PENDING, LEASED, now)).fetchone()
+            if row is None:
+                return None
+            cursor.execute('UPDATE shards SET state = ?, worker = ?, lease_expires = ?, attempts = attempts + 1 '
+                           'WHERE shard_id = ?', (LEASED, worker_id, now + (lease_seconds or self.lease_seconds),
+                                                  row[0]))
+        return {'shard_id': row[0], 'kind': row[1], 'params': json.loads(row[2]), 'attempts': row[3] + 1}
+
+    def renew(self, shard_id, worker_id, lease_seconds=None):
+        """This method extends the lease of a shard that is still held by a worker.
+
+        :param shard_id: The unique identifier for the shard
+        :type shard_id: str
+        :param worker_id: The unique identifier for the worker
+        :type worker_id: str
+        :param lease_seconds: The number of seconds after which the lease expires (the queue default by default)
+        :type lease_seconds: int, float, None
+        :returns: Boolean value indicating if the worker still holds the lease
+        """
+        with self._transaction() as cursor:
+            cursor.execute('UPDATE shards SET lease_expires = ? WHERE shard_id = ? AND worker = ? AND state = ?',
+                           (time.time() + (lease_seconds or self.lease_seconds), shard_id, worker_id, LEASED))
+            return cursor.rowcount == 1
+
+    def complete(self, shard_id, worker_id, result=None, new_shards=None):
+        """This method marks a shard as done and adds the shards discovered while processing it.
+
+        .. note:: The new shards are added even when the lease was lost, since the worker that now holds the shard
+                  discovers the same shards and they are only added once.
+
+        :param shard_id: The unique identifier for the shard
+        :type shard_id: str
+        :param worker_id: The unique identifier for the worker
+        :type worker_id: str
+        :param result: The dictionary of results recorded for the shard (e.g. the number of records)
+        :type result: dict, None
+        :param new_shards: The shards to add in the same transaction (see the ``add_shards`` method)
+        :type new_shards: list, tuple, None
+        :returns: Boolean value indicating if the worker still held the lease
+        """
+        with self._transaction() as cursor:
+            self._insert_shards(cursor, new_shards or ())
+            cursor.execute('UPDATE shards SET state = ?, result = ?, error = NULL WHERE shard_id = ? AND worker = ? '
+                           'AND state = ?', (DONE, json.dumps(result or {}), shard_id, worker_id, LEASED))
+            return cursor.rowcount == 1
+
+    def fail(self, shard_id, worker_id, error):
+        """This method returns a shard to the queue to be retried, or marks it as failed after the last attempt.
+
+        :param shard_id: The unique identifier for the shard
+        :type shard_id: str
+        :param worker_id: The unique identifier for the worker
+        :type worker_id: str
+        :param error: The description of the error
+        :type error: str
+        :returns: The new state of the shard (or ``None`` if the worker no longer held the lease)
+        """
+        with self._transaction() as cursor:
+            row = cursor.execute('SELECT attempts FROM shards WHERE shard_id = ? AND worker = ? AND state = ?',
+                                 (shard_id, worker_id, LEASED)).fetchone()
+            if row is None:
+                return None
+            state = FAILED if row[0] >= self.max_attempts else PENDING
+            cursor.execute('UPDATE shards SET state = ?, worker = NULL, lease_expires = NULL, error = ? '
+                           'WHERE shard_id = ?', (state, error, shard_id))
+        return state
+
+    def get_counts(self):
+        """This method returns the number of shards in each state.
+
+        :returns: A dictionary with the states as keys and the numbers of shards as values
+        """
+        counts = dict.fromkeys((PENDING, LEASED, DONE, FAILED), 0)
+        with self._lock:
+            counts.update(self._connection.execute('SELECT state, COUNT(*) FROM shards GROUP BY state').fetchall())
+        return counts
+
+    def is_finished(self):
+        """This method determines if every shard is either done or failed.
+
+        :returns: Boolean value indicating if the export is finished
+        """
+        counts = self.get_counts()
+        return not (counts[PENDING] or counts[LEASED])
+
+    def iter_shards(self, state=None):
+        """This method yields the shards in the order of their identifiers.
+
+        :param state: The state by which to filter the shards (all shards by default)
+        :type state: str, None
+        :returns: A generator of dictionaries with the ``shard_id``, ``kind``, ``params``, ``state``, ``attempts``,
+                  ``result`` and ``error`` of each shard
+        """
+        query, params = 'SELECT shard_id, kind, params, state, attempts, result, error FROM shards', ()
+        if state:
+            query, params = f'{query} WHERE state = ?', (state,)
+        with self._lock:
+            rows = self._connection.execute(f'{query} ORDER BY shard_id', params).fetchall()
+        for shard_id, kind, shard_params, shard_state, attempts, result, error in rows:
+            yield {'shard_id': shard_id, 'kind': kind, 'params': json.loads(shard_params), 'state': shard_state,
+                   'attempts': attempts, 'result': json.loads(result) if result else None, 'error': error}
+
+    def get_setting(self, name, default=None):
+        """This method returns a setting stored alongside the shards.
+
+        :param name: The name of the setting
+        :type name: str
+        :param default: The value returned when the setting is not defined (``None`` by default)
+        :returns: The JSON-decoded value of the setting
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT value FROM settings WHERE name = ?', (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_setting(self, name, value):
+        """This method stores a setting alongside the shards.
+
+        :param name: The name of the setting
+        :type name: str
+        :param value: The JSON-serializable value of the setting
+        :returns: None
+        """
+        with self._transaction() as cursor:
+            cursor.execute('INSERT OR REPLACE INTO settings VALUES (?, ?)', (name, json.dumps(value)))
+
+    def close(self):
+        """This method closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _transaction(self):
+        """This method returns a context manager that holds an exclusive write transaction."""
+        return _ImmediateTransaction(self._connection, self._lock)
+
+    @staticmethod
+    def _insert_shards(_cursor, _shards):
+        """This method inserts shards with a cursor that holds a transaction and returns the number added."""
+        _added = 0
+        for _shard_id, _kind, _params, _priority in _shards:
+            _cursor.execute('INSERT OR IGNORE INTO shards VALUES (?, ?, ?, ?, ?, NULL, NULL, 0, NULL, NULL)',
+                            (_shard_id, _kind, json.dumps(_params, sort_keys=True), _priority, PENDING))
+            _added += _cursor.rowcount
+        return _added
+
+
+class ExportCoordinator(object):
+    """This class splits a full export into shards, processes the shards leased to a worker and merges the output.
+
+    The export is split into pages of users, pages of Spots (when the Spots are not listed explicitly), pages of the
+    items in each Spot, and the properties (and optionally the content) of each item. Only the first page of each
+    collection is planned up front. When a worker finds that a page is full it adds the next pages, keeping up to
+    ``prefetch_pages`` pages of each collection in the queue, and each page of items adds a shard for the details of
+    each of its items. Any number of workers on any number of hosts may therefore share the work directory, and the
+    workers on each host use their own client (and connection pool) so that the per-connection limits apply to each
+    host rather than to the export as a whole.
+
+    Each shard is written to its own file (which is replaced once it is complete), so a shard that is processed again
+    after its lease expired produces the same file, and the merged output is assembled in the order of the shard
+    identifiers rather than the order in which the shards were completed.
+    """
+    def __init__(self, work_dir, spot_ids=None, include_users=True, include_properties=True, include_content=False,
+                 limit=100, prefetch_pages=4, lease_seconds=300, max_attempts=5):
+        """This method instantiates the :py:class:`highspot.coordinator.ExportCoordinator` class object.
+
+        .. note:: The options are stored in the work directory when the export is planned, so the workers only need
+                  the ``work_dir`` and use the stored options rather than their own.
+
+        :param work_dir: The directory shared by the workers for the queue and the shard files
+        :type work_dir: str
+        :param spot_ids: The Spots whose items are exported (every Spot by default)
+        :type spot_ids: list, tuple, None
+        :param include_users: Determines if the users should be exported (``True`` by default)
+        :type include_users: bool
+        :param include_properties: Determines if the properties of each item should be exported (``True`` by default)
+        :type include_properties: bool
+        :param include_content: Determines if the content of each item should be downloaded (``False`` by default)
+        :type include_content: bool
+        :param limit: Maximum number of records returned per page (``100`` by default)
+        :type limit: int
+        :param prefetch_pages: The number of pages of each collection that are queued ahead of the last full page
+                               (``4`` by default)
+        :type prefetch_pages: int
+        :param lease_seconds: The number of seconds after which a lease that is not renewed expires (``300`` by
+                              default)
+        :type lease_seconds: int, float
+        :param max_attempts: The number of times a shard is attempted before it is marked as failed (``5`` by default)
+        :type max_attempts: int
+        :raises: :py:exc:`ValueError`
+        """
+        if limit < 1 or prefetch_pages < 1:
+            raise ValueError('The limit and the number of prefetched pages must be at least one.')
+        self.work_dir = work_dir
+        self.options = {
+            'spot_ids': sorted(str(spot_id) for spot_id in spot_ids) if spot_ids else None,
+            'include_users': include_users,
+            'include_properties': include_properties,
+            'include_content': include_content,
+            'limit': int(limit),
+            'prefetch_pages': int(prefetch_pages),
+        }
+        os.makedirs(os.path.join(work_dir, SHARDS_DIR_NAME), exist_ok=True)
+        os.makedirs(os.path.join(work_dir, CONTENT_DIR_NAME), exist_ok=True)
+        self.queue = ShardQueue(os.path.join(work_dir, QUEUE_FILE_NAME), lease_seconds, max_attempts)
+        self._queue_changed = threading.Condition()
+
+    def plan(self):
+        """This method stores the options and adds the initial shards, unless the export has already been planned.
+
+        :returns: The number of shards that were added
+        """
+        stored_options = self.queue.get_setting('options')
+        if stored_options is not None:
+            self.options = stored_options
+            return 0
+        self.queue.set_setting('options', self.options)
+        shards = []
+        if self.options['include_users']:
+            shards.append(self._get_page_shard(USERS_PAGE, 0))
+        if self.options['spot_ids'] is None:
+            shards.append(self._get_page_shard(SPOTS_PAGE, 0))
+        else:
+            shards.extend(self._get_page_shard(ITEMS_PAGE, 0, spot_id) for spot_id in self.options['spot_ids'])
+        return self.queue.add_shards(shards)
+
+    def run_worker(self, hs_object, worker_id=None, max_shards=None, poll_interval=1.0):
+        """This method processes the shards leased to a worker until the export is finished.
+
+        .. note:: A worker waits while other workers hold the remaining leases, as those shards may add further
+                  shards or be re-assigned once their leases expire.
+
+        :param hs_object: The core :py:class:`highspot.Highspot` object used by the worker
+        :type hs_object: class[highspot.Highspot]
+        :param worker_id: The unique identifier for the worker (the hostname, process ID and thread ID by default)
+        :type worker_id: str, None
+        :param max_shards: The maximum number of shards to process before returning (unlimited by default)
+        :type max_shards: int, None
+        :param poll_interval: The number of seconds to wait before asking for a shard again (``1.0`` by default)
+        :type poll_interval: int, float
+        :returns: The number of shards that were processed
+        :raises: :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+        """
+        options = self.queue.get_setting('options')
+        if options is None:
+            raise exceptions.MissingRequiredDataError('The export must be planned before the workers are started.')
+        self.options = options
+        worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}'
+        processed = 0
+        while max_shards is None or processed < max_shards:
+            shard = self.queue.lease(worker_id)
+            if shard is None:
+                if self.queue.is_finished():
+                    break
+                # A worker in this process that completes or fails a shard wakes the idle workers immediately
+                with self._queue_changed:
+                    self._queue_changed.wait(poll_interval)
+                continue
+            heartbeat = _LeaseHeartbeat(self.queue, shard['shard_id'], worker_id)
+            try:
+                with heartbeat, scheduler.request_priority(scheduler.BATCH):
+                    result, new_shards = self._process_shard(hs_object, shard)
+            except Exception as exc:
+                state = self.queue.fail(shard['shard_id'], worker_id, f'{type(exc).__name__}: {exc}')
+                logger.warning(f"The shard '{shard['shard_id']}' failed on attempt {shard['attempts']} and is now "
+                               f"{state or 'held by another worker'}: {type(exc).__name__}: {exc}")
+            else:
+                if not self.queue.complete(shard['shard_id'], worker_id, result, new_shards):
+                    logger.warning(f"The lease on the shard '{shard['shard_id']}' expired before it was completed.")
+            with self._queue_changed:
+                self._queue_changed.notify_all()
+            processed += 1
+        return processed
+
+    def run_workers(self, hs_object, worker_count=4, poll_interval=1.0):
+        """This method plans the export (if needed) and processes the shards with worker threads in this process.
+
+        .. note:: The threads share the connection pool of the core object, so its ``max_connections`` should be at
+                  least the ``worker_count``. Workers on other hosts call the :py:meth:`run_worker` method with their
+                  own core object.
+
+        :param hs_object: The core :py:class:`highspot.Highspot` object used by the workers
+        :type hs_object: class[highspot.Highspot]
+        :param worker_count: The number of workers (``4`` by default)
+        :type worker_count: int
+        :param poll_interval: The number of seconds a worker waits before asking for a shard again (``1.0`` by
+                              default)
+        :type poll_interval: int, float
+        :returns: The number of shards processed by each worker
+        """
+        self.plan()
+        processed, errors = [0] * worker_count, []
+
+        def _run(_index):
+            try:
+                processed[_index] = self.run_worker(hs_object, poll_interval=poll_interval)
+            except Exception as _exc_msg:
+                errors.append(_exc_msg)
+
+        threads = [threading.Thread(target=_run, args=(index,), name=f'highspot-export-worker-{index}')
+                   for index in range(worker_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return processed
+
+    def get_progress(self):
+        """This method returns the number of shards in each state and the number of exported records.
+
+        :returns: A dictionary with the ``shards`` counts, the ``records`` count for each kind of shard and the number
+                  of shards that were ``reassigned`` to another worker or retried
+        """
+        records, reassigned = dict.fromkeys(MERGED_FILE_NAMES, 0), 0
+        for shard in self.queue.iter_shards():
+            if shard['result']:
+                records[shard['kind']] += shard['result'].get('records', 0)
+            if shard['attempts'] > 1:
+                reassigned += 1
+        return {'shards': self.queue.get_counts(), 'records': records, 'reassigned': reassigned}
+
+    def merge(self, output_dir):
+        """This method concatenates the shard files into one file for each kind of shard in the order of the shards.
+
+        .. note:: The downloaded content is linked (or copied) into the ``content`` directory of the output directory,
+                  and the ``item_details.jsonl`` file references each file by its path relative to the output
+                  directory. Merging again (e.g. on another host) produces identical files.
+
+        :param output_dir: The directory in which the merged files are created
+        :type output_dir: str
+        :returns: A dictionary with the number of records in each merged file
+        :raises: :py:exc:`highspot.errors.exceptions.IncompleteExportError`
+        """
+        counts = self.queue.get_counts()
+        if counts[PENDING] or counts[LEASED] or counts[FAILED]:
+            raise exceptions.IncompleteExportError(f"The export cannot be merged as {counts[PENDING]} shards are "
+                                                   f"pending, {counts[LEASED]} are leased and {counts[FAILED]} "
+                                                   f"failed.")
+        os.makedirs(output_dir, exist_ok=True)
+        temp_suffix = f'.{socket.gethostname()}.{os.getpid()}.tmp'
+        merged_counts, merged_files = dict.fromkeys(MERGED_FILE_NAMES, 0), {}
+        try:
+            for kind, file_name in MERGED_FILE_NAMES.items():
+                merged_files[kind] = open(os.path.join(output_dir, f'{file_name}{temp_suffix}'), 'wb')
+            for shard in self.queue.iter_shards(DONE):
+                with open(self._get_shard_path(shard['shard_id']), 'rb') as shard_file:
+                    shutil.copyfileobj(shard_file, merged_files[shard['kind']])
+                merged_counts[shard['kind']] += shard['result'].get('records', 0)
+        finally:
+            for merged_file in merged_files.values():
+                merged_file.close()
+        for file_name in MERGED_FILE_NAMES.values():
+            os.replace(os.path.join(output_dir, f'{file_name}{temp_suffix}'), os.path.join(output_dir, file_name))
+        content_dir = os.path.join(self.work_dir, CONTENT_DIR_NAME)
+        if self.options['include_content'] and os.path.abspath(output_dir) != os.path.abspath(self.work_dir):
+            os.makedirs(os.path.join(output_dir, CONTENT_DIR_NAME), exist_ok=True)
+            for file_name in sorted(os.listdir(content_dir)):
+                if not file_name.endswith('.part'):
+                    _link_or_copy(os.path.join(content_dir, file_name),
+                                  os.path.join(output_dir, CONTENT_DIR_NAME, file_name))
+        logger.info(f"The export was merged into '{output_dir}': {merged_counts}")
+        return merged_counts
+
+    def close(self):
+        """This method closes the work queue.
+
+        :returns: None
+        """
+        self.queue.close()
+
+    def _process_shard(self, _hs_object, _shard):
+        """This method processes a shard, writes its file and returns its result and the shards it discovered."""
+        _kind, _params = _shard['kind'], _shard['params']
+        if _kind == ITEM_DETAILS:
+            _record = self._get_item_details(_hs_object, _params['item_id'], _params['spot_id'])
+            self._write_shard_file(_shard['shard_id'], [_record])
+            return {'records': 1}, []
+        _endpoint = {USERS_PAGE: '/users', SPOTS_PAGE: '/spots'}.get(_kind) or \
+            f"/items?{urllib.parse.urlencode({'spot': _params['spot_id']})}"
+        _limit = self.options['limit']
+        # An error response raises so that the shard is retried rather than completed as an empty (final) page
+        _records = pipeline.get_page(_hs_object, _endpoint, _params['start'], _limit)
+        self._write_shard_file(_shard['shard_id'], _records)
+        _new_shards = []
+        if len(_records) >= _limit:
+            _page_index = _params['start'] // _limit
+            # The first full page queues the next pages and each later page queues the page after the prefetch window
+            _next_pages = range(1, self.options['prefetch_pages'] + 1) if _page_index == 0 else \
+                (_page_index + self.options['prefetch_pages'],)
+            _new_shards.extend(self._get_page_shard(_kind, _next_page * _limit, _params.get('spot_id'))
+                               for _next_page in _next_pages)
+        if _kind == SPOTS_PAGE:
+            _new_shards.extend(self._get_page_shard(ITEMS_PAGE, 0, str(_record['id'])) for _record in _records)
+        elif _kind == ITEMS_PAGE and (self.options['include_properties'] or self.options['include_content']):
+            _new_shards.extend((get_shard_id(ITEM_DETAILS, item_id=_record['id']), ITEM_DETAILS,
+                                {'item_id': str(_record['id']), 'spot_id': _params['spot_id']}, 1)
+                               for _record in _records)
+        return {'records': len(_records)}, _new_shards
+
+    def _get_item_details(self, _hs_object, _item_id, _spot_id):
+        """This method retrieves the properties and downloads the content of an item as requested by the options."""
+        _record = {'item_id': _item_id, 'spot_id': _spot_id}
+        if self.options['include_properties']:
+            _response = api.get_request_with_retries(_hs_object, f'/items/{_item_id}/properties', return_json=False)
+            if _response.status_code in (404, 410):
+                # The item was deleted after its page was exported
+                _record['properties'] = None
+            elif _response.status_code >= 400:
+                raise exceptions.APIRequestError(f"The properties of the item '{_item_id}' could not be retrieved and "
+                                                 f"returned a {_response.status_code} response.")
+            else:
+                _record['properties'] = _response.json()
+        if self.options['include_content']:
+            _content_path = os.path.join(CONTENT_DIR_NAME, _get_safe_file_name(_item_id))
+            _download = items.download_item_content(_hs_object, _item_id, os.path.join(self.work_dir, _content_path),
+                                                    hash_algorithm='sha256')
+            _record['content'] = {'path': _content_path.replace(os.sep, '/'), 'size': _download['size'],
+                                  'sha256': _download['hash']}
+        return _record
+
+    def _get_page_shard(self, _kind, _start, _spot_id=None):
+        """This method returns the tuple that adds a page of a collection to the queue."""
+        _params = {'start': _start, 'spot_id': _spot_id} if _kind == ITEMS_PAGE else {'start': _start}
+        return get_shard_id(_kind, _start, _spot_id), _kind, _params, 0
+
+    def _get_shard_path(self, _shard_id):
+        """This method returns the path to the file of a shard within the work directory."""
+        return os.path.join(self.work_dir, SHARDS_DIR_NAME, f'{_get_safe_file_name(_shard_id)}.jsonl')
+
+    def _write_shard_file(self, _shard_id, _records):
+        """This method writes the records of a shard to a temporary file and then replaces the file of the shard."""
+        _shard_path = self._get_shard_path(_shard_id)
+        _temp_path = f'{_shard_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(_temp_path, 'wb') as _shard_file:
+            for _record in _records:
+                _shard_file.write(json.dumps(_record, separators=(',', ':'), sort_keys=True).encode('utf-8') + b'\n')
+            _shard_file.flush()
+            os.fsync(_shard_file.fileno())
+        os.replace(_temp_path, _shard_path)
+
+
+class _ImmediateTransaction(object):
+    """This class holds a write transaction that is taken immediately so that concurrent workers queue for the lock."""
+    def __init__(self, _connection, _lock):
+        """This method instantiates the :py:class:`highspot.coordinator._ImmediateTransaction` class object."""
+        self._connection = _connection
+        self._lock = _lock
+
+    def __enter__(self):
+        """This method takes the thread lock and begins the transaction."""
+        self._lock.acquire()
+        try:
+            self._connection.execute('BEGIN IMMEDIATE')
+        except BaseException:
+            self._lock.release()
+            raise
+        return self._connection.cursor()
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        """This method commits the transaction (or rolls it back after an exception) and releases the thread lock."""
+        try:
+            self._connection.execute('ROLLBACK' if _exc_type else 'COMMIT')
+        finally:
+            self._lock.release()
+        return False
+
+
+class _LeaseHeartbeat(object):
+    """This class renews the lease on a shard in a background thread while the shard is processed."""
+    def __init__(self, _queue, _shard_id, _worker_id):
+        """This method instantiates the :py:class:`highspot.coordinator._LeaseHeartbeat` class object."""
+        self._queue = _queue
+        self._shard_id = _shard_id
+        self._worker_id = _worker_id
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        """This method starts renewing the lease at a third of the lease duration."""
+        self._thread = threading.Thread(target=self._renew, name='highspot-export-lease', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        """This method stops renewing the lease."""
+        self._stopped.set()
+        self._thread.join()
+        return False
+
+    def _renew(self):
+        """This method renews the lease until it is stopped or the lease is lost."""
+        while not self._stopped.wait(self._queue.lease_seconds / 3):
+            try:
+                if not self._queue.renew(self._shard_id, self._worker_id):
+                    logger.warning(f"The lease on the shard '{self._shard_id}' was lost to another worker.")
+                    return
+            except sqlite3.Error as _exc_msg:
+                logger.warning(f"The lease on the shard '{self._shard_id}' could not be renewed: {_exc_msg}")
+
+
+def _link_or_copy(_source_path, _target_path):
+    """This function hard links a file to a new path (or copies it across filesystems) unless the path exists."""
+    if os.path.exists(_target_path):
+        return
+    try:
+        os.link(_source_path, _target_path)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copy2(_source_path, _target_path)
+
+
+def _get_safe_file_name(_identifier):
+    """This function returns a file name for an identifier with any character unsafe in a path percent-encoded."""
+    return urllib.parse.quote(str(_identifier), safe='-_.')
@@ -4,35 +4,134 @@
 :Synopsis:          Defines the core highspot object used to interface with the Highspot API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     20 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
-from . import api
-from . import domain as domain_module
-from . import groups as groups_module
-from . import items as items_module
-from . import pitches as pitches_module
-from . import request as request_module
-from . import spots as spots_module
-from . import users as users_module
 from .errors import exceptions
-from .utils import log_utils, version
+from .utils import import_utils, log_utils, version
+
+# Defer loading the submodules until they are first used
+analytics = import_utils.lazy_import('.analytics', __package__)
+api = import_utils.lazy_import('.api', __package__)
+columnar = import_utils.lazy_import('.columnar', __package__)
+coordinator = import_utils.lazy_import('.coordinator', __package__)
+domain_module = import_utils.lazy_import('.domain', __package__)
+exports = import_utils.lazy_import('.exports', __package__)
+groups_module = import_utils.lazy_import('.groups', __package__)
+items_module = import_utils.lazy_import('.items', __package__)
+pipeline_module = import_utils.lazy_import('.pipeline', __package__)
+pitches_module = import_utils.lazy_import('.pitches', __package__)
+transports = import_utils.lazy_import('.transports', __package__)
+request_module = import_utils.lazy_import('.request', __package__)
+search = import_utils.lazy_import('.search', __package__)
+snapshots = import_utils.lazy_import('.snapshots', __package__)
+spots_module = import_utils.lazy_import('.spots', __package__)
+users_module = import_utils.lazy_import('.users', __package__)
+circuit_breaker = import_utils.lazy_import('.utils.circuit_breaker', __package__)
+concurrency = import_utils.lazy_import('.utils.concurrency', __package__)
+metrics = import_utils.lazy_import('.utils.metrics', __package__)
+rate_limiter = import_utils.lazy_import('.utils.rate_limiter', __package__)
+scheduler_module = import_utils.lazy_import('.utils.scheduler', __package__)
+profiling = import_utils.lazy_import('.utils.profiling', __package__)
+response_cache_module = import_utils.lazy_import('.utils.response_cache', __package__)
 
 # Initialize logging
-logger = log_utils.initialize_logging(__name__)
+logger = log_utils.defer_logging(__name__)
+
+# Define the API hosts for each Highspot region, which are defined here so the base URL is resolved without loading
+# the api module when the core object is instantiated
+DEFAULT_REGION = 'su2'
+REGION_HOSTS = {
+    'us': 'https://api.highspot.com',
+    'su2': 'https://api-su2.highspot.com',
+}
+
+# Define the names of the transports (i.e. the values of highspot.transports.HTTP1 and highspot.transports.HTTP2)
+TRANSPORT_NAMES = ('http1', 'http2')
+
+
+class _LazyInnerClass(object):
+    """This class defines an attribute that instantiates an inner class object the first time it is accessed."""
+    def __init__(self, import_method):
+        """This method initializes the :py:class:`highspot.core._LazyInnerClass` descriptor object.
+
+        :param import_method: The name of the core object method that returns the inner class object
+        :type import_method: str
+        """
+        self.import_method = import_method
+        self.attr_name = None
+
+    def __set_name__(self, owner, name):
+        """This method captures the name of the attribute to which the descriptor is assigned."""
+        self.attr_name = name
+
+    def __get__(self, instance, owner=None):
+        """This method instantiates the inner class object and caches it on the core object instance."""
+        if instance is None:
+            return self
+        inner_object = getattr(instance, self.import_method)()
+        if instance.profiler is not None:
+            inner_object = instance.profiler.wrap(inner_object, self.attr_name)
+        instance.__dict__[self.attr_name] = inner_object
+        return inner_object
 
 
 class Highspot(object):
     """This is the class for the core object leveraged in this library."""
+    # Define the inner class objects which are instantiated the first time they are called
+    domain = _LazyInnerClass('_import_domain_class')
+    groups = _LazyInnerClass('_import_groups_class')
+    items = _LazyInnerClass('_import_items_class')
+    pitches = _LazyInnerClass('_import_pitches_class')
+    requests = _LazyInnerClass('_import_request_class')
+    spots = _LazyInnerClass('_import_spots_class')
+    users = _LazyInnerClass('_import_users_class')
+
     # Define the function that initializes the object instance (i.e. instantiates the object)
-    def __init__(self, username=None, password=None, helper=None, api_version='0.5'):
-        """This method instantiates the core Fresh object."""
+    def __init__(self, username=None, password=None, helper=None, api_version='0.5', profiling=False,
+                 circuit_breakers=True, base_url=None, region=None, max_connections=10, rate_limit=None,
+                 rate_limit_burst=None, transport='http1', compression=True, scheduler=False,
+                 adaptive_concurrency=False, cache=False, queue_logging=False):
+        """This method instantiates the core Fresh object.
+
+        .. note:: The ``region`` may be set to ``auto`` to identify the region whose API host accepts the
+                  credentials, which performs a request to each host until one succeeds.
+
+        .. note:: The ``transport`` may be set to ``http2`` to multiplex concurrent requests over fewer connections,
+                  which falls back to ``http1`` when the ``httpx`` and ``h2`` packages are not installed. A
+                  :py:class:`highspot.transports.BaseTransport` object may also be provided (e.g. a
+                  :py:class:`highspot.transports.RecordingTransport` or :py:class:`highspot.transports.ReplayTransport`
+                  object to record the responses to a cassette file or to replay them without network access).
+
+        .. note:: The ``compression`` may be ``True`` to negotiate every content encoding that can be decoded (i.e.
+                  ``zstd``, ``br``, ``gzip`` and ``deflate`` depending on the installed decoders), ``False`` to
+                  disable compression, or a list of encodings in order of preference.
+
+        .. note:: The ``scheduler`` may be ``True`` to admit requests within the ``max_connections`` and rate limits
+                  in priority order (with the ``interactive`` and ``batch`` priority classes weighted 8 to 1), a
+                  dictionary of priority class weights, or a :py:class:`highspot.utils.scheduler.PriorityScheduler`
+                  object. Paged and bulk operations are performed as ``batch`` requests and every other request is
+                  performed as an ``interactive`` request unless the :py:meth:`highspot.core.Highspot.request_priority`
+                  method assigns a priority.
+
+        .. note:: The ``adaptive_concurrency`` may be ``True`` to tune the number of requests in flight from the
+                  observed latency and throttling (starting at ``max_connections`` and ranging up to four times that
+                  number) or a :py:class:`highspot.utils.concurrency.AdaptiveConcurrencyLimiter` object.
+
+        .. note:: The ``cache`` may be ``True`` to cache the user, group, item and domain lookups and serve them while
+                  they are refreshed in the background once they are a minute old (for up to five minutes), the URL of
+                  a cache backend shared with other processes (e.g. ``sqlite:///var/cache/highspot.db`` or
+                  ``redis://cache.example.com:6379/0``), a dictionary of
+                  :py:class:`highspot.utils.response_cache.ResponseCache` options (e.g. ``soft_ttl``, ``hard_ttl``
+                  and ``backend``), or a :py:class:`highspot.utils.response_cache.ResponseCache` object.
+
+        .. note:: The ``queue_logging`` may be ``True`` to pass the log records of the library to the handlers
+                  configured by the application from a background thread so that logging I/O (e.g. retry warnings
+                  written to a slow file or syslog handler) never blocks the request path.
+        """
         # Define the current version
         self.version = version.get_full_version()
 
-        # Define the base URL
-        self.base_url = f'https://api-su2.highspot.com/v{api_version}'
-
         # Configure the authentication
         if not any((username, password)):
             raise exceptions.MissingAuthDataError()
@@ -42,14 +141,116 @@ class Highspot(object):
             raise exceptions.MissingAuthDataError('password')
         self.auth = (username, password)
 
-        # Import inner object classes so their methods can be called from the primary object
-        self.domain = self._import_domain_class()
-        self.groups = self._import_groups_class()
-        self.items = self._import_items_class()
-        self.pitches = self._import_pitches_class()
-        self.requests = self._import_request_class()
-        self.spots = self._import_spots_class()
-        self.users = self._import_users_class()
+        # Process the log records of the library from a background thread when queued logging is enabled
+        if queue_logging:
+            log_utils.enable_queue_output()
+
+        # Configure the transport and connection pool (which are created on first use) and the rate limiter
+        if isinstance(transport, str):
+            if transport not in TRANSPORT_NAMES:
+                raise exceptions.InvalidFieldError(f"The value '{transport}' is not a valid transport.")
+        elif not isinstance(transport, transports.BaseTransport):
+            raise exceptions.InvalidFieldError(f"The value '{transport}' is not a valid transport.")
+        self.transport = None
+        self.transport_name = transport
+        self.compression = compression
+        self.headers = None
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter.RateLimiter(rate_limit, rate_limit_burst) if rate_limit else None
+
+        # Define the base URL (and only load the api module to discover the region, through the configured transport,
+        # or to normalize an explicit host)
+        if region == 'auto' and not base_url:
+            region = api.discover_region(self.auth, api_version, transport=api.get_transport(self))
+        self.region = None if base_url else region or DEFAULT_REGION
+        if base_url or self.region not in REGION_HOSTS:
+            self.base_url = api.get_base_url(region, api_version, base_url)
+        else:
+            self.base_url = f'{REGION_HOSTS[self.region]}/v{api_version}'
+
+        # Define the cache for thumbnail images, which is created the first time it is needed
+        self.thumbnail_cache = None
+
+        # Configure the request metrics and the circuit breakers for each endpoint family
+        self.metrics = metrics.Metrics()
+        if isinstance(circuit_breakers, circuit_breaker.CircuitBreakerRegistry):
+            circuit_breakers.metrics = circuit_breakers.metrics or self.metrics
+            self.circuit_breakers = circuit_breakers
+        else:
+            self.circuit_breakers = circuit_breaker.CircuitBreakerRegistry(metrics=self.metrics) \
+                if circuit_breakers else None
+
+        # Configure the limiter that adapts the number of requests in flight when it is enabled
+        if not adaptive_concurrency:
+            self.concurrency_limiter = None
+        elif isinstance(adaptive_concurrency, concurrency.AdaptiveConcurrencyLimiter):
+            adaptive_concurrency.metrics = adaptive_concurrency.metrics or self.metrics
+            self.concurrency_limiter = adaptive_concurrency
+        else:
+            self.concurrency_limiter = concurrency.AdaptiveConcurrencyLimiter(
+                max_connections, max_limit=max_connections * 4, metrics=self.metrics)
+
+        # Configure the scheduler that admits requests by priority class when it is enabled
+        max_concurrency = self.concurrency_limiter.max_limit if self.concurrency_limiter else max_connections
+        if not scheduler:
+            self.scheduler = None
+        elif isinstance(scheduler, scheduler_module.PriorityScheduler):
+            scheduler.metrics = scheduler.metrics or self.metrics
+            scheduler.rate_limiter = scheduler.rate_limiter or self.rate_limiter
+            scheduler.concurrency_limiter = scheduler.concurrency_limiter or self.concurrency_limiter
+            self.scheduler = scheduler
+        else:
+            self.scheduler = scheduler_module.PriorityScheduler(max_concurrency,
+                                                                scheduler if isinstance(scheduler, dict) else None,
+                                                                rate_limiter=self.rate_limiter, metrics=self.metrics,
+                                                                concurrency_limiter=self.concurrency_limiter)
+
+        # Configure the cache that serves stale lookups while they are refreshed when it is enabled (the cache
+        # modules, and the sqlite3 and socket modules used by its backends, are only loaded when caching is used)
+        if hasattr(cache, 'is_cached_endpoint'):
+            cache.metrics = cache.metrics or self.metrics
+            self.response_cache = cache
+        elif isinstance(cache, str):
+            self.response_cache = response_cache_module.ResponseCache(metrics=self.metrics, backend=cache)
+        elif cache:
+            self.response_cache = response_cache_module.ResponseCache(metrics=self.metrics,
+                                                                      **(cache if isinstance(cache, dict) else {}))
+        else:
+            self.response_cache = None
+        if self.response_cache is not None and self.response_cache.namespace is None:
+            self.response_cache.namespace = response_cache_module.get_namespace(self.base_url, username)
+
+        # Configure the profiler when profiling mode is enabled
+        self.profiler = None
+        if profiling:
+            self.enable_profiling()
+
+    def enable_profiling(self, use_cprofile=False, sampling_interval=None):
+        """This method enables profiling mode, which aggregates the CPU time and network wait time of each method.
+
+        :param use_cprofile: Determines if the profiled calls should also be traced with :py:mod:`cProfile`
+        :type use_cprofile: bool
+        :param sampling_interval: The interval in seconds at which the stacks of active calls are sampled for the
+                                  collapsed-stack output (sampling is disabled by default)
+        :type sampling_interval: float, None
+        :returns: The :py:class:`highspot.utils.profiling.Profiler` object that collects the statistics
+        """
+        self.disable_profiling()
+        self.profiler = profiling.Profiler(use_cprofile=use_cprofile, sampling_interval=sampling_interval)
+        return self.profiler
+
+    def disable_profiling(self):
+        """This method disables profiling mode so that calls are no longer wrapped by the profiler.
+
+        :returns: The :py:class:`highspot.utils.profiling.Profiler` object that was in use (if any)
+        """
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.stop()
+        for attr_name, attr_value in vars(Highspot).items():
+            if isinstance(attr_value, _LazyInnerClass):
+                self.__dict__.pop(attr_name, None)
+        return profiler
 
     def _import_domain_class(self):
         """This method allows the :py:class:`highspot.core.Highspot.Domain` class to be utilized in the core object."""
@@ -80,7 +281,7 @@ class Highspot(object):
         return Highspot.User(self)
 
     # Define the basic GET request method
-    def get(self, endpoint, return_json=True, verify_ssl=True):
+    def get(self, endpoint, return_json=True, verify_ssl=True, stream=False):
         """This method performs a GET request and will retry several times if a failure occurs.
 
         :param endpoint: The endpoint URI to query
@@ -89,10 +290,172 @@ class Highspot(object):
         :type return_json: bool
         :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
         :type verify_ssl: bool
-        :returns: The JSON data from the response or the raw :py:mod:`requests` response.
+        :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+        :type stream: bool
+        :returns: The JSON data from the response, a generator of the records when streaming, or the raw
+                  :py:mod:`requests` response.
         :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
         """
-        return api.get_request_with_retries(self, endpoint, return_json, verify_ssl)
+        if self.profiler is not None:
+            return self.profiler.profile_call('get', api.get_request_with_retries, self, endpoint, return_json,
+                                              verify_ssl, stream=stream)
+        return api.get_request_with_retries(self, endpoint, return_json, verify_ssl, stream=stream)
+
+    def close(self):
+        """This method closes the transport and connection pool (and the cache refresh workers) used by the core object.
+
+        :returns: None
+        """
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    def get_metrics(self):
+        """This method returns the request metrics (including the circuit breaker states) for each endpoint family.
+
+        :returns: A dictionary with the ``endpoints`` and ``client`` metrics
+        """
+        summary = self.metrics.get_summary()
+        if self.concurrency_limiter is not None:
+            summary['client']['concurrency_limit'] = self.concurrency_limiter.limit
+        if self.scheduler is not None:
+            summary['client']['scheduler_in_flight'] = self.scheduler.in_flight
+            summary['client']['scheduler_queued'] = self.scheduler.get_queue_lengths()
+        if self.response_cache is not None:
+            summary['client']['response_cache_entries'] = len(self.response_cache)
+        return summary
+
+    def get_many(self, endpoints, return_json=True, verify_ssl=True, max_workers=None, priority=None):
+        """This method performs GET requests for many endpoints concurrently and returns the results in order.
+
+        :param endpoints: The endpoint URIs to query (e.g. ``['/items/abc123', '/items/abc123/properties']``)
+        :type endpoints: list, tuple
+        :param return_json: Determines if JSON data should be returned
+        :type return_json: bool
+        :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+        :type verify_ssl: bool
+        :param max_workers: The maximum number of concurrent requests (``10`` by default, or the highest limit of the
+                            adaptive concurrency limiter when it is enabled)
+        :type max_workers: int, None
+        :param priority: The priority class used when the scheduler is enabled (the priority assigned to the current
+                         thread, or ``interactive``, by default)
+        :type priority: str, None
+        :returns: A list of the JSON data or raw responses in the same order as the endpoints
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+        """
+        return api.get_many(self, endpoints, return_json=return_json, verify_ssl=verify_ssl, max_workers=max_workers,
+                            priority=priority)
+
+    def request_priority(self, priority):
+        """This method returns a context manager that assigns a priority class to the requests of the current thread.
+
+        .. note:: The priority only affects the order of the requests when the scheduler is enabled.
+
+        :param priority: The name of the priority class (e.g. ``interactive`` or ``batch``)
+        :type priority: str
+        :returns: A context manager
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if self.scheduler is not None and priority not in self.scheduler.weights:
+            raise exceptions.InvalidFieldError(f"The value '{priority}' is not a defined priority class.")
+        return scheduler_module.request_priority(priority)
+
+    def process_pages(self, endpoint, transform=None, start=0, limit=100, max_workers=None, max_pending=None,
+                      max_pages=None):
+        """This method streams the pages of an endpoint into a process pool for decoding and transformation.
+
+        .. note:: The ``transform`` function must be defined at the module level so that it can be pickled, and it
+                  receives the list of decoded records for a single page.
+
+        :param endpoint: The endpoint URI to query (without the ``start`` and ``limit`` parameters)
+        :type endpoint: str
+        :param transform: The function to apply to the records of each page (returns the records as-is by default)
+        :type transform: function, None
+        :param start: The start position of the first paged request (``0`` by default)
+        :type start: int
+        :param limit: Maximum number of records returned per page (``100`` by default)
+        :type limit: int
+        :param max_workers: The number of worker processes (defaults to the number of CPU cores)
+        :type max_workers: int, None
+        :param max_pending: The maximum number of pages queued in the pool (defaults to twice the number of workers)
+        :type max_pending: int, None
+        :param max_pages: The maximum number of pages to retrieve (unlimited by default)
+        :type max_pages: int, None
+        :returns: A generator of the transformed results for each page in order
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+        """
+        return pipeline_module.process_pages(self, endpoint, transform=transform, start=start, limit=limit,
+                                             max_workers=max_workers, max_pending=max_pending, max_pages=max_pages)
+
+    def run_sharded_export(self, work_dir, output_dir=None, spot_ids=None, include_users=True, include_properties=True,
+                           include_content=False, limit=100, worker_count=4, lease_seconds=300):
+        """This method exports the users and the items (with their properties and content) of every Spot in shards.
+
+        .. note:: The shards are leased through a queue in the ``work_dir``, so the same call may be made on several
+                  hosts that share the directory to divide the export between them.
+
+        :param work_dir: The directory shared by the workers for the queue and the shard files
+        :type work_dir: str
+        :param output_dir: The directory in which the merged files are created (the output is not merged by default)
+        :type output_dir: str, None
+        :param spot_ids: The Spots whose items are exported (every Spot by default)
+        :type spot_ids: list, tuple, None
+        :param include_users: Determines if the users should be exported (``True`` by default)
+        :type include_users: bool
+        :param include_properties: Determines if the properties of each item should be exported (``True`` by default)
+        :type include_properties: bool
+        :param include_content: Determines if the content of each item should be downloaded (``False`` by default)
+        :type include_content: bool
+        :param limit: Maximum number of records returned per page (``100`` by default)
+        :type limit: int
+        :param worker_count: The number of worker threads on this host (``4`` by default)
+        :type worker_count: int
+        :param lease_seconds: The number of seconds after which a lease that is not renewed expires (``300`` by
+                              default)
+        :type lease_seconds: int, float
+        :returns: A dictionary with the ``progress`` of the export and the ``merged`` record counts (or ``None``)
+        :raises: :py:exc:`highspot.errors.exceptions.IncompleteExportError`
+        """
+        return coordinator.run_sharded_export(self, work_dir, output_dir=output_dir, spot_ids=spot_ids,
+                                              include_users=include_users, include_properties=include_properties,
+                                              include_content=include_content, limit=limit,
+                                              worker_count=worker_count, lease_seconds=lease_seconds)
+
+    def take_snapshot(self, resource, spot_id=None, limit=100, id_field='id'):
+        """This method retrieves every record for a resource and returns a snapshot of their content hashes.
+
+        :param resource: The resource to capture (``users``, ``groups`` or ``items``)
+        :type resource: str
+        :param spot_id: The unique identifier for the Spot (required when the resource is ``items``)
+        :type spot_id: str, None
+        :param limit: Maximum number of records returned per page (``100`` by default)
+        :type limit: int
+        :param id_field: The field that contains the unique identifier of each record (``id`` by default)
+        :type id_field: str
+        :returns: The :py:class:`highspot.snapshots.Snapshot` object
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                 :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+        """
+        return snapshots.take_snapshot(self, resource, spot_id=spot_id, limit=limit, id_field=id_field)
+
+    def diff_snapshot(self, previous, limit=100, id_field='id'):
+        """This method retrieves every record for the resource of a previous snapshot and identifies what changed.
+
+        :param previous: The snapshot from the previous run
+        :type previous: class[highspot.snapshots.Snapshot]
+        :param limit: Maximum number of records returned per page (``100`` by default)
+        :type limit: int
+        :param id_field: The field that contains the unique identifier of each record (``id`` by default)
+        :type id_field: str
+        :returns: The :py:class:`highspot.snapshots.SnapshotDiff` object, which includes the new snapshot
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                 :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+        """
+        return snapshots.diff_snapshot(self, previous, limit=limit, id_field=id_field)
 
     class Domain(object):
         """This class includes methods associated with Highspot domains."""
@@ -104,25 +467,50 @@ class Highspot(object):
             """
             self.hs_object = hs_object
 
-        def get_custom_usage_labels(self):
+        def get_custom_usage_labels(self, fields=None, exclude=None):
             """This method returns the custom usage labels in the user's domain.
 
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The custom usage labels data in JSON format
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return domain_module.get_custom_usage_labels(self.hs_object)
+            return domain_module.get_custom_usage_labels(self.hs_object, fields=fields, exclude=exclude)
 
-        def get_promoted_search_results(self, start=None, limit=None):
+        def get_promoted_search_results(self, start=None, limit=None, fields=None, exclude=None):
             """This method retrieves the existing promoted search terms and their associated items.
 
             :param start: The start position of a paged request (``0`` by default)
             :type start: int, str, None
             :param limit: Maximum number of users returned (``100`` by default)
             :type limit: int, str, None
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The promoted search data in JSON format
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return domain_module.get_promoted_search_results(self.hs_object, start=start, limit=limit)
+            return domain_module.get_promoted_search_results(self.hs_object, start=start, limit=limit, fields=fields,
+                                                             exclude=exclude)
+
+        def get_promoted_search_index(self, ttl=300, limit=100, max_prefix_length=20):
+            """This method returns a local index of the promoted search terms that is refreshed when its TTL expires.
+
+            .. note:: The index is built during the first lookup and subsequent lookups never wait for the API.
+
+            :param ttl: The number of seconds after which the index is refreshed (``300`` by default)
+            :type ttl: int, float
+            :param limit: Maximum number of records returned per page during a refresh (``100`` by default)
+            :type limit: int
+            :param max_prefix_length: The maximum length of the indexed prefixes (``20`` by default)
+            :type max_prefix_length: int
+            :returns: The :py:class:`highspot.search.PromotedSearchIndex` object
+            """
+            return search.PromotedSearchIndex(self.hs_object, ttl=ttl, limit=limit,
+                                              max_prefix_length=max_prefix_length)
 
     class Group(object):
         """This class includes methods associated with Highspot groups."""
@@ -134,7 +522,8 @@ class Highspot(object):
             """
             self.hs_object = hs_object
 
-        def get_groups(self, role_filter=None, right_filter=None, start=None, limit=None):
+        def get_groups(self, role_filter=None, right_filter=None, start=None, limit=None, fields=None, exclude=None,
+                       stream=False):
             """This method retrieves the list of groups.
 
             :param role_filter: Role by which to filter groups (``editor``, ``viewer``, ``manager``, or ``owner``)
@@ -145,22 +534,32 @@ class Highspot(object):
             :type start: str, int, None
             :param limit: The maximum number of groups returned
             :type limit: str, int, None
-            :returns: The group list data in JSON format
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
+            :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+            :type stream: bool
+            :returns: The group list data in JSON format (or a generator of the records when streaming)
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
                      :py:exc:`highspot.errors.exceptions.InvalidFieldError`
             """
             return groups_module.get_groups(self.hs_object, role_filter=role_filter, right_filter=right_filter,
-                                            start=start, limit=limit)
+                                            start=start, limit=limit, fields=fields, exclude=exclude, stream=stream)
 
-        def get_group(self, group_id):
+        def get_group(self, group_id, fields=None, exclude=None):
             """This method returns the metadata for a specific group.
 
             :param group_id: The unique identifier for the group
             :type group_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The group metadata in JSON format
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return groups_module.get_group(self.hs_object, group_id=group_id)
+            return groups_module.get_group(self.hs_object, group_id=group_id, fields=fields, exclude=exclude)
 
     class Item(object):
         """This class includes methods associated with Highspot items."""
@@ -172,7 +571,7 @@ class Highspot(object):
             """
             self.hs_object = hs_object
 
-        def get_items(self, spot_id, list_id=None, start=0, limit=100):
+        def get_items(self, spot_id, list_id=None, start=0, limit=100, fields=None, exclude=None, stream=False):
             """This method retrieves the items for a specific Spot.
 
             :param spot_id: The unique identifier for the Spot (**required**)
@@ -183,30 +582,100 @@ class Highspot(object):
             :type start: int, str
             :param limit: Maximum number of users returned (``100`` by default)
             :type limit: int, str
-            :returns: A dictionary containing the items
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
+            :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+            :type stream: bool
+            :returns: A dictionary containing the items (or a generator of the records when streaming)
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return items_module.get_items(self.hs_object, spot_id=spot_id, list_id=list_id, start=start, limit=limit)
+            return items_module.get_items(self.hs_object, spot_id=spot_id, list_id=list_id, start=start, limit=limit,
+                                          fields=fields, exclude=exclude, stream=stream)
+
+        def export_items(self, spot_id, output_path, list_id=None, limit=100, fields=None, exclude=None,
+                         output_format='jsonl', checkpoint_path=None, resume=True):
+            """This method exports every item in a Spot to a file, resuming from the checkpoint of an earlier attempt.
+
+            :param spot_id: The unique identifier for the Spot (**required**)
+            :type spot_id: str
+            :param output_path: The path to the output file, which is only created once the export is complete
+            :type output_path: str
+            :param list_id: The unique identifier for a list by which to filter the items
+            :type list_id: str, None
+            :param limit: Maximum number of items returned per page (``100`` by default)
+            :type limit: int
+            :param fields: The field(s) to retain in the exported records (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the exported records
+            :type exclude: str, tuple, list, set, None
+            :param output_format: The output format (``jsonl`` for one record per line or ``json`` for a JSON array)
+            :type output_format: str
+            :param checkpoint_path: The path to the checkpoint file (``{output_path}.checkpoint`` by default)
+            :type checkpoint_path: str, None
+            :param resume: Determines if an existing checkpoint should be resumed (``True`` by default)
+            :type resume: bool
+            :returns: The number of exported items
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                     :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+                     :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                     :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+            """
+            return exports.export_items(self.hs_object, spot_id, output_path, list_id=list_id, limit=limit,
+                                        fields=fields, exclude=exclude, output_format=output_format,
+                                        checkpoint_path=checkpoint_path, resume=resume)
+
+        def export_item_store(self, spot_id, file_path, limit=100, fields=None, exclude=None):
+            """This method exports every item in a Spot to a memory-mapped columnar store indexed by item ID.
+
+            .. note:: The store can be opened read-only by any number of processes with the
+                      :py:func:`highspot.columnar.open_store` function rather than each retrieving the items.
+
+            :param spot_id: The unique identifier for the Spot (**required**)
+            :type spot_id: str
+            :param file_path: The path to the store file, which is only replaced once the export is complete
+            :type file_path: str
+            :param limit: Maximum number of items returned per page (``100`` by default)
+            :type limit: int
+            :param fields: The field(s) to retain in the stored records (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the stored records
+            :type exclude: str, tuple, list, set, None
+            :returns: The number of stored items
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                     :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+            """
+            return columnar.export_store(self.hs_object, 'items', file_path, spot_id=spot_id, limit=limit,
+                                         fields=fields, exclude=exclude)
 
-        def get_item(self, item_id):
+        def get_item(self, item_id, fields=None, exclude=None):
             """This method retrieves the metadata for a specific item.
 
             :param item_id: The unique identifier for the specific item
             :type item_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The item metadata as a dictionary
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return items_module.get_item(self.hs_object, item_id=item_id)
+            return items_module.get_item(self.hs_object, item_id=item_id, fields=fields, exclude=exclude)
 
-        def get_item_bookmarks(self, item_id):
+        def get_item_bookmarks(self, item_id, fields=None, exclude=None):
             """This method retrieves the bookmarks for a specific item.
 
             :param item_id: The unique identifier for the specific item
             :type item_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The item bookmarks as a dictionary
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return items_module.get_item_bookmarks(self.hs_object, item_id=item_id)
+            return items_module.get_item_bookmarks(self.hs_object, item_id=item_id, fields=fields, exclude=exclude)
 
         def get_item_content(self, item_id, report=False):
             """This method retrieves the content for a specific item.
@@ -221,6 +690,47 @@ class Highspot(object):
             # TODO: Add support for the start parameter
             return items_module.get_item_content(self.hs_object, item_id=item_id, report=report)
 
+        def get_item_content_bytes(self, item_id, report=False):
+            """This method retrieves the content for a specific item as raw bytes without decoding it as text.
+
+            :param item_id: The unique identifier for the specific item
+            :type item_id: str
+            :param report: Indicates that the content is a report and should be returned in CSV format (``False`` by
+                           default)
+            :type report: bool
+            :returns: The item content as bytes
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                     :py:exc:`highspot.errors.exceptions.APIRequestError`
+            """
+            return items_module.get_item_content_bytes(self.hs_object, item_id=item_id, report=report)
+
+        def download_item_content(self, item_id, destination, report=False, hash_algorithm=None, chunk_size=65536):
+            """This method streams the content for a specific item into a buffer, a file object or a file path.
+
+            :param item_id: The unique identifier for the specific item
+            :type item_id: str
+            :param destination: A :py:class:`bytearray` object (which is extended with the content), a writable
+                                :py:class:`memoryview` object (which is filled from the start), a file object opened
+                                in binary mode, or the path to a file (which is only replaced once the download is
+                                complete)
+            :type destination: bytearray, memoryview, str, class[io.BufferedIOBase]
+            :param report: Indicates that the content is a report and should be returned in CSV format (``False`` by
+                           default)
+            :type report: bool
+            :param hash_algorithm: The :py:mod:`hashlib` algorithm with which to hash the content (e.g. ``sha256``)
+            :type hash_algorithm: str, None
+            :param chunk_size: The maximum number of bytes read from the response at a time (``65536`` by default)
+            :type chunk_size: int
+            :returns: A dictionary with the ``size`` of the content in bytes and its hexadecimal ``hash`` (or ``None``)
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                     :py:exc:`highspot.errors.exceptions.APIRequestError`,
+                     :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+                     :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+            """
+            return items_module.download_item_content(self.hs_object, item_id=item_id, destination=destination,
+                                                      report=report, hash_algorithm=hash_algorithm,
+                                                      chunk_size=chunk_size)
+
         def get_item_report(self, item_id):
             """This method retrieves a CSV report for a specific item.
 
@@ -232,47 +742,125 @@ class Highspot(object):
             # TODO: Add support for the start parameter
             return items_module.get_item_report(self.hs_object, item_id=item_id)
 
-        def get_cms_metadata(self, item_id):
+        def get_item_report_frame(self, item_id, column_types=None, use_numpy=None):
+            """This method retrieves a CSV report for a specific item and loads it into typed columns for aggregation.
+
+            :param item_id: The unique identifier for the specific item
+            :type item_id: str
+            :param column_types: Dictionary with column names as keys and the column types (``numeric``,
+                                 ``timestamp`` or ``categorical``) as values for any columns whose types should not
+                                 be inferred
+            :type column_types: dict, None
+            :param use_numpy: Determines if NumPy arrays should be used (``True`` when NumPy is installed by default)
+            :type use_numpy: bool, None
+            :returns: The :py:class:`highspot.analytics.ReportFrame` object
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                     :py:exc:`highspot.errors.exceptions.DataMismatchError`
+            """
+            return analytics.load_item_report(self.hs_object, item_id=item_id, column_types=column_types,
+                                              use_numpy=use_numpy)
+
+        def get_cms_metadata(self, item_id, fields=None, exclude=None):
             """This method retrieves item metadata when the item was imported through an external CMS.
 
             :param item_id: The unique identifier for the specific item
             :type item_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The CMS metadata
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return items_module.get_cms_metadata(self.hs_object, item_id=item_id)
+            return items_module.get_cms_metadata(self.hs_object, item_id=item_id, fields=fields, exclude=exclude)
 
-        def get_item_thumbnails(self, item_id):
+        def get_item_thumbnails(self, item_id, fields=None, exclude=None):
             """This method retrieves the thumbnail(s) for a given item.
 
             :param item_id: The unique identifier for the specific item
             :type item_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The thumbnail data
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return items_module.get_item_thumbnails(self.hs_object, item_id=item_id)
+            return items_module.get_item_thumbnails(self.hs_object, item_id=item_id, fields=fields, exclude=exclude)
+
+        def get_item_thumbnail_files(self, item_ids, cache_dir=None, max_cache_size=None, max_workers=10,
+                                     refresh=False):
+            """This method downloads the thumbnail images for many items into a local cache and returns their paths.
+
+            .. note:: The images are stored under the digest of their content, so an image shared by several items is
+                      only stored once, and items whose images are already cached are resolved without any API calls.
+
+            :param item_ids: The unique identifiers for the items
+            :type item_ids: list, tuple, set
+            :param cache_dir: The directory in which the images are cached (``~/.cache/highspot/thumbnails`` by
+                              default)
+            :type cache_dir: str, None
+            :param max_cache_size: The maximum combined size of the cached images in bytes (256 MB by default)
+            :type max_cache_size: int, None
+            :param max_workers: The maximum number of concurrent requests (``10`` by default)
+            :type max_workers: int
+            :param refresh: Determines if the thumbnails should be retrieved again even when cached (``False`` by
+                            default)
+            :type refresh: bool
+            :returns: A dictionary with the item IDs as keys and lists of the local image paths as values
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                     :py:exc:`highspot.errors.exceptions.APIRequestError`
+            """
+            return items_module.get_item_thumbnail_files(self.hs_object, item_ids, cache_dir=cache_dir,
+                                                         max_cache_size=max_cache_size, max_workers=max_workers,
+                                                         refresh=refresh)
+
+        def get_item_search_index(self, path=':memory:', backend=None):
+            """This method returns a local full-text index of item metadata that is populated one Spot at a time.
+
+            .. note:: The index is populated and incrementally refreshed with the
+                      :py:meth:`highspot.search.ItemSearchIndex.update_spot` method.
+
+            :param path: The path to the SQLite database file (in memory by default)
+            :type path: str
+            :param backend: The backend to use (``fts5`` or ``inverted``) which is ``fts5`` when supported by default
+            :type backend: str, None
+            :returns: The :py:class:`highspot.search.ItemSearchIndex` object
+            :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                     :py:exc:`highspot.errors.exceptions.CurrentlyUnsupportedError`
+            """
+            return search.ItemSearchIndex(self.hs_object, path=path, backend=backend)
 
-        def get_item_properties(self, item_id):
+        def get_item_properties(self, item_id, fields=None, exclude=None):
             """This method retrieves the properties for a given item.
 
             :param item_id: The unique identifier for the specific item
             :type item_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The properties data
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return items_module.get_item_properties(self.hs_object, item_id=item_id)
+            return items_module.get_item_properties(self.hs_object, item_id=item_id, fields=fields, exclude=exclude)
 
-        def get_item_property(self, item_id, property_name):
+        def get_item_property(self, item_id, property_name, fields=None, exclude=None):
             """This method retrieves a specific property for a given item.
 
             :param item_id: The unique identifier for the specific item
             :type item_id: str
             :param property_name: The name of the property to retrieve
             :type property_name: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The value of the property in JSON format
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return items_module.get_item_property(self.hs_object, item_id=item_id, property_name=property_name)
+            return items_module.get_item_property(self.hs_object, item_id=item_id, property_name=property_name,
+                                                  fields=fields, exclude=exclude)
 
     class Pitch(object):
         """This class includes methods associated with Highspot pitches."""
@@ -284,7 +872,7 @@ class Highspot(object):
             """
             self.hs_object = hs_object
 
-        def get_pitches(self, start=0, limit=25, sort_by='recent_activity'):
+        def get_pitches(self, start=0, limit=25, sort_by='recent_activity', fields=None, exclude=None, stream=False):
             """This method retrieves a list of the user's pitches.
 
             :param start: The start position of a paged request (``0`` by default)
@@ -293,11 +881,18 @@ class Highspot(object):
             :type limit: int, str
             :param sort_by: Determines how the data is sorted (``recent_activity``, ``alphabetical``, or ``date_created``)
             :type sort_by: str
-            :returns: The pitch data in JSON format
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
+            :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+            :type stream: bool
+            :returns: The pitch data in JSON format (or a generator of the records when streaming)
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
                      :py:exc:`highspot.errors.exceptions.InvalidFieldError`
             """
-            return pitches_module.get_pitches(self.hs_object, start=start, limit=limit, sort_by=sort_by)
+            return pitches_module.get_pitches(self.hs_object, start=start, limit=limit, sort_by=sort_by, fields=fields,
+                                              exclude=exclude, stream=stream)
 
     class Request(object):
         """This class includes methods associated with Highspot asynchronous requests."""
@@ -309,25 +904,54 @@ class Highspot(object):
             """
             self.hs_object = hs_object
 
-        def get_request_status(self, request_id):
+        def get_request_status(self, request_id, fields=None, exclude=None):
             """This function returns the status of an asynchronous request.
 
             :param request_id: The ID of the request to check
             :type request_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The status of the request
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return request_module.get_request_status(self.hs_object, request_id=request_id)
+            return request_module.get_request_status(self.hs_object, request_id=request_id, fields=fields,
+                                                     exclude=exclude)
 
-        def get_request_result(self, request_id):
+        def get_request_result(self, request_id, fields=None, exclude=None):
             """This function returns the result of an asynchronous request.
 
             :param request_id: The ID of the request to check
             :type request_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The status of the request
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return request_module.get_request_result(self.hs_object, request_id=request_id)
+            return request_module.get_request_result(self.hs_object, request_id=request_id, fields=fields,
+                                                     exclude=exclude)
+
+        def wait_for_request(self, request_id, interval=2.0, timeout=300.0, include_result=True):
+            """This method polls the status of an asynchronous request until it finishes and returns its result.
+
+            :param request_id: The ID of the request to wait for
+            :type request_id: str
+            :param interval: The number of seconds to wait before checking the status again (``2`` by default)
+            :type interval: int, float
+            :param timeout: The maximum number of seconds to wait (``300`` by default, or ``None`` to wait indefinitely)
+            :type timeout: int, float, None
+            :param include_result: Determines if the result should be retrieved once the request finishes (``True``
+                                   by default)
+            :type include_result: bool
+            :returns: A dictionary with the final ``status`` data and the ``result`` data (or ``None``)
+            :raises: :py:exc:`TimeoutError`,
+                     :py:exc:`highspot.errors.exceptions.APIConnectionError`
+            """
+            return request_module.wait_for_request(self.hs_object, request_id=request_id, interval=interval,
+                                                   timeout=timeout, include_result=include_result)
 
     class Spot(object):
         """This class includes methods associated with Highspot spots and lists."""
@@ -349,15 +973,20 @@ class Highspot(object):
             """
             self.hs_object = hs_object
 
-        def me(self):
+        def me(self, fields=None, exclude=None):
             """This method returns the information about the user making the API call.
 
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: A dictionary with the user data
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return users_module.me(self.hs_object)
+            return users_module.me(self.hs_object, fields=fields, exclude=exclude)
 
-        def get_users(self, email=None, list_type=None, with_fields=None, exclude_fields=None, start=0, limit=100):
+        def get_users(self, email=None, list_type=None, with_fields=None, exclude_fields=None, start=0, limit=100,
+                      fields=None, exclude=None, stream=False):
             """This method retrieves a list of users.
 
             :param email: An email address by which to filter the users
@@ -372,41 +1001,112 @@ class Highspot(object):
             :type start: int, str
             :param limit: Maximum number of users returned (``100`` by default)
             :type limit: int, str
-            :returns: A dictionary containing the user data
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
+            :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+            :type stream: bool
+            :returns: A dictionary containing the user data (or a generator of the records when streaming)
             :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
                      :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
             return users_module.get_users(self.hs_object, email=email, list_type=list_type, with_fields=with_fields,
-                                          exclude_fields=exclude_fields, start=start, limit=limit)
+                                          exclude_fields=exclude_fields, start=start, limit=limit, fields=fields,
+                                          exclude=exclude, stream=stream)
+
+        def export_users(self, output_path, email=None, list_type=None, limit=100, fields=None, exclude=None,
+                         output_format='jsonl', checkpoint_path=None, resume=True):
+            """This method exports every user to a file, resuming from a checkpoint left by an earlier attempt.
+
+            :param output_path: The path to the output file, which is only created once the export is complete
+            :type output_path: str
+            :param email: An email address by which to filter the users
+            :type email: str, None
+            :param list_type: Allows filtering by ``all`` or ``unverified`` users (filters by ``verified`` users by default)
+            :type list_type: str, None
+            :param limit: Maximum number of users returned per page (``100`` by default)
+            :type limit: int
+            :param fields: The field(s) to retain in the exported records (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the exported records, which are also excluded by the server
+            :type exclude: str, tuple, list, set, None
+            :param output_format: The output format (``jsonl`` for one record per line or ``json`` for a JSON array)
+            :type output_format: str
+            :param checkpoint_path: The path to the checkpoint file (``{output_path}.checkpoint`` by default)
+            :type checkpoint_path: str, None
+            :param resume: Determines if an existing checkpoint should be resumed (``True`` by default)
+            :type resume: bool
+            :returns: The number of exported users
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                     :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+                     :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+            """
+            return exports.export_users(self.hs_object, output_path, email=email, list_type=list_type, limit=limit,
+                                        fields=fields, exclude=exclude, output_format=output_format,
+                                        checkpoint_path=checkpoint_path, resume=resume)
+
+        def export_user_store(self, file_path, limit=100, fields=None, exclude=None):
+            """This method exports every user to a memory-mapped columnar store indexed by user ID.
+
+            .. note:: The store can be opened read-only by any number of processes with the
+                      :py:func:`highspot.columnar.open_store` function rather than each retrieving the users.
+
+            :param file_path: The path to the store file, which is only replaced once the export is complete
+            :type file_path: str
+            :param limit: Maximum number of users returned per page (``100`` by default)
+            :type limit: int
+            :param fields: The field(s) to retain in the stored records (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the stored records
+            :type exclude: str, tuple, list, set, None
+            :returns: The number of stored users
+            :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+            """
+            return columnar.export_store(self.hs_object, 'users', file_path, limit=limit, fields=fields,
+                                         exclude=exclude)
 
-        def get_user(self, user_id):
+        def get_user(self, user_id, fields=None, exclude=None):
             """This method retrieves the metadata for a specific user.
 
             :param user_id: The unique identifier for the user
             :type user_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The user metadata as a dictionary
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return users_module.get_user(self.hs_object, user_id=user_id)
+            return users_module.get_user(self.hs_object, user_id=user_id, fields=fields, exclude=exclude)
 
-        def get_user_properties(self, user_id):
+        def get_user_properties(self, user_id, fields=None, exclude=None):
             """This method retrieves the properties for a specific user.
 
             :param user_id: The unique identifier for the user
             :type user_id: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The user properties as a dictionary
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return users_module.get_user_properties(self.hs_object, user_id=user_id)
+            return users_module.get_user_properties(self.hs_object, user_id=user_id, fields=fields, exclude=exclude)
 
-        def get_user_property(self, user_id, property_name):
+        def get_user_property(self, user_id, property_name, fields=None, exclude=None):
             """This method retrieves a given property for a specific user.
 
             :param user_id: The unique identifier for the user
             :type user_id: str
             :param property_name: The name of the property value to return
             :type property_name: str
+            :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+            :type fields: str, tuple, list, set, None
+            :param exclude: The field(s) to remove from the returned record(s)
+            :type exclude: str, tuple, list, set, None
             :returns: The user properties as a dictionary
             :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
             """
-            return users_module.get_user_property(self.hs_object, user_id=user_id, property_name=property_name)
+            return users_module.get_user_property(self.hs_object, user_id=user_id, property_name=property_name,
+                                                  fields=fields, exclude=exclude)
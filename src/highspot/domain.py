@@ -4,26 +4,30 @@
 :Synopsis:          Defines the domain-related functions associated with the Highspot API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     17 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 from . import api
 from .errors import exceptions
 
 
-def get_custom_usage_labels(hs_object):
+def get_custom_usage_labels(hs_object, fields=None, exclude=None):
     """This function returns the custom usage labels in the user's domain.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The custom usage labels data in JSON format
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = '/domain/custom-usage-labels'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
-def get_promoted_search_results(hs_object, start=None, limit=None):
+def get_promoted_search_results(hs_object, start=None, limit=None, fields=None, exclude=None):
     """This function retrieves the existing promoted search terms and their associated items.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
@@ -32,13 +36,17 @@ def get_promoted_search_results(hs_object, start=None, limit=None):
     :type start: int, str, None
     :param limit: Maximum number of users returned (``100`` by default)
     :type limit: int, str, None
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The promoted search data in JSON format
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = '/domain/search/promoted'
-    endpoint += '?' if any((start, limit)) else endpoint
+    endpoint += '?' if any((start, limit)) else ''
     if start:
         endpoint += f'start={start}'
     if limit:
         endpoint += f'&limit={limit}' if '=' in endpoint else f'limit={limit}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
@@ -4,7 +4,7 @@
 :Synopsis:          Collection of exception classes relating to the highspot library
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     16 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 #################
@@ -124,6 +124,20 @@ class APIConnectionError(HighspotError):
         super().__init__(*args)
 
 
+class CircuitBreakerOpenError(APIConnectionError):
+    """This exception is used when a request is rejected because the circuit breaker for the endpoint is open."""
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "The request was rejected because the endpoint is currently considered unhealthy."
+        if not (args or kwargs):
+            args = (default_msg,)
+        elif 'endpoint' in kwargs:
+            custom_msg = f"{default_msg.split('the endpoint')[0]}the '{kwargs['endpoint']}' endpoint family" + \
+                         f"{default_msg.split('the endpoint')[1]}"
+            args = (custom_msg,)
+        super().__init__(*args)
+
+
 class APIRequestError(HighspotError):
     """This exception is used for generic API request errors when there isn't a more specific exception."""
     def __init__(self, *args, **kwargs):
@@ -132,3 +146,46 @@ class APIRequestError(HighspotError):
         if not (args or kwargs):
             args = (default_msg,)
         super().__init__(*args)
+
+
+class RecordingNotFoundError(APIRequestError):
+    """This exception is used when a replayed request does not match any of the responses in a cassette file."""
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "The request does not match any of the recorded responses."
+        if not (args or kwargs):
+            args = (default_msg,)
+        elif 'url' in kwargs:
+            custom_msg = f"The request for the '{kwargs['url']}' URL does not match any of the recorded responses."
+            args = (custom_msg,)
+        super().__init__(*args)
+
+
+####################
+# Export Exceptions
+####################
+
+
+class IncompleteExportError(HighspotError):
+    """This exception is used when the output of an export is requested before every part of it has completed."""
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "The export has not completed successfully."
+        if not (args or kwargs):
+            args = (default_msg,)
+        super().__init__(*args)
+
+
+###################
+# Cache Exceptions
+###################
+
+
+class CacheBackendError(HighspotError):
+    """This exception is used when a cache backend cannot be accessed or returns an invalid entry."""
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "The cache backend could not be accessed."
+        if not (args or kwargs):
+            args = (default_msg,)
+        super().__init__(*args)
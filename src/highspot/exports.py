@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.exports
+:Synopsis:          Defines long-running exports that checkpoint their progress after each page and can be resumed
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import json
+import time
+import urllib.parse
+
+from . import pipeline
+from .errors import exceptions
+from .utils import log_utils, projection
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the supported output formats
+JSON_LINES = 'jsonl'
+JSON_ARRAY = 'json'
+OUTPUT_FORMATS = (JSON_LINES, JSON_ARRAY)
+
+# Define the suffixes of the files that are kept alongside the output file while an export is in progress
+CHECKPOINT_SUFFIX = '.checkpoint'
+PARTIAL_SUFFIX = '.part'
+
+
+def export_users(hs_object, output_path, email=None, list_type=None, limit=100, fields=None, exclude=None,
+                 output_format=JSON_LINES, checkpoint_path=None, resume=True):
+    """This function exports every user to a file, resuming from a checkpoint left by an earlier attempt.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param output_path: The path to the output file, which is only created once the export is complete
+    :type output_path: str
+    :param email: An email address by which to filter the users
+    :type email: str, None
+    :param list_type: Allows filtering by ``all`` or ``unverified`` users (filters by ``verified`` users by default)
+    :type list_type: str, None
+    :param limit: Maximum number of users returned per page (``100`` by default)
+    :type limit: int
+    :param fields: The field(s) to retain in the exported records (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the exported records, which are also excluded by the server
+    :type exclude: str, tuple, list, set, None
+    :param output_format: The output format (``jsonl`` for one record per line or ``json`` for a JSON array)
+    :type output_format: str
+    :param checkpoint_path: The path to the checkpoint file (``{output_path}.checkpoint`` by default)
+    :type checkpoint_path: str, None
+    :param resume: Determines if an existing checkpoint should be resumed (``True`` by default)
+    :type resume: bool
+    :returns: The number of exported users
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    if list_type and list_type not in ('all', 'unverified', 'verified'):
+        raise exceptions.InvalidFieldError(val='list_type')
+    filters = {'email': email, 'list': list_type}
+    if exclude:
+        # Ask the server to omit the excluded fields so that they are not transferred at all
+        filters['exclude-fields'] = ','.join(projection.normalize_fields(exclude))
+    job = ExportJob(hs_object, '/users', output_path, filters=filters, limit=limit, fields=fields, exclude=exclude,
+                    output_format=output_format, checkpoint_path=checkpoint_path)
+    return job.run(resume=resume)
+
+
+def export_items(hs_object, spot_id, output_path, list_id=None, limit=100, fields=None, exclude=None,
+                 output_format=JSON_LINES, checkpoint_path=None, resume=True):
+    """This function exports every item in a Spot to a file, resuming from a checkpoint left by an earlier attempt.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param spot_id: The unique identifier for the Spot (**required**)
+    :type spot_id: str
+    :param output_path: The path to the output file, which is only created once the export is complete
+    :type output_path: str
+    :param list_id: The unique identifier for a list by which to filter the items
+    :type list_id: str, None
+    :param limit: Maximum number of items returned per page (``100`` by default)
+    :type limit: int
+    :param fields: The field(s) to retain in the exported records (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the exported records
+    :type exclude: str, tuple, list, set, None
+    :param output_format: The output format (``jsonl`` for one record per line or ``json`` for a JSON array)
+    :type output_format: str
+    :param checkpoint_path: The path to the checkpoint file (``{output_path}.checkpoint`` by default)
+    :type checkpoint_path: str, None
+    :param resume: Determines if an existing checkpoint should be resumed (``True`` by default)
+    :type resume: bool
+    :returns: The number of exported items
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+             :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+    """
+    if not spot_id:
+        raise exceptions.MissingRequiredDataError(param='spot_id')
+    job = ExportJob(hs_object, '/items', output_path, filters={'spot': spot_id, 'list': list_id}, limit=limit,
+                    fields=fields, exclude=exclude, output_format=output_format, checkpoint_path=checkpoint_path)
+    return job.run(resume=resume)
+
+
+class ExportJob(object):
+    """This class exports every record of a paged endpoint to a file and checkpoints its progress after each page.
+
+    The records are appended to a partial file (``{output_path}.part``) and, once each page has been written to disk,
+    the cursor (the endpoint, the filters, the next ``start`` offset and the size of the partial file) is saved to the
+    checkpoint file. If the export fails it can be run again to resume from the page after the last checkpoint, and
+    anything written to the partial file after that checkpoint is discarded. The output file is only created (by
+    renaming the completed partial file) once the last page has been exported.
+    """
+    def __init__(self, hs_object, endpoint, output_path, filters=None, limit=100, fields=None, exclude=None,
+                 output_format=JSON_LINES, checkpoint_path=None, collection_key=pipeline.COLLECTION_KEY):
+        """This method instantiates the :py:class:`highspot.exports.ExportJob` class object.
+
+        :param hs_object: The core :py:class:`highspot.Highspot` object
+        :type hs_object: class[highspot.Highspot]
+        :param endpoint: The endpoint URI to export (without the filters and the ``start`` and ``limit`` parameters)
+        :type endpoint: str
+        :param output_path: The path to the output file, which is only created once the export is complete
+        :type output_path: str
+        :param filters: Dictionary of query parameters by which to filter the records (``None`` values are ignored)
+        :type filters: dict, None
+        :param limit: Maximum number of records returned per page (``100`` by default)
+        :type limit: int
+        :param fields: The field(s) to retain in the exported records (all fields by default)
+        :type fields: str, tuple, list, set, None
+        :param exclude: The field(s) to remove from the exported records
+        :type exclude: str, tuple, list, set, None
+        :param output_format: The output format (``jsonl`` for one record per line or ``json`` for a JSON array)
+        :type output_format: str
+        :param checkpoint_path: The path to the checkpoint file (``{output_path}.checkpoint`` by default)
+        :type checkpoint_path: str, None
+        :param collection_key: The key that contains the records within each page (``collection`` by default)
+        :type collection_key: str
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise exceptions.InvalidFieldError(f"The value '{output_format}' is not a supported output format.")
+        self.hs_object = hs_object
+        self.endpoint = endpoint
+        self.output_path = output_path
+        self.filters = {key: str(value) for key, value in (filters or {}).items() if value is not None}
+        self.limit = int(limit)
+        self.fields = fields
+        self.exclude = exclude
+        self.output_format = output_format
+        self.checkpoint_path = checkpoint_path or f'{output_path}{CHECKPOINT_SUFFIX}'
+        self.partial_path = f'{output_path}{PARTIAL_SUFFIX}'
+        self.collection_key = collection_key
+        self.start = 0
+        self.record_count = 0
+        self.page_count = 0
+        self.completed = False
+        self._partial_size = 0
+
+    def get_filtered_endpoint(self):
+        """This method returns the endpoint URI with the filters as query parameters.
+
+        :returns: The endpoint URI without the ``start`` and ``limit`` parameters
+        """
+        if not self.filters:
+            return self.endpoint
+        separator = '&' if '?' in self.endpoint else '?'
+        return f'{self.endpoint}{separator}{urllib.parse.urlencode(self.filters)}'
+
+    def get_cursor(self):
+        """This method returns the cursor that is saved to the checkpoint file.
+
+        :returns: A dictionary with the endpoint, the filters, the paging position and the size of the partial output
+        """
+        return {
+            'endpoint': self.endpoint,
+            'filters': self.filters,
+            'limit': self.limit,
+            'output_format': self.output_format,
+            'start': self.start,
+            'record_count': self.record_count,
+            'page_count': self.page_count,
+            'partial_size': self._partial_size,
+            'updated_at': time.time(),
+        }
+
+    def load_checkpoint(self):
+        """This method restores the cursor from the checkpoint file if one exists.
+
+        :returns: Boolean value indicating if a checkpoint was loaded
+        :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return False
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+            cursor = json.load(checkpoint_file)
+        for key in ('endpoint', 'filters', 'limit', 'output_format'):
+            if cursor.get(key) != getattr(self, key):
+                raise exceptions.DataMismatchError(f"The checkpoint '{self.checkpoint_path}' belongs to a different "
+                                                   f"export (the '{key}' value does not match).")
+        self.start = cursor['start']
+        self.record_count = cursor['record_count']
+        self.page_count = cursor['page_count']
+        self._partial_size = cursor['partial_size']
+        return True
+
+    def run(self, resume=True, max_pages=None):
+        """This method exports the remaining pages, saving a checkpoint after each page.
+
+        :param resume: Determines if an existing checkpoint should be resumed (``True`` by default)
+        :type resume: bool
+        :param max_pages: The maximum number of pages to export before returning (unlimited by default)
+        :type max_pages: int, None
+        :returns: The number of exported records (so far, if ``max_pages`` was reached)
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                 :py:exc:`highspot.errors.exceptions.APIRequestError`,
+                 :py:exc:`highspot.errors.exceptions.DataMismatchError`
+        """
+        if not (resume and self.load_checkpoint()):
+            self._reset()
+        elif self._get_partial_file_size() < self._partial_size:
+            logger.warning(f"The partial output '{self.partial_path}' is incomplete so the export will restart.")
+            self._reset()
+        elif self.start:
+            logger.info(f"Resuming the export of '{self.endpoint}' at record {self.start}.")
+        self.completed = False
+        endpoint, pages_exported = self.get_filtered_endpoint(), 0
+        with open(self.partial_path, 'ab') as partial_file:
+            # Discard anything written after the last checkpoint (e.g. part of a page when the process was killed)
+            partial_file.truncate(self._partial_size)
+            while max_pages is None or pages_exported < max_pages:
+                # An error response raises before the page is written so the checkpoint still points to this page
+                records = pipeline.get_page(self.hs_object, endpoint, self.start, self.limit, fields=self.fields,
+                                            exclude=self.exclude, collection_key=self.collection_key)
+                partial_file.write(self._serialize_records(records))
+                partial_file.flush()
+                os.fsync(partial_file.fileno())
+                self._partial_size = partial_file.tell()
+                self.start += self.limit
+                self.record_count += len(records)
+                self.page_count += 1
+                pages_exported += 1
+                if len(records) < self.limit:
+                    self.completed = True
+                    break
+                self._save_checkpoint()
+        if self.completed:
+            self._finalize()
+        else:
+            self._save_checkpoint()
+        return self.record_count
+
+    def discard(self):
+        """This method removes the checkpoint and partial files so that the next run starts from the beginning.
+
+        :returns: None
+        """
+        for file_path in (self.checkpoint_path, self.partial_path):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    def _reset(self):
+        """This method moves the cursor back to the first page."""
+        self.start, self.record_count, self.page_count, self._partial_size = 0, 0, 0, 0
+
+    def _get_partial_file_size(self):
+        """This method returns the size of the partial file in bytes (or zero if it does not exist)."""
+        try:
+            return os.path.getsize(self.partial_path)
+        except OSError:
+            return 0
+
+    def _serialize_records(self, _records):
+        """This method serializes the records of a page in the output format as bytes."""
+        if not _records:
+            return b''
+        _lines = '\n'.join(json.dumps(_record, separators=(',', ':')) for _record in _records)
+        if self.output_format == JSON_ARRAY:
+            # Records are separated by commas, so each page after the first begins with one
+            _lines = _lines.replace('\n', ',\n')
+            if self._partial_size:
+                _lines = f',\n{_lines}'
+            return _lines.encode('utf-8')
+        return f'{_lines}\n'.encode('utf-8')
+
+    def _save_checkpoint(self):
+        """This method writes the cursor to the checkpoint file, replacing the existing file once it is complete."""
+        _temp_path = f'{self.checkpoint_path}.tmp'
+        with open(_temp_path, 'w', encoding='utf-8') as _checkpoint_file:
+            json.dump(self.get_cursor(), _checkpoint_file, separators=(',', ':'))
+            _checkpoint_file.flush()
+            os.fsync(_checkpoint_file.fileno())
+        os.replace(_temp_path, self.checkpoint_path)
+
+    def _finalize(self):
+        """This method moves the completed partial file into place as the output file and removes the checkpoint."""
+        if self.output_format == JSON_ARRAY:
+            _temp_path = f'{self.output_path}.tmp'
+            with open(self.partial_path, 'rb') as _partial_file, open(_temp_path, 'wb') as _output_file:
+                _output_file.write(b'[\n')
+                while True:
+                    _chunk = _partial_file.read(1024 * 1024)
+                    if not _chunk:
+                        break
+                    _output_file.write(_chunk)
+                _output_file.write(b'\n]\n' if self._partial_size else b']\n')
+                _output_file.flush()
+                os.fsync(_output_file.fileno())
+            os.replace(_temp_path, self.output_path)
+            os.remove(self.partial_path)
+        else:
+            os.replace(self.partial_path, self.output_path)
+        try:
+            os.remove(self.checkpoint_path)
+        except FileNotFoundError:
+            pass
+        logger.info(f"Exported {self.record_count} records from '{self.endpoint}' to '{self.output_path}'.")
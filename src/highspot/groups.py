@@ -4,14 +4,15 @@
 :Synopsis:          Defines the group-related functions associated with the Highspot API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     16 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 from . import api
 from .errors import exceptions
 
 
-def get_groups(hs_object, role_filter=None, right_filter=None, start=None, limit=None):
+def get_groups(hs_object, role_filter=None, right_filter=None, start=None, limit=None, fields=None, exclude=None,
+               stream=False):
     """This function retrieves the list of groups.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
@@ -24,7 +25,13 @@ def get_groups(hs_object, role_filter=None, right_filter=None, start=None, limit
     :type start: str, int, None
     :param limit: The maximum number of groups returned
     :type limit: str, int, None
-    :returns: The group list data in JSON format
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
+    :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+    :type stream: bool
+    :returns: The group list data in JSON format (or a generator of the records when streaming)
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
              :py:exc:`highspot.errors.exceptions.InvalidFieldError`
     """
@@ -43,18 +50,22 @@ def get_groups(hs_object, role_filter=None, right_filter=None, start=None, limit
         endpoint += f'&start={start}' if '=' in endpoint else f'start={start}'
     if limit:
         endpoint += f'&limit={limit}' if '=' in endpoint else f'limit={limit}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude, stream=stream)
 
 
-def get_group(hs_object, group_id):
+def get_group(hs_object, group_id, fields=None, exclude=None):
     """This function returns the metadata for a specific group.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param group_id: The unique identifier for the group
     :type group_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The group metadata in JSON format
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/groups/{group_id}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
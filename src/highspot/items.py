@@ -4,14 +4,25 @@
 :Synopsis:          Defines the item-related functions associated with the Highspot API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     16 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
+import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
 from . import api
 from .errors import exceptions
+from .utils import content_cache, scheduler
+
+# Define the default directory in which thumbnail images are cached
+DEFAULT_THUMBNAIL_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'highspot', 'thumbnails')
 
+# Define the keys that may contain the URL of a thumbnail image
+THUMBNAIL_URL_KEYS = ('url', 'href')
 
-def get_items(hs_object, spot_id, list_id=None, start=0, limit=100):
+
+def get_items(hs_object, spot_id, list_id=None, start=0, limit=100, fields=None, exclude=None, stream=False):
     """This function retrieves the items for a specific Spot.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
@@ -24,41 +35,55 @@ def get_items(hs_object, spot_id, list_id=None, start=0, limit=100):
     :type start: int, str
     :param limit: Maximum number of users returned (``100`` by default)
     :type limit: int, str
-    :returns: A dictionary containing the items
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
+    :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+    :type stream: bool
+    :returns: A dictionary containing the items (or a generator of the records when streaming)
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/items?spot={spot_id}&start={start}&limit={limit}'
     if list_id and isinstance(list_id, str):
         endpoint += f'&list={list_id}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude, stream=stream)
 
 
-def get_item(hs_object, item_id):
+def get_item(hs_object, item_id, fields=None, exclude=None):
     """This function retrieves the metadata for a specific item.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param item_id: The unique identifier for the specific item
     :type item_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The item metadata as a dictionary
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/items/{item_id}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
-def get_item_bookmarks(hs_object, item_id):
+def get_item_bookmarks(hs_object, item_id, fields=None, exclude=None):
     """This function retrieves the bookmarks for a specific item.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param item_id: The unique identifier for the specific item
     :type item_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The item bookmarks as a dictionary
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/items/{item_id}/bookmarks'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
 def get_item_content(hs_object, item_id, report=False):
@@ -74,10 +99,7 @@ def get_item_content(hs_object, item_id, report=False):
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     # TODO: Add support for the start parameter
-    endpoint = f'/items/{item_id}/content'
-    if report:
-        endpoint += '?format=text/csv'
-    response = api.get_request_with_retries(hs_object, endpoint, return_json=False)
+    response = api.get_request_with_retries(hs_object, _get_content_endpoint(item_id, report), return_json=False)
     if response.status_code == 404 or response.status_code == 410:
         response = response.json()
     else:
@@ -85,6 +107,66 @@ def get_item_content(hs_object, item_id, report=False):
     return response
 
 
+def get_item_content_bytes(hs_object, item_id, report=False):
+    """This function retrieves the content for a specific item as raw bytes without decoding it as text.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param item_id: The unique identifier for the specific item
+    :type item_id: str
+    :param report: Indicates that the content is a report and should be returned in CSV format (False by default)
+    :type report: bool
+    :returns: The item content as bytes
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    return api.get_file_content(hs_object, _get_content_endpoint(item_id, report))
+
+
+def download_item_content(hs_object, item_id, destination, report=False, hash_algorithm=None, chunk_size=65536):
+    """This function streams the content for a specific item into a buffer, a file object or a file path.
+
+    .. note:: The content is written as each chunk is received without being decoded as text or held in memory in
+              full, and the hash (when requested) is calculated from the same chunks as they are written.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param item_id: The unique identifier for the specific item
+    :type item_id: str
+    :param destination: A :py:class:`bytearray` object (which is extended with the content), a writable
+                        :py:class:`memoryview` object (which is filled from the start), a file object opened in binary
+                        mode, or the path to a file (which is only replaced once the download is complete)
+    :type destination: bytearray, memoryview, str, class[io.BufferedIOBase]
+    :param report: Indicates that the content is a report and should be returned in CSV format (False by default)
+    :type report: bool
+    :param hash_algorithm: The :py:mod:`hashlib` algorithm with which to hash the content (e.g. ``sha256``)
+    :type hash_algorithm: str, None
+    :param chunk_size: The maximum number of bytes read from the response at a time (``65536`` by default)
+    :type chunk_size: int
+    :returns: A dictionary with the ``size`` of the content in bytes and its hexadecimal ``hash`` (or ``None``)
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    if hash_algorithm and hash_algorithm not in hashlib.algorithms_available:
+        raise exceptions.InvalidFieldError(f"The value '{hash_algorithm}' is not a supported hash algorithm.")
+    content_hash = hashlib.new(hash_algorithm) if hash_algorithm else None
+    chunks = api.stream_content(hs_object, _get_content_endpoint(item_id, report), chunk_size=chunk_size)
+    if isinstance(destination, str):
+        temp_path = f'{destination}.part'
+        try:
+            with open(temp_path, 'wb') as content_file:
+                size = _write_chunks(chunks, content_file, content_hash)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        os.replace(temp_path, destination)
+    else:
+        size = _write_chunks(chunks, destination, content_hash)
+    return {'size': size, 'hash': content_hash.hexdigest() if content_hash else None}
+
+
 def get_item_report(hs_object, item_id):
     """This function retrieves a CSV report for a specific item.
 
@@ -99,49 +181,154 @@ def get_item_report(hs_object, item_id):
     return get_item_content(hs_object, item_id, report=True)
 
 
-def get_cms_metadata(hs_object, item_id):
+def get_cms_metadata(hs_object, item_id, fields=None, exclude=None):
     """This function retrieves item metadata when the item was imported through an external CMS.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param item_id: The unique identifier for the specific item
     :type item_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The CMS metadata
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/items/{item_id}/cms/metadata'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
-def get_item_thumbnails(hs_object, item_id):
+def get_item_thumbnails(hs_object, item_id, fields=None, exclude=None):
     """This function retrieves the thumbnail(s) for a given item.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param item_id: The unique identifier for the specific item
     :type item_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The thumbnail data
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/items/{item_id}/thumbnails'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
+
+
+def get_thumbnail_urls(thumbnail_data):
+    """This function returns the unique image URLs found within the thumbnail data for an item.
+
+    :param thumbnail_data: The thumbnail data returned by the :py:func:`highspot.items.get_item_thumbnails` function
+    :type thumbnail_data: dict, list, str
+    :returns: A list of the image URLs in the order they were found
+    """
+    urls = []
+    if isinstance(thumbnail_data, str):
+        if thumbnail_data.startswith(('http://', 'https://', '/')):
+            urls.append(thumbnail_data)
+    elif isinstance(thumbnail_data, list):
+        for entry in thumbnail_data:
+            urls.extend(get_thumbnail_urls(entry))
+    elif isinstance(thumbnail_data, dict):
+        url_key = next((key for key in THUMBNAIL_URL_KEYS if isinstance(thumbnail_data.get(key), str)), None)
+        if url_key:
+            urls.append(thumbnail_data[url_key])
+        else:
+            for value in thumbnail_data.values():
+                if isinstance(value, (dict, list)):
+                    urls.extend(get_thumbnail_urls(value))
+    return list(dict.fromkeys(urls))
+
+
+def get_item_thumbnail_files(hs_object, item_ids, cache_dir=None, max_cache_size=None, max_workers=10,
+                             refresh=False):
+    """This function downloads the thumbnail images for many items into a local cache and returns their paths.
+
+    .. note:: The images are stored under the digest of their content, so an image shared by several items is only
+              stored once, and items whose images are already cached are resolved without any API calls.
+
+    .. note:: The images of the batch are not evicted while the batch is retrieved, so the cache may exceed its
+              maximum size (until the next image is stored) when the images of a single batch do not fit within it.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param item_ids: The unique identifiers for the items
+    :type item_ids: list, tuple, set
+    :param cache_dir: The directory in which the images are cached (``~/.cache/highspot/thumbnails`` by default)
+    :type cache_dir: str, None
+    :param max_cache_size: The maximum combined size of the cached images in bytes (256 MB by default)
+    :type max_cache_size: int, None
+    :param max_workers: The maximum number of concurrent requests (``10`` by default)
+    :type max_workers: int
+    :param refresh: Determines if the thumbnails should be retrieved again even when cached (``False`` by default)
+    :type refresh: bool
+    :returns: A dictionary with the item IDs as keys and lists of the local image paths as values
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    cache = _get_thumbnail_cache(hs_object, cache_dir, max_cache_size)
+    file_digests, pending_items, pinned_digests = {}, [], []
+    try:
+        for item_id in dict.fromkeys(item_ids):
+            item_digests = None if refresh else cache.get_alias(f'item:{item_id}', pin=True)
+            if item_digests is None:
+                pending_items.append(item_id)
+            else:
+                file_digests[item_id] = item_digests
+                pinned_digests.extend(item_digests)
+
+        # Resolve the thumbnails for the remaining items and download each unique image that is not cached (with
+        # every image of the batch pinned so that later downloads cannot evict the images that are returned)
+        aliases = {}
+        if pending_items:
+            # The downloads run as batch requests (unless the caller assigned a priority) on the worker threads
+            priority = scheduler.get_priority(scheduler.BATCH)
+            with ThreadPoolExecutor(max_workers=max_workers, initializer=scheduler.set_priority,
+                                    initargs=(priority,)) as executor:
+                item_urls = dict(zip(pending_items, executor.map(
+                    lambda item_id: get_thumbnail_urls(get_item_thumbnails(hs_object, item_id)), pending_items)))
+                url_digests, missing_urls = {}, []
+                for url in dict.fromkeys(url for urls in item_urls.values() for url in urls):
+                    cached_digests = None if refresh else cache.get_alias(url, pin=True)
+                    if cached_digests:
+                        url_digests[url] = cached_digests[0]
+                        pinned_digests.extend(cached_digests)
+                    else:
+                        missing_urls.append(url)
+                for url, digest in zip(missing_urls, executor.map(
+                        lambda url: _put_thumbnail(hs_object, cache, url, pinned_digests), missing_urls)):
+                    url_digests[url] = digest
+                    aliases[url] = [digest]
+            for item_id, urls in item_urls.items():
+                file_digests[item_id] = aliases[f'item:{item_id}'] = [url_digests[url] for url in urls]
+            cache.set_aliases(aliases)
+        return {item_id: [cache.get_path(digest) for digest in item_digests]
+                for item_id, item_digests in file_digests.items()}
+    finally:
+        cache.unpin(pinned_digests)
 
 
-def get_item_properties(hs_object, item_id):
+def get_item_properties(hs_object, item_id, fields=None, exclude=None):
     """This function retrieves the properties for a given item.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param item_id: The unique identifier for the specific item
     :type item_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The properties data in JSON format
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/items/{item_id}/properties'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
-def get_item_property(hs_object, item_id, property_name):
+def get_item_property(hs_object, item_id, property_name, fields=None, exclude=None):
     """This function retrieves a specific property for a given item.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
@@ -150,8 +337,101 @@ def get_item_property(hs_object, item_id, property_name):
     :type item_id: str
     :param property_name: The name of the property to retrieve
     :type property_name: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The value of the property in JSON format
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/items/{item_id}/properties/{property_name}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
+
+
+def _get_thumbnail_cache(_hs_object, _cache_dir=None, _max_cache_size=None):
+    """This function returns the thumbnail cache for a core object and creates it when necessary.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _cache_dir: The directory in which the images are cached (``~/.cache/highspot/thumbnails`` by default)
+    :type _cache_dir: str, None
+    :param _max_cache_size: The maximum combined size of the cached images in bytes (256 MB by default)
+    :type _max_cache_size: int, None
+    :returns: The :py:class:`highspot.utils.content_cache.ContentCache` object
+    """
+    _cache_dir = _cache_dir or DEFAULT_THUMBNAIL_CACHE_DIR
+    _cache = _hs_object.thumbnail_cache
+    if _cache is None or _cache.directory != _cache_dir:
+        _cache = content_cache.ContentCache(_cache_dir, _max_cache_size or content_cache.DEFAULT_MAX_SIZE)
+        _hs_object.thumbnail_cache = _cache
+    elif _max_cache_size:
+        _cache.max_size = _max_cache_size
+    return _cache
+
+
+def _put_thumbnail(_hs_object, _cache, _url, _pinned_digests):
+    """This function downloads a thumbnail image into the cache and pins it until the batch has been returned.
+
+    :param _hs_object: The core :py:class:`highspot.Highspot` object
+    :type _hs_object: class[highspot.Highspot]
+    :param _cache: The thumbnail cache
+    :type _cache: class[highspot.utils.content_cache.ContentCache]
+    :param _url: The URL of the thumbnail image
+    :type _url: str
+    :param _pinned_digests: The list of the pinned digests to which the digest of the image is added
+    :type _pinned_digests: list
+    :returns: The digest of the image
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    _digest, _ = _cache.put(api.get_file_content(_hs_object, _url), pin=True)
+    _pinned_digests.append(_digest)
+    return _digest
+
+
+def _get_content_endpoint(_item_id, _report=False):
+    """This function returns the endpoint URI for the content of an item.
+
+    :param _item_id: The unique identifier for the specific item
+    :type _item_id: str
+    :param _report: Indicates that the content is a report and should be returned in CSV format (False by default)
+    :type _report: bool
+    :returns: The endpoint URI
+    """
+    _endpoint = f'/items/{_item_id}/content'
+    return f'{_endpoint}?format=text/csv' if _report else _endpoint
+
+
+def _write_chunks(_chunks, _destination, _content_hash=None):
+    """This function writes chunks of content to a buffer or a file object and updates the hash as they are written.
+
+    :param _chunks: The chunks of content as bytes
+    :type _chunks: generator
+    :param _destination: A :py:class:`bytearray` object, a writable :py:class:`memoryview` object or a file object
+    :type _destination: bytearray, memoryview, class[io.BufferedIOBase]
+    :param _content_hash: The :py:mod:`hashlib` object to update with each chunk (if defined)
+    :returns: The number of bytes written
+    :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    if isinstance(_destination, memoryview):
+        if _destination.readonly:
+            raise exceptions.InvalidFieldError('The memoryview destination must be writable.')
+        _destination = _destination.cast('B')
+    elif not isinstance(_destination, bytearray) and not hasattr(_destination, 'write'):
+        raise exceptions.InvalidFieldError('The destination must be a bytearray, memoryview, file object or path.')
+    _size = 0
+    for _chunk in _chunks:
+        if _content_hash is not None:
+            _content_hash.update(_chunk)
+        if isinstance(_destination, bytearray):
+            _destination += _chunk
+        elif isinstance(_destination, memoryview):
+            if _size + len(_chunk) > len(_destination):
+                _chunks.close()
+                raise exceptions.DataMismatchError('The content is larger than the memoryview destination.')
+            _destination[_size:_size + len(_chunk)] = _chunk
+        else:
+            _destination.write(_chunk)
+        _size += len(_chunk)
+    return _size
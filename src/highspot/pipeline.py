@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.pipeline
+:Synopsis:          Defines helpers that decode and transform large exports across multiple worker processes
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import io
+import os
+import csv
+import json
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+from . import api
+from .errors import exceptions
+from .utils import log_utils, projection, scheduler
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the key that contains the records within a paged response and the key with the size of the collection
+COLLECTION_KEY = projection.COLLECTION_KEY
+COUNTS_TOTAL_KEY = 'counts_total'
+
+
+def iter_raw_pages(hs_object, endpoint, start=0, limit=100, max_pages=None):
+    """This function retrieves successive pages for an endpoint and yields the raw (undecoded) response bodies.
+
+    .. note:: The pages are requested until ``max_pages`` is reached or the generator is closed, as the end of the
+              collection can only be identified once a page has been decoded.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param endpoint: The endpoint URI to query (without the ``start`` and ``limit`` parameters)
+    :type endpoint: str
+    :param start: The start position of the first paged request (``0`` by default)
+    :type start: int
+    :param limit: Maximum number of records returned per page (``100`` by default)
+    :type limit: int
+    :param max_pages: The maximum number of pages to retrieve (unlimited by default)
+    :type max_pages: int, None
+    :returns: A generator of tuples containing the start position and the raw page content as bytes
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    page_count = 0
+    while max_pages is None or page_count < max_pages:
+        paged_endpoint = api.add_paging_params(endpoint, start, limit)
+        response = api.get_request_with_retries(hs_object, paged_endpoint, return_json=False,
+                                                priority=scheduler.get_priority(scheduler.BATCH))
+        _check_page_status(response, paged_endpoint)
+        yield start, response.content
+        start += limit
+        page_count += 1
+
+
+def iter_records(hs_object, endpoint, start=0, limit=100, max_pages=None, include_raw=False,
+                 collection_key=COLLECTION_KEY):
+    """This function streams successive pages for an endpoint and yields each record as soon as it is decoded.
+
+    .. note:: The pages are requested until a page returns fewer than ``limit`` records or ``max_pages`` is reached.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param endpoint: The endpoint URI to query (without the ``start`` and ``limit`` parameters)
+    :type endpoint: str
+    :param start: The start position of the first paged request (``0`` by default)
+    :type start: int
+    :param limit: Maximum number of records returned per page (``100`` by default)
+    :type limit: int
+    :param max_pages: The maximum number of pages to retrieve (unlimited by default)
+    :type max_pages: int, None
+    :param include_raw: Determines if each record should be yielded in a tuple with its raw JSON text
+                        (``False`` by default)
+    :type include_raw: bool
+    :param collection_key: The key that contains the records within each page (``collection`` by default)
+    :type collection_key: str
+    :returns: A generator of the records (or of tuples with each record and its raw JSON text)
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    limit, page_count = int(limit), 0
+    while max_pages is None or page_count < max_pages:
+        paged_endpoint = api.add_paging_params(endpoint, start, limit)
+        record_count = 0
+        for record in api.stream_records(hs_object, paged_endpoint, collection_key=collection_key,
+                                         include_raw=include_raw, priority=scheduler.get_priority(scheduler.BATCH)):
+            record_count += 1
+            yield record
+        if record_count < limit:
+            break
+        start += limit
+        page_count += 1
+
+
+def get_page(hs_object, endpoint, start=0, limit=100, fields=None, exclude=None, collection_key=COLLECTION_KEY,
+             priority=None):
+    """This function retrieves a single page for an endpoint and returns its records.
+
+    .. note:: An error response raises an exception rather than returning an empty page, so that a failed page is
+              never mistaken for the end of the collection.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param endpoint: The endpoint URI to query (without the ``start`` and ``limit`` parameters)
+    :type endpoint: str
+    :param start: The start position of the paged request (``0`` by default)
+    :type start: int
+    :param limit: Maximum number of records returned (``100`` by default)
+    :type limit: int
+    :param fields: The field(s) to retain in the returned records (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned records
+    :type exclude: str, tuple, list, set, None
+    :param collection_key: The key that contains the records within the page (``collection`` by default)
+    :type collection_key: str
+    :param priority: The priority class used when a request scheduler is enabled (``batch`` by default)
+    :type priority: str, None
+    :returns: A list of the records within the page
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    paged_endpoint = api.add_paging_params(endpoint, start, limit)
+    response = api.get_request_with_retries(hs_object, paged_endpoint, return_json=False,
+                                            priority=priority or scheduler.get_priority(scheduler.BATCH))
+    _check_page_status(response, paged_endpoint)
+    records = get_page_records(response.json(), collection_key)
+    return projection.project_response(records, fields, exclude)
+
+
+def decode_page(page_content, collection_key=COLLECTION_KEY):
+    """This function decodes the raw content of a paged response and returns its records.
+
+    :param page_content: The raw page content
+    :type page_content: bytes, str
+    :param collection_key: The key that contains the records within the page (``collection`` by default)
+    :type collection_key: str
+    :returns: A list of the records within the page
+    :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    page_data = json.loads(page_content)
+    return get_page_records(page_data, collection_key)
+
+
+def get_page_records(page_data, collection_key=COLLECTION_KEY):
+    """This function returns the records from a decoded page.
+
+    .. note:: If the collection key is not found then the first list value within the page is used, and a page without
+              any list (e.g. an error payload) raises an exception rather than being treated as the end of the data.
+
+    :param page_data: The decoded page data
+    :type page_data: dict, list
+    :param collection_key: The key that contains the records within the page (``collection`` by default)
+    :type collection_key: str
+    :returns: A list of the records within the page
+    :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    if isinstance(page_data, list):
+        return page_data
+    if isinstance(page_data, dict):
+        if isinstance(page_data.get(collection_key), list):
+            return page_data[collection_key]
+        for value in page_data.values():
+            if isinstance(value, list):
+                return value
+    raise exceptions.DataMismatchError('The page data does not contain a collection of records.')
+
+
+def flatten_record(record, separator='.', _prefix=''):
+    """This function flattens a nested record into a single-level dictionary.
+
+    :param record: The record to flatten
+    :type record: dict
+    :param separator: The string used to join nested keys (``.`` by default)
+    :type separator: str
+    :returns: The flattened record as a dictionary
+    """
+    flat_record = {}
+    for key, value in record.items():
+        full_key = f'{_prefix}{separator}{key}' if _prefix else str(key)
+        if isinstance(value, dict):
+            flat_record.update(flatten_record(value, separator, full_key))
+        elif isinstance(value, list):
+            flat_record[full_key] = json.dumps(value, separators=(',', ':'))
+        else:
+            flat_record[full_key] = value
+    return flat_record
+
+
+def flatten_records(records):
+    """This function flattens each record in a list and is intended to be used as a pipeline transform.
+
+    :param records: The records to flatten
+    :type records: list
+    :returns: A list of flattened records
+    """
+    return [flatten_record(record) for record in records]
+
+
+def process_pages(hs_object, endpoint, transform=None, start=0, limit=100, max_workers=None, max_pending=None,
+                  max_pages=None, collection_key=COLLECTION_KEY):
+    """This function streams raw pages into a process pool for decoding and transformation and yields the results.
+
+    The pages are retrieved in the current process while the worker processes decode and transform the previously
+    retrieved pages. The results are yielded in page order regardless of the order in which the workers finish.
+
+    .. note:: Up to ``max_pending`` pages are queued in the pool so that every worker stays busy. Once a decoded page
+              reveals the end of the collection (through its ``counts_total`` value or by returning fewer than
+              ``limit`` records) no further pages are requested and any queued pages beyond the end are cancelled, so
+              at most ``max_pending`` requests are performed for pages beyond the end of the collection.
+
+    .. note:: The ``transform`` function must be defined at the module level so that it can be pickled, and it
+              receives the list of decoded records for a single page.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param endpoint: The endpoint URI to query (without the ``start`` and ``limit`` parameters)
+    :type endpoint: str
+    :param transform: The function to apply to the records of each page (returns the records as-is by default)
+    :type transform: function, None
+    :param start: The start position of the first paged request (``0`` by default)
+    :type start: int
+    :param limit: Maximum number of records returned per page (``100`` by default)
+    :type limit: int
+    :param max_workers: The number of worker processes (defaults to the number of CPU cores)
+    :type max_workers: int, None
+    :param max_pending: The maximum number of pages queued in the pool (defaults to twice the number of workers)
+    :type max_pending: int, None
+    :param max_pages: The maximum number of pages to retrieve (unlimited by default)
+    :type max_pages: int, None
+    :param collection_key: The key that contains the records within each page (``collection`` by default)
+    :type collection_key: str
+    :returns: A generator of the transformed results for each page in order
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.APIRequestError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    limit = int(limit)
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or max_workers * 2
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending, next_start, end = collections.deque(), start, None
+        pages = iter_raw_pages(hs_object, endpoint, start, limit, max_pages)
+        try:
+            while True:
+                # Keep the pool busy with the following pages, other than those known to be beyond the end
+                while (end is None or next_start < end) and len(pending) < max_pending:
+                    try:
+                        page_start, page_content = next(pages)
+                    except StopIteration:
+                        end = next_start
+                        break
+                    pending.append((page_start, executor.submit(_decode_and_transform, page_content, transform,
+                                                                collection_key)))
+                    next_start = page_start + limit
+                if not pending:
+                    break
+
+                # Yield the oldest page to preserve the page order
+                page_start, future = pending.popleft()
+                record_count, counts_total, result = future.result()
+                yield result
+                if record_count < limit:
+                    end = page_start + limit
+                elif counts_total is not None:
+                    end = min(end, counts_total) if end is not None else counts_total
+                while pending and end is not None and pending[-1][0] >= end:
+                    pending.pop()[1].cancel()
+        finally:
+            pages.close()
+
+
+def process_csv(csv_content, transform=None, max_workers=None, chunk_size=5000):
+    """This function parses a large CSV report across a process pool and returns the merged results in order.
+
+    :param csv_content: The CSV content (e.g. from :py:func:`highspot.items.get_item_report`)
+    :type csv_content: str, bytes
+    :param transform: The function to apply to the rows (as dictionaries) of each chunk (returns the rows by default)
+    :type transform: function, None
+    :param max_workers: The number of worker processes (defaults to the number of CPU cores)
+    :type max_workers: int, None
+    :param chunk_size: The number of lines to parse within each worker task (``5000`` by default)
+    :type chunk_size: int
+    :returns: A list of the transformed results for each chunk in order
+    """
+    if isinstance(csv_content, bytes):
+        csv_content = csv_content.decode('utf-8-sig')
+    chunks = _split_csv_chunks(csv_content, chunk_size)
+    header_chunk = next(chunks, '')
+    fieldnames = next(csv.reader(io.StringIO(header_chunk)), [])
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_parse_csv_chunk, chunk, fieldnames, transform) for chunk in chunks]
+        return [future.result() for future in futures]
+
+
+def _decode_and_transform(_page_content, _transform, _collection_key):
+    """This function decodes a page and applies the transform within a worker process.
+
+    :param _page_content: The raw page content
+    :type _page_content: bytes
+    :param _transform: The function to apply to the decoded records
+    :type _transform: function, None
+    :param _collection_key: The key that contains the records within the page
+    :type _collection_key: str
+    :returns: A tuple containing the number of records on the page, the ``counts_total`` value of the page (or
+              ``None``) and the transformed result
+    """
+    _page_data = json.loads(_page_content)
+    _records = get_page_records(_page_data, _collection_key)
+    _counts_total = _page_data.get(COUNTS_TOTAL_KEY) if isinstance(_page_data, dict) else None
+    return len(_records), _counts_total if isinstance(_counts_total, int) else None, \
+        _transform(_records) if _transform else _records
+
+
+def _check_page_status(_response, _endpoint):
+    """This function raises an exception for an error response so that it is not treated as an empty page.
+
+    :param _response: The response returned for the page
+    :param _endpoint: The paged endpoint URI that was queried
+    :type _endpoint: str
+    :returns: None
+    :raises: :py:exc:`highspot.errors.exceptions.APIRequestError`
+    """
+    if _response.status_code >= 400:
+        raise exceptions.APIRequestError(f"The page '{_endpoint}' could not be retrieved and returned a "
+                                         f"{_response.status_code} response.")
+
+
+def _split_csv_chunks(_csv_content, _chunk_size):
+    """This function splits CSV content into chunks of lines without splitting quoted multi-line values.
+
+    .. note:: The first chunk that is yielded is always the header line.
+
+    :param _csv_content: The CSV content
+    :type _csv_content: str
+    :param _chunk_size: The approximate number of lines per chunk
+    :type _chunk_size: int
+    :returns: A generator of CSV chunks as strings
+    """
+    _lines, _chunk, _in_quotes, _header_found = _csv_content.splitlines(keepends=True), [], False, False
+    for _line in _lines:
+        _chunk.append(_line)
+        if _line.count('"') % 2:
+            _in_quotes = not _in_quotes
+        if _in_quotes:
+            continue
+        if not _header_found or len(_chunk) >= _chunk_size:
+            yield ''.join(_chunk)
+            _chunk, _header_found = [], True
+    if _chunk:
+        yield ''.join(_chunk)
+
+
+def _parse_csv_chunk(_chunk, _fieldnames, _transform):
+    """This function parses a chunk of CSV lines and applies the transform within a worker process.
+
+    :param _chunk: The CSV lines to parse
+    :type _chunk: str
+    :param _fieldnames: The field names from the CSV header
+    :type _fieldnames: list
+    :param _transform: The function to apply to the parsed rows
+    :type _transform: function, None
+    :returns: The transformed rows
+    """
+    _rows = list(csv.DictReader(io.StringIO(_chunk), fieldnames=_fieldnames))
+    return _transform(_rows) if _transform else _rows
@@ -4,14 +4,14 @@
 :Synopsis:          Defines the pitch-related functions associated with the Highspot API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     17 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 from . import api
 from .errors import exceptions
 
 
-def get_pitches(hs_object, start=0, limit=25, sort_by='recent_activity'):
+def get_pitches(hs_object, start=0, limit=25, sort_by='recent_activity', fields=None, exclude=None, stream=False):
     """This function retrieves a list of the user's pitches.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
@@ -22,7 +22,13 @@ def get_pitches(hs_object, start=0, limit=25, sort_by='recent_activity'):
     :type limit: int, str
     :param sort_by: Determines how the data is sorted (``recent_activity``, ``alphabetical``, or ``date_created``)
     :type sort_by: str
-    :returns: The pitch data in JSON format
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
+    :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+    :type stream: bool
+    :returns: The pitch data in JSON format (or a generator of the records when streaming)
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
              :py:exc:`highspot.errors.exceptions.InvalidFieldError`
     """
@@ -30,5 +36,5 @@ def get_pitches(hs_object, start=0, limit=25, sort_by='recent_activity'):
     if sort_by not in valid_sort_options:
         raise exceptions.InvalidFieldError(f"The value '{sort_by}' is not a valid sort option.")
     endpoint = f'/pitches?start={start}&limit={limit}&sortby={sort_by}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude, stream=stream)
 
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.pool
+:Synopsis:          Defines a pool that manages core objects for many tenants and schedules their calls fairly
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import threading
+import collections
+from concurrent.futures import Future
+
+from .core import Highspot
+from .errors import exceptions
+from .utils import log_utils
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+
+class HighspotPool(object):
+    """This class manages a :py:class:`highspot.Highspot` object per tenant and runs their calls on shared workers.
+
+    Each tenant has its own connection pool, rate limiter and metrics. The calls submitted for each tenant are queued
+    separately and the workers take them from the tenant queues in round-robin order, with a cap on the number of
+    calls each tenant may have in flight, so that a busy tenant cannot starve the others.
+    """
+    def __init__(self, credentials=None, max_workers=8, max_in_flight_per_tenant=None, **client_kwargs):
+        """This method instantiates the :py:class:`highspot.pool.HighspotPool` class object.
+
+        :param credentials: Dictionary with tenant names as keys and dictionaries with the ``username`` and
+                            ``password`` (and optionally other core object parameters) as values
+        :type credentials: dict, None
+        :param max_workers: The number of worker threads shared by all tenants (``8`` by default)
+        :type max_workers: int
+        :param max_in_flight_per_tenant: The maximum number of concurrent calls per tenant (defaults to half of the
+                                         workers when there is more than one worker)
+        :type max_in_flight_per_tenant: int, None
+        :param client_kwargs: Default parameters for the core objects (e.g. ``region`` or ``rate_limit``)
+        """
+        self.max_workers = max_workers
+        self.max_in_flight_per_tenant = max_in_flight_per_tenant or max(max_workers // 2, 1)
+        self.client_kwargs = client_kwargs
+        self.clients = {}
+        self._queues = {}
+        self._in_flight = {}
+        self._tenant_order = collections.deque()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._workers = []
+        for tenant, tenant_credentials in (credentials or {}).items():
+            self.add_tenant(tenant, **tenant_credentials)
+
+    def __enter__(self):
+        """This method allows the pool to be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """This method shuts down the pool when the context manager exits."""
+        self.shutdown()
+
+    def add_tenant(self, tenant, username=None, password=None, **kwargs):
+        """This method adds a tenant and instantiates its core object.
+
+        :param tenant: The name of the tenant
+        :type tenant: str
+        :param username: The username (i.e. API key) for the tenant
+        :type username: str
+        :param password: The password (i.e. API secret) for the tenant
+        :type password: str
+        :param kwargs: Parameters for the core object which override the defaults of the pool
+        :returns: The :py:class:`highspot.Highspot` object for the tenant
+        :raises: :py:exc:`highspot.errors.exceptions.MissingAuthDataError`
+        """
+        client = Highspot(username, password, **dict(self.client_kwargs, **kwargs))
+        with self._condition:
+            if tenant not in self.clients:
+                self._tenant_order.append(tenant)
+                self._queues[tenant] = collections.deque()
+                self._in_flight[tenant] = 0
+            self.clients[tenant] = client
+        return client
+
+    def remove_tenant(self, tenant):
+        """This method removes a tenant, cancels its queued calls and closes its connection pool.
+
+        :param tenant: The name of the tenant
+        :type tenant: str
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        with self._condition:
+            client = self._get_client(tenant)
+            for future, _, _, _ in self._queues.pop(tenant):
+                future.cancel()
+            self._tenant_order.remove(tenant)
+            self._in_flight.pop(tenant)
+            del self.clients[tenant]
+        client.close()
+
+    def get_client(self, tenant):
+        """This method returns the core object for a tenant.
+
+        :param tenant: The name of the tenant
+        :type tenant: str
+        :returns: The :py:class:`highspot.Highspot` object for the tenant
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        with self._condition:
+            return self._get_client(tenant)
+
+    def submit(self, tenant, func, *args, **kwargs):
+        """This method queues a call for a tenant and returns a future for its result.
+
+        :param tenant: The name of the tenant
+        :type tenant: str
+        :param func: A method path on the core object (e.g. ``users.get_user``) or a function that accepts the core
+                     object as its first argument
+        :type func: str, function
+        :param args: The positional arguments for the call
+        :param kwargs: The keyword arguments for the call
+        :returns: A :py:class:`concurrent.futures.Future` object for the result of the call
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`highspot.errors.exceptions.CurrentlyUnsupportedError`
+        """
+        future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise exceptions.CurrentlyUnsupportedError('Calls cannot be submitted after the pool is shut down.')
+            self._get_client(tenant)
+            self._queues[tenant].append((future, func, args, kwargs))
+            self._start_workers()
+            self._condition.notify()
+        return future
+
+    def map(self, tenant, func, *iterables):
+        """This method queues a call for each set of arguments and returns the results in order.
+
+        :param tenant: The name of the tenant
+        :type tenant: str
+        :param func: A method path on the core object (e.g. ``users.get_user``) or a function that accepts the core
+                     object as its first argument
+        :type func: str, function
+        :param iterables: The iterables that supply the positional arguments for each call
+        :returns: A generator of the results in the order the arguments were supplied
+        """
+        futures = [self.submit(tenant, func, *args) for args in zip(*iterables)]
+        for future in futures:
+            yield future.result()
+
+    def get_metrics(self):
+        """This method returns the metrics for each tenant along with its queued and in-flight call counts.
+
+        :returns: A dictionary with the tenant names as keys and the metrics dictionaries as values
+        """
+        with self._condition:
+            tenant_metrics = {tenant: client.get_metrics() for tenant, client in self.clients.items()}
+            for tenant, metrics in tenant_metrics.items():
+                metrics['client']['pool_queued'] = len(self._queues[tenant])
+                metrics['client']['pool_in_flight'] = self._in_flight[tenant]
+        return tenant_metrics
+
+    def shutdown(self, wait=True, cancel_queued=False):
+        """This method stops the workers and closes the connection pool of each tenant.
+
+        :param wait: Determines if the method should wait for the workers to exit (``True`` by default)
+        :type wait: bool
+        :param cancel_queued: Determines if calls that have not yet started should be cancelled (``False`` by default)
+        :type cancel_queued: bool
+        :returns: None
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_queued:
+                for tenant_queue in self._queues.values():
+                    while tenant_queue:
+                        tenant_queue.popleft()[0].cancel()
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+            for client in list(self.clients.values()):
+                client.close()
+
+    def _get_client(self, _tenant):
+        """This method returns the core object for a tenant or raises an exception if the tenant is unknown."""
+        if _tenant not in self.clients:
+            raise exceptions.InvalidFieldError(f"The tenant '{_tenant}' has not been added to the pool.")
+        return self.clients[_tenant]
+
+    def _start_workers(self):
+        """This method starts the worker threads the first time a call is submitted."""
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._run_worker, name=f'highspot-pool-{len(self._workers)}',
+                                      daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_task(self):
+        """This method returns the next call in round-robin tenant order or ``None`` when none are eligible.
+
+        .. note:: This method must be called while holding the condition lock.
+        """
+        for _ in range(len(self._tenant_order)):
+            tenant = self._tenant_order[0]
+            self._tenant_order.rotate(-1)
+            if self._queues[tenant] and self._in_flight[tenant] < self.max_in_flight_per_tenant:
+                self._in_flight[tenant] += 1
+                return (tenant,) + self._queues[tenant].popleft()
+        return None
+
+    def _run_worker(self):
+        """This method is the main loop of a worker thread."""
+        while True:
+            with self._condition:
+                task = self._next_task()
+                while task is None:
+                    if self._shutdown and not any(self._queues.values()):
+                        return
+                    self._condition.wait()
+                    task = self._next_task()
+                tenant, future, func, args, kwargs = task
+                client = self.clients[tenant]
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(_call(client, func, args, kwargs))
+                    except BaseException as exc:
+                        future.set_exception(exc)
+            finally:
+                with self._condition:
+                    if tenant in self._in_flight:
+                        self._in_flight[tenant] -= 1
+                    self._condition.notify_all()
+
+
+def _call(_client, _func, _args, _kwargs):
+    """This function performs a call against a core object using a method path or a function.
+
+    :param _client: The core object for the tenant
+    :type _client: class[highspot.Highspot]
+    :param _func: A method path on the core object (e.g. ``users.get_user``) or a function
+    :type _func: str, function
+    :param _args: The positional arguments for the call
+    :type _args: tuple
+    :param _kwargs: The keyword arguments for the call
+    :type _kwargs: dict
+    :returns: The value returned by the call
+    """
+    if isinstance(_func, str):
+        _target = _client
+        for _attr_name in _func.split('.'):
+            _target = getattr(_target, _attr_name)
+        return _target(*_args, **_kwargs)
+    return _func(_client, *_args, **_kwargs)
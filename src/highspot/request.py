@@ -4,36 +4,96 @@
 :Synopsis:          Defines the domain-related functions associated with the Highspot API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     20 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
+import time
+
 from . import api
 from .errors import exceptions
 
+# Define the status values which indicate that an asynchronous request has not finished yet
+PENDING_STATUSES = {'pending', 'queued', 'running', 'processing', 'in_progress', 'in progress', 'started'}
+
 
-def get_request_status(hs_object, request_id):
+def get_request_status(hs_object, request_id, fields=None, exclude=None):
     """This function returns the status of an asynchronous request.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param request_id: The ID of the request to check
     :type request_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The status of the request
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/requests/{request_id}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
-def get_request_result(hs_object, request_id):
+def get_request_result(hs_object, request_id, fields=None, exclude=None):
     """This function returns the result of an asynchronous request.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param request_id: The ID of the request to check
     :type request_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The status of the request
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/requests/{request_id}/result'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
+
+
+def wait_for_request(hs_object, request_id, interval=2.0, timeout=300.0, include_result=True):
+    """This function polls the status of an asynchronous request until it finishes and optionally returns its result.
+
+    .. note:: The polling interval doubles after each check (up to ten times the initial interval) so that long
+              running requests do not consume the rate limit.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param request_id: The ID of the request to wait for
+    :type request_id: str
+    :param interval: The number of seconds to wait before checking the status again (``2`` by default)
+    :type interval: int, float
+    :param timeout: The maximum number of seconds to wait (``300`` by default, or ``None`` to wait indefinitely)
+    :type timeout: int, float, None
+    :param include_result: Determines if the result should be retrieved once the request finishes (``True`` by
+                           default)
+    :type include_result: bool
+    :returns: A dictionary with the final ``status`` data and the ``result`` data (or ``None``)
+    :raises: :py:exc:`TimeoutError`,
+             :py:exc:`highspot.errors.exceptions.APIConnectionError`
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = interval
+    while True:
+        status = get_request_status(hs_object, request_id)
+        if not _is_pending(status):
+            break
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise TimeoutError(f"The request '{request_id}' did not finish within {timeout} seconds.")
+        time.sleep(delay)
+        delay = min(delay * 2, interval * 10)
+    result = get_request_result(hs_object, request_id) if include_result else None
+    return {'status': status, 'result': result}
+
+
+def _is_pending(_status):
+    """This function determines if the status data of an asynchronous request indicates that it has not finished.
+
+    :param _status: The status data returned by the API
+    :type _status: dict, str
+    :returns: Boolean value indicating if the request is still pending
+    """
+    if isinstance(_status, dict):
+        _status = _status.get('status', _status.get('state'))
+    return isinstance(_status, str) and _status.lower() in PENDING_STATUSES
@@ -0,0 +1,744 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.search
+:Synopsis:          Defines local indexes that answer search lookups without querying the API
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import re
+import json
+import math
+import heapq
+import time
+import sqlite3
+import hashlib
+import itertools
+import threading
+import collections
+import unicodedata
+
+from . import api, pipeline
+from .errors import exceptions
+from .utils import log_utils, scheduler
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the endpoint that returns the promoted search terms
+PROMOTED_SEARCH_ENDPOINT = '/domain/search/promoted'
+
+# Define the keys that may contain the search term and the promoted items within a promoted search record
+PROMOTED_TERM_KEYS = ('query', 'term', 'search_term', 'keyword', 'name')
+PROMOTED_ITEM_KEYS = ('items', 'item_ids', 'promoted_items', 'results')
+
+# Define the pattern that matches the characters which separate tokens
+TOKEN_SEPARATOR = re.compile(r'[\W_]+', re.UNICODE)
+
+# Define the names of the item search index backends
+FTS5 = 'fts5'
+INVERTED = 'inverted'
+
+# Define the relevance weights for the item fields and the BM25 ranking parameters
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 5.0
+PROPERTIES_WEIGHT = 1.0
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Cache whether the SQLite library supports FTS5
+_fts5_available = None
+
+
+def normalize_term(term):
+    """This function normalizes a search term by folding its case and accents and collapsing its punctuation.
+
+    :param term: The search term
+    :type term: str
+    :returns: The normalized search term (e.g. ``Q3 Pricing-Guide`` becomes ``q3 pricing guide``)
+    """
+    term = unicodedata.normalize('NFKD', str(term).casefold())
+    term = ''.join(char for char in term if not unicodedata.combining(char))
+    return ' '.join(TOKEN_SEPARATOR.split(term)).strip()
+
+
+def tokenize(text):
+    """This function splits text into its normalized tokens.
+
+    :param text: The text to tokenize
+    :type text: str
+    :returns: A list of the normalized tokens
+    """
+    normalized_text = normalize_term(text)
+    return normalized_text.split(' ') if normalized_text else []
+
+
+def get_promoted_terms(record):
+    """This function returns the search terms defined within a promoted search record.
+
+    :param record: The promoted search record
+    :type record: dict
+    :returns: A list of the search terms
+    """
+    for key in PROMOTED_TERM_KEYS:
+        value = record.get(key)
+        if isinstance(value, str):
+            return [value]
+        if isinstance(value, list):
+            return [term for term in value if isinstance(term, str)]
+    return []
+
+
+def get_promoted_item_ids(record):
+    """This function returns the IDs of the items promoted within a promoted search record.
+
+    :param record: The promoted search record
+    :type record: dict
+    :returns: A list of the item IDs in the order they are promoted
+    """
+    for key in PROMOTED_ITEM_KEYS:
+        value = record.get(key)
+        if isinstance(value, list):
+            return [str(item['id']) if isinstance(item, dict) else str(item) for item in value
+                    if not isinstance(item, dict) or 'id' in item]
+    return [str(record['item_id'])] if 'item_id' in record else []
+
+
+def fts5_available():
+    """This function determines if the SQLite library supports the FTS5 full-text search extension.
+
+    :returns: Boolean value indicating if FTS5 can be used
+    """
+    global _fts5_available
+    if _fts5_available is None:
+        try:
+            _connection = sqlite3.connect(':memory:')
+            _connection.execute('CREATE VIRTUAL TABLE fts5_check USING fts5(content)')
+            _connection.close()
+            _fts5_available = True
+        except sqlite3.OperationalError:
+            _fts5_available = False
+    return _fts5_available
+
+
+class PromotedSearchIndex(object):
+    """This class maps the normalized promoted search terms, their tokens and their prefixes to the promoted items.
+
+    The index is built from a single paged sweep of the promoted search terms, and the lookups are dictionary
+    operations that never query the API. When the time-to-live (TTL) expires, the next lookup starts a refresh in a
+    background thread and continues to use the existing index until the refresh completes, so a lookup only waits
+    for the API when the index has never been built.
+    """
+    def __init__(self, hs_object, ttl=300, limit=100, max_prefix_length=20):
+        """This method instantiates the :py:class:`highspot.search.PromotedSearchIndex` class object.
+
+        :param hs_object: The core :py:class:`highspot.Highspot` object
+        :type hs_object: class[highspot.Highspot]
+        :param ttl: The number of seconds after which the index is refreshed (``300`` by default)
+        :type ttl: int, float
+        :param limit: Maximum number of records returned per page during a refresh (``100`` by default)
+        :type limit: int
+        :param max_prefix_length: The maximum length of the indexed prefixes (``20`` by default)
+        :type max_prefix_length: int
+        """
+        self.hs_object = hs_object
+        self.ttl = ttl
+        self.limit = limit
+        self.max_prefix_length = max_prefix_length
+        self.refreshed_at = None
+        self.refresh_duration = None
+        self._terms, self._tokens, self._prefixes = {}, {}, {}
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+
+    def __len__(self):
+        """This method returns the number of normalized search terms in the index."""
+        return len(self._terms)
+
+    def refresh(self, background=False):
+        """This method rebuilds the index from a full sweep of the promoted search terms.
+
+        .. note:: The new index is built separately and then swapped in, so concurrent lookups never see a partially
+                  built index.
+
+        :param background: Determines if the refresh should be performed in a background thread (``False`` by
+                           default)
+        :type background: bool
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+        """
+        if background:
+            with self._lock:
+                if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                    return
+                self._refresh_thread = threading.Thread(target=self._refresh_in_background,
+                                                        name='highspot-promoted-search-refresh', daemon=True)
+                self._refresh_thread.start()
+            return
+        start_time = time.perf_counter()
+        terms, tokens, prefixes = {}, {}, {}
+        for record in pipeline.iter_records(self.hs_object, PROMOTED_SEARCH_ENDPOINT, limit=self.limit):
+            item_ids = get_promoted_item_ids(record)
+            for term in get_promoted_terms(record):
+                normalized_term = normalize_term(term)
+                if not normalized_term:
+                    continue
+                _add_item_ids(terms, normalized_term, item_ids)
+                for prefix in self._get_prefixes(normalized_term):
+                    _add_item_ids(prefixes, prefix, item_ids)
+                for token in normalized_term.split(' '):
+                    _add_item_ids(tokens, token, item_ids)
+                    for prefix in self._get_prefixes(token):
+                        _add_item_ids(prefixes, prefix, item_ids)
+        self._terms, self._tokens, self._prefixes = _freeze(terms), _freeze(tokens), _freeze(prefixes)
+        self.refreshed_at = time.monotonic()
+        self.refresh_duration = time.perf_counter() - start_time
+        logger.debug(f'The promoted search index was refreshed with {len(terms)} terms.',
+                     extra={'endpoint': PROMOTED_SEARCH_ENDPOINT, 'latency': self.refresh_duration})
+
+    def lookup(self, query):
+        """This method returns the items promoted for a search query that matches a promoted term exactly.
+
+        :param query: The search query
+        :type query: str
+        :returns: A tuple of the promoted item IDs
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+        """
+        self._ensure_fresh()
+        return self._terms.get(normalize_term(query), ())
+
+    def lookup_prefix(self, prefix):
+        """This method returns the items promoted for the terms (or the term tokens) that begin with a prefix.
+
+        :param prefix: The prefix of a search term (e.g. the text typed so far)
+        :type prefix: str
+        :returns: A tuple of the promoted item IDs
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+        """
+        self._ensure_fresh()
+        normalized_prefix = normalize_term(prefix)
+        if len(normalized_prefix) <= self.max_prefix_length:
+            return self._prefixes.get(normalized_prefix, ())
+
+        # Resolve prefixes that are longer than the indexed prefixes by scanning the terms and tokens
+        matches = {}
+        for key, item_ids in itertools.chain(self._terms.items(), self._tokens.items()):
+            if key.startswith(normalized_prefix):
+                matches.update(dict.fromkeys(item_ids))
+        return tuple(matches)
+
+    def lookup_tokens(self, query):
+        """This method returns the items promoted for terms that contain every token of a search query.
+
+        :param query: The search query
+        :type query: str
+        :returns: A tuple of the promoted item IDs
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
+        """
+        self._ensure_fresh()
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return ()
+        matches = self._tokens.get(query_tokens[0], ())
+        for token in query_tokens[1:]:
+            token_matches = set(self._tokens.get(token, ()))
+            matches = tuple(item_id for item_id in matches if item_id in token_matches)
+        return matches
+
+    def _ensure_fresh(self):
+        """This method builds the index if needed and starts a background refresh when the TTL has expired."""
+        if self.refreshed_at is None:
+            with self._lock:
+                if self.refreshed_at is None:
+                    self.refresh()
+        elif self.ttl is not None and time.monotonic() - self.refreshed_at >= self.ttl:
+            self.refresh(background=True)
+
+    def _refresh_in_background(self):
+        """This method refreshes the index and logs (rather than raises) any failure so the existing index is kept."""
+        try:
+            self.refresh()
+        except Exception as _exc_msg:
+            logger.warning(f'The promoted search index could not be refreshed: {type(_exc_msg).__name__}: '
+                           f'{_exc_msg}', extra={'endpoint': PROMOTED_SEARCH_ENDPOINT})
+
+    def _get_prefixes(self, _text):
+        """This method returns the prefixes of a normalized term or token up to the maximum prefix length."""
+        return (_text[:_length] for _length in range(1, min(len(_text), self.max_prefix_length) + 1))
+
+
+class ItemSearchIndex(object):
+    """This class maintains a local full-text index of item metadata that supports ranked keyword queries.
+
+    The index uses SQLite FTS5 when the available SQLite library supports it and falls back to an in-memory inverted
+    index otherwise. Each item is stored with the content hash of its record, so refreshing a Spot only re-indexes the
+    items that were added or changed and removes the items that no longer exist.
+    """
+    def __init__(self, hs_object=None, path=':memory:', backend=None):
+        """This method instantiates the :py:class:`highspot.search.ItemSearchIndex` class object.
+
+        :param hs_object: The core :py:class:`highspot.Highspot` object used to retrieve the items
+        :type hs_object: class[highspot.Highspot], None
+        :param path: The path to the SQLite database file (in memory by default), which is ignored by the inverted
+                     index backend
+        :type path: str
+        :param backend: The backend to use (``fts5`` or ``inverted``) which is ``fts5`` when supported by default
+        :type backend: str, None
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`highspot.errors.exceptions.CurrentlyUnsupportedError`
+        """
+        backend = backend or (FTS5 if fts5_available() else INVERTED)
+        if backend == FTS5:
+            if not fts5_available():
+                raise exceptions.CurrentlyUnsupportedError('The SQLite library does not support FTS5.')
+            self._backend = SQLiteFullTextBackend(path)
+        elif backend == INVERTED:
+            self._backend = InvertedIndexBackend()
+        else:
+            raise exceptions.InvalidFieldError(f"The value '{backend}' is not a valid search index backend.")
+        self.hs_object = hs_object
+        self.backend = backend
+        self.stats = {
+            'builds': 0,
+            'last_build_latency': None,
+            'total_build_latency': 0.0,
+            'queries': 0,
+            'total_query_latency': 0.0,
+            'max_query_latency': 0.0,
+        }
+        self._stats_lock = threading.Lock()
+
+    def __len__(self):
+        """This method returns the number of items in the index."""
+        return self._backend.count()
+
+    def add_items(self, items, spot_id=None, list_id=None, properties=None):
+        """This method adds or replaces items in the index.
+
+        :param items: The item records (e.g. from :py:func:`highspot.items.get_items`)
+        :type items: list, tuple
+        :param spot_id: The unique identifier for the Spot that contains the items
+        :type spot_id: str, None
+        :param list_id: The unique identifier for the list that contains the items
+        :type list_id: str, None
+        :param properties: Dictionary with the item IDs as keys and the item properties as values
+        :type properties: dict, None
+        :returns: The number of items that were indexed
+        """
+        documents = [_get_item_document(item, spot_id, list_id, (properties or {}).get(str(item.get('id'))),
+                                        _get_item_hash(item)) for item in items if item.get('id') is not None]
+        self._backend.upsert(documents)
+        return len(documents)
+
+    def remove_items(self, item_ids):
+        """This method removes items from the index.
+
+        :param item_ids: The unique identifiers for the items
+        :type item_ids: list, tuple, set
+        :returns: None
+        """
+        self._backend.delete([str(item_id) for item_id in item_ids])
+
+    def update_spot(self, spot_id, list_id=None, include_properties=False, limit=100, max_workers=10):
+        """This method incrementally updates the index with the current items in a Spot (or a list within it).
+
+        .. note:: The items are streamed from the API and compared to the stored content hashes, so only the items
+                  that were added or changed are re-indexed (and only their properties are retrieved). The index is
+                  only modified once every page has been retrieved, so a failed page raises an exception and leaves
+                  the index unchanged rather than removing the items that were not seen.
+
+        :param spot_id: The unique identifier for the Spot
+        :type spot_id: str
+        :param list_id: The unique identifier for a list within the Spot
+        :type list_id: str, None
+        :param include_properties: Determines if the item properties should also be indexed (``False`` by default)
+        :type include_properties: bool
+        :param limit: Maximum number of items returned per page (``100`` by default)
+        :type limit: int
+        :param max_workers: The maximum number of concurrent requests for the item properties (``10`` by default)
+        :type max_workers: int
+        :returns: A dictionary with the ``added``, ``updated``, ``unchanged`` and ``removed`` counts
+        :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+                 :py:exc:`highspot.errors.exceptions.APIRequestError`,
+                 :py:exc:`highspot.errors.exceptions.DataMismatchError`,
+                 :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+        """
+        if self.hs_object is None:
+            raise exceptions.MissingRequiredDataError(param='hs_object')
+        start_time = time.perf_counter()
+        endpoint = f'/items?spot={spot_id}' + (f'&list={list_id}' if list_id else '')
+        stored_hashes = self._backend.get_hashes(str(spot_id), list_id)
+        changed_items, seen_ids, counts = [], set(), {'added': 0, 'updated': 0, 'unchanged': 0, 'removed': 0}
+        for item in pipeline.iter_records(self.hs_object, endpoint, limit=limit):
+            if item.get('id') is None:
+                continue
+            item_id = str(item['id'])
+            seen_ids.add(item_id)
+            item_hash = _get_item_hash(item)
+            if stored_hashes.get(item_id) == item_hash:
+                counts['unchanged'] += 1
+                continue
+            counts['updated' if item_id in stored_hashes else 'added'] += 1
+            changed_items.append((item, item_hash))
+        properties = {}
+        if include_properties and changed_items:
+            item_ids = [str(item['id']) for item, _ in changed_items]
+            endpoints = [f'/items/{item_id}/properties' for item_id in item_ids]
+            properties = dict(zip(item_ids, api.get_many(self.hs_object, endpoints, max_workers=max_workers,
+                                                         priority=scheduler.get_priority(scheduler.BATCH))))
+        self._backend.upsert([_get_item_document(item, str(spot_id), list_id, properties.get(str(item['id'])),
+                                                 item_hash) for item, item_hash in changed_items])
+        removed_ids = [item_id for item_id in stored_hashes if item_id not in seen_ids]
+        self._backend.delete(removed_ids)
+        counts['removed'] = len(removed_ids)
+        self._record_build(time.perf_counter() - start_time)
+        logger.debug(f'The search index was updated for the Spot {spot_id}: {counts}',
+                     extra={'endpoint': endpoint, 'latency': self.stats['last_build_latency']})
+        return counts
+
+    def search(self, query, spot_id=None, list_id=None, limit=20):
+        """This method returns the items that contain every keyword in a query, ranked by relevance.
+
+        .. note:: Matches within the title are weighted more heavily than matches within the description, which are
+                  weighted more heavily than matches within the properties.
+
+        :param query: The keyword query
+        :type query: str
+        :param spot_id: The unique identifier for a Spot by which to filter the items
+        :type spot_id: str, None
+        :param list_id: The unique identifier for a list by which to filter the items
+        :type list_id: str, None
+        :param limit: The maximum number of items returned (``20`` by default)
+        :type limit: int
+        :returns: A list of dictionaries with the ``id``, ``title``, ``spot_id``, ``list_id`` and ``score`` of each
+                  item in descending order of relevance
+        """
+        start_time = time.perf_counter()
+        tokens = tokenize(query)
+        results = self._backend.search(tokens, spot_id, list_id, limit) if tokens else []
+        latency = time.perf_counter() - start_time
+        with self._stats_lock:
+            self.stats['queries'] += 1
+            self.stats['total_query_latency'] += latency
+            self.stats['max_query_latency'] = max(self.stats['max_query_latency'], latency)
+        return results
+
+    def get_stats(self):
+        """This method returns the index size along with the build and query latency statistics.
+
+        :returns: A dictionary with the index statistics
+        """
+        with self._stats_lock:
+            stats = dict(self.stats, backend=self.backend, items=len(self))
+        stats['average_query_latency'] = stats['total_query_latency'] / stats['queries'] if stats['queries'] else 0.0
+        return stats
+
+    def close(self):
+        """This method closes the underlying database connection (if applicable).
+
+        :returns: None
+        """
+        self._backend.close()
+
+    def _record_build(self, _latency):
+        """This method records the latency of an index update with the statistics."""
+        with self._stats_lock:
+            self.stats['builds'] += 1
+            self.stats['last_build_latency'] = _latency
+            self.stats['total_build_latency'] += _latency
+
+
+class SQLiteFullTextBackend(object):
+    """This class stores the item search index in an SQLite database using the FTS5 extension."""
+    def __init__(self, path=':memory:'):
+        """This method instantiates the :py:class:`highspot.search.SQLiteFullTextBackend` class object.
+
+        :param path: The path to the SQLite database file (in memory by default)
+        :type path: str
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS items (id TEXT PRIMARY KEY, spot_id TEXT, '
+                                     'list_id TEXT, title TEXT, hash TEXT)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS items_spot ON items (spot_id, list_id)')
+            self._connection.execute("CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(id UNINDEXED, title, "
+                                     "description, properties, tokenize='unicode61 remove_diacritics 2')")
+
+    def count(self):
+        """This method returns the number of indexed items."""
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+
+    def upsert(self, documents):
+        """This method adds or replaces indexed items.
+
+        :param documents: The item documents
+        :type documents: list
+        :returns: None
+        """
+        if not documents:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany('DELETE FROM items_fts WHERE id = ?', [(doc['id'],) for doc in documents])
+            self._connection.executemany('INSERT OR REPLACE INTO items VALUES (:id, :spot_id, :list_id, :title, :hash)',
+                                         documents)
+            self._connection.executemany('INSERT INTO items_fts VALUES (:id, :title, :description, :properties)',
+                                         documents)
+
+    def delete(self, item_ids):
+        """This method removes indexed items.
+
+        :param item_ids: The unique identifiers for the items
+        :type item_ids: list
+        :returns: None
+        """
+        if not item_ids:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany('DELETE FROM items_fts WHERE id = ?', [(item_id,) for item_id in item_ids])
+            self._connection.executemany('DELETE FROM items WHERE id = ?', [(item_id,) for item_id in item_ids])
+
+    def get_hashes(self, spot_id, list_id=None):
+        """This method returns the content hashes of the indexed items in a Spot (or a list within it).
+
+        :param spot_id: The unique identifier for the Spot
+        :type spot_id: str
+        :param list_id: The unique identifier for a list within the Spot
+        :type list_id: str, None
+        :returns: Dictionary with the item IDs as keys and the content hashes as values
+        """
+        query, params = 'SELECT id, hash FROM items WHERE spot_id = ?', [spot_id]
+        if list_id:
+            query, params = query + ' AND list_id = ?', params + [list_id]
+        with self._lock:
+            return dict(self._connection.execute(query, params).fetchall())
+
+    def search(self, tokens, spot_id=None, list_id=None, limit=20):
+        """This method returns the indexed items that contain every token ranked using the BM25 algorithm.
+
+        :param tokens: The normalized query tokens
+        :type tokens: list
+        :param spot_id: The unique identifier for a Spot by which to filter the items
+        :type spot_id: str, None
+        :param list_id: The unique identifier for a list by which to filter the items
+        :type list_id: str, None
+        :param limit: The maximum number of items returned (``20`` by default)
+        :type limit: int
+        :returns: A list of dictionaries with the matching items
+        """
+        query = ('SELECT items.id, items.title, items.spot_id, items.list_id, '
+                 f'bm25(items_fts, 0.0, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT}, {PROPERTIES_WEIGHT}) AS rank '
+                 'FROM items_fts JOIN items ON items.id = items_fts.id WHERE items_fts MATCH ?')
+        params = [' '.join('"' + token.replace('"', '""') + '"' for token in tokens)]
+        if spot_id:
+            query, params = query + ' AND items.spot_id = ?', params + [str(spot_id)]
+        if list_id:
+            query, params = query + ' AND items.list_id = ?', params + [str(list_id)]
+        query, params = query + ' ORDER BY rank LIMIT ?', params + [limit]
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [{'id': item_id, 'title': title, 'spot_id': row_spot_id, 'list_id': row_list_id, 'score': -rank}
+                for item_id, title, row_spot_id, row_list_id, rank in rows]
+
+    def close(self):
+        """This method closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class InvertedIndexBackend(object):
+    """This class stores the item search index in memory as an inverted index of weighted term frequencies."""
+    def __init__(self):
+        """This method instantiates the :py:class:`highspot.search.InvertedIndexBackend` class object."""
+        self._documents = {}
+        self._postings = collections.defaultdict(dict)
+        self._total_length = 0.0
+        self._lock = threading.Lock()
+
+    def count(self):
+        """This method returns the number of indexed items."""
+        return len(self._documents)
+
+    def upsert(self, documents):
+        """This method adds or replaces indexed items.
+
+        :param documents: The item documents
+        :type documents: list
+        :returns: None
+        """
+        with self._lock:
+            for document in documents:
+                self._remove(document['id'])
+                frequencies = collections.Counter()
+                for field_name, weight in (('title', TITLE_WEIGHT), ('description', DESCRIPTION_WEIGHT),
+                                           ('properties', PROPERTIES_WEIGHT)):
+                    for token in tokenize(document[field_name]):
+                        frequencies[token] += weight
+                for token, frequency in frequencies.items():
+                    self._postings[token][document['id']] = frequency
+                length = sum(frequencies.values())
+                self._documents[document['id']] = dict(document, length=length, tokens=tuple(frequencies))
+                self._total_length += length
+
+    def delete(self, item_ids):
+        """This method removes indexed items.
+
+        :param item_ids: The unique identifiers for the items
+        :type item_ids: list
+        :returns: None
+        """
+        with self._lock:
+            for item_id in item_ids:
+                self._remove(item_id)
+
+    def get_hashes(self, spot_id, list_id=None):
+        """This method returns the content hashes of the indexed items in a Spot (or a list within it).
+
+        :param spot_id: The unique identifier for the Spot
+        :type spot_id: str
+        :param list_id: The unique identifier for a list within the Spot
+        :type list_id: str, None
+        :returns: Dictionary with the item IDs as keys and the content hashes as values
+        """
+        with self._lock:
+            return {item_id: document['hash'] for item_id, document in self._documents.items()
+                    if document['spot_id'] == spot_id and (not list_id or document['list_id'] == list_id)}
+
+    def search(self, tokens, spot_id=None, list_id=None, limit=20):
+        """This method returns the indexed items that contain every token ranked using the BM25 algorithm.
+
+        :param tokens: The normalized query tokens
+        :type tokens: list
+        :param spot_id: The unique identifier for a Spot by which to filter the items
+        :type spot_id: str, None
+        :param list_id: The unique identifier for a list by which to filter the items
+        :type list_id: str, None
+        :param limit: The maximum number of items returned (``20`` by default)
+        :type limit: int
+        :returns: A list of dictionaries with the matching items
+        """
+        with self._lock:
+            postings = sorted((self._postings.get(token, {}) for token in dict.fromkeys(tokens)), key=len)
+            if not postings or not postings[0]:
+                return []
+            document_count = len(self._documents)
+            average_length = self._total_length / document_count
+            scores = {}
+            for item_id in postings[0]:
+                document = self._documents[item_id]
+                if (spot_id and document['spot_id'] != str(spot_id)) or \
+                        (list_id and document['list_id'] != str(list_id)):
+                    continue
+                if not all(item_id in token_postings for token_postings in postings[1:]):
+                    continue
+                length_norm = BM25_K1 * (1 - BM25_B + BM25_B * document['length'] / average_length)
+                score = 0.0
+                for token_postings in postings:
+                    frequency = token_postings[item_id]
+                    idf = math.log(1 + (document_count - len(token_postings) + 0.5) / (len(token_postings) + 0.5))
+                    score += idf * frequency * (BM25_K1 + 1) / (frequency + length_norm)
+                scores[item_id] = score
+            ranked_ids = heapq.nlargest(limit, scores, key=scores.get)
+            return [{'id': item_id, 'title': self._documents[item_id]['title'],
+                     'spot_id': self._documents[item_id]['spot_id'], 'list_id': self._documents[item_id]['list_id'],
+                     'score': scores[item_id]} for item_id in ranked_ids]
+
+    def close(self):
+        """This method exists for parity with the SQLite backend and does not perform any action."""
+        return None
+
+    def _remove(self, _item_id):
+        """This method removes an item from the postings and documents (while holding the lock)."""
+        _document = self._documents.pop(_item_id, None)
+        if _document is None:
+            return
+        for _token in _document['tokens']:
+            _token_postings = self._postings[_token]
+            _token_postings.pop(_item_id, None)
+            if not _token_postings:
+                del self._postings[_token]
+        self._total_length -= _document['length']
+
+
+def _add_item_ids(_index, _key, _item_ids):
+    """This function adds item IDs to an index entry while preserving the order in which they were first added.
+
+    :param _index: The index being built
+    :type _index: dict
+    :param _key: The normalized term, token or prefix
+    :type _key: str
+    :param _item_ids: The item IDs to add
+    :type _item_ids: list
+    :returns: None
+    """
+    _entry = _index.setdefault(_key, {})
+    for _item_id in _item_ids:
+        _entry[_item_id] = None
+
+
+def _freeze(_index):
+    """This function converts the entries of an index that was built into immutable tuples.
+
+    :param _index: The index that was built
+    :type _index: dict
+    :returns: The index with a tuple of the item IDs for each entry
+    """
+    return {_key: tuple(_entry) for _key, _entry in _index.items()}
+
+
+def _get_item_hash(_item):
+    """This function returns the content hash of an item from its canonical JSON serialization.
+
+    .. note:: The record is serialized with sorted keys so that an item has the same hash whether it was added with
+              the ``add_items`` method or retrieved by the ``update_spot`` method.
+
+    :param _item: The item record
+    :type _item: dict
+    :returns: The hexadecimal digest of the item
+    """
+    _canonical_item = json.dumps(_item, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(_canonical_item.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _get_item_document(_item, _spot_id, _list_id, _properties, _item_hash):
+    """This function returns the document that is stored in the search index for an item.
+
+    :param _item: The item record
+    :type _item: dict
+    :param _spot_id: The unique identifier for the Spot that contains the item
+    :type _spot_id: str, None
+    :param _list_id: The unique identifier for the list that contains the item
+    :type _list_id: str, None
+    :param _properties: The item properties
+    :type _properties: dict, list, None
+    :param _item_hash: The content hash of the item
+    :type _item_hash: str
+    :returns: The document as a dictionary
+    """
+    return {
+        'id': str(_item['id']),
+        'spot_id': str(_spot_id or _item.get('spot') or _item.get('spot_id') or '') or None,
+        'list_id': _list_id,
+        'title': str(_item.get('title') or ''),
+        'description': str(_item.get('description') or ''),
+        'properties': ' '.join(_get_text_values(_properties)),
+        'hash': _item_hash,
+    }
+
+
+def _get_text_values(_value):
+    """This function returns the text values within nested properties.
+
+    :param _value: The properties or a nested value within them
+    :returns: A list of the text values
+    """
+    if isinstance(_value, str):
+        return [_value]
+    if isinstance(_value, dict):
+        return [_text for _key, _nested in _value.items() for _text in [str(_key)] + _get_text_values(_nested)]
+    if isinstance(_value, list):
+        return [_text for _nested in _value for _text in _get_text_values(_nested)]
+    return [str(_value)] if _value is not None else []
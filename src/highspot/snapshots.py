@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.snapshots
+:Synopsis:          Defines snapshots of content hashes that identify the records which changed between runs
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import json
+import time
+import hashlib
+
+from . import pipeline
+from .errors import exceptions
+from .utils import log_utils
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the endpoints for the resources that can be captured in a snapshot
+RESOURCE_ENDPOINTS = {
+    'users': '/users',
+    'groups': '/groups',
+    'items': '/items?spot={spot_id}',
+}
+
+# Define the number of bytes in each content hash
+DIGEST_SIZE = 16
+
+
+def get_record_hash(raw_record):
+    """This function returns the compact content hash for the raw JSON text of a record.
+
+    :param raw_record: The raw JSON text of the record as returned by the API
+    :type raw_record: str, bytes
+    :returns: The hexadecimal digest of the record
+    """
+    if isinstance(raw_record, str):
+        raw_record = raw_record.encode('utf-8')
+    return hashlib.blake2b(raw_record, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def get_resource_endpoint(resource, spot_id=None):
+    """This function returns the endpoint URI used to capture a resource in a snapshot.
+
+    :param resource: The resource to capture (``users``, ``groups`` or ``items``)
+    :type resource: str
+    :param spot_id: The unique identifier for the Spot (required when the resource is ``items``)
+    :type spot_id: str, None
+    :returns: The endpoint URI without the paging parameters
+    :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+             :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+    """
+    if resource not in RESOURCE_ENDPOINTS:
+        raise exceptions.InvalidFieldError(f"The value '{resource}' is not a resource that supports snapshots.")
+    if resource == 'items' and not spot_id:
+        raise exceptions.MissingRequiredDataError(param='spot_id')
+    return RESOURCE_ENDPOINTS[resource].format(spot_id=spot_id)
+
+
+def take_snapshot(hs_object, resource, spot_id=None, limit=100, id_field='id'):
+    """This function retrieves every record for a resource and returns a snapshot of their content hashes.
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param resource: The resource to capture (``users``, ``groups`` or ``items``)
+    :type resource: str
+    :param spot_id: The unique identifier for the Spot (required when the resource is ``items``)
+    :type spot_id: str, None
+    :param limit: Maximum number of records returned per page (``100`` by default)
+    :type limit: int
+    :param id_field: The field that contains the unique identifier of each record (``id`` by default)
+    :type id_field: str
+    :returns: The :py:class:`highspot.snapshots.Snapshot` object
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+             :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+    """
+    return diff_snapshot(hs_object, Snapshot(resource, spot_id), limit=limit, id_field=id_field,
+                         include_records=False).snapshot
+
+
+def diff_snapshot(hs_object, previous, limit=100, id_field='id', include_records=True):
+    """This function retrieves every record for the resource of a previous snapshot and identifies what changed.
+
+    .. note:: The content hash of each record is computed from its raw JSON text as returned by the API, so a record
+              that has not changed costs a single hash comparison and is never serialized or returned.
+
+    .. note:: When ``include_records`` is ``False`` only the record IDs are retained (as with the
+              :py:meth:`highspot.snapshots.Snapshot.diff` method), so the memory used is bounded by the hashes
+              rather than by the records that were added or changed (e.g. every record of a first snapshot).
+
+    :param hs_object: The core :py:class:`highspot.Highspot` object
+    :type hs_object: class[highspot.Highspot]
+    :param previous: The snapshot from the previous run
+    :type previous: class[highspot.snapshots.Snapshot]
+    :param limit: Maximum number of records returned per page (``100`` by default)
+    :type limit: int
+    :param id_field: The field that contains the unique identifier of each record (``id`` by default)
+    :type id_field: str
+    :param include_records: Determines if the added and changed records should be returned rather than only their
+                            record IDs (``True`` by default)
+    :type include_records: bool
+    :returns: The :py:class:`highspot.snapshots.SnapshotDiff` object, which includes the new snapshot
+    :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`,
+             :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+             :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+    """
+    endpoint = get_resource_endpoint(previous.resource, previous.spot_id)
+    current = Snapshot(previous.resource, previous.spot_id)
+    previous_hashes, current_hashes = previous.hashes, current.hashes
+    added, changed = {}, {}
+    for record, raw_record in pipeline.iter_records(hs_object, endpoint, limit=limit, include_raw=True):
+        record_id = record.get(id_field)
+        if record_id is None:
+            logger.warning(f"A record without the '{id_field}' field was skipped.", extra={'endpoint': endpoint})
+            continue
+        record_id = str(record_id)
+        record_hash = get_record_hash(raw_record)
+        current_hashes[record_id] = record_hash
+        previous_hash = previous_hashes.get(record_id)
+        if previous_hash == record_hash:
+            continue
+        if previous_hash is None:
+            added[record_id] = record if include_records else record_id
+        else:
+            changed[record_id] = record if include_records else record_id
+    removed = [record_id for record_id in previous_hashes if record_id not in current_hashes]
+    return SnapshotDiff(added, changed, removed, current)
+
+
+class Snapshot(object):
+    """This class stores the content hash of each record of a resource, keyed by the record ID."""
+    def __init__(self, resource, spot_id=None, hashes=None, created_at=None):
+        """This method instantiates the :py:class:`highspot.snapshots.Snapshot` class object.
+
+        :param resource: The resource that was captured (``users``, ``groups`` or ``items``)
+        :type resource: str
+        :param spot_id: The unique identifier for the Spot (when the resource is ``items``)
+        :type spot_id: str, None
+        :param hashes: Dictionary with the record IDs as keys and the content hashes as values
+        :type hashes: dict, None
+        :param created_at: The Unix timestamp when the snapshot was captured (the current time by default)
+        :type created_at: float, None
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+        """
+        get_resource_endpoint(resource, spot_id)
+        self.resource = resource
+        self.spot_id = spot_id
+        self.hashes = hashes if hashes is not None else {}
+        self.created_at = created_at or time.time()
+
+    def __len__(self):
+        """This method returns the number of records in the snapshot."""
+        return len(self.hashes)
+
+    def __contains__(self, record_id):
+        """This method determines if a record ID is in the snapshot."""
+        return str(record_id) in self.hashes
+
+    def diff(self, newer):
+        """This method compares the snapshot with a newer snapshot of the same resource using only the hashes.
+
+        :param newer: The newer snapshot
+        :type newer: class[highspot.snapshots.Snapshot]
+        :returns: The :py:class:`highspot.snapshots.SnapshotDiff` object with the record IDs as the values of the
+                  ``added`` and ``changed`` dictionaries
+        :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+        """
+        if (newer.resource, newer.spot_id) != (self.resource, self.spot_id):
+            raise exceptions.DataMismatchError('Snapshots can only be compared when they capture the same resource.')
+        added, changed = {}, {}
+        for record_id, record_hash in newer.hashes.items():
+            previous_hash = self.hashes.get(record_id)
+            if previous_hash is None:
+                added[record_id] = record_id
+            elif previous_hash != record_hash:
+                changed[record_id] = record_id
+        removed = [record_id for record_id in self.hashes if record_id not in newer.hashes]
+        return SnapshotDiff(added, changed, removed, newer)
+
+    def to_dict(self):
+        """This method returns the snapshot as a dictionary that can be serialized as JSON.
+
+        :returns: A dictionary with the snapshot data
+        """
+        return {
+            'resource': self.resource,
+            'spot_id': self.spot_id,
+            'created_at': self.created_at,
+            'hashes': self.hashes,
+        }
+
+    @classmethod
+    def from_dict(cls, snapshot_data):
+        """This method instantiates a snapshot from a dictionary returned by the ``to_dict`` method.
+
+        :param snapshot_data: The snapshot data
+        :type snapshot_data: dict
+        :returns: The :py:class:`highspot.snapshots.Snapshot` object
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`highspot.errors.exceptions.MissingRequiredDataError`
+        """
+        return cls(snapshot_data['resource'], snapshot_data.get('spot_id'), snapshot_data.get('hashes'),
+                   snapshot_data.get('created_at'))
+
+    def save(self, file_path):
+        """This method writes the snapshot to a JSON file, replacing the existing file only once it is complete.
+
+        :param file_path: The path to the snapshot file
+        :type file_path: str
+        :returns: None
+        """
+        temp_path = f'{file_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as snapshot_file:
+            json.dump(self.to_dict(), snapshot_file, separators=(',', ':'))
+        os.replace(temp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path):
+        """This method reads a snapshot from a JSON file written by the ``save`` method.
+
+        :param file_path: The path to the snapshot file
+        :type file_path: str
+        :returns: The :py:class:`highspot.snapshots.Snapshot` object
+        :raises: :py:exc:`FileNotFoundError`
+        """
+        with open(file_path, 'r', encoding='utf-8') as snapshot_file:
+            return cls.from_dict(json.load(snapshot_file))
+
+
+class SnapshotDiff(object):
+    """This class contains the records that were added, changed and removed between two snapshots."""
+    def __init__(self, added, changed, removed, snapshot):
+        """This method instantiates the :py:class:`highspot.snapshots.SnapshotDiff` class object.
+
+        :param added: Dictionary with the IDs of the added records as keys and the records (or their IDs) as values
+        :type added: dict
+        :param changed: Dictionary with the IDs of the changed records as keys and the records (or their IDs) as values
+        :type changed: dict
+        :param removed: The IDs of the removed records
+        :type removed: list
+        :param snapshot: The newer snapshot, which should be saved for the next run
+        :type snapshot: class[highspot.snapshots.Snapshot]
+        """
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.snapshot = snapshot
+
+    def __bool__(self):
+        """This method determines if any records were added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+    def get_counts(self):
+        """This method returns the number of records that were added, changed and removed.
+
+        :returns: A dictionary with the ``added``, ``changed`` and ``removed`` counts
+        """
+        return {'added': len(self.added), 'changed': len(self.changed), 'removed': len(self.removed)}
@@ -0,0 +1,666 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.transports
+:Synopsis:          Defines the HTTP transports used to perform requests against the Highspot API
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import io
+import json
+import time
+import gzip
+import base64
+import threading
+import collections
+import urllib.parse
+
+from .errors import exceptions
+from .utils import import_utils, log_utils
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Defer importing the requests library until a transport is created
+requests = import_utils.lazy_import('requests')
+
+# Define the names of the supported transports
+HTTP1 = 'http1'
+HTTP2 = 'http2'
+
+# Define the content encodings in the default order of preference
+DEFAULT_ENCODINGS = ('zstd', 'br', 'gzip', 'deflate')
+
+# Define the version of the cassette file format and the response headers that are not recorded in cassettes
+CASSETTE_VERSION = 1
+UNRECORDED_HEADERS = {'content-encoding', 'content-length', 'set-cookie', 'transfer-encoding'}
+
+
+def get_transport(transport_name=HTTP1, max_connections=10):
+    """This function instantiates a transport by name and falls back to HTTP/1.1 when HTTP/2 is unavailable.
+
+    .. note:: The HTTP/2 transport requires the ``httpx`` and ``h2`` packages, which can be installed with the
+              ``http2`` extra (i.e. ``pip install highspot[http2]``).
+
+    :param transport_name: The name of the transport (``http1`` or ``http2``) or a transport object, which is
+                           returned as-is
+    :type transport_name: str, class[highspot.transports.BaseTransport]
+    :param max_connections: The maximum number of pooled connections (``10`` by default)
+    :type max_connections: int
+    :returns: The transport object
+    :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    if isinstance(transport_name, BaseTransport):
+        return transport_name
+    if transport_name == HTTP2:
+        if http2_available():
+            return HTTP2Transport(max_connections=max_connections)
+        logger.warning('The HTTP/2 transport requires the httpx and h2 packages so HTTP/1.1 will be used instead.')
+        return RequestsTransport(max_connections=max_connections)
+    if transport_name == HTTP1:
+        return RequestsTransport(max_connections=max_connections)
+    raise exceptions.InvalidFieldError(f"The value '{transport_name}' is not a valid transport.")
+
+
+def http2_available():
+    """This function determines if the packages required by the HTTP/2 transport are installed.
+
+    :returns: Boolean value indicating if the HTTP/2 transport can be used
+    """
+    try:
+        import httpx
+        import h2
+    except ImportError:
+        return False
+    return True
+
+
+def get_accept_encoding(transport, compression=True):
+    """This function returns the ``Accept-Encoding`` header value for the encodings a transport is able to decode.
+
+    :param transport: The transport object
+    :param compression: ``True`` to use the default order of preference, ``False`` to disable compression, or the
+                        encodings to negotiate in order of preference (e.g. ``['br', 'gzip']``)
+    :type compression: bool, list, tuple
+    :returns: The ``Accept-Encoding`` header value
+    :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    if not compression:
+        return 'identity'
+    requested = DEFAULT_ENCODINGS if compression is True else tuple(compression)
+    for encoding in requested:
+        if encoding not in DEFAULT_ENCODINGS:
+            raise exceptions.InvalidFieldError(f"The value '{encoding}' is not a supported content encoding.")
+    supported = transport.get_supported_encodings()
+    encodings = [encoding for encoding in requested if encoding in supported]
+    return ', '.join(encodings) if encodings else 'identity'
+
+
+def save_cassette(file_path, responses, http_version=None):
+    """This function writes recorded responses to a gzip-compressed cassette file with one JSON record per line.
+
+    .. note:: The bodies are stored decompressed (as text when they are valid UTF-8 and as Base64 otherwise) and the
+              whole file is compressed, so the cassette is compact and can be replayed without any decoders.
+
+    :param file_path: The path to the cassette file
+    :type file_path: str
+    :param responses: The :py:class:`highspot.transports.RecordedResponse` objects in the order they were received
+    :type responses: list, tuple
+    :param http_version: The HTTP version of the transport with which the responses were recorded
+    :type http_version: str, None
+    :returns: None
+    """
+    with gzip.open(file_path, 'wt', encoding='utf-8') as cassette_file:
+        header = {'version': CASSETTE_VERSION, 'http_version': http_version, 'count': len(responses)}
+        cassette_file.write(json.dumps(header, separators=(',', ':')) + '\n')
+        for response in responses:
+            cassette_file.write(json.dumps(_serialize_response(response), separators=(',', ':')) + '\n')
+
+
+def load_cassette(file_path):
+    """This function reads the recorded responses from a cassette file written by the ``save_cassette`` function.
+
+    :param file_path: The path to the cassette file
+    :type file_path: str
+    :returns: A tuple with the cassette header (as a dictionary) and a list of
+              :py:class:`highspot.transports.RecordedResponse` objects
+    :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    with gzip.open(file_path, 'rt', encoding='utf-8') as cassette_file:
+        header = json.loads(cassette_file.readline() or '{}')
+        if header.get('version') != CASSETTE_VERSION:
+            raise exceptions.DataMismatchError(f"The file '{file_path}' is not a supported cassette.")
+        responses = [_deserialize_response(json.loads(line)) for line in cassette_file if line.strip()]
+    return header, responses
+
+
+def get_request_key(url):
+    """This function returns the key with which a recorded response is matched to a request.
+
+    .. note:: The scheme and host are ignored so that a cassette recorded against one region can be replayed with a
+              core object configured for any other region.
+
+    :param url: The full URL of the request
+    :type url: str
+    :returns: The path and query string of the URL
+    """
+    parts = urllib.parse.urlsplit(url)
+    return f'{parts.path}?{parts.query}' if parts.query else parts.path
+
+
+def _module_available(_module_name):
+    """This function determines if a module can be imported.
+
+    :param _module_name: The name of the module
+    :type _module_name: str
+    :returns: Boolean value indicating if the module is installed
+    """
+    import importlib.util
+    return importlib.util.find_spec(_module_name) is not None
+
+
+def _serialize_response(_response):
+    """This function converts a recorded response into a dictionary for a cassette file.
+
+    :param _response: The :py:class:`highspot.transports.RecordedResponse` object
+    :returns: A dictionary that can be serialized as JSON
+    """
+    _record = {
+        'url': _response.url,
+        'status_code': _response.status_code,
+        'headers': dict(_response.headers),
+        'elapsed': round(_response.elapsed, 6),
+        'wire_size': _response.wire_size,
+    }
+    try:
+        _record['text'] = _response.content.decode('utf-8')
+    except UnicodeDecodeError:
+        _record['base64'] = base64.b64encode(_response.content).decode('ascii')
+    return _record
+
+
+def _deserialize_response(_record):
+    """This function converts a dictionary from a cassette file into a recorded response.
+
+    :param _record: The dictionary from the cassette file
+    :type _record: dict
+    :returns: The :py:class:`highspot.transports.RecordedResponse` object
+    """
+    _content = _record['text'].encode('utf-8') if 'text' in _record else base64.b64decode(_record['base64'])
+    return RecordedResponse(_record['url'], _record['status_code'], _record.get('headers'), _content,
+                            _record.get('elapsed', 0.0), _record.get('wire_size'))
+
+
+class BaseTransport(object):
+    """This class defines the interface of the transports used to perform requests against the Highspot API.
+
+    .. note:: A transport object may be passed as the ``transport`` of the core :py:class:`highspot.Highspot` object
+              to substitute the network (e.g. with a :py:class:`highspot.transports.ReplayTransport` object).
+    """
+    http_version = None
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method performs a GET request.
+
+        :param url: The full URL to query
+        :type url: str
+        :param auth: The username and password to use for authentication
+        :type auth: tuple, None
+        :param verify: Determines if SSL verification should occur (``True`` by default)
+        :type verify: bool
+        :param headers: Additional headers to include in the request
+        :type headers: dict, None
+        :param timeout: The number of seconds to wait for the server to respond (no timeout by default)
+        :type timeout: int, float, None
+        :param stream: Determines if the body should be left unread so it can be consumed with the ``iter_content``
+                       method (``False`` by default)
+        :type stream: bool
+        :returns: The response object
+        :raises: :py:exc:`NotImplementedError`
+        """
+        raise NotImplementedError('The get method must be implemented by the transport.')
+
+    @staticmethod
+    def iter_content(response, chunk_size=65536):
+        """This method yields the decompressed body of a streamed response in chunks as they are received.
+
+        :param response: The response object
+        :param chunk_size: The maximum number of bytes in each chunk (``65536`` by default)
+        :type chunk_size: int
+        :returns: A generator of the chunks as bytes
+        """
+        return response.iter_content(chunk_size=chunk_size)
+
+    @staticmethod
+    def get_supported_encodings():
+        """This method returns the content encodings that the transport is able to decode.
+
+        :returns: A set of the supported content encodings
+        """
+        return set()
+
+    @staticmethod
+    def get_transfer_sizes(response, decoded_size=None):
+        """This method returns the number of bytes received over the wire and after decompression for a response.
+
+        :param response: The response object
+        :param decoded_size: The decompressed size of a streamed response (the size of the content by default)
+        :type decoded_size: int, None
+        :returns: A tuple with the compressed (wire) size and the decompressed size in bytes
+        """
+        decoded_size = len(response.content) if decoded_size is None else decoded_size
+        return getattr(response, 'wire_size', None) or decoded_size, decoded_size
+
+    def close(self):
+        """This method releases any resources held by the transport.
+
+        :returns: None
+        """
+        pass
+
+
+class RequestsTransport(BaseTransport):
+    """This class performs HTTP/1.1 requests using a pooled :py:class:`requests.Session` object."""
+    http_version = 'HTTP/1.1'
+
+    def __init__(self, max_connections=10):
+        """This method instantiates the :py:class:`highspot.transports.RequestsTransport` class object.
+
+        :param max_connections: The maximum number of pooled connections (``10`` by default)
+        :type max_connections: int
+        """
+        self.max_connections = max_connections
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method performs a GET request.
+
+        :param url: The full URL to query
+        :type url: str
+        :param auth: The username and password to use for authentication
+        :type auth: tuple, None
+        :param verify: Determines if SSL verification should occur (``True`` by default)
+        :type verify: bool
+        :param headers: Additional headers to include in the request
+        :type headers: dict, None
+        :param timeout: The number of seconds to wait for the server to respond (no timeout by default)
+        :type timeout: int, float, None
+        :param stream: Determines if the body should be left unread so it can be consumed with
+                       :py:meth:`highspot.transports.RequestsTransport.iter_content` (``False`` by default)
+        :type stream: bool
+        :returns: The :py:class:`requests.Response` object
+        """
+        return self.session.get(url, auth=auth, verify=verify, headers=headers, timeout=timeout, stream=stream)
+
+    @staticmethod
+    def iter_content(response, chunk_size=65536):
+        """This method yields the decompressed body of a streamed response in chunks as they are received.
+
+        :param response: The :py:class:`requests.Response` object
+        :param chunk_size: The maximum number of bytes in each chunk (``65536`` by default)
+        :type chunk_size: int
+        :returns: A generator of the chunks as bytes
+        """
+        return response.iter_content(chunk_size=chunk_size)
+
+    @staticmethod
+    def get_supported_encodings():
+        """This method returns the content encodings that the underlying ``urllib3`` library is able to decode.
+
+        :returns: A set of the supported content encodings
+        """
+        import urllib3.util.request
+        return {encoding.strip() for encoding in urllib3.util.request.ACCEPT_ENCODING.split(',')}
+
+    @staticmethod
+    def get_transfer_sizes(response, decoded_size=None):
+        """This method returns the number of bytes received over the wire and after decompression for a response.
+
+        :param response: The :py:class:`requests.Response` object
+        :param decoded_size: The decompressed size of a streamed response (the size of the content by default)
+        :type decoded_size: int, None
+        :returns: A tuple with the compressed (wire) size and the decompressed size in bytes
+        """
+        decoded_size = len(response.content) if decoded_size is None else decoded_size
+        wire_size = None
+        if hasattr(response.raw, 'tell'):
+            try:
+                wire_size = response.raw.tell()
+            except (OSError, ValueError):
+                wire_size = None
+        if not wire_size:
+            wire_size = int(response.headers.get('Content-Length') or decoded_size)
+        return wire_size, decoded_size
+
+    def close(self):
+        """This method closes the pooled connections.
+
+        :returns: None
+        """
+        self.session.close()
+
+
+class HTTP2Transport(BaseTransport):
+    """This class performs HTTP/2 requests that are multiplexed over a small number of connections using ``httpx``.
+
+    .. note:: The protocol is negotiated with each host, so requests to hosts that do not support HTTP/2 are performed
+              using HTTP/1.1 automatically.
+    """
+    http_version = 'HTTP/2'
+
+    def __init__(self, max_connections=10):
+        """This method instantiates the :py:class:`highspot.transports.HTTP2Transport` class object.
+
+        :param max_connections: The maximum number of connections (``10`` by default)
+        :type max_connections: int
+        """
+        self.max_connections = max_connections
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method performs a GET request.
+
+        :param url: The full URL to query
+        :type url: str
+        :param auth: The username and password to use for authentication
+        :type auth: tuple, None
+        :param verify: Determines if SSL verification should occur (``True`` by default)
+        :type verify: bool
+        :param headers: Additional headers to include in the request
+        :type headers: dict, None
+        :param timeout: The number of seconds to wait for the server to respond (no timeout by default)
+        :type timeout: int, float, None
+        :param stream: Determines if the body should be left unread so it can be consumed with
+                       :py:meth:`highspot.transports.HTTP2Transport.iter_content` (``False`` by default)
+        :type stream: bool
+        :returns: The :py:class:`httpx.Response` object
+        """
+        client = self._get_client(verify)
+        if stream:
+            request = client.build_request('GET', url, headers=headers, timeout=timeout)
+            return client.send(request, auth=auth, stream=True)
+        return client.get(url, auth=auth, headers=headers, timeout=timeout)
+
+    @staticmethod
+    def iter_content(response, chunk_size=65536):
+        """This method yields the decompressed body of a streamed response in chunks as they are received.
+
+        :param response: The :py:class:`httpx.Response` object
+        :param chunk_size: The maximum number of bytes in each chunk (``65536`` by default)
+        :type chunk_size: int
+        :returns: A generator of the chunks as bytes
+        """
+        return response.iter_bytes(chunk_size=chunk_size)
+
+    @staticmethod
+    def get_supported_encodings():
+        """This method returns the content encodings that ``httpx`` is able to decode in the current environment.
+
+        :returns: A set of the supported content encodings
+        """
+        try:
+            from httpx._decoders import SUPPORTED_DECODERS
+            return set(SUPPORTED_DECODERS) - {'identity'}
+        except ImportError:
+            encodings = {'gzip', 'deflate'}
+            if _module_available('brotli') or _module_available('brotlicffi'):
+                encodings.add('br')
+            return encodings
+
+    @staticmethod
+    def get_transfer_sizes(response, decoded_size=None):
+        """This method returns the number of bytes received over the wire and after decompression for a response.
+
+        :param response: The :py:class:`httpx.Response` object
+        :param decoded_size: The decompressed size of a streamed response (the size of the content by default)
+        :type decoded_size: int, None
+        :returns: A tuple with the compressed (wire) size and the decompressed size in bytes
+        """
+        decoded_size = len(response.content) if decoded_size is None else decoded_size
+        return response.num_bytes_downloaded or decoded_size, decoded_size
+
+    def close(self):
+        """This method closes the connections.
+
+        :returns: None
+        """
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def _get_client(self, _verify):
+        """This method returns the :py:class:`httpx.Client` for an SSL verification setting.
+
+        .. note:: A separate client is required for each setting as ``httpx`` configures verification per client.
+        """
+        client = self._clients.get(_verify)
+        if client is None:
+            import httpx
+            with self._lock:
+                client = self._clients.get(_verify)
+                if client is None:
+                    limits = httpx.Limits(max_connections=self.max_connections,
+                                          max_keepalive_connections=self.max_connections)
+                    client = httpx.Client(http2=True, verify=_verify, limits=limits)
+                    self._clients[_verify] = client
+        return client
+
+
+class RecordedResponse(object):
+    """This class represents a response that was recorded to (or replayed from) a cassette file.
+
+    .. note:: The attributes and methods mirror the subset of :py:class:`requests.Response` used by this library.
+    """
+    def __init__(self, url, status_code, headers=None, content=b'', elapsed=0.0, wire_size=None):
+        """This method instantiates the :py:class:`highspot.transports.RecordedResponse` class object.
+
+        :param url: The full URL that was queried
+        :type url: str
+        :param status_code: The status code of the response
+        :type status_code: int
+        :param headers: The response headers
+        :type headers: dict, None
+        :param content: The decompressed body of the response
+        :type content: bytes
+        :param elapsed: The number of seconds that the request took when it was recorded
+        :type elapsed: float
+        :param wire_size: The number of bytes that were received over the wire (the size of the content by default)
+        :type wire_size: int, None
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.elapsed = elapsed
+        self.wire_size = wire_size
+        self.encoding = 'utf-8'
+
+    @property
+    def ok(self):
+        """This property indicates if the status code is below ``400``."""
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        """This property returns the body of the response decoded as text."""
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self, **kwargs):
+        """This method returns the body of the response decoded as JSON.
+
+        :returns: The decoded JSON data
+        """
+        return json.loads(self.content, **kwargs)
+
+    def iter_content(self, chunk_size=65536):
+        """This method yields the body of the response in chunks.
+
+        :param chunk_size: The maximum number of bytes in each chunk (``65536`` by default)
+        :type chunk_size: int
+        :returns: A generator of the chunks as bytes
+        """
+        body = io.BytesIO(self.content)
+        return iter(lambda: body.read(chunk_size), b'')
+
+    def close(self):
+        """This method is defined for compatibility with streamed responses and has no effect.
+
+        :returns: None
+        """
+        pass
+
+
+class RecordingTransport(BaseTransport):
+    """This class performs requests with another transport and records the responses to a cassette file.
+
+    .. note:: The cassette is written when the transport is closed (e.g. with :py:meth:`highspot.core.Highspot.close`)
+              or when the :py:meth:`highspot.transports.RecordingTransport.save` method is called. The request
+              headers and credentials are never recorded.
+    """
+    def __init__(self, cassette_path, transport=None, max_connections=10):
+        """This method instantiates the :py:class:`highspot.transports.RecordingTransport` class object.
+
+        :param cassette_path: The path to the cassette file
+        :type cassette_path: str
+        :param transport: The transport that performs the requests (a new
+                          :py:class:`highspot.transports.RequestsTransport` object by default)
+        :type transport: class[highspot.transports.BaseTransport], None
+        :param max_connections: The maximum number of pooled connections of the default transport (``10`` by default)
+        :type max_connections: int
+        """
+        self.cassette_path = cassette_path
+        self.transport = transport or RequestsTransport(max_connections=max_connections)
+        self.http_version = self.transport.http_version
+        self.responses = []
+        self._lock = threading.Lock()
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method performs a GET request with the underlying transport and records the response.
+
+        .. note:: Streamed responses are read in full before they are returned so that they can be recorded.
+
+        :param url: The full URL to query
+        :type url: str
+        :param auth: The username and password to use for authentication
+        :type auth: tuple, None
+        :param verify: Determines if SSL verification should occur (``True`` by default)
+        :type verify: bool
+        :param headers: Additional headers to include in the request
+        :type headers: dict, None
+        :param timeout: The number of seconds to wait for the server to respond (no timeout by default)
+        :type timeout: int, float, None
+        :param stream: Determines if the body should be streamed from the underlying transport (``False`` by default)
+        :type stream: bool
+        :returns: The :py:class:`highspot.transports.RecordedResponse` object
+        """
+        start_time = time.perf_counter()
+        response = self.transport.get(url, auth=auth, verify=verify, headers=headers, timeout=timeout, stream=stream)
+        try:
+            content = b''.join(self.transport.iter_content(response)) if stream else response.content
+        finally:
+            if stream:
+                response.close()
+        elapsed = time.perf_counter() - start_time
+        wire_size = self.transport.get_transfer_sizes(response, len(content))[0]
+        response_headers = {name: value for name, value in response.headers.items()
+                            if name.lower() not in UNRECORDED_HEADERS}
+        recorded = RecordedResponse(url, response.status_code, response_headers, content, elapsed, wire_size)
+        with self._lock:
+            self.responses.append(recorded)
+        return recorded
+
+    def get_supported_encodings(self):
+        """This method returns the content encodings that the underlying transport is able to decode.
+
+        :returns: A set of the supported content encodings
+        """
+        return self.transport.get_supported_encodings()
+
+    def save(self):
+        """This method writes the responses recorded so far to the cassette file.
+
+        :returns: None
+        """
+        with self._lock:
+            responses = list(self.responses)
+        save_cassette(self.cassette_path, responses, self.http_version)
+
+    def close(self):
+        """This method writes the cassette file and closes the underlying transport.
+
+        :returns: None
+        """
+        self.save()
+        self.transport.close()
+
+
+class ReplayTransport(BaseTransport):
+    """This class serves the responses recorded in a cassette file without performing any network requests.
+
+    .. note:: Responses are matched by the path and query string of the URL. When the same URL was recorded several
+              times the responses are served in the order they were recorded, and the last one is repeated once they
+              have all been served.
+    """
+    def __init__(self, cassette_path, latency_factor=0.0):
+        """This method instantiates the :py:class:`highspot.transports.ReplayTransport` class object.
+
+        :param cassette_path: The path to the cassette file
+        :type cassette_path: str
+        :param latency_factor: The multiple of the recorded latency to wait before each response is returned (``0``
+                               by default to serve the responses at memory speed, or ``1`` to reproduce the latency)
+        :type latency_factor: int, float
+        :raises: :py:exc:`highspot.errors.exceptions.DataMismatchError`
+        """
+        header, responses = load_cassette(cassette_path)
+        self.cassette_path = cassette_path
+        self.latency_factor = latency_factor
+        self.http_version = header.get('http_version')
+        self._responses = collections.defaultdict(list)
+        for response in responses:
+            self._responses[get_request_key(response.url)].append(response)
+        self._positions = collections.Counter()
+        self._lock = threading.Lock()
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method returns the recorded response for a GET request.
+
+        :param url: The full URL to query
+        :type url: str
+        :param auth: The username and password to use for authentication (ignored)
+        :type auth: tuple, None
+        :param verify: Determines if SSL verification should occur (ignored)
+        :type verify: bool
+        :param headers: Additional headers to include in the request (ignored)
+        :type headers: dict, None
+        :param timeout: The number of seconds to wait for the server to respond (ignored)
+        :type timeout: int, float, None
+        :param stream: Determines if the body should be streamed (ignored as the body is held in memory)
+        :type stream: bool
+        :returns: The :py:class:`highspot.transports.RecordedResponse` object
+        :raises: :py:exc:`highspot.errors.exceptions.RecordingNotFoundError`
+        """
+        request_key = get_request_key(url)
+        with self._lock:
+            recorded = self._responses.get(request_key)
+            if not recorded:
+                raise exceptions.RecordingNotFoundError(url=url)
+            position = min(self._positions[request_key], len(recorded) - 1)
+            self._positions[request_key] += 1
+        response = recorded[position]
+        if self.latency_factor:
+            time.sleep(response.elapsed * self.latency_factor)
+        return response
+
+    def rewind(self):
+        """This method restarts the replay so that each URL is served from its first recorded response again.
+
+        :returns: None
+        """
+        with self._lock:
+            self._positions.clear()
@@ -4,25 +4,31 @@
 :Synopsis:          Defines the users-related functions associated with the Highspot API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     16 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 from . import api
 from .errors import exceptions
+from .utils import projection
 
 
-def me(hs_object):
+def me(hs_object, fields=None, exclude=None):
     """This function returns the information about the user making the API call.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: A dictionary with the user data
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
-    return api.get_request_with_retries(hs_object, '/me')
+    return api.get_request_with_retries(hs_object, '/me', fields=fields, exclude=exclude)
 
 
-def get_users(hs_object, email=None, list_type=None, with_fields=None, exclude_fields=None, start=0, limit=100):
+def get_users(hs_object, email=None, list_type=None, with_fields=None, exclude_fields=None, start=0, limit=100,
+              fields=None, exclude=None, stream=False):
     """This function retrieves a list of users.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
@@ -39,7 +45,13 @@ def get_users(hs_object, email=None, list_type=None, with_fields=None, exclude_f
     :type start: int, str
     :param limit: Maximum number of users returned (``100`` by default)
     :type limit: int, str
-    :returns: A dictionary containing the user data
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s), which are also excluded by the server
+    :type exclude: str, tuple, list, set, None
+    :param stream: Determines if the records should be decoded and yielded as they arrive (``False`` by default)
+    :type stream: bool
+    :returns: A dictionary containing the user data (or a generator of the records when streaming)
     :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
              :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
@@ -57,6 +69,9 @@ def get_users(hs_object, email=None, list_type=None, with_fields=None, exclude_f
             with_fields = ",".join(with_fields)
         segment = f'with-fields={with_fields}'
         endpoint += segment if endpoint.endswith('?') else f'&{segment}'
+    if exclude:
+        # Ask the server to omit the excluded fields so that they are not transferred at all
+        exclude_fields = (projection.normalize_fields(exclude_fields) or ()) + projection.normalize_fields(exclude)
     if exclude_fields:
         # TODO: Raise an exception if exclude_fields is not a str, tuple, list, or set
         if not isinstance(exclude_fields, str):
@@ -65,38 +80,46 @@ def get_users(hs_object, email=None, list_type=None, with_fields=None, exclude_f
         endpoint += segment if endpoint.endswith('?') else f'&{segment}'
     start_limit_segment = f'start={start}&limit={limit}'
     endpoint += start_limit_segment if endpoint.endswith('?') else f'&{start_limit_segment}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude, stream=stream)
 
 
-def get_user(hs_object, user_id):
+def get_user(hs_object, user_id, fields=None, exclude=None):
     """This function retrieves the metadata for a specific user.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param user_id: The unique identifier for the user
     :type user_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The user metadata as a dictionary
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/users/{user_id}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
-def get_user_properties(hs_object, user_id):
+def get_user_properties(hs_object, user_id, fields=None, exclude=None):
     """This function retrieves the properties for a specific user.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
     :type hs_object: class[highspot.Highspot]
     :param user_id: The unique identifier for the user
     :type user_id: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The user properties as a dictionary
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/users/{user_id}/properties'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
 
 
-def get_user_property(hs_object, user_id, property_name):
+def get_user_property(hs_object, user_id, property_name, fields=None, exclude=None):
     """This function retrieves a given property for a specific user.
 
     :param hs_object: The core :py:class:`highspot.Highspot` object
@@ -105,8 +128,12 @@ def get_user_property(hs_object, user_id, property_name):
     :type user_id: str
     :param property_name: The name of the property value to return
     :type property_name: str
+    :param fields: The field(s) to retain in the returned record(s) (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove from the returned record(s)
+    :type exclude: str, tuple, list, set, None
     :returns: The user properties as a dictionary
     :raises: :py:exc:`highspot.errors.exceptions.APIConnectionError`
     """
     endpoint = f'/users/{user_id}/properties/{property_name}'
-    return api.get_request_with_retries(hs_object, endpoint)
+    return api.get_request_with_retries(hs_object, endpoint, fields=fields, exclude=exclude)
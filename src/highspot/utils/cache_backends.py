@@ -0,0 +1,636 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.cache_backends
+:Synopsis:          Utilities that store cached API responses in memory, in an SQLite file or in a Redis server
+:Usage:             ``from highspot.utils import cache_backends``
+:Example:           ``backend = cache_backends.get_backend('redis://cache.example.com:6379/0')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import time
+import zlib
+import socket
+import struct
+import sqlite3
+import threading
+import collections
+import urllib.parse
+
+from ..errors import exceptions
+
+# Define the header of a serialized entry (i.e. the flags and the time at which the value was stored)
+ENTRY_HEADER = struct.Struct('<Bd')
+
+# Define the flag that indicates a serialized value is compressed and the size above which values are compressed
+COMPRESSED_FLAG = 1
+DEFAULT_COMPRESS_THRESHOLD = 256
+
+# Define the default port of a Redis server
+DEFAULT_REDIS_PORT = 6379
+
+
+def serialize_entry(value, stored_at, compress_threshold=DEFAULT_COMPRESS_THRESHOLD):
+    """This function packs a cached value and the time at which it was stored into compact bytes.
+
+    :param value: The cached value (e.g. the body of a response)
+    :type value: bytes
+    :param stored_at: The time at which the value was stored in seconds since the epoch
+    :type stored_at: float
+    :param compress_threshold: The size in bytes above which the value is compressed with :py:mod:`zlib` (``256`` by
+                               default)
+    :type compress_threshold: int
+    :returns: The serialized entry as bytes
+    """
+    flags = 0
+    if len(value) > compress_threshold:
+        compressed = zlib.compress(value, 6)
+        if len(compressed) < len(value):
+            flags, value = COMPRESSED_FLAG, compressed
+    return ENTRY_HEADER.pack(flags, stored_at) + value
+
+
+def deserialize_entry(data):
+    """This function unpacks an entry that was serialized with the :py:func:`serialize_entry` function.
+
+    :param data: The serialized entry
+    :type data: bytes
+    :returns: A tuple with the value and the time at which it was stored
+    :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+    """
+    try:
+        flags, stored_at = ENTRY_HEADER.unpack_from(data)
+        value = bytes(data[ENTRY_HEADER.size:])
+        if flags & COMPRESSED_FLAG:
+            value = zlib.decompress(value)
+    except (struct.error, zlib.error) as exc:
+        raise exceptions.CacheBackendError(f'The cached entry could not be deserialized: {exc}') from exc
+    return value, stored_at
+
+
+def get_backend(url):
+    """This function instantiates the cache backend identified by a URL.
+
+    .. note:: The supported URLs are ``memory://``, ``sqlite:///path/to/cache.db`` (or ``sqlite://cache.db`` for a
+              relative path) and ``redis://[:password@]host[:port][/db]``.
+
+    :param url: The URL of the cache backend
+    :type url: str
+    :returns: The cache backend object
+    :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    parsed_url = urllib.parse.urlsplit(url)
+    if parsed_url.scheme == 'memory':
+        return MemoryCacheBackend()
+    elif parsed_url.scheme == 'sqlite':
+        path = parsed_url.netloc + parsed_url.path
+        if not path:
+            raise exceptions.InvalidFieldError(f"The cache URL '{url}' does not include the path to a database.")
+        return SQLiteCacheBackend(path)
+    elif parsed_url.scheme == 'redis':
+        db = parsed_url.path.strip('/')
+        return RedisCacheBackend(host=parsed_url.hostname or 'localhost', port=parsed_url.port or DEFAULT_REDIS_PORT,
+                                 db=int(db) if db else 0, password=parsed_url.password)
+    raise exceptions.InvalidFieldError(f"The value '{url}' is not a supported cache backend URL.")
+
+
+class BaseCacheBackend(object):
+    """This class defines the interface of the backends in which the cached API responses are stored.
+
+    .. note:: A backend that is ``shared`` is read by other processes (e.g. an SQLite file or a Redis server), so its
+              values must be bytes and the refresh of an entry is deduplicated across the processes with the
+              ``try_lock`` method.
+    """
+    shared = False
+
+    def get(self, key):
+        """This method returns a cached value along with the time at which it was stored.
+
+        :param key: The cache key
+        :type key: str
+        :returns: A tuple with the value and the time at which it was stored, or ``None`` if the key is not cached
+        :raises: :py:exc:`NotImplementedError`
+        """
+        raise NotImplementedError('The get method must be implemented by the cache backend.')
+
+    def set(self, key, value, stored_at, ttl):
+        """This method stores a value.
+
+        :param key: The cache key
+        :type key: str
+        :param value: The value to store
+        :type value: bytes
+        :param stored_at: The time at which the value was stored in seconds since the epoch
+        :type stored_at: float
+        :param ttl: The number of seconds after which the backend may discard the value
+        :type ttl: int, float
+        :returns: None
+        :raises: :py:exc:`NotImplementedError`
+        """
+        raise NotImplementedError('The set method must be implemented by the cache backend.')
+
+    def delete(self, key):
+        """This method removes a value.
+
+        :param key: The cache key
+        :type key: str
+        :returns: None
+        :raises: :py:exc:`NotImplementedError`
+        """
+        raise NotImplementedError('The delete method must be implemented by the cache backend.')
+
+    def clear(self):
+        """This method removes every value.
+
+        :returns: None
+        :raises: :py:exc:`NotImplementedError`
+        """
+        raise NotImplementedError('The clear method must be implemented by the cache backend.')
+
+    def count(self):
+        """This method returns the number of stored values.
+
+        :returns: The number of values
+        :raises: :py:exc:`NotImplementedError`
+        """
+        raise NotImplementedError('The count method must be implemented by the cache backend.')
+
+    def try_lock(self, key, ttl):
+        """This method attempts to take the lock that permits a single process to refresh a key.
+
+        :param key: The cache key
+        :type key: str
+        :param ttl: The number of seconds after which the lock expires if it is not released
+        :type ttl: int, float
+        :returns: Boolean value indicating if the lock was taken (always ``True`` for a backend that is not shared)
+        """
+        return True
+
+    def unlock(self, key):
+        """This method releases the lock taken with the ``try_lock`` method.
+
+        :param key: The cache key
+        :type key: str
+        :returns: None
+        """
+        return None
+
+    def close(self):
+        """This method releases the resources used by the backend.
+
+        :returns: None
+        """
+        return None
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """This class stores the cached values in memory and evicts the least recently used values when it is full."""
+    def __init__(self, max_entries=1024):
+        """This method instantiates the :py:class:`highspot.utils.cache_backends.MemoryCacheBackend` class object.
+
+        :param max_entries: The number of values retained before the least recently used are evicted (``1024`` by
+                            default)
+        :type max_entries: int
+        :raises: :py:exc:`ValueError`
+        """
+        if max_entries < 1:
+            raise ValueError('The maximum entries must be at least one.')
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """This method returns a cached value along with the time at which it was stored.
+
+        :param key: The cache key
+        :type key: str
+        :returns: A tuple with the value and the time at which it was stored, or ``None`` if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, stored_at, ttl):
+        """This method stores a value and evicts the least recently used values beyond the maximum entries.
+
+        :param key: The cache key
+        :type key: str
+        :param value: The value to store
+        :param stored_at: The time at which the value was stored in seconds since the epoch
+        :type stored_at: float
+        :param ttl: The number of seconds after which the value may be discarded (unused as values are evicted by use)
+        :type ttl: int, float
+        :returns: None
+        """
+        with self._lock:
+            self._entries[key] = (value, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """This method removes a value.
+
+        :param key: The cache key
+        :type key: str
+        :returns: None
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """This method removes every value.
+
+        :returns: None
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def count(self):
+        """This method returns the number of stored values."""
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """This class stores the cached values in an SQLite database file that may be shared by the processes on a host.
+
+    .. note:: The database uses write-ahead logging so that readers in other processes are not blocked by a writer,
+              and the expired values are purged periodically as values are stored.
+    """
+    shared = True
+
+    def __init__(self, path, max_entries=None, timeout=30, purge_interval=100,
+                 compress_threshold=DEFAULT_COMPRESS_THRESHOLD):
+        """This method instantiates the :py:class:`highspot.utils.cache_backends.SQLiteCacheBackend` class object.
+
+        :param path: The path to the SQLite database file
+        :type path: str
+        :param max_entries: The number of values retained before those that expire soonest are evicted (unlimited by
+                            default)
+        :type max_entries: int, None
+        :param timeout: The number of seconds to wait for another process to release a lock on the database (``30`` by
+                        default)
+        :type timeout: int, float
+        :param purge_interval: The number of values stored between purges of the expired values (``100`` by default)
+        :type purge_interval: int
+        :param compress_threshold: The size in bytes above which the values are compressed (``256`` by default)
+        :type compress_threshold: int
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.purge_interval = purge_interval
+        self.compress_threshold = compress_threshold
+        self._writes = 0
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, '
+                                     'expires_at REAL)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS entries_expiry ON entries (expires_at)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, expires_at REAL)')
+
+    def get(self, key):
+        """This method returns a cached value along with the time at which it was stored.
+
+        :param key: The cache key
+        :type key: str
+        :returns: A tuple with the value and the time at which it was stored, or ``None`` if the key is not cached
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        row = self._execute('SELECT value FROM entries WHERE key = ? AND expires_at > ?', (key, time.time()),
+                            _fetch=True)
+        return deserialize_entry(row[0][0]) if row else None
+
+    def set(self, key, value, stored_at, ttl):
+        """This method stores a value that expires after the given number of seconds.
+
+        :param key: The cache key
+        :type key: str
+        :param value: The value to store
+        :type value: bytes
+        :param stored_at: The time at which the value was stored in seconds since the epoch
+        :type stored_at: float
+        :param ttl: The number of seconds after which the value expires
+        :type ttl: int, float
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        data = serialize_entry(value, stored_at, self.compress_threshold)
+        self._execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?)', (key, data, stored_at + ttl))
+        self._writes += 1
+        if self._writes % self.purge_interval == 0:
+            self._purge()
+
+    def delete(self, key):
+        """This method removes a value.
+
+        :param key: The cache key
+        :type key: str
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        self._execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def clear(self):
+        """This method removes every value.
+
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        self._execute('DELETE FROM entries', ())
+
+    def count(self):
+        """This method returns the number of stored values that have not expired."""
+        return self._execute('SELECT COUNT(*) FROM entries WHERE expires_at > ?', (time.time(),), _fetch=True)[0][0]
+
+    def try_lock(self, key, ttl):
+        """This method attempts to take the lock that permits a single process to refresh a key.
+
+        :param key: The cache key
+        :type key: str
+        :param ttl: The number of seconds after which the lock expires if it is not released
+        :type ttl: int, float
+        :returns: Boolean value indicating if the lock was taken
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        now = time.time()
+        try:
+            with self._lock, self._connection:
+                # The expired lock is removed in the same transaction so that only one process can take it over
+                self._connection.execute('DELETE FROM locks WHERE key = ? AND expires_at <= ?', (key, now))
+                cursor = self._connection.execute('INSERT OR IGNORE INTO locks VALUES (?, ?)', (key, now + ttl))
+                return cursor.rowcount == 1
+        except sqlite3.Error as exc:
+            raise exceptions.CacheBackendError(f'The cache database could not be updated: {exc}') from exc
+
+    def unlock(self, key):
+        """This method releases the lock taken with the ``try_lock`` method.
+
+        :param key: The cache key
+        :type key: str
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        self._execute('DELETE FROM locks WHERE key = ?', (key,))
+
+    def close(self):
+        """This method closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _purge(self):
+        """This method removes the expired values and locks and evicts the values beyond the maximum entries."""
+        now = time.time()
+        self._execute('DELETE FROM entries WHERE expires_at <= ?', (now,))
+        self._execute('DELETE FROM locks WHERE expires_at <= ?', (now,))
+        if self.max_entries:
+            self._execute('DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY expires_at DESC '
+                          'LIMIT -1 OFFSET ?)', (self.max_entries,))
+
+    def _execute(self, _query, _params, _fetch=False):
+        """This method executes a query within a transaction and wraps any database error."""
+        try:
+            with self._lock, self._connection:
+                _cursor = self._connection.execute(_query, _params)
+                return _cursor.fetchall() if _fetch else None
+        except sqlite3.Error as _exc_msg:
+            raise exceptions.CacheBackendError(f'The cache database could not be accessed: {_exc_msg}') from _exc_msg
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """This class stores the cached values in a server that implements the Redis protocol (RESP).
+
+    .. note:: The commands are sent over plain sockets, so the :py:mod:`redis` package is not required, and only the
+              ``GET``, ``SET`` (with the ``PX`` and ``NX`` options), ``DEL``, ``SCAN``, ``AUTH`` and ``SELECT``
+              commands are used so that a compatible server (e.g. a local stand-in) may be substituted.
+    """
+    shared = True
+
+    def __init__(self, host='localhost', port=DEFAULT_REDIS_PORT, db=0, password=None, prefix='highspot:',
+                 timeout=5, max_connections=10, compress_threshold=DEFAULT_COMPRESS_THRESHOLD):
+        """This method instantiates the :py:class:`highspot.utils.cache_backends.RedisCacheBackend` class object.
+
+        :param host: The hostname of the server (``localhost`` by default)
+        :type host: str
+        :param port: The port of the server (``6379`` by default)
+        :type port: int
+        :param db: The database number selected on each connection (``0`` by default)
+        :type db: int
+        :param password: The password used to authenticate each connection (if required)
+        :type password: str, None
+        :param prefix: The prefix of the keys stored by the backend (``highspot:`` by default)
+        :type prefix: str
+        :param timeout: The number of seconds to wait for the server to respond (``5`` by default)
+        :type timeout: int, float
+        :param max_connections: The number of idle connections retained for reuse (``10`` by default)
+        :type max_connections: int
+        :param compress_threshold: The size in bytes above which the values are compressed (``256`` by default)
+        :type compress_threshold: int
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.prefix = prefix
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.compress_threshold = compress_threshold
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """This method returns a cached value along with the time at which it was stored.
+
+        :param key: The cache key
+        :type key: str
+        :returns: A tuple with the value and the time at which it was stored, or ``None`` if the key is not cached
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        data = self.execute('GET', self.prefix + key)
+        return deserialize_entry(data) if data is not None else None
+
+    def set(self, key, value, stored_at, ttl):
+        """This method stores a value that the server expires after the given number of seconds.
+
+        :param key: The cache key
+        :type key: str
+        :param value: The value to store
+        :type value: bytes
+        :param stored_at: The time at which the value was stored in seconds since the epoch
+        :type stored_at: float
+        :param ttl: The number of seconds after which the value expires
+        :type ttl: int, float
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        data = serialize_entry(value, stored_at, self.compress_threshold)
+        self.execute('SET', self.prefix + key, data, 'PX', max(1, int(ttl * 1000)))
+
+    def delete(self, key):
+        """This method removes a value.
+
+        :param key: The cache key
+        :type key: str
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        self.execute('DEL', self.prefix + key)
+
+    def clear(self):
+        """This method removes every value (and lock) stored with the key prefix of the backend.
+
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        keys = list(self._scan_keys())
+        for index in range(0, len(keys), 500):
+            self.execute('DEL', *keys[index:index + 500])
+
+    def count(self):
+        """This method returns the number of values (and locks) stored with the key prefix of the backend."""
+        return sum(1 for _ in self._scan_keys())
+
+    def try_lock(self, key, ttl):
+        """This method attempts to take the lock that permits a single process to refresh a key.
+
+        :param key: The cache key
+        :type key: str
+        :param ttl: The number of seconds after which the server expires the lock if it is not released
+        :type ttl: int, float
+        :returns: Boolean value indicating if the lock was taken
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        return self.execute('SET', f'{self.prefix}lock:{key}', '1', 'NX', 'PX', max(1, int(ttl * 1000))) is not None
+
+    def unlock(self, key):
+        """This method releases the lock taken with the ``try_lock`` method.
+
+        :param key: The cache key
+        :type key: str
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        self.execute('DEL', f'{self.prefix}lock:{key}')
+
+    def execute(self, *args):
+        """This method sends a command to the server and returns the reply.
+
+        :param args: The command name followed by its arguments
+        :returns: The decoded reply (i.e. a string, integer, bytes, list or ``None``)
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        connection = self._get_connection()
+        try:
+            connection[0].sendall(_encode_command(args))
+            reply = _read_reply(connection[1])
+        except (OSError, EOFError) as exc:
+            # The state of the connection is unknown after a failure so it is not reused
+            _close_connection(connection)
+            raise exceptions.CacheBackendError(f'The cache server could not be reached: {exc}') from exc
+        except exceptions.CacheBackendError:
+            self._release_connection(connection)
+            raise
+        self._release_connection(connection)
+        return reply
+
+    def close(self):
+        """This method closes the idle connections to the server."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            _close_connection(connection)
+
+    def _scan_keys(self):
+        """This method yields the keys stored with the key prefix of the backend."""
+        _cursor = b'0'
+        while True:
+            _cursor, _keys = self.execute('SCAN', _cursor, 'MATCH', self._escape_pattern(self.prefix) + '*',
+                                          'COUNT', 500)
+            yield from _keys
+            if _cursor in (b'0', '0'):
+                break
+
+    def _get_connection(self):
+        """This method returns an idle connection or opens a new connection to the server."""
+        with self._lock:
+            if self._connections:
+                return self._connections.pop()
+        try:
+            _socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except OSError as _exc_msg:
+            raise exceptions.CacheBackendError(f'The cache server could not be reached: {_exc_msg}') from _exc_msg
+        _connection = (_socket, _socket.makefile('rb'))
+        try:
+            if self.password:
+                _socket.sendall(_encode_command(('AUTH', self.password)))
+                _read_reply(_connection[1])
+            if self.db:
+                _socket.sendall(_encode_command(('SELECT', self.db)))
+                _read_reply(_connection[1])
+        except (OSError, EOFError, exceptions.CacheBackendError) as _exc_msg:
+            _close_connection(_connection)
+            raise exceptions.CacheBackendError(f'The cache server connection could not be prepared: '
+                                               f'{_exc_msg}') from _exc_msg
+        return _connection
+
+    def _release_connection(self, _connection):
+        """This method returns a connection to the pool of idle connections (or closes it if the pool is full)."""
+        with self._lock:
+            if len(self._connections) < self.max_connections:
+                self._connections.append(_connection)
+                return
+        _close_connection(_connection)
+
+    @staticmethod
+    def _escape_pattern(_text):
+        """This method escapes the characters of the key prefix that have a special meaning in a ``SCAN`` pattern."""
+        return ''.join(f'\\{_char}' if _char in '*?[]\\' else _char for _char in _text)
+
+
+def _encode_command(_args):
+    """This function encodes a command as a RESP array of bulk strings."""
+    _parts = [b'*%d\r\n' % len(_args)]
+    for _arg in _args:
+        if not isinstance(_arg, (bytes, bytearray, memoryview)):
+            _arg = str(_arg).encode('utf-8')
+        _parts.extend((b'$%d\r\n' % len(_arg), bytes(_arg), b'\r\n'))
+    return b''.join(_parts)
+
+
+def _read_reply(_file):
+    """This function reads and decodes a single RESP reply from the file object of a connection."""
+    _line = _file.readline()
+    if not _line.endswith(b'\r\n'):
+        raise EOFError('The connection was closed by the cache server.')
+    _type, _payload = _line[:1], _line[1:-2]
+    if _type == b'+':
+        return _payload.decode('utf-8')
+    elif _type == b'-':
+        raise exceptions.CacheBackendError(f'The cache server returned an error: {_payload.decode("utf-8")}')
+    elif _type == b':':
+        return int(_payload)
+    elif _type == b'$':
+        _length = int(_payload)
+        if _length < 0:
+            return None
+        _data = _file.read(_length + 2)
+        if len(_data) < _length + 2:
+            raise EOFError('The connection was closed by the cache server.')
+        return _data[:-2]
+    elif _type == b'*':
+        _length = int(_payload)
+        return None if _length < 0 else [_read_reply(_file) for _ in range(_length)]
+    raise exceptions.CacheBackendError(f'The cache server returned an unexpected reply: {_line!r}')
+
+
+def _close_connection(_connection):
+    """This function closes the socket and file object of a connection, ignoring any error."""
+    for _resource in reversed(_connection):
+        try:
+            _resource.close()
+        except OSError:
+            pass
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.circuit_breaker
+:Synopsis:          Utilities that stop requests to an unhealthy endpoint family from tying up the client
+:Usage:             ``from highspot.utils import circuit_breaker``
+:Example:           ``registry = circuit_breaker.CircuitBreakerRegistry(failure_threshold=3)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import time
+import threading
+
+from ..errors import exceptions
+from . import log_utils
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the circuit breaker states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker(object):
+    """This class tracks the health of a single endpoint family and rejects requests while it is unhealthy.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and rejects every request until the
+    ``recovery_timeout`` has elapsed. It then moves to the half-open state and allows up to ``half_open_max_calls``
+    probe requests; a successful probe closes the breaker while a failed probe opens it again.
+    """
+    def __init__(self, endpoint_template, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1,
+                 metrics=None):
+        """This method instantiates the :py:class:`highspot.utils.circuit_breaker.CircuitBreaker` class object.
+
+        :param endpoint_template: The endpoint template tracked by the breaker (e.g. ``/items/{id}/content``)
+        :type endpoint_template: str
+        :param failure_threshold: The number of consecutive failures that open the breaker (``5`` by default)
+        :type failure_threshold: int
+        :param recovery_timeout: The number of seconds the breaker stays open before probing (``30`` by default)
+        :type recovery_timeout: int, float
+        :param half_open_max_calls: The number of concurrent probe requests allowed when half-open (``1`` by default)
+        :type half_open_max_calls: int
+        :param metrics: The metrics object to which the breaker state is reported
+        :type metrics: class[highspot.utils.metrics.Metrics], None
+        """
+        self.endpoint_template = endpoint_template
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.metrics = metrics
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+        self._report_state()
+
+    def before_request(self):
+        """This method determines if a request may proceed and raises an exception if the breaker is open.
+
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CircuitBreakerOpenError`
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    self._reject()
+                self._set_state(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    self._reject()
+                self._half_open_calls += 1
+
+    def record_result(self, success):
+        """This method records the outcome of a request that was permitted by the breaker.
+
+        :param success: Indicates that the request was successful
+        :type success: bool
+        :returns: None
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._half_open_calls = max(self._half_open_calls - 1, 0)
+            if success:
+                self.consecutive_failures = 0
+                if self.state != CLOSED:
+                    self._set_state(CLOSED)
+            else:
+                self.consecutive_failures += 1
+                if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                    self.opened_at = time.monotonic()
+                    if self.state != OPEN:
+                        self._set_state(OPEN)
+
+    def _reject(self):
+        """This method records a rejected request and raises the associated exception."""
+        if self.metrics is not None:
+            self.metrics.increment('circuit_breaker_rejections', self.endpoint_template)
+        raise exceptions.CircuitBreakerOpenError(endpoint=self.endpoint_template)
+
+    def _set_state(self, _state):
+        """This method changes the state of the breaker and reports the transition."""
+        logger.warning(f"The circuit breaker for '{self.endpoint_template}' changed from {self.state} to {_state}.",
+                       extra={'endpoint': self.endpoint_template, 'circuit_breaker_state': _state})
+        self.state = _state
+        self._half_open_calls = 0
+        self._report_state()
+
+    def _report_state(self):
+        """This method reports the current state of the breaker to the metrics object."""
+        if self.metrics is not None:
+            self.metrics.set_value('circuit_breaker_state', self.state, self.endpoint_template)
+
+
+class CircuitBreakerRegistry(object):
+    """This class maintains a separate :py:class:`highspot.utils.circuit_breaker.CircuitBreaker` per endpoint template.
+    """
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1, metrics=None):
+        """This method instantiates the :py:class:`highspot.utils.circuit_breaker.CircuitBreakerRegistry` class object.
+
+        :param failure_threshold: The number of consecutive failures that open a breaker (``5`` by default)
+        :type failure_threshold: int
+        :param recovery_timeout: The number of seconds a breaker stays open before probing (``30`` by default)
+        :type recovery_timeout: int, float
+        :param half_open_max_calls: The number of concurrent probe requests allowed when half-open (``1`` by default)
+        :type half_open_max_calls: int
+        :param metrics: The metrics object to which the breaker states are reported
+        :type metrics: class[highspot.utils.metrics.Metrics], None
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.metrics = metrics
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def get_breaker(self, endpoint_template):
+        """This method returns the breaker for an endpoint template and creates it when necessary.
+
+        :param endpoint_template: The endpoint template (e.g. ``/requests/{id}``)
+        :type endpoint_template: str
+        :returns: The :py:class:`highspot.utils.circuit_breaker.CircuitBreaker` object
+        """
+        breaker = self.breakers.get(endpoint_template)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.get(endpoint_template)
+                if breaker is None:
+                    breaker = CircuitBreaker(endpoint_template, self.failure_threshold, self.recovery_timeout,
+                                             self.half_open_max_calls, self.metrics)
+                    self.breakers[endpoint_template] = breaker
+        return breaker
+
+    def get_states(self):
+        """This method returns the current state of each breaker.
+
+        :returns: A dictionary with the endpoint templates as keys and the breaker states as values
+        """
+        return {endpoint_template: breaker.state for endpoint_template, breaker in self.breakers.items()}
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.concurrency
+:Synopsis:          Utilities that adapt the number of concurrent API requests to the observed latency and throttling
+:Usage:             ``from highspot.utils import concurrency``
+:Example:           ``limiter = concurrency.AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=40)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import time
+import threading
+import collections
+
+# Define the status codes which indicate that the API is overloaded or throttling the client
+OVERLOAD_STATUS_CODES = {429, 503}
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """This class tunes the number of requests permitted in flight using additive increase, multiplicative decrease.
+
+    Each request that completes without a sign of congestion while the limit is in full use raises the limit by
+    ``1 / limit`` (i.e. by roughly one request per round trip). A throttled (``429``) or overloaded (``503``) response,
+    a failed attempt, or a smoothed latency greater than ``latency_tolerance`` times the baseline (the lowest smoothed
+    latency among the recent requests) multiplies the limit by ``backoff``. The limit is decreased at most once per
+    round trip, as the requests that were already in flight when congestion was detected report the same congestion.
+    """
+    def __init__(self, initial_limit=10, min_limit=1, max_limit=100, backoff=0.75, latency_tolerance=2.0,
+                 window_size=100, smoothing=0.2, metrics=None):
+        """This method instantiates the :py:class:`highspot.utils.concurrency.AdaptiveConcurrencyLimiter` class object.
+
+        :param initial_limit: The number of concurrent requests permitted initially (``10`` by default)
+        :type initial_limit: int
+        :param min_limit: The lowest limit (``1`` by default)
+        :type min_limit: int
+        :param max_limit: The highest limit (``100`` by default)
+        :type max_limit: int
+        :param backoff: The factor by which the limit is multiplied when congestion is detected (``0.75`` by default)
+        :type backoff: float
+        :param latency_tolerance: The multiple of the baseline latency above which a request is considered congested
+                                  (``2.0`` by default)
+        :type latency_tolerance: float
+        :param window_size: The number of recent latencies from which the baseline is taken (``100`` by default)
+        :type window_size: int
+        :param smoothing: The weight of each new latency in the exponentially weighted average (``0.2`` by default)
+        :type smoothing: float
+        :param metrics: The metrics object in which the current limit and the decreases are recorded
+        :type metrics: class[highspot.utils.metrics.Metrics], None
+        :raises: :py:exc:`ValueError`
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.')
+        if not 0 < backoff < 1:
+            raise ValueError('The backoff factor must be between zero and one.')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.metrics = metrics
+        self.in_flight = 0
+        self._limit = float(initial_limit)
+        self._latencies = collections.deque(maxlen=window_size)
+        self._smoothed_latency = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._record_limit()
+
+    @property
+    def limit(self):
+        """This property returns the number of requests currently permitted in flight."""
+        return int(self._limit)
+
+    def acquire(self):
+        """This method blocks until the number of requests in flight is below the current limit.
+
+        :returns: The number of seconds spent waiting
+        """
+        start_time = time.monotonic()
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+        return time.monotonic() - start_time
+
+    def release(self):
+        """This method frees the slot of a request acquired with the ``acquire`` method.
+
+        :returns: None
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def record_response(self, latency, status_code=None, failed=False, in_flight=None):
+        """This method adjusts the limit based on the outcome of a completed request.
+
+        :param latency: The number of seconds that the request took
+        :type latency: float
+        :param status_code: The status code of the response (``None`` if no response was received)
+        :type status_code: int, None
+        :param failed: Indicates that the attempt failed (e.g. with a connection error or a ``5xx`` response)
+        :type failed: bool
+        :param in_flight: The number of requests that were in flight, including this one (the requests acquired with
+                          the ``acquire`` method by default)
+        :type in_flight: int, None
+        :returns: The new limit
+        """
+        now = time.monotonic()
+        with self._condition:
+            in_flight = self.in_flight if in_flight is None else in_flight
+            overloaded = failed or status_code in OVERLOAD_STATUS_CODES
+            if not overloaded:
+                # Smooth the latencies so that the scheduling noise of a single request is not mistaken for congestion
+                self._smoothed_latency = latency if self._smoothed_latency is None else \
+                    self._smoothed_latency + self.smoothing * (latency - self._smoothed_latency)
+                self._latencies.append(self._smoothed_latency)
+            congested = overloaded or self._smoothed_latency > min(self._latencies) * self.latency_tolerance
+            previous_limit = self.limit
+            if congested:
+                # Only decrease once per round trip since the other requests in flight saw the same congestion
+                if now - self._last_decrease >= latency:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    self._last_decrease = now
+                    if self.metrics is not None:
+                        self.metrics.increment('concurrency_limit_decreases')
+            elif in_flight >= previous_limit:
+                # Only increase the limit when it is in full use, otherwise it would grow without any evidence
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            if self.limit != previous_limit:
+                self._record_limit()
+                self._condition.notify_all()
+            return self.limit
+
+    def _record_limit(self):
+        """This method records the current limit in the metrics (if defined)."""
+        if self.metrics is not None:
+            self.metrics.set_value('concurrency_limit', self.limit)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.content_cache
+:Synopsis:          Utilities that store downloaded files in a content-addressed and size-bounded local cache
+:Usage:             ``from highspot.utils import content_cache``
+:Example:           ``digest, file_path = content_cache.ContentCache('/tmp/thumbnails').put(image_bytes)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import json
+import hashlib
+import threading
+import collections
+
+# Define the default maximum size of the cache (256 MB)
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# Define the file signatures used to identify the extension of common image formats
+IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF87a', '.gif'),
+    (b'GIF89a', '.gif'),
+    (b'<svg', '.svg'),
+    (b'<?xml', '.svg'),
+)
+
+
+def get_content_hash(content):
+    """This function returns the SHA-256 digest that addresses a file within the cache.
+
+    :param content: The file content
+    :type content: bytes
+    :returns: The hexadecimal digest of the content
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_image_extension(content):
+    """This function identifies the file extension for image content based on its file signature.
+
+    :param content: The image content
+    :type content: bytes
+    :returns: The file extension (e.g. ``.png``) or an empty string if the format is not recognized
+    """
+    if content[:4] == b'RIFF' and content[8:12] == b'WEBP':
+        return '.webp'
+    for signature, extension in IMAGE_SIGNATURES:
+        if content.startswith(signature):
+            return extension
+    return ''
+
+
+class ContentCache(object):
+    """This class stores files on disk under the digest of their content and evicts the least recently used files.
+
+    Identical content is only stored once, regardless of how many keys (e.g. URLs or item IDs) refer to it. The keys
+    are stored as aliases in an index file so that a file can be located again without downloading it. Files may be
+    pinned while their paths are in use (e.g. while a batch of files is collected) so that they are not evicted, in
+    which case the cache may exceed its maximum size until the next file is stored after they are unpinned.
+    """
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        """This method instantiates the :py:class:`highspot.utils.content_cache.ContentCache` class object.
+
+        :param directory: The directory in which the cached files are stored (created if it does not exist)
+        :type directory: str
+        :param max_size: The maximum combined size of the cached files in bytes (256 MB by default)
+        :type max_size: int
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        self._files = collections.OrderedDict()
+        self._aliases = {}
+        self._pinned = collections.Counter()
+        self._lock = threading.RLock()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def __contains__(self, digest):
+        """This method determines if a file with a given digest is in the cache."""
+        return digest in self._files
+
+    def put(self, content, extension=None, pin=False):
+        """This method stores content in the cache (if it is not already present) and returns its local path.
+
+        :param content: The file content
+        :type content: bytes
+        :param extension: The file extension (identified from the image signature by default)
+        :type extension: str, None
+        :param pin: Determines if the file should be pinned until it is unpinned with the
+                    :py:meth:`highspot.utils.content_cache.ContentCache.unpin` method (``False`` by default)
+        :type pin: bool
+        :returns: The digest of the content and the path to the cached file as a tuple
+        """
+        digest = get_content_hash(content)
+        with self._lock:
+            if pin:
+                self._pinned[digest] += 1
+            if digest in self._files:
+                if os.path.exists(self._files[digest][0]):
+                    return digest, self._touch(digest)
+                # Store the content again when its file was removed outside of the cache (e.g. by another process)
+                self._remove(digest)
+            extension = get_image_extension(content) if extension is None else extension
+            file_path = self._get_file_path(digest, extension)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            temp_path = f'{file_path}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'wb') as cached_file:
+                cached_file.write(content)
+            os.replace(temp_path, file_path)
+            self._files[digest] = (file_path, len(content))
+            self.size += len(content)
+            self._evict(_keep=digest)
+        return digest, file_path
+
+    def get_path(self, digest):
+        """This method returns the path to a cached file and marks it as recently used.
+
+        :param digest: The digest of the file content
+        :type digest: str
+        :returns: The path to the cached file or ``None`` if it is not in the cache
+        """
+        with self._lock:
+            if digest not in self._files:
+                return None
+            if not os.path.exists(self._files[digest][0]):
+                self._remove(digest)
+                return None
+            return self._touch(digest)
+
+    def set_alias(self, key, digests):
+        """This method associates a key (e.g. a URL or an item ID) with the digests of one or more cached files.
+
+        :param key: The key for the cached files
+        :type key: str
+        :param digests: The digests of the cached files
+        :type digests: list, tuple
+        :returns: None
+        """
+        self.set_aliases({key: digests})
+
+    def set_aliases(self, aliases):
+        """This method associates several keys with the digests of their cached files and saves the index once.
+
+        :param aliases: Dictionary with the keys as keys and lists of digests as values
+        :type aliases: dict
+        :returns: None
+        """
+        with self._lock:
+            for key, digests in aliases.items():
+                self._aliases[key] = list(digests)
+            self._save_index()
+
+    def get_alias(self, key, pin=False):
+        """This method returns the digests of the cached files associated with a key.
+
+        :param key: The key for the cached files
+        :type key: str
+        :param pin: Determines if the files should be pinned until they are unpinned with the
+                    :py:meth:`highspot.utils.content_cache.ContentCache.unpin` method (``False`` by default)
+        :type pin: bool
+        :returns: A list of the digests or ``None`` if the key is unknown or any of its files have been evicted
+        """
+        with self._lock:
+            digests = self._aliases.get(key)
+            if digests is None:
+                return None
+            if any(self.get_path(digest) is None for digest in digests):
+                del self._aliases[key]
+                return None
+            if pin:
+                self._pinned.update(digests)
+            return list(digests)
+
+    def unpin(self, digests):
+        """This method releases the pins on files so that they may be evicted when the next file is stored.
+
+        .. note:: The files are not evicted immediately so that the paths returned while they were pinned remain
+                  valid until the cache is written to again.
+
+        :param digests: The digests of the files (once for each time that they were pinned)
+        :type digests: list, tuple
+        :returns: None
+        """
+        with self._lock:
+            self._pinned.subtract(digests)
+            self._pinned += collections.Counter()
+
+    def clear(self):
+        """This method removes every cached file and alias.
+
+        :returns: None
+        """
+        with self._lock:
+            for digest in list(self._files):
+                self._remove(digest)
+            self._aliases.clear()
+            self._save_index()
+
+    def _load(self):
+        """This method indexes the files that already exist in the cache directory, ordered by their last use."""
+        _entries = []
+        for _root, _, _file_names in os.walk(self.directory):
+            for _file_name in _file_names:
+                if _file_name == self.INDEX_FILE or _file_name.endswith('.tmp'):
+                    continue
+                _file_path = os.path.join(_root, _file_name)
+                _stat = os.stat(_file_path)
+                _entries.append((_stat.st_mtime, os.path.splitext(_file_name)[0], _file_path, _stat.st_size))
+        for _, _digest, _file_path, _file_size in sorted(_entries):
+            self._files[_digest] = (_file_path, _file_size)
+            self.size += _file_size
+        _index_path = os.path.join(self.directory, self.INDEX_FILE)
+        if os.path.exists(_index_path):
+            with open(_index_path, 'r', encoding='utf-8') as _index_file:
+                self._aliases = json.load(_index_file).get('aliases', {})
+        self._evict()
+
+    def _save_index(self):
+        """This method writes the aliases to the index file."""
+        _index_path = os.path.join(self.directory, self.INDEX_FILE)
+        _temp_path = f'{_index_path}.{threading.get_ident()}.tmp'
+        with open(_temp_path, 'w', encoding='utf-8') as _index_file:
+            json.dump({'aliases': self._aliases}, _index_file, separators=(',', ':'))
+        os.replace(_temp_path, _index_path)
+
+    def _get_file_path(self, _digest, _extension):
+        """This method returns the path for a file, which is placed in a subdirectory named after its digest prefix."""
+        return os.path.join(self.directory, _digest[:2], f'{_digest}{_extension}')
+
+    def _touch(self, _digest):
+        """This method marks a file as the most recently used and returns its path."""
+        self._files.move_to_end(_digest)
+        _file_path = self._files[_digest][0]
+        try:
+            os.utime(_file_path)
+        except OSError:
+            pass
+        return _file_path
+
+    def _evict(self, _keep=None):
+        """This method removes the least recently used files (other than pinned files) until the cache is within its
+           maximum size."""
+        for _digest in list(self._files):
+            if self.size <= self.max_size:
+                break
+            if _digest != _keep and _digest not in self._pinned:
+                self._remove(_digest)
+
+    def _remove(self, _digest):
+        """This method removes a file from the cache."""
+        _file_path, _file_size = self._files.pop(_digest)
+        self.size -= _file_size
+        try:
+            os.remove(_file_path)
+        except FileNotFoundError:
+            pass
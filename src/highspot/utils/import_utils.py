@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.import_utils
+:Synopsis:          Utilities that allow modules and packages to be imported lazily on first use
+:Usage:             ``from highspot.utils import import_utils``
+:Example:           ``requests = import_utils.lazy_import('requests')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import sys
+import types
+import importlib
+import importlib.util
+
+
+def lazy_import(module_name, package=None):
+    """This function returns a module proxy that only imports the module when one of its attributes is first accessed.
+
+    .. note:: If the module has already been imported then the existing module object is returned as-is.
+
+    :param module_name: The absolute or relative name of the module to import (e.g. ``requests`` or ``.items``)
+    :type module_name: str
+    :param package: The anchor package to use when a relative module name is provided
+    :type package: str, None
+    :returns: The imported module or a :py:class:`highspot.utils.import_utils.LazyModule` proxy
+    """
+    full_name = importlib.util.resolve_name(module_name, package) if module_name.startswith('.') else module_name
+    if full_name in sys.modules:
+        return sys.modules[full_name]
+    return LazyModule(full_name)
+
+
+class LazyModule(types.ModuleType):
+    """This class is a proxy for a module that is imported the first time one of its attributes is accessed.
+
+    .. note:: The import is performed through :py:func:`importlib.import_module`, which uses the per-module import
+              locks, so the proxy can be safely accessed from multiple threads.
+    """
+    def __init__(self, module_name):
+        """This method instantiates the :py:class:`highspot.utils.import_utils.LazyModule` class object.
+
+        :param module_name: The absolute name of the module
+        :type module_name: str
+        """
+        super().__init__(module_name)
+        self._module = None
+
+    def __getattr__(self, attr_name):
+        """This method imports the module (if needed) and returns the requested attribute."""
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self._module = module
+        return getattr(module, attr_name)
+
+    def __setattr__(self, attr_name, attr_value):
+        """This method sets attributes on the underlying module, except for the reference to the module itself."""
+        if attr_name == '_module':
+            super().__setattr__(attr_name, attr_value)
+        else:
+            setattr(importlib.import_module(self.__name__), attr_name, attr_value)
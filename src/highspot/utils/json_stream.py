@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.json_stream
+:Synopsis:          Utilities that decode the records of a JSON response incrementally as its bytes arrive
+:Usage:             ``from highspot.utils import json_stream``
+:Example:           ``records = json_stream.iter_records(response.iter_content(65536))``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import json
+import codecs
+
+from ..errors import exceptions
+from .projection import COLLECTION_KEY
+
+# Define the whitespace characters that may appear between JSON tokens
+WHITESPACE = ' \t\n\r'
+
+
+def iter_records(chunks, collection_key=COLLECTION_KEY, parser=None):
+    """This function decodes the records of a JSON document from an iterable of byte chunks and yields each record.
+
+    .. note:: The records are read from the array stored in the ``collection_key`` key of the top-level object, or
+              from the document itself when it is a top-level array. Any other top-level keys are stored in the
+              :py:attr:`highspot.utils.json_stream.RecordStreamParser.metadata` dictionary of the parser. When the
+              object does not contain the collection key the records are read from its first array (as with the
+              :py:func:`highspot.pipeline.get_page_records` function), and a document without any array raises an
+              exception rather than being treated as an empty collection.
+
+    :param chunks: The chunks of the (decompressed) response body
+    :type chunks: iterable
+    :param collection_key: The key that contains the records within a paged response (``collection`` by default)
+    :type collection_key: str
+    :param parser: An existing parser to use, which allows the metadata to be retrieved afterward
+    :type parser: class[highspot.utils.json_stream.RecordStreamParser], None
+    :returns: A generator of the decoded records
+    :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+             :py:exc:`highspot.errors.exceptions.DataMismatchError`
+    """
+    parser = parser or RecordStreamParser(collection_key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class RecordStreamParser(object):
+    """This class incrementally parses a JSON document and returns the records of its collection as they complete.
+
+    Only the text of the current (incomplete) record is buffered, and each complete record is decoded with the
+    C-accelerated :py:class:`json.JSONDecoder`, so the peak memory is bounded by the size of a chunk and a record
+    rather than by the size of the response. (The records of the first array are retained until the document is
+    closed while the collection key has not been found, as they are returned when the key is missing.)
+    """
+    def __init__(self, collection_key=COLLECTION_KEY, include_raw=False):
+        """This method instantiates the :py:class:`highspot.utils.json_stream.RecordStreamParser` class object.
+
+        :param collection_key: The key that contains the records within a paged response (``collection`` by default)
+        :type collection_key: str
+        :param include_raw: Determines if each record should be returned in a tuple with its raw JSON text, which
+                            allows the record to be hashed or stored without serializing it again (``False`` by default)
+        :type include_raw: bool
+        """
+        self.collection_key = collection_key
+        self.include_raw = include_raw
+        self.metadata = {}
+        self.record_count = 0
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._state = 'start'
+        self._in_object = False
+        self._key = None
+        self._collection_found = False
+        self._fallback_key = None
+        self._fallback_records = None
+        self._collecting = False
+
+    def feed(self, chunk):
+        """This method adds a chunk of the document and returns the records that have been completed.
+
+        :param chunk: The next chunk of the document
+        :type chunk: bytes, str
+        :returns: A list of the decoded records (or of tuples with each record and its raw JSON text)
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return self._parse(final=False)
+
+    def close(self):
+        """This method parses any remaining buffered text and verifies that the document was complete.
+
+        :returns: A list of the decoded records that remained in the buffer (or the records of the first array when
+                  the document did not contain the collection key)
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`highspot.errors.exceptions.DataMismatchError`
+        """
+        self._buffer = self._buffer[self._position:] + self._text_decoder.decode(b'', final=True)
+        self._position = 0
+        records = self._parse(final=True)
+        if self._state != 'done':
+            raise exceptions.InvalidFieldError('The JSON document ended before it was complete.')
+        if not self._collection_found:
+            if self._fallback_records is None:
+                raise exceptions.DataMismatchError('The JSON document does not contain a collection of records.')
+            records.extend(self._fallback_records)
+            self.record_count += len(self._fallback_records)
+            self._fallback_records = []
+        return records
+
+    def _parse(self, final):
+        """This method parses as much of the buffered text as possible and returns the completed records.
+
+        .. note:: A value that ends exactly at the end of the buffer is not consumed until more text arrives (or the
+                  document is closed) because a number such as ``12`` may be the beginning of ``123``.
+        """
+        records = []
+        while self._state != 'done':
+            char = self._next_char()
+            if char is None:
+                break
+            if self._state == 'start':
+                if char not in '{[':
+                    self._raise_invalid()
+                self._position += 1
+                self._in_object = char == '{'
+                self._collection_found = not self._in_object
+                self._state = 'key' if self._in_object else 'records'
+            elif self._state == 'key':
+                if char == ',':
+                    self._position += 1
+                elif char == '}':
+                    self._position += 1
+                    self._state = 'done'
+                elif char == '"':
+                    start_position = self._position
+                    key = self._decode_value(final)
+                    if self._position == start_position:
+                        break
+                    self._key = key
+                    self._state = 'colon'
+                else:
+                    self._raise_invalid()
+            elif self._state == 'colon':
+                if char != ':':
+                    self._raise_invalid()
+                self._position += 1
+                self._state = 'value'
+            elif self._state == 'value':
+                if char == '[' and self._key == self.collection_key:
+                    self._position += 1
+                    self._state = 'records'
+                    self._collection_found, self._collecting = True, False
+                    self._fallback_records = None
+                    continue
+                if char == '[' and not self._collection_found and self._fallback_records is None:
+                    # Retain the records of the first array in case the document does not contain the collection key
+                    self._position += 1
+                    self._state = 'records'
+                    self._fallback_key, self._fallback_records, self._collecting = self._key, [], True
+                    continue
+                start_position = self._position
+                value = self._decode_value(final)
+                if self._position == start_position:
+                    break
+                self.metadata[self._key] = value
+                self._state = 'key'
+            elif self._state == 'records':
+                if char == ',':
+                    self._position += 1
+                elif char == ']':
+                    self._position += 1
+                    self._state = 'key' if self._in_object else 'done'
+                    if self._collecting:
+                        self.metadata[self._fallback_key] = [_entry[0] if self.include_raw else _entry
+                                                             for _entry in self._fallback_records]
+                        self._collecting = False
+                else:
+                    start_position = self._position
+                    record = self._decode_value(final)
+                    if self._position == start_position:
+                        break
+                    entry = (record, self._buffer[start_position:self._position]) if self.include_raw else record
+                    if self._collecting:
+                        self._fallback_records.append(entry)
+                    else:
+                        records.append(entry)
+                        self.record_count += 1
+        return records
+
+    def _next_char(self):
+        """This method skips any whitespace and returns the next character without consuming it."""
+        buffer, position = self._buffer, self._position
+        while position < len(buffer) and buffer[position] in WHITESPACE:
+            position += 1
+        self._position = position
+        return buffer[position] if position < len(buffer) else None
+
+    def _decode_value(self, _final):
+        """This method decodes the value at the current position and advances past it when it is complete.
+
+        .. note:: The position is left unchanged (and ``None`` is returned) when the value is incomplete.
+        """
+        try:
+            _value, _end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError as exc:
+            if _final:
+                raise exceptions.InvalidFieldError(f'The JSON document could not be decoded: {exc}') from exc
+            return None
+        if _end >= len(self._buffer) and not _final:
+            return None
+        self._position = _end
+        return _value
+
+    def _raise_invalid(self):
+        """This method raises an exception for an unexpected character at the current position."""
+        raise exceptions.InvalidFieldError(f"The JSON document contains the unexpected character "
+                                           f"'{self._buffer[self._position]}' in the '{self._state}' state.")
@@ -6,14 +6,14 @@
 :Example:           ``logger = log_utils.initialize_logging(__name__)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     16 Oct 2022
+:Modified Date:     19 Oct 2026
 """
 
 import os
 import sys
+import atexit
 import logging
-import logging.handlers
-from pathlib import Path
+import threading
 
 LOGGING_DEFAULTS = {
     'logger_name': __name__,
@@ -29,24 +29,157 @@ HANDLER_DEFAULTS = {
     'syslog_port': 514,
 }
 
+# Define the attributes present on every log record which are excluded from the structured fields
+STANDARD_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Define the listeners that process the queue-based handlers and the loggers whose records they process
+_queue_listeners = []
+_queued_loggers = []
+
+# Define the lock that prevents loggers from being initialized (or queued) more than once by concurrent threads
+_initialization_lock = threading.Lock()
+
 
 def initialize_logging(logger_name=None, log_level=None, formatter=None, debug=None, no_output=None, file_output=None,
                        file_log_level=None, log_file=None, overwrite_log_files=None, console_output=None,
                        console_log_level=None, syslog_output=None, syslog_log_level=None, syslog_address=None,
-                       syslog_port=None):
-    """This function initializes logging for the highspot library."""
+                       syslog_port=None, queue_output=None, json_format=None):
+    """This function initializes logging for the highspot library.
+
+    .. note:: When ``queue_output`` is enabled the file, console and syslog handlers are serviced by a background
+              :py:class:`logging.handlers.QueueListener` thread so that logging I/O never blocks the calling thread.
+
+    .. note:: When no output is enabled (and ``no_output`` is not set) no handler is added, so the records propagate
+              to the handlers configured by the application or, when there are none, the warnings and errors are
+              written to ``stderr`` by the :py:data:`logging.lastResort` handler.
+    """
     # TODO: Complete the docstring above with parameters
+    if json_format and not formatter:
+        formatter = JSONFormatter()
     logger_name, log_levels, formatter = _apply_defaults(logger_name, formatter, debug, log_level, file_log_level,
                                                          console_log_level, syslog_log_level)
     log_level, file_log_level, console_log_level, syslog_log_level = _get_log_levels_from_dict(log_levels)
     logger = logging.getLogger(logger_name)
     logger = _set_logging_level(logger, log_level)
+    existing_handlers = list(logger.handlers)
     logger = _add_handlers(logger, formatter, no_output, file_output, file_log_level, log_file, overwrite_log_files,
                            console_output, console_log_level, syslog_output, syslog_log_level, syslog_address,
                            syslog_port)
+    if queue_output:
+        new_handlers = [handler for handler in logger.handlers if handler not in existing_handlers]
+        logger = _move_handlers_to_queue(logger, new_handlers)
+    return logger
+
+
+def enable_queue_output(logger_name='highspot'):
+    """This function passes the records of a logger (and its descendants) to the handlers of its ancestors from a
+       background thread so that logging I/O never blocks the calling thread (e.g. the request path).
+
+    .. note:: The records are placed on a queue rather than propagated, and a :py:class:`logging.handlers.QueueListener`
+              thread passes them to the handlers that would otherwise have received them (e.g. the handlers that the
+              application configured on the root logger). Calling the function again for the same logger has no
+              effect.
+
+    :param logger_name: The name of the logger (``highspot`` by default, which includes every module of the library)
+    :type logger_name: str
+    :returns: The :py:class:`logging.Logger` instance
+    """
+    import queue
+    import logging.handlers
+    logger = logging.getLogger(logger_name)
+    with _initialization_lock:
+        if logger in _queued_loggers:
+            return logger
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, _AncestorHandler(logger))
+        listener.start()
+        if not _queue_listeners:
+            atexit.register(stop_queue_listeners)
+        _queue_listeners.append(listener)
+        _queued_loggers.append(logger)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.propagate = False
     return logger
 
 
+def stop_queue_listeners():
+    """This function stops the queue listeners after processing any log records that are still queued.
+
+    .. note:: This function is called automatically when the interpreter exits, and the loggers queued with the
+              :py:func:`highspot.utils.log_utils.enable_queue_output` function propagate their records again.
+
+    :returns: None
+    """
+    import logging.handlers
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+    while _queued_loggers:
+        _logger = _queued_loggers.pop()
+        for _handler in list(_logger.handlers):
+            if isinstance(_handler, logging.handlers.QueueHandler):
+                _logger.removeHandler(_handler)
+        _logger.propagate = True
+
+
+class JSONFormatter(logging.Formatter):
+    """This class formats log records as single-line JSON objects that include any structured fields.
+
+    The structured fields are the values passed to a logging call through the ``extra`` parameter, such as the
+    ``endpoint``, ``latency`` and ``attempt`` values recorded by the :py:mod:`highspot.api` module.
+    """
+    def format(self, record):
+        """This method returns the log record as a JSON string."""
+        import json
+        log_entry = {
+            'timestamp': self.formatTime(record, self.datefmt),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for attr_name, attr_value in vars(record).items():
+            if attr_name not in STANDARD_RECORD_ATTRIBUTES:
+                log_entry[attr_name] = attr_value
+        if record.exc_info:
+            log_entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(log_entry, default=str)
+
+
+def defer_logging(logger_name=None, **kwargs):
+    """This function returns a logger proxy that only initializes logging when the logger is first used.
+
+    .. note:: The keyword arguments are passed to the :py:func:`highspot.utils.log_utils.initialize_logging`
+              function when the logger is initialized.
+
+    :param logger_name: The name of the logger instance
+    :type logger_name: str, None
+    :returns: The :py:class:`highspot.utils.log_utils.DeferredLogger` proxy object
+    """
+    return DeferredLogger(logger_name, **kwargs)
+
+
+class DeferredLogger(object):
+    """This class is a proxy for a :py:class:`logging.Logger` instance that is initialized on first use.
+
+    .. note:: The logger is initialized while holding a lock so that threads that log for the first time concurrently
+              (e.g. the workers of :py:func:`highspot.api.get_many`) do not initialize it more than once.
+    """
+    def __init__(self, logger_name=None, **kwargs):
+        """This method instantiates the :py:class:`highspot.utils.log_utils.DeferredLogger` class object."""
+        self._logger_name = logger_name
+        self._logging_kwargs = kwargs
+        self._logger = None
+
+    def __getattr__(self, attr_name):
+        """This method initializes the underlying logger (if needed) and returns the requested attribute."""
+        logger = self._logger
+        if logger is None:
+            with _initialization_lock:
+                if self._logger is None:
+                    self._logger = initialize_logging(self._logger_name, **self._logging_kwargs)
+                logger = self._logger
+        return getattr(logger, attr_name)
+
+
 class LessThanFilter(logging.Filter):
     """This class allows filters to be set to limit log levels to only less than a specified level.
 
@@ -66,6 +199,26 @@ class LessThanFilter(logging.Filter):
         return 1 if record.levelno < self.max_level else 0
 
 
+class _AncestorHandler(logging.Handler):
+    """This class passes the records taken from a queue to the handlers of the ancestors of a logger."""
+    def __init__(self, _logger):
+        """This method instantiates the :py:class:`highspot.utils.log_utils._AncestorHandler` class object."""
+        super().__init__()
+        self._logger = _logger
+
+    def emit(self, record):
+        """This method passes a record to the handlers that would have received it through propagation."""
+        _handler_count, _current = 0, self._logger.parent
+        while _current is not None:
+            for _handler in _current.handlers:
+                _handler_count += 1
+                if record.levelno >= _handler.level:
+                    _handler.handle(record)
+            _current = _current.parent if _current.propagate else None
+        if not _handler_count and logging.lastResort and record.levelno >= logging.lastResort.level:
+            logging.lastResort.handle(record)
+
+
 def _apply_defaults(_logger_name, _formatter, _debug, _log_level, _file_level, _console_level, _syslog_level):
     """This function applies default values to the configuration settings if not explicitly defined.
 
@@ -142,9 +295,9 @@ def _add_handlers(_logger, _formatter, _no_output, _file_output, _file_log_level
                   _console_output, _console_log_level, _syslog_output, _syslog_log_level, _syslog_address,
                   _syslog_port):
     # TODO: Add docstring
-    if _no_output or not any((_file_output, _console_output, _syslog_output)):
+    if _no_output:
         _logger.addHandler(logging.NullHandler())
-    else:
+    elif any((_file_output, _console_output, _syslog_output)):
         if _file_output:
             # Add the FileHandler to the Logger object
             _logger = _add_file_handler(_logger, _file_log_level, _log_file, _overwrite_log_files, _formatter)
@@ -157,6 +310,32 @@ def _add_handlers(_logger, _formatter, _no_output, _file_output, _file_log_level
     return _logger
 
 
+def _move_handlers_to_queue(_logger, _handlers):
+    """This function moves handlers behind a :py:class:`logging.handlers.QueueHandler` serviced by a listener thread.
+
+    :param _logger: The :py:class:`logging.Logger` instance
+    :type _logger: Logger
+    :param _handlers: The handlers that should be serviced by the queue listener
+    :type _handlers: list
+    :returns: The :py:class:`logging.Logger` instance with the added :py:class:`logging.handlers.QueueHandler`
+    """
+    import queue
+    import logging.handlers
+    _handlers = [_handler for _handler in _handlers if not isinstance(_handler, logging.NullHandler)]
+    if not _handlers:
+        return _logger
+    for _handler in _handlers:
+        _logger.removeHandler(_handler)
+    _queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    if not _queue_listeners:
+        atexit.register(stop_queue_listeners)
+    _queue_listeners.append(_listener)
+    _logger.addHandler(logging.handlers.QueueHandler(_queue))
+    return _logger
+
+
 def _add_file_handler(_logger, _log_level, _log_file, _overwrite, _formatter):
     """This function adds a :py:class:`logging.FileHandler` to the :py:class:`logging.Logger` instance.
 
@@ -177,6 +356,7 @@ def _add_file_handler(_logger, _log_level, _log_file, _overwrite, _formatter):
     :returns: The :py:class:`logging.Logger` instance with the added :py:class:`logging.FileHandler`
     """
     # Define the log file to use
+    from pathlib import Path
     _home_dir = str(Path.home())
     if _log_file:
         if not any((('/' in _log_file), ('\\' in _log_file))):
@@ -254,6 +434,7 @@ def _add_split_stream_handlers(_logger, _log_level, _formatter):
 
 def _add_syslog_handler(_logger, _log_level, _formatter, _address, _port):
     # TODO: Add docstring
+    import logging.handlers
     _log_level = HANDLER_DEFAULTS.get('syslog_log_level') if not _log_level else _log_level
     _address = HANDLER_DEFAULTS.get('syslog_address') if not _address else _address
     _port = HANDLER_DEFAULTS.get('syslog_port') if not _port else _port
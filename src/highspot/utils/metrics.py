@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.metrics
+:Synopsis:          Utilities that collect request metrics for each endpoint family queried by the core object
+:Usage:             ``from highspot.utils import metrics``
+:Example:           ``summary = hs.metrics.get_summary()``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import threading
+
+
+class Metrics(object):
+    """This class collects thread-safe counters and values for each endpoint template (e.g. ``/items/{id}``)."""
+    def __init__(self):
+        """This method instantiates the :py:class:`highspot.utils.metrics.Metrics` class object."""
+        self.endpoints = {}
+        self.client = {}
+        self._lock = threading.Lock()
+
+    def record_request(self, endpoint_template, latency, failed=False):
+        """This method records the outcome and latency of a single request attempt.
+
+        :param endpoint_template: The endpoint template that was queried (e.g. ``/users/{id}``)
+        :type endpoint_template: str
+        :param latency: The number of seconds that elapsed during the attempt
+        :type latency: float
+        :param failed: Indicates that the attempt failed (``False`` by default)
+        :type failed: bool
+        :returns: None
+        """
+        with self._lock:
+            endpoint_metrics = self._get_endpoint_metrics(endpoint_template)
+            endpoint_metrics['requests'] += 1
+            endpoint_metrics['total_latency'] += latency
+            endpoint_metrics['max_latency'] = max(endpoint_metrics['max_latency'], latency)
+            if failed:
+                endpoint_metrics['failures'] += 1
+
+    def record_transfer(self, endpoint_template, wire_bytes, decoded_bytes):
+        """This method records the size of a response body as received over the wire and after decompression.
+
+        :param endpoint_template: The endpoint template that was queried (e.g. ``/users``)
+        :type endpoint_template: str
+        :param wire_bytes: The number of (possibly compressed) bytes received over the wire
+        :type wire_bytes: int
+        :param decoded_bytes: The number of bytes after decompression
+        :type decoded_bytes: int
+        :returns: None
+        """
+        with self._lock:
+            endpoint_metrics = self._get_endpoint_metrics(endpoint_template)
+            endpoint_metrics['wire_bytes'] += wire_bytes
+            endpoint_metrics['decoded_bytes'] += decoded_bytes
+
+    def increment(self, metric_name, endpoint_template=None, amount=1):
+        """This method increments a counter for an endpoint template or for the client as a whole.
+
+        :param metric_name: The name of the counter
+        :type metric_name: str
+        :param endpoint_template: The endpoint template to which the counter applies (the client if not defined)
+        :type endpoint_template: str, None
+        :param amount: The amount by which to increment the counter (``1`` by default)
+        :type amount: int, float
+        :returns: None
+        """
+        with self._lock:
+            target = self._get_endpoint_metrics(endpoint_template) if endpoint_template else self.client
+            target[metric_name] = target.get(metric_name, 0) + amount
+
+    def set_value(self, metric_name, value, endpoint_template=None):
+        """This method sets the current value of a metric for an endpoint template or for the client as a whole.
+
+        :param metric_name: The name of the metric
+        :type metric_name: str
+        :param value: The current value of the metric
+        :param endpoint_template: The endpoint template to which the metric applies (the client if not defined)
+        :type endpoint_template: str, None
+        :returns: None
+        """
+        with self._lock:
+            target = self._get_endpoint_metrics(endpoint_template) if endpoint_template else self.client
+            target[metric_name] = value
+
+    def get_summary(self):
+        """This method returns a copy of the collected metrics including the average latency and compression ratio.
+
+        :returns: A dictionary with the ``endpoints`` and ``client`` metrics
+        """
+        with self._lock:
+            endpoints = {}
+            for endpoint_template, endpoint_metrics in self.endpoints.items():
+                endpoints[endpoint_template] = dict(endpoint_metrics)
+                request_count = endpoint_metrics['requests']
+                endpoints[endpoint_template]['average_latency'] = \
+                    endpoint_metrics['total_latency'] / request_count if request_count else 0.0
+                endpoints[endpoint_template]['compression_ratio'] = \
+                    endpoint_metrics['decoded_bytes'] / endpoint_metrics['wire_bytes'] \
+                    if endpoint_metrics['wire_bytes'] else None
+            return {'endpoints': endpoints, 'client': dict(self.client)}
+
+    def reset(self):
+        """This method clears all of the collected metrics.
+
+        :returns: None
+        """
+        with self._lock:
+            self.endpoints.clear()
+            self.client.clear()
+
+    def _get_endpoint_metrics(self, _endpoint_template):
+        """This method returns the metrics dictionary for an endpoint template and creates it when necessary."""
+        _endpoint_metrics = self.endpoints.get(_endpoint_template)
+        if _endpoint_metrics is None:
+            _endpoint_metrics = self.endpoints[_endpoint_template] = {
+                'requests': 0,
+                'failures': 0,
+                'total_latency': 0.0,
+                'max_latency': 0.0,
+                'wire_bytes': 0,
+                'decoded_bytes': 0,
+            }
+        return _endpoint_metrics
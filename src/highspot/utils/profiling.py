@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.profiling
+:Synopsis:          Utilities that profile the client-side cost of calls performed with the core object
+:Usage:             ``from highspot.utils import profiling``
+:Example:           ``profiler = profiling.Profiler(sampling_interval=0.005)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import sys
+import time
+import threading
+import functools
+import collections
+
+from . import log_utils
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the clock used to measure the CPU time of the calling thread
+_cpu_clock = getattr(time, 'thread_time', time.process_time)
+
+
+class Profiler(object):
+    """This class aggregates the CPU time and network wait time of the methods called on the core object.
+
+    The wall-clock time of each profiled method is split into the time spent waiting on the network (i.e. the time
+    spent within the underlying HTTP request) and the CPU time consumed by the calling thread, which covers work
+    such as URL construction, JSON decoding and dictionary handling.
+
+    .. note:: Only one thread at a time is traced by :py:mod:`cProfile`, as the Python profiler cannot be enabled
+              in more than one thread simultaneously. The timing data is collected for every thread.
+    """
+    def __init__(self, use_cprofile=False, sampling_interval=None):
+        """This method instantiates the :py:class:`highspot.utils.profiling.Profiler` class object.
+
+        :param use_cprofile: Determines if the profiled calls should also be traced with :py:mod:`cProfile`
+        :type use_cprofile: bool
+        :param sampling_interval: The interval in seconds at which the stacks of active calls are sampled for the
+                                  collapsed-stack output (sampling is disabled by default)
+        :type sampling_interval: float, None
+        """
+        self.use_cprofile = use_cprofile
+        self.sampling_interval = sampling_interval
+        self.stats = {}
+        self.samples = collections.Counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile = None
+        self._cprofile_owner = None
+        self._active_threads = {}
+        self._sampler = None
+        self._sampler_stop = threading.Event()
+        if use_cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+
+    def wrap(self, wrapped_object, prefix):
+        """This method returns a proxy object whose public methods are profiled.
+
+        :param wrapped_object: The object (e.g. an inner class object) whose methods should be profiled
+        :param prefix: The prefix used when naming the methods in the statistics (e.g. ``users``)
+        :type prefix: str
+        :returns: The :py:class:`highspot.utils.profiling.ProfiledObject` proxy object
+        """
+        return ProfiledObject(self, wrapped_object, prefix)
+
+    def profile_call(self, method_name, func, *args, **kwargs):
+        """This method calls a function and records its wall-clock time, CPU time and network wait time.
+
+        :param method_name: The name under which the call is recorded
+        :type method_name: str
+        :param func: The function to call
+        :type func: function
+        :returns: The value returned by the function
+        """
+        call_stack = self._get_call_stack()
+        call_stack.append([method_name, 0.0])
+        thread_id = threading.get_ident()
+        tracing = len(call_stack) == 1 and self._start_tracing(thread_id)
+        wall_start, cpu_start = time.perf_counter(), _cpu_clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            wall_time, cpu_time = time.perf_counter() - wall_start, _cpu_clock() - cpu_start
+            if tracing:
+                self._stop_tracing(thread_id)
+            _, network_time = call_stack.pop()
+            if call_stack:
+                # Attribute the network time to the outer call as well so its breakdown remains complete
+                call_stack[-1][1] += network_time
+            self._record(method_name, wall_time, cpu_time, network_time)
+
+    def add_network_time(self, elapsed):
+        """This method records time spent waiting on the network against the method currently being profiled.
+
+        :param elapsed: The number of seconds spent waiting on the network
+        :type elapsed: float
+        :returns: None
+        """
+        call_stack = self._get_call_stack()
+        if call_stack:
+            call_stack[-1][1] += elapsed
+        else:
+            self._record('<unattributed>', elapsed, 0.0, elapsed)
+
+    def get_summary(self):
+        """This method returns the aggregated statistics for each profiled method.
+
+        :returns: A dictionary with the method names as keys and dictionaries of statistics as values
+        """
+        with self._lock:
+            summary = {}
+            for method_name, stats in self.stats.items():
+                summary[method_name] = dict(stats)
+                summary[method_name]['other_time'] = max(stats['wall_time'] - stats['cpu_time'] -
+                                                         stats['network_time'], 0.0)
+            return summary
+
+    def format_summary(self):
+        """This method returns the aggregated statistics as a table sorted by the total wall-clock time.
+
+        :returns: The statistics table as a string
+        """
+        lines = [f"{'method':<40} {'calls':>7} {'wall (s)':>10} {'cpu (s)':>10} {'network (s)':>12}"]
+        summary = sorted(self.get_summary().items(), key=lambda item: item[1]['wall_time'], reverse=True)
+        for method_name, stats in summary:
+            lines.append(f"{method_name:<40} {stats['calls']:>7} {stats['wall_time']:>10.4f} "
+                         f"{stats['cpu_time']:>10.4f} {stats['network_time']:>12.4f}")
+        return '\n'.join(lines)
+
+    def dump_stats(self, file_path):
+        """This method writes the :py:mod:`cProfile` data to a file that can be loaded with :py:mod:`pstats`.
+
+        :param file_path: The path to the file to write
+        :type file_path: str
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CurrentlyUnsupportedError`
+        """
+        self._get_cprofile().dump_stats(file_path)
+
+    def get_pstats(self, sort_by='cumulative'):
+        """This method returns the :py:mod:`cProfile` data as a :py:class:`pstats.Stats` object.
+
+        :param sort_by: The key by which the statistics should be sorted (``cumulative`` by default)
+        :type sort_by: str
+        :returns: The :py:class:`pstats.Stats` object
+        :raises: :py:exc:`highspot.errors.exceptions.CurrentlyUnsupportedError`
+        """
+        import pstats
+        return pstats.Stats(self._get_cprofile()).sort_stats(sort_by)
+
+    def get_collapsed_stacks(self):
+        """This method returns the sampled stacks in the collapsed format used by flame graph tools.
+
+        :returns: The collapsed stacks with one ``frame;frame;frame count`` entry per line
+        """
+        with self._lock:
+            return '\n'.join(f'{stack} {count}' for stack, count in self.samples.most_common())
+
+    def write_collapsed_stacks(self, file_path):
+        """This method writes the sampled stacks in the collapsed format to a file.
+
+        :param file_path: The path to the file to write
+        :type file_path: str
+        :returns: None
+        """
+        with open(file_path, 'w') as collapsed_file:
+            collapsed_file.write(self.get_collapsed_stacks() + '\n')
+
+    def reset(self):
+        """This method clears the statistics and samples that have been collected.
+
+        :returns: None
+        """
+        with self._lock:
+            self.stats.clear()
+            self.samples.clear()
+            if self._cprofile is not None and self._cprofile_owner is None:
+                import cProfile
+                self._cprofile = cProfile.Profile()
+
+    def stop(self):
+        """This method stops the background sampling thread if it is running.
+
+        :returns: None
+        """
+        self._sampler_stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _get_call_stack(self):
+        """This method returns the stack of profiled calls for the current thread."""
+        try:
+            return self._local.call_stack
+        except AttributeError:
+            self._local.call_stack = []
+            return self._local.call_stack
+
+    def _record(self, _method_name, _wall_time, _cpu_time, _network_time, calls=1):
+        """This method adds the timings of a call to the aggregated statistics."""
+        with self._lock:
+            stats = self.stats.get(_method_name)
+            if stats is None:
+                stats = self.stats[_method_name] = {'calls': 0, 'wall_time': 0.0, 'cpu_time': 0.0,
+                                                    'network_time': 0.0}
+            stats['calls'] += calls
+            stats['wall_time'] += _wall_time
+            stats['cpu_time'] += _cpu_time
+            stats['network_time'] += _network_time
+
+    def _start_tracing(self, _thread_id):
+        """This method registers the thread for sampling and enables :py:mod:`cProfile` where applicable.
+
+        :returns: Boolean value indicating if the thread was registered
+        """
+        with self._lock:
+            self._active_threads[_thread_id] = True
+            if self._cprofile is not None and self._cprofile_owner is None:
+                self._cprofile_owner = _thread_id
+                self._cprofile.enable()
+            if self.sampling_interval and self._sampler is None:
+                self._sampler_stop.clear()
+                self._sampler = threading.Thread(target=self._sample_stacks, name='highspot-profiler', daemon=True)
+                self._sampler.start()
+        return True
+
+    def _stop_tracing(self, _thread_id):
+        """This method unregisters the thread for sampling and disables :py:mod:`cProfile` where applicable."""
+        with self._lock:
+            self._active_threads.pop(_thread_id, None)
+            if self._cprofile_owner == _thread_id:
+                self._cprofile.disable()
+                self._cprofile_owner = None
+
+    def _get_cprofile(self):
+        """This method returns the :py:class:`cProfile.Profile` object or raises an exception if not enabled."""
+        if self._cprofile is None:
+            from ..errors import exceptions
+            raise exceptions.CurrentlyUnsupportedError('The profiler must be initialized with use_cprofile=True '
+                                                       'in order to produce cProfile statistics.')
+        return self._cprofile
+
+    def _sample_stacks(self):
+        """This method periodically samples the stacks of the threads that are within profiled calls."""
+        while not self._sampler_stop.wait(self.sampling_interval):
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id in self._active_threads:
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        self.samples[_collapse_frame(frame)] += 1
+
+
+class ProfiledObject(object):
+    """This class is a proxy that profiles the public methods of the object it wraps."""
+    def __init__(self, profiler, wrapped_object, prefix):
+        """This method instantiates the :py:class:`highspot.utils.profiling.ProfiledObject` class object.
+
+        :param profiler: The profiler that records the calls
+        :type profiler: class[highspot.utils.profiling.Profiler]
+        :param wrapped_object: The object whose methods should be profiled
+        :param prefix: The prefix used when naming the methods in the statistics
+        :type prefix: str
+        """
+        self._profiler = profiler
+        self._wrapped_object = wrapped_object
+        self._prefix = prefix
+
+    def __getattr__(self, attr_name):
+        """This method returns the attribute of the wrapped object with public methods wrapped by the profiler."""
+        attr_value = getattr(self._wrapped_object, attr_name)
+        if attr_name.startswith('_') or not callable(attr_value):
+            return attr_value
+        method_name = f'{self._prefix}.{attr_name}'
+
+        @functools.wraps(attr_value)
+        def _profiled_method(*args, **kwargs):
+            return self._profiler.profile_call(method_name, attr_value, *args, **kwargs)
+
+        setattr(self, attr_name, _profiled_method)
+        return _profiled_method
+
+
+def _collapse_frame(_frame):
+    """This function converts a stack frame into a semicolon-delimited string ordered from the root to the leaf.
+
+    :param _frame: The innermost stack frame
+    :type _frame: frame
+    :returns: The collapsed stack as a string
+    """
+    _names = []
+    while _frame is not None:
+        _code = _frame.f_code
+        _names.append(f"{_frame.f_globals.get('__name__', '?')}:{_code.co_name}")
+        _frame = _frame.f_back
+    return ';'.join(reversed(_names))
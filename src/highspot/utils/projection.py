@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.projection
+:Synopsis:          Utilities that limit the fields retained from the records returned by the API
+:Usage:             ``from highspot.utils import projection``
+:Example:           ``record = projection.project_record(record, fields=('id', 'title'))``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+from ..errors import exceptions
+
+# Define the key that contains the records within a paged response
+COLLECTION_KEY = 'collection'
+
+
+def normalize_fields(fields):
+    """This function converts a field definition into a tuple of field names.
+
+    :param fields: One or more field names as a comma-separated string or as an iterable
+    :type fields: str, tuple, list, set, None
+    :returns: A tuple of field names or ``None`` if no fields were defined
+    :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        return tuple(field.strip() for field in fields.split(',') if field.strip())
+    if not isinstance(fields, (tuple, list, set, frozenset)):
+        raise exceptions.InvalidFieldError('The fields must be defined as a string, tuple, list or set.')
+    return tuple(fields)
+
+
+def project_record(record, fields=None, exclude=None):
+    """This function returns a record with only the requested fields and without the excluded fields.
+
+    :param record: The record to project
+    :type record: dict
+    :param fields: The field(s) to retain (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove
+    :type exclude: str, tuple, list, set, None
+    :returns: The projected record (or the original value if it is not a dictionary)
+    """
+    if not isinstance(record, dict):
+        return record
+    fields, exclude = normalize_fields(fields), normalize_fields(exclude)
+    if fields:
+        record = {field: record[field] for field in fields if field in record}
+    if exclude:
+        record = {key: value for key, value in record.items() if key not in exclude}
+    return record
+
+
+def project_response(data, fields=None, exclude=None, collection_key=COLLECTION_KEY):
+    """This function applies a projection to each record within decoded response data.
+
+    .. note:: When the data contains a collection of records then the projection is applied to each record and the
+              remaining keys (e.g. counts) are retained. Otherwise, the projection is applied to the data itself.
+
+    :param data: The decoded response data
+    :type data: dict, list
+    :param fields: The field(s) to retain (all fields by default)
+    :type fields: str, tuple, list, set, None
+    :param exclude: The field(s) to remove
+    :type exclude: str, tuple, list, set, None
+    :param collection_key: The key that contains the records within a paged response (``collection`` by default)
+    :type collection_key: str
+    :returns: The projected data
+    """
+    fields, exclude = normalize_fields(fields), normalize_fields(exclude)
+    if not (fields or exclude):
+        return data
+    if isinstance(data, list):
+        return [project_record(record, fields, exclude) for record in data]
+    if isinstance(data, dict) and isinstance(data.get(collection_key), list):
+        data = dict(data)
+        data[collection_key] = [project_record(record, fields, exclude) for record in data[collection_key]]
+        return data
+    return project_record(data, fields, exclude)
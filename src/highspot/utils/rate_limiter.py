@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.rate_limiter
+:Synopsis:          Utilities that limit the rate at which API requests are performed
+:Usage:             ``from highspot.utils import rate_limiter``
+:Example:           ``limiter = rate_limiter.RateLimiter(rate=10, burst=20)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import time
+import threading
+
+
+class RateLimiter(object):
+    """This class is a thread-safe token bucket that limits requests to an average rate with a configurable burst."""
+    def __init__(self, rate, burst=None):
+        """This method instantiates the :py:class:`highspot.utils.rate_limiter.RateLimiter` class object.
+
+        :param rate: The average number of requests permitted per second
+        :type rate: int, float
+        :param burst: The maximum number of requests that may be performed back-to-back (defaults to the rate)
+        :type burst: int, float, None
+        :raises: :py:exc:`ValueError`
+        """
+        if rate <= 0:
+            raise ValueError('The rate limit must be greater than zero.')
+        self.rate = float(rate)
+        self.burst = float(burst or max(rate, 1))
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """This method blocks until the requested number of tokens is available and then consumes them.
+
+        :param tokens: The number of tokens to consume (``1`` by default)
+        :type tokens: int, float
+        :returns: The number of seconds spent waiting for the tokens
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def try_acquire(self, tokens=1):
+        """This method consumes the requested number of tokens only if they are immediately available.
+
+        :param tokens: The number of tokens to consume (``1`` by default)
+        :type tokens: int, float
+        :returns: Boolean value indicating if the tokens were consumed
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def get_delay(self, tokens=1):
+        """This method returns the number of seconds until the requested number of tokens will be available.
+
+        :param tokens: The number of tokens (``1`` by default)
+        :type tokens: int, float
+        :returns: The number of seconds to wait (``0.0`` if the tokens are available now)
+        """
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def _refill(self):
+        """This method adds the tokens that have accumulated since the bucket was last updated."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
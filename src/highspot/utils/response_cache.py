@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.response_cache
+:Synopsis:          Utilities that cache API responses and refresh stale entries in the background
+:Usage:             ``from highspot.utils import response_cache``
+:Example:           ``cache = response_cache.ResponseCache(soft_ttl=30, hard_ttl=600)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import time
+import hashlib
+import threading
+import concurrent.futures
+
+from . import cache_backends, log_utils, scheduler
+from ..errors import exceptions
+
+# Initialize logging
+logger = log_utils.defer_logging(__name__)
+
+# Define the endpoint templates of the lookups that are cached by default
+DEFAULT_ENDPOINT_TEMPLATES = frozenset({
+    '/domain/custom-usage-labels',
+    '/groups/{id}',
+    '/items/{id}',
+    '/items/{id}/properties',
+    '/me',
+    '/spots/{id}',
+    '/users/{id}',
+    '/users/{id}/properties',
+})
+
+
+def get_namespace(base_url, username):
+    """This function returns the prefix of the cache keys for the responses that a user receives from a tenant.
+
+    .. note:: The username is hashed so that it is not exposed to the other users of a shared backend.
+
+    :param base_url: The base URL of the API (e.g. ``https://api-su2.highspot.com/v0.5``)
+    :type base_url: str
+    :param username: The username (i.e. API key) used for authentication
+    :type username: str
+    :returns: The namespace string
+    """
+    user_hash = hashlib.sha256(str(username).encode('utf-8')).hexdigest()[:16]
+    return f'{base_url}|{user_hash}|'
+
+
+class ResponseCache(object):
+    """This class caches values with a soft and a hard time-to-live and serves stale values while they are refreshed.
+
+    An entry younger than the ``soft_ttl`` is served from the cache. An entry older than the ``soft_ttl`` but younger
+    than the ``hard_ttl`` is still served immediately, and a single refresh of the entry is queued for a background
+    worker (further lookups of the same key do not queue another refresh while one is pending). Only a missing entry,
+    or an entry older than the ``hard_ttl``, is loaded while the caller waits, and concurrent callers that miss the
+    same key wait for a single load rather than each performing the request.
+
+    The entries are kept in a :py:class:`highspot.utils.cache_backends.BaseCacheBackend` object, which may be shared
+    by the processes on a host (an SQLite file) or on several hosts (a Redis server). A stale entry of a shared backend
+    is only refreshed by the process that takes its refresh lock, and an unavailable backend is treated as a miss.
+    """
+    def __init__(self, soft_ttl=60, hard_ttl=300, max_entries=1024, max_refresh_workers=2, metrics=None,
+                 endpoint_templates=None, backend=None, namespace=None):
+        """This method instantiates the :py:class:`highspot.utils.response_cache.ResponseCache` class object.
+
+        :param soft_ttl: The number of seconds after which an entry is refreshed in the background (``60`` by default)
+        :type soft_ttl: int, float
+        :param hard_ttl: The number of seconds after which an entry is no longer served (``300`` by default)
+        :type hard_ttl: int, float
+        :param max_entries: The number of entries retained in memory before the least recently used are evicted
+                            (``1024`` by default, and ignored when a ``backend`` is defined)
+        :type max_entries: int
+        :param max_refresh_workers: The number of threads that refresh stale entries (``2`` by default)
+        :type max_refresh_workers: int
+        :param metrics: The metrics object in which the hits, stale hits, misses and refreshes are recorded
+        :type metrics: class[highspot.utils.metrics.Metrics], None
+        :param endpoint_templates: The endpoint templates whose responses are cached (the user, group, item and domain
+                                   lookups in :py:data:`DEFAULT_ENDPOINT_TEMPLATES` by default)
+        :type endpoint_templates: set, frozenset, list, tuple, None
+        :param backend: The backend in which the entries are stored, or the URL of the backend (e.g.
+                        ``sqlite:///var/cache/highspot.db`` or ``redis://cache.example.com:6379/0``), which is in
+                        memory by default
+        :type backend: class[highspot.utils.cache_backends.BaseCacheBackend], str, None
+        :param namespace: The prefix of the cache keys, which separates the entries of different tenants and users in
+                          a shared backend (defined by the core object by default)
+        :type namespace: str, None
+        :raises: :py:exc:`ValueError`, :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if not 0 <= soft_ttl <= hard_ttl:
+            raise ValueError('The TTLs must satisfy 0 <= soft_ttl <= hard_ttl.')
+        if max_refresh_workers < 1:
+            raise ValueError('The maximum refresh workers must be at least one.')
+        if isinstance(backend, str):
+            backend = cache_backends.get_backend(backend)
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.max_refresh_workers = max_refresh_workers
+        self.metrics = metrics
+        self.endpoint_templates = frozenset(DEFAULT_ENDPOINT_TEMPLATES if endpoint_templates is None
+                                            else endpoint_templates)
+        self.backend = backend if backend is not None else cache_backends.MemoryCacheBackend(max_entries)
+        self.namespace = namespace
+        self._loading = {}
+        self._refreshing = set()
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """This method returns the number of entries in the cache (or zero if the backend cannot be accessed)."""
+        try:
+            return self.backend.count()
+        except exceptions.CacheBackendError:
+            return 0
+
+    def is_cached_endpoint(self, endpoint_template):
+        """This method determines if the responses for an endpoint template are cached.
+
+        :param endpoint_template: The endpoint template (e.g. ``/users/{id}``)
+        :type endpoint_template: str
+        :returns: Boolean value indicating if the responses are cached
+        """
+        return endpoint_template in self.endpoint_templates
+
+    def get(self, key, loader):
+        """This method returns the cached value for a key, loading it or refreshing it in the background as needed.
+
+        .. note:: The ``loader`` must return a tuple with the value and a boolean indicating whether the value may be
+                  cached (e.g. ``False`` for an error response), and is called without arguments. The value must be
+                  bytes when the backend is shared.
+
+        :param key: The cache key (e.g. the endpoint URI), which is prefixed with the namespace
+        :type key: str
+        :param loader: The function that loads the current value for the key
+        :type loader: function
+        :returns: The cached or loaded value
+        """
+        key = (self.namespace or '') + key
+        while True:
+            entry = self._get_entry(key)
+            if entry is not None:
+                age = time.time() - entry[1]
+                if age < self.soft_ttl:
+                    self._increment('response_cache_hits')
+                    return entry[0]
+                if age < self.hard_ttl:
+                    self._increment('response_cache_stale_hits')
+                    self._schedule_refresh(key, loader)
+                    return entry[0]
+            with self._lock:
+                pending_load = self._loading.get(key)
+                if pending_load is None:
+                    pending_load = self._loading[key] = threading.Event()
+                    break
+            # Another caller is already loading the key so wait for it and check the cache again
+            pending_load.wait()
+            if self._get_entry(key) is None:
+                # The value loaded by the other caller could not be cached so it must be loaded again
+                return loader()[0]
+        self._increment('response_cache_misses')
+        try:
+            value, cacheable = loader()
+            if cacheable:
+                self._set_entry(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending_load.set()
+
+    def refresh(self, key, loader):
+        """This method loads the current value for a key and stores it in the cache (if it may be cached).
+
+        :param key: The cache key including the namespace
+        :type key: str
+        :param loader: The function that loads the current value for the key
+        :type loader: function
+        :returns: Boolean value indicating if the value was stored
+        """
+        value, cacheable = loader()
+        return cacheable and self._set_entry(key, value)
+
+    def invalidate(self, key=None):
+        """This method removes an entry (or every entry) from the cache.
+
+        .. note:: Every entry of the backend is removed when no key is defined, including those of other namespaces.
+
+        :param key: The cache key to remove, which is prefixed with the namespace (every entry is removed by default)
+        :type key: str, None
+        :returns: None
+        :raises: :py:exc:`highspot.errors.exceptions.CacheBackendError`
+        """
+        if key is None:
+            self.backend.clear()
+        else:
+            self.backend.delete((self.namespace or '') + key)
+
+    def close(self):
+        """This method waits for the pending refreshes, stops the refresh workers and closes the backend.
+
+        :returns: None
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.backend.close()
+
+    def _get_entry(self, _key):
+        """This method returns the value and storage time of a key, or ``None`` if it is missing or unavailable."""
+        try:
+            return self.backend.get(_key)
+        except exceptions.CacheBackendError as _exc_msg:
+            self._report_backend_error('read', _key, _exc_msg)
+            return None
+
+    def _set_entry(self, _key, _value):
+        """This method stores a value with the current time and returns whether the backend accepted it."""
+        try:
+            self.backend.set(_key, _value, time.time(), self.hard_ttl)
+            return True
+        except exceptions.CacheBackendError as _exc_msg:
+            self._report_backend_error('updated', _key, _exc_msg)
+            return False
+
+    def _schedule_refresh(self, _key, _loader):
+        """This method queues a background refresh of a key unless one is already pending in this process."""
+        with self._lock:
+            if _key in self._refreshing:
+                return
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_refresh_workers,
+                                                                       thread_name_prefix='highspot-cache-refresh')
+            self._refreshing.add(_key)
+            self._executor.submit(self._refresh_in_background, _key, _loader)
+
+    def _refresh_in_background(self, _key, _loader):
+        """This method refreshes an entry and logs (rather than raises) any failure so the stale value is kept."""
+        _locked = False
+        try:
+            # Another process sharing the backend may already be refreshing the entry
+            _locked = self.backend.try_lock(_key, self.soft_ttl or self.hard_ttl)
+            _entry = self._get_entry(_key) if _locked else None
+            if not _locked or (_entry is not None and time.time() - _entry[1] < self.soft_ttl):
+                self._increment('response_cache_refreshes_skipped')
+                return
+            # Background refreshes should not delay the requests that callers are waiting on
+            with scheduler.request_priority(scheduler.BATCH):
+                _refreshed = self.refresh(_key, _loader)
+            self._increment('response_cache_refreshes' if _refreshed else 'response_cache_refresh_failures')
+        except Exception as _exc_msg:
+            self._increment('response_cache_refresh_failures')
+            logger.warning(f'The cached response could not be refreshed: {type(_exc_msg).__name__}: {_exc_msg}',
+                           extra={'endpoint': _key})
+        finally:
+            with self._lock:
+                self._refreshing.discard(_key)
+            if _locked:
+                try:
+                    self.backend.unlock(_key)
+                except exceptions.CacheBackendError as _exc_msg:
+                    self._report_backend_error('unlocked', _key, _exc_msg)
+
+    def _report_backend_error(self, _action, _key, _exc_msg):
+        """This method logs and counts a failure to access the cache backend."""
+        self._increment('response_cache_backend_errors')
+        logger.warning(f'The cache backend could not be {_action}: {_exc_msg}', extra={'endpoint': _key})
+
+    def _increment(self, _metric_name):
+        """This method increments a client counter in the metrics (if defined)."""
+        if self.metrics is not None:
+            self.metrics.increment(_metric_name)
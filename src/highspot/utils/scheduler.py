@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            highspot.utils.scheduler
+:Synopsis:          Utilities that schedule API requests by priority class using weighted fair queuing
+:Usage:             ``from highspot.utils import scheduler``
+:Example:           ``with scheduler.request_priority(scheduler.BATCH): hs.users.get_users()``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import time
+import threading
+import contextlib
+import collections
+
+from ..errors import exceptions
+
+# Define the default priority classes
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+
+# Define the default share of the capacity for each priority class when both have requests waiting
+DEFAULT_WEIGHTS = {
+    INTERACTIVE: 8,
+    BATCH: 1,
+}
+
+# Define the storage for the priority of the requests performed by the current thread
+_local = threading.local()
+
+
+def get_priority(default=INTERACTIVE):
+    """This function returns the priority class assigned to the requests performed by the current thread.
+
+    :param default: The priority class to return when none has been assigned (``interactive`` by default)
+    :type default: str
+    :returns: The name of the priority class
+    """
+    return getattr(_local, 'priority', None) or default
+
+
+def set_priority(priority):
+    """This function assigns a priority class to the requests performed by the current thread (e.g. a worker thread).
+
+    :param priority: The name of the priority class (or ``None`` to remove the assigned priority)
+    :type priority: str, None
+    :returns: None
+    """
+    _local.priority = priority
+
+
+@contextlib.contextmanager
+def request_priority(priority):
+    """This function returns a context manager that assigns a priority class to the requests of the current thread.
+
+    .. note:: The priority overrides the default priority of bulk operations (e.g. paged exports), which are
+              performed as ``batch`` requests unless a priority is assigned.
+
+    :param priority: The name of the priority class (e.g. ``interactive`` or ``batch``)
+    :type priority: str
+    :returns: A context manager
+    """
+    previous = getattr(_local, 'priority', None)
+    _local.priority = priority
+    try:
+        yield priority
+    finally:
+        _local.priority = previous
+
+
+class PriorityScheduler(object):
+    """This class admits requests within a concurrency limit (and rate limit) in weighted fair queuing order.
+
+    Each priority class has its own queue. Every queued request is stamped with a virtual finish time, which advances
+    by the inverse of the weight of its class, and the request with the earliest finish time is admitted whenever a
+    slot is available. While several classes have requests waiting they therefore share the capacity in proportion to
+    their weights, and a class with nothing waiting leaves its share to the others, so that interactive requests are
+    not queued behind a backlog of batch requests and batch requests still use all of the capacity that is idle.
+    """
+    def __init__(self, max_concurrency=10, weights=None, rate_limiter=None, metrics=None, concurrency_limiter=None):
+        """This method instantiates the :py:class:`highspot.utils.scheduler.PriorityScheduler` class object.
+
+        :param max_concurrency: The maximum number of requests that may be in flight at once (``10`` by default)
+        :type max_concurrency: int
+        :param weights: Dictionary with the priority class names as keys and their weights as values (defaults to
+                        ``{'interactive': 8, 'batch': 1}``)
+        :type weights: dict, None
+        :param rate_limiter: The rate limiter from which a token is taken as each request is admitted
+        :type rate_limiter: class[highspot.utils.rate_limiter.RateLimiter], None
+        :param metrics: The metrics object in which the admitted requests and queue wait times are recorded
+        :type metrics: class[highspot.utils.metrics.Metrics], None
+        :param concurrency_limiter: The adaptive limiter whose current limit lowers the maximum concurrency
+        :type concurrency_limiter: class[highspot.utils.concurrency.AdaptiveConcurrencyLimiter], None
+        :raises: :py:exc:`ValueError`
+        """
+        weights = dict(weights or DEFAULT_WEIGHTS)
+        if max_concurrency < 1:
+            raise ValueError('The maximum concurrency must be at least one.')
+        if not weights or any(weight <= 0 for weight in weights.values()):
+            raise ValueError('The weight of each priority class must be greater than zero.')
+        self.max_concurrency = max_concurrency
+        self.weights = weights
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.concurrency_limiter = concurrency_limiter
+        self.in_flight = 0
+        self._queues = {priority: collections.deque() for priority in weights}
+        self._finish_times = {priority: 0.0 for priority in weights}
+        self._virtual_time = 0.0
+        self._sequence = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, priority=INTERACTIVE, cost=1):
+        """This method blocks until a request of the given priority class is admitted.
+
+        :param priority: The name of the priority class (``interactive`` by default)
+        :type priority: str
+        :param cost: The relative cost of the request (``1`` by default)
+        :type cost: int, float
+        :returns: The number of seconds spent waiting in the queue
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        if priority not in self.weights:
+            raise exceptions.InvalidFieldError(f"The value '{priority}' is not a defined priority class.")
+        start_time = time.monotonic()
+        with self._condition:
+            finish_time = max(self._virtual_time, self._finish_times[priority]) + cost / self.weights[priority]
+            self._finish_times[priority] = finish_time
+            self._sequence += 1
+            ticket = (finish_time, self._sequence)
+            queue = self._queues[priority]
+            queue.append(ticket)
+            try:
+                while True:
+                    if self.in_flight < self.get_max_concurrency() and self._is_next(ticket, queue):
+                        if self.rate_limiter is None or self.rate_limiter.try_acquire():
+                            break
+                        self._condition.wait(self.rate_limiter.get_delay())
+                    else:
+                        self._condition.wait()
+            except BaseException:
+                queue.remove(ticket)
+                self._condition.notify_all()
+                raise
+            queue.popleft()
+            self.in_flight += 1
+            self._virtual_time = finish_time
+            # Another request may be admitted immediately if there are still slots available
+            self._condition.notify_all()
+        waited = time.monotonic() - start_time
+        if self.metrics is not None:
+            self.metrics.increment(f'scheduled_{priority}_requests')
+            self.metrics.increment(f'scheduled_{priority}_wait', amount=waited)
+        return waited
+
+    def release(self):
+        """This method frees the slot of a request that has completed.
+
+        :returns: None
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self, priority=INTERACTIVE, cost=1):
+        """This method returns a context manager that holds a slot for the duration of a request.
+
+        :param priority: The name of the priority class (``interactive`` by default)
+        :type priority: str
+        :param cost: The relative cost of the request (``1`` by default)
+        :type cost: int, float
+        :returns: A context manager that yields the number of seconds spent waiting in the queue
+        :raises: :py:exc:`highspot.errors.exceptions.InvalidFieldError`
+        """
+        waited = self.acquire(priority, cost)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def get_max_concurrency(self):
+        """This method returns the number of requests that may currently be in flight.
+
+        :returns: The maximum concurrency, lowered to the current limit of the adaptive limiter (if defined)
+        """
+        if self.concurrency_limiter is None:
+            return self.max_concurrency
+        return min(self.max_concurrency, self.concurrency_limiter.limit)
+
+    def get_queue_lengths(self):
+        """This method returns the number of requests waiting in the queue of each priority class.
+
+        :returns: A dictionary with the priority class names as keys and the queue lengths as values
+        """
+        with self._condition:
+            return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    def _is_next(self, _ticket, _queue):
+        """This method determines if a ticket has the earliest virtual finish time among the queued requests.
+
+        .. note:: This method must be called while holding the condition lock.
+        """
+        if _queue[0] != _ticket:
+            return False
+        return all(not _other or _other[0] >= _ticket for _other in self._queues.values())
@@ -4,13 +4,13 @@
 :Synopsis:          This simple script contains the package version
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     11 Dec 2022
+:Modified Date:     19 Oct 2026
 """
 
 from . import log_utils
 
 # Initialize logging
-logger = log_utils.initialize_logging(__name__)
+logger = log_utils.defer_logging(__name__)
 
 # Define special and global variables
 __version__ = "1.0.0"
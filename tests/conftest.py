@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.conftest
+:Synopsis:          This module defines the fixtures shared by the pytest tests of the highspot library
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import sys
+import json
+import time
+import fnmatch
+import threading
+import socketserver
+import urllib.parse
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from highspot import Highspot, transports     # noqa: E402
+
+
+class TenantTransport(transports.BaseTransport):
+    """This class serves the paged users of a synthetic tenant and returns an error response for selected pages."""
+    def __init__(self, user_count=250, failed_starts=None, error_status=500):
+        """This method instantiates the transport with the number of users and the pages that should fail once."""
+        self.user_count = user_count
+        self.failed_starts = set(failed_starts or ())
+        self.error_status = error_status
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method returns the requested page of users (or an error response for a page that should fail)."""
+        query = {key: values[0] for key, values in urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).items()}
+        start, limit = int(query.get('start', 0)), int(query.get('limit', 100))
+        with self._lock:
+            self.urls.append(url)
+            failed = start in self.failed_starts
+            self.failed_starts.discard(start)
+        if failed:
+            status, body = self.error_status, {'error': 'The server encountered an internal error.'}
+        else:
+            status = 200
+            body = {'collection': [{'id': f'user{index:06d}'}
+                                   for index in range(start, min(start + limit, self.user_count))]}
+        return transports.RecordedResponse(url, status, {'Content-Type': 'application/json'},
+                                           json.dumps(body).encode('utf-8'))
+
+
+class RESPServer(socketserver.ThreadingTCPServer):
+    """This class is an in-process stand-in for a Redis server that implements the commands used by the cache backend.
+
+    Only the ``GET``, ``SET`` (with the ``PX`` and ``NX`` options), ``DEL``, ``SCAN``, ``AUTH`` and ``SELECT`` commands
+    are supported, and the values of each database are stored in a dictionary with their expiration times.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password=None):
+        """This method starts the server on an unused local port with an optional password."""
+        super().__init__(('127.0.0.1', 0), RESPHandler)
+        self.password = password
+        self.databases = {}
+        self.commands = []
+        self.lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self):
+        """This property returns the port on which the server is listening."""
+        return self.server_address[1]
+
+    def get_values(self, db):
+        """This method returns the unexpired values of a database (after discarding any expired values)."""
+        values, now = self.databases.setdefault(db, {}), time.monotonic()
+        for key in [key for key, (_, expires_at) in values.items() if expires_at is not None and expires_at <= now]:
+            del values[key]
+        return values
+
+    def stop(self):
+        """This method stops the server and closes its socket."""
+        self.shutdown()
+        self.server_close()
+
+
+class RESPHandler(socketserver.StreamRequestHandler):
+    """This class reads the commands of a connection to the stand-in server and writes their replies."""
+    def handle(self):
+        """This method processes commands until the connection is closed."""
+        self.db, self.authenticated = 0, self.server.password is None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:-2])):
+                length = int(self.rfile.readline()[1:-2])
+                args.append(self.rfile.read(length + 2)[:-2])
+            with self.server.lock:
+                self.server.commands.append(args[0].upper().decode('utf-8'))
+                reply = self.execute(args[0].upper().decode('utf-8'), args[1:])
+            self.wfile.write(reply)
+
+    def execute(self, command, args):
+        """This method performs a command and returns its encoded reply."""
+        if command == 'AUTH':
+            self.authenticated = args[0].decode('utf-8') == self.server.password
+            return b'+OK\r\n' if self.authenticated else b'-WRONGPASS invalid password\r\n'
+        if not self.authenticated:
+            return b'-NOAUTH Authentication required.\r\n'
+        values = self.server.get_values(self.db)
+        if command == 'SELECT':
+            self.db = int(args[0])
+            return b'+OK\r\n'
+        elif command == 'GET':
+            value = values.get(args[0])
+            return b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value[0]), value[0])
+        elif command == 'SET':
+            options = [arg.upper() for arg in args[2:]]
+            if b'NX' in options and args[0] in values:
+                return b'$-1\r\n'
+            expires_at = None
+            if b'PX' in options:
+                expires_at = time.monotonic() + int(options[options.index(b'PX') + 1]) / 1000
+            values[args[0]] = (args[1], expires_at)
+            return b'+OK\r\n'
+        elif command == 'DEL':
+            return b':%d\r\n' % sum(values.pop(key, None) is not None for key in args)
+        elif command == 'SCAN':
+            # Escaped characters are matched literally by placing them within a character class
+            pattern, escaped = '', False
+            for char in args[args.index(b'MATCH') + 1].decode('utf-8'):
+                if escaped:
+                    pattern, escaped = pattern + f'[{char}]', False
+                elif char == '\\':
+                    escaped = True
+                else:
+                    pattern += char
+            keys = [key for key in values if fnmatch.fnmatchcase(key.decode('utf-8'), pattern)]
+            return b'*2\r\n$1\r\n0\r\n*%d\r\n' % len(keys) + \
+                b''.join(b'$%d\r\n%s\r\n' % (len(key), key) for key in keys)
+        return b'-ERR unknown command\r\n'
+
+
+@pytest.fixture
+def redis_server():
+    """This fixture returns a function that starts a stand-in Redis server, which is stopped after the test."""
+    _servers = []
+
+    def _start_server(**kwargs):
+        _servers.append(RESPServer(**kwargs))
+        return _servers[-1]
+    yield _start_server
+    for _server in _servers:
+        _server.stop()
+
+
+@pytest.fixture
+def tenant():
+    """This fixture returns a function that creates a core object whose requests are served by a synthetic tenant."""
+    def _create_client(**kwargs):
+        _transport = TenantTransport(**kwargs)
+        return Highspot(username='tester', password='secret', transport=_transport), _transport
+    return _create_client
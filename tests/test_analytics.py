@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_analytics
+:Synopsis:          This module is used by pytest to verify that reports are loaded into columns of equal length
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import pytest
+
+from highspot import analytics
+from highspot.errors import exceptions
+
+# Define a report whose second row omits its trailing value
+RAGGED_REPORT = 'user_id,item_id,time_spent\nuser1,item1,10\nuser2,item1\nuser1,item1,5\n'
+
+# Define the modes in which reports are loaded (the NumPy mode is skipped when NumPy is not installed)
+MODES = [False, pytest.param(True, marks=pytest.mark.skipif(not analytics.numpy_available(),
+                                                            reason='NumPy is not installed'))]
+
+
+@pytest.mark.parametrize('use_numpy', MODES)
+def test_short_rows_are_padded(use_numpy):
+    """This function tests that a row with fewer values than the header does not truncate the other columns."""
+    frame = analytics.ReportFrame.from_csv(RAGGED_REPORT, use_numpy=use_numpy)
+    assert len(frame) == 3
+    assert frame.get_column('user_id') == ['user1', 'user2', 'user1']
+    assert frame.sum('time_spent') == 15.0
+    assert frame.group_by('user_id', {'time_spent': ['sum', 'max']}) == {
+        'user1': {'count': 2, 'time_spent_sum': 15.0, 'time_spent_max': 10.0},
+        'user2': {'count': 1, 'time_spent_sum': 0.0, 'time_spent_max': None},
+    }
+
+
+@pytest.mark.parametrize('use_numpy', MODES)
+def test_long_rows_are_rejected(use_numpy):
+    """This function tests that a row with more values than the header raises an exception."""
+    with pytest.raises(exceptions.DataMismatchError):
+        analytics.ReportFrame.from_csv(RAGGED_REPORT + 'user3,item2,1,extra\n', use_numpy=use_numpy)
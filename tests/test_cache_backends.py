@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_cache_backends
+:Synopsis:          This module is used by pytest to verify the Redis cache backend against a stand-in RESP server
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import time
+
+import pytest
+
+from highspot.errors import exceptions
+from highspot.utils import cache_backends
+
+
+def test_get_and_set(redis_server):
+    """This function tests that small and compressed values are returned with the time at which they were stored."""
+    server = redis_server()
+    backend = cache_backends.RedisCacheBackend(port=server.port)
+    large_value = b'{"collection": []}' * 100
+    backend.set('small', b'value', 1000.5, 60)
+    backend.set('large', large_value, 2000.0, 60)
+    assert backend.get('small') == (b'value', 1000.5)
+    assert backend.get('large') == (large_value, 2000.0)
+    assert len(server.get_values(0)[b'highspot:large'][0]) < len(large_value)
+    assert backend.get('missing') is None
+    backend.delete('small')
+    assert backend.get('small') is None
+    backend.close()
+
+
+def test_ttl_expires_values(redis_server):
+    """This function tests that the server discards a value once its time to live has elapsed."""
+    server = redis_server()
+    backend = cache_backends.RedisCacheBackend(port=server.port)
+    backend.set('key', b'value', time.time(), 0.05)
+    assert backend.get('key') is not None
+    time.sleep(0.1)
+    assert backend.get('key') is None
+    backend.close()
+
+
+def test_try_lock(redis_server):
+    """This function tests that a refresh lock is only granted once until it is released or expires."""
+    server = redis_server()
+    first, second = (cache_backends.RedisCacheBackend(port=server.port) for _ in range(2))
+    assert first.try_lock('key', 60)
+    assert not second.try_lock('key', 60)
+    first.unlock('key')
+    assert second.try_lock('key', 0.05)
+    time.sleep(0.1)
+    assert first.try_lock('key', 60)
+    first.close()
+    second.close()
+
+
+def test_clear_and_count_use_prefix(redis_server):
+    """This function tests that clearing a backend only removes the keys with its prefix."""
+    server = redis_server()
+    backend = cache_backends.RedisCacheBackend(port=server.port, prefix='hs[1]:')
+    other_backend = cache_backends.RedisCacheBackend(port=server.port, prefix='other:')
+    for index in range(3):
+        backend.set(f'key{index}', b'value', 0.0, 60)
+    backend.try_lock('key0', 60)
+    other_backend.set('key', b'value', 0.0, 60)
+    assert backend.count() == 4
+    backend.clear()
+    assert backend.count() == 0
+    assert other_backend.get('key') == (b'value', 0.0)
+    backend.close()
+    other_backend.close()
+
+
+def test_url_authenticates_and_selects_database(redis_server):
+    """This function tests that the password and database of a backend URL are applied to each connection."""
+    server = redis_server(password='secret')
+    backend = cache_backends.get_backend(f'redis://:secret@127.0.0.1:{server.port}/2')
+    backend.set('key', b'value', 0.0, 60)
+    assert b'highspot:key' in server.get_values(2)
+    assert server.commands[:2] == ['AUTH', 'SELECT']
+    backend.close()
+    with pytest.raises(exceptions.CacheBackendError):
+        cache_backends.get_backend(f'redis://:wrong@127.0.0.1:{server.port}/2').get('key')
+
+
+def test_unreachable_server_raises(redis_server):
+    """This function tests that a server that cannot be reached raises a cache backend exception."""
+    server = redis_server()
+    port = server.port
+    server.stop()
+    with pytest.raises(exceptions.CacheBackendError):
+        cache_backends.RedisCacheBackend(port=port, timeout=1).get('key')
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_cli
+:Synopsis:          This module is used by pytest to verify that the command-line downloads recover from cache eviction
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import argparse
+
+import pytest
+
+from highspot import Highspot, cli, transports
+from highspot.utils import content_cache
+
+
+class ContentTransport(transports.BaseTransport):
+    """This class serves the content of every item and counts the requests."""
+    def __init__(self):
+        """This method instantiates the transport with an empty list of requested URLs."""
+        self.urls = []
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method returns the content of the requested item."""
+        self.urls.append(url)
+        item_id = url.split('/items/', 1)[1].split('/', 1)[0]
+        return transports.RecordedResponse(url, 200, {'Content-Type': 'application/pdf'},
+                                           f'content of {item_id}'.encode('utf-8'))
+
+
+@pytest.mark.parametrize('method_name', ['get_alias', 'get_path'])
+def test_download_after_eviction(tmp_path, monkeypatch, method_name):
+    """This function tests that content whose cached file is removed during the lookup is downloaded again."""
+    transport = ContentTransport()
+    hs = Highspot(username='tester', password='secret', transport=transport)
+    cache = content_cache.ContentCache(str(tmp_path / 'cache'))
+    args = argparse.Namespace(output_dir=str(tmp_path), extension='.pdf', resume=False, report=False,
+                              hash_algorithm='sha256')
+    assert not cli._download_item(hs, 'item1', args, cache)['cached']
+    assert cli._download_item(hs, 'item1', args, cache)['cached']
+    assert len(transport.urls) == 1
+
+    # Remove the cached file (as another process sharing the cache directory would) once the lookup has found it
+    original_method = getattr(cache, method_name)
+
+    def _lookup_then_remove(*_args, **_kwargs):
+        _result = original_method(*_args, **_kwargs)
+        for _file_path, _ in cache._files.values():
+            os.remove(_file_path)
+        return _result
+    monkeypatch.setattr(cache, method_name, _lookup_then_remove)
+    outcome = cli._download_item(hs, 'item1', args, cache)
+    assert not outcome['cached']
+    assert len(transport.urls) == 2
+    with open(outcome['path'], 'rb') as content_file:
+        assert content_file.read() == b'content of item1'
+
+    # The content that was downloaded again is stored in the cache once more
+    monkeypatch.undo()
+    assert cli._download_item(hs, 'item1', args, cache)['cached']
+    assert len(transport.urls) == 2
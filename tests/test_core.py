@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_core
+:Synopsis:          This module is used by pytest to verify that the core object discovers its region
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import pytest
+
+from highspot import Highspot, core, transports
+from highspot.errors import exceptions
+
+
+class RegionTransport(transports.BaseTransport):
+    """This class accepts the credentials only on the API host of a single region."""
+    def __init__(self, region):
+        """This method instantiates the transport with the region whose host accepts the credentials."""
+        self.host = core.REGION_HOSTS[region]
+        self.urls = []
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method returns a successful response from the accepted host and a ``401`` response from the others."""
+        self.urls.append(url)
+        status = 200 if url.startswith(self.host) and auth == ('tester', 'secret') else 401
+        return transports.RecordedResponse(url, status, {'Content-Type': 'application/json'}, b'{}')
+
+
+def test_auto_region_uses_configured_transport():
+    """This function tests that the region is discovered through the transport of the core object."""
+    region = next(name for name in core.REGION_HOSTS if name != core.DEFAULT_REGION)
+    transport = RegionTransport(region)
+    hs = Highspot(username='tester', password='secret', region='auto', transport=transport)
+    assert hs.region == region
+    assert hs.base_url.startswith(core.REGION_HOSTS[region])
+    assert transport.urls and all(url.endswith('/me') for url in transport.urls)
+
+
+def test_auto_region_without_accepting_host():
+    """This function tests that an exception is raised when no region accepts the credentials."""
+    with pytest.raises(exceptions.APIConnectionError):
+        Highspot(username='tester', password='wrong', region='auto', transport=RegionTransport(core.DEFAULT_REGION))
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_exports
+:Synopsis:          This module is used by pytest to verify that the checkpointed exports resume after a failure
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import json
+
+import pytest
+
+from highspot import exports
+from highspot.errors import exceptions
+
+
+def test_failed_page_keeps_checkpoint(tmp_path, tenant):
+    """This function tests that an error response stops the export without finalizing a truncated output file."""
+    hs, _ = tenant(user_count=250, failed_starts=[100])
+    output_path = str(tmp_path / 'users.jsonl')
+    with pytest.raises(exceptions.APIRequestError):
+        exports.export_users(hs, output_path)
+    assert not os.path.exists(output_path)
+    with open(f'{output_path}{exports.CHECKPOINT_SUFFIX}', 'r', encoding='utf-8') as checkpoint_file:
+        cursor = json.load(checkpoint_file)
+    assert cursor['start'] == 100
+    assert cursor['record_count'] == 100
+
+
+def test_failed_page_resumes(tmp_path, tenant):
+    """This function tests that the next run resumes from the failed page and exports every record once."""
+    hs, transport = tenant(user_count=250, failed_starts=[100])
+    output_path = str(tmp_path / 'users.jsonl')
+    with pytest.raises(exceptions.APIRequestError):
+        exports.export_users(hs, output_path)
+    transport.urls.clear()
+    assert exports.export_users(hs, output_path) == 250
+    assert 'start=0&' not in transport.urls[0]
+    with open(output_path, 'r', encoding='utf-8') as output_file:
+        user_ids = [json.loads(line)['id'] for line in output_file]
+    assert user_ids == [f'user{index:06d}' for index in range(250)]
+    assert not os.path.exists(f'{output_path}{exports.CHECKPOINT_SUFFIX}')
+
+
+def test_error_payload_is_not_end_of_data(tmp_path, tenant):
+    """This function tests that a page without a collection is not treated as the last page."""
+    hs, _ = tenant(user_count=250, failed_starts=[200], error_status=200)
+    output_path = str(tmp_path / 'users.json')
+    with pytest.raises(exceptions.DataMismatchError):
+        exports.export_users(hs, output_path, output_format=exports.JSON_ARRAY)
+    assert not os.path.exists(output_path)
+    assert exports.export_users(hs, output_path, output_format=exports.JSON_ARRAY) == 250
+    with open(output_path, 'r', encoding='utf-8') as output_file:
+        assert len(json.load(output_file)) == 250
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_items
+:Synopsis:          This module is used by pytest to verify that the thumbnail images of a batch are not evicted
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import os
+import json
+
+from highspot import Highspot, api, items, transports
+
+# Define the size of each synthetic thumbnail image in bytes
+IMAGE_SIZE = 1000
+
+
+class ThumbnailTransport(transports.BaseTransport):
+    """This class serves a distinct thumbnail image for each item and fails the selected image requests once."""
+    def __init__(self, failed_urls=None):
+        """This method instantiates the transport with the image URLs whose first request should fail."""
+        self.failed_urls = set(failed_urls or ())
+        self.image_auth = []
+
+    def get(self, url, auth=None, verify=True, headers=None, timeout=None, stream=False):
+        """This method returns the thumbnail data for an item or the content of its image."""
+        if url.startswith('https://cdn.example.com/'):
+            self.image_auth.append(auth)
+            if url in self.failed_urls:
+                self.failed_urls.discard(url)
+                raise ConnectionError('The connection to the content delivery network was reset.')
+            image_name = url.rsplit('/', 1)[-1].encode('utf-8')
+            return transports.RecordedResponse(url, 200, {'Content-Type': 'image/png'},
+                                               b'\x89PNG\r\n\x1a\n' + image_name.ljust(IMAGE_SIZE - 8, b'\x00'))
+        item_id = url.split('/items/', 1)[1].split('/', 1)[0]
+        body = {'thumbnails': [{'url': f'https://cdn.example.com/{item_id}.png'}]}
+        return transports.RecordedResponse(url, 200, {'Content-Type': 'application/json'},
+                                           json.dumps(body).encode('utf-8'))
+
+
+def test_batch_larger_than_cache(tmp_path):
+    """This function tests that every image of a batch is returned even when the batch exceeds the cache size."""
+    hs = Highspot(username='tester', password='secret', transport=ThumbnailTransport())
+    item_ids = [f'item{index}' for index in range(10)]
+    for _ in range(2):
+        paths = items.get_item_thumbnail_files(hs, item_ids, cache_dir=str(tmp_path),
+                                               max_cache_size=3 * IMAGE_SIZE, max_workers=4)
+        assert sorted(paths) == item_ids
+        assert all(len(item_paths) == 1 and os.path.isfile(item_paths[0]) for item_paths in paths.values())
+
+    # The images of the batch are evicted once another image is stored
+    hs.thumbnail_cache.put(b'\x89PNG\r\n\x1a\nother')
+    assert hs.thumbnail_cache.size <= 3 * IMAGE_SIZE
+
+
+def test_transient_cdn_failure_is_retried(tmp_path):
+    """This function tests that an image request that fails once is retried and recorded in the metrics."""
+    transport = ThumbnailTransport(failed_urls=['https://cdn.example.com/item1.png'])
+    hs = Highspot(username='tester', password='secret', transport=transport)
+    paths = items.get_item_thumbnail_files(hs, ['item0', 'item1'], cache_dir=str(tmp_path))
+    assert all(os.path.isfile(item_paths[0]) for item_paths in paths.values())
+    assert transport.image_auth == [None, None, None]
+    cdn_metrics = hs.get_metrics()['endpoints'][api.CDN_ENDPOINT_TEMPLATE]
+    assert (cdn_metrics['requests'], cdn_metrics['failures']) == (3, 1)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_json_stream
+:Synopsis:          This module is used by pytest to verify that streamed records match the decoded page records
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+import json
+
+import pytest
+
+from highspot import pipeline
+from highspot.errors import exceptions
+from highspot.utils import json_stream
+
+# Define documents whose records are found in the collection key, in the first array and at the top level
+DOCUMENTS = [
+    {'counts_total': 2, 'collection': [{'id': 1}, {'id': 2}], 'tags': ['a']},
+    {'tags': ['a', 'b'], 'counts_total': 3, 'collection': [{'id': 1}, {'id': 2}, {'id': 3}]},
+    {'counts_total': 2, 'items': [{'id': 1}, {'id': 2}], 'tags': ['a']},
+    [{'id': 1}, {'id': 2}],
+]
+
+
+def _stream(_document, _include_raw=False):
+    """This function streams a document one byte at a time and returns the records and the parser."""
+    _content = json.dumps(_document).encode('utf-8')
+    _parser = json_stream.RecordStreamParser(include_raw=_include_raw)
+    _chunks = (_content[_index:_index + 1] for _index in range(len(_content)))
+    return list(json_stream.iter_records(_chunks, parser=_parser)), _parser
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_records_match_page_records(document):
+    """This function tests that the streamed records are the records returned for the decoded page."""
+    records, parser = _stream(document)
+    assert records == pipeline.get_page_records(document)
+    assert parser.record_count == len(records)
+
+
+def test_fallback_records_include_raw_text():
+    """This function tests that the records of the first array are returned with their raw text when requested."""
+    records, parser = _stream(DOCUMENTS[2], True)
+    assert [json.loads(raw_record) for _, raw_record in records] == [record for record, _ in records]
+    assert parser.metadata['items'] == DOCUMENTS[2]['items']
+
+
+def test_document_without_records_raises():
+    """This function tests that an error payload is not mistaken for an empty collection."""
+    with pytest.raises(exceptions.DataMismatchError):
+        _stream({'error': 'Service Unavailable', 'status': 503})
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_snapshots
+:Synopsis:          This module is used by pytest to verify that snapshots only retain the hashes of the records
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     19 Oct 2026
+"""
+
+from highspot import snapshots
+
+
+def test_first_snapshot_keeps_no_records(tenant, monkeypatch):
+    """This function tests that taking a snapshot retains the record IDs and hashes rather than the records."""
+    hs, _ = tenant(user_count=250)
+    diffs, snapshot_diff_class = [], snapshots.SnapshotDiff
+    monkeypatch.setattr(snapshots, 'SnapshotDiff', lambda *args: diffs.append(args) or snapshot_diff_class(*args))
+    snapshot = snapshots.take_snapshot(hs, 'users')
+    added, changed, removed, _ = diffs[0]
+    assert len(snapshot) == 250
+    assert added == {record_id: record_id for record_id in snapshot.hashes}
+    assert not changed and not removed
+
+
+def test_diff_returns_changed_records(tenant):
+    """This function tests that a diff against a previous snapshot returns the records that were added."""
+    hs, _ = tenant(user_count=250)
+    previous = snapshots.take_snapshot(hs, 'users')
+    del previous.hashes['user000007']
+    diff = snapshots.diff_snapshot(hs, previous)
+    assert diff.added == {'user000007': {'id': 'user000007'}}
+    assert not diff.changed and not diff.removed